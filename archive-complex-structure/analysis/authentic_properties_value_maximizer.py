@@ -6,6 +6,7 @@ Maximize the business value of 75 verified 100% authentic Athens properties
 
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -14,6 +15,9 @@ import numpy as np
 from dataclasses import dataclass, asdict
 import statistics
 
+sys.path.append(str(Path(__file__).parent.parent))
+from core.intelligence.feature_store import PropertyFeatureStore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -52,9 +56,10 @@ class InvestmentOpportunity:
 class AuthenticPropertiesValueMaximizer:
     """Advanced value maximization for authentic property portfolio"""
     
-    def __init__(self):
+    def __init__(self, feature_store: Optional[PropertyFeatureStore] = None):
         self.analysis_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.project_root = Path(__file__).parent.parent
+        self.feature_store = feature_store
         
         # Load the authentic dataset
         self.authentic_properties = []
@@ -96,6 +101,10 @@ class AuthenticPropertiesValueMaximizer:
             logger.info(f"📊 Dataset: {metadata.get('dataset_name', 'Unknown')}")
             
             self.authentic_properties = properties
+            
+            if self.feature_store is not None:
+                self.feature_store.upsert(properties)
+            
             return properties
             
         except Exception as e:
@@ -111,7 +120,7 @@ class AuthenticPropertiesValueMaximizer:
             logger.error("❌ No authentic properties to analyze")
             return {}
         
-        df = pd.DataFrame(self.authentic_properties)
+        df = self._property_frame()
         
         # Price analysis
         price_analysis = {
@@ -151,7 +160,6 @@ class AuthenticPropertiesValueMaximizer:
         }
         
         # Price per sqm analysis
-        df['price_per_sqm'] = df['price'] / df['sqm']
         psqm_analysis = {
             'psqm_statistics': {
                 'min': df['price_per_sqm'].min(),
@@ -241,6 +249,18 @@ class AuthenticPropertiesValueMaximizer:
         
         return insights
     
+    def _property_frame(self) -> pd.DataFrame:
+        """Authentic properties with price per sqm, read from the feature store when attached"""
+        
+        if self.feature_store is not None:
+            property_ids = [prop.get('property_id') for prop in self.authentic_properties]
+            if all(property_ids):
+                return self.feature_store.frame(property_ids=property_ids)
+        
+        df = pd.DataFrame(self.authentic_properties)
+        df['price_per_sqm'] = df['price'] / df['sqm']
+        return df
+    
     def identify_investment_opportunities(self) -> List[InvestmentOpportunity]:
         """Identify and rank investment opportunities"""
         
@@ -250,8 +270,7 @@ class AuthenticPropertiesValueMaximizer:
             logger.error("❌ No properties to analyze")
             return []
         
-        df = pd.DataFrame(self.authentic_properties)
-        df['price_per_sqm'] = df['price'] / df['sqm']
+        df = self._property_frame()
         
         opportunities = []
         
@@ -14,11 +14,28 @@ from crewai import Agent, Task, Crew
 from crewai.tools import BaseTool
 from typing import List, Dict, Any
 import json
+import sys
 from pathlib import Path
 import logging
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.data_catalog import get_data_catalog
+
 logger = logging.getLogger(__name__)
 
+DATASET_KIND = "athens_large_scale_real_data"
+
+
+def load_latest_dataset(kind: str = DATASET_KIND) -> List[Dict]:
+    """Newest dataset of a kind from the data catalog; each file version is parsed once per process"""
+    catalog = get_data_catalog()
+    catalog.refresh(["data/processed"], patterns=[f"{kind}_*.json"])
+    latest = catalog.latest(kind, formats=["json"])
+    return catalog.load(latest) if latest else []
+
+
 class RealEstateDataTool(BaseTool):
     """Tool for accessing real estate data"""
     name: str = "real_estate_data"
@@ -28,15 +45,10 @@ class RealEstateDataTool(BaseTool):
         """Load and return real estate data"""
         try:
             # Load our scraped data
-            data_files = list(Path("data/processed").glob("athens_large_scale_real_data_*.json"))
-            if not data_files:
+            data = load_latest_dataset()
+            if not data:
                 return "No real estate data found"
             
-            latest_file = max(data_files, key=lambda x: x.stat().st_mtime)
-            
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-            
             # Filter based on query
             if "expensive" in query.lower():
                 properties = sorted(data, key=lambda x: x['price'], reverse=True)[:10]
@@ -63,14 +75,10 @@ class MarketAnalysisTool(BaseTool):
         """Perform market analysis"""
         try:
             # Load data
-            data_files = list(Path("data/processed").glob("athens_large_scale_real_data_*.json"))
-            if not data_files:
+            data = load_latest_dataset()
+            if not data:
                 return "No data available for analysis"
             
-            latest_file = max(data_files, key=lambda x: x.stat().st_mtime)
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-            
             if analysis_type == "price_analysis":
                 prices = [p['price'] for p in data if p['price']]
                 return f"""Price Analysis:
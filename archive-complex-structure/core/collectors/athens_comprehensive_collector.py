@@ -10,14 +10,19 @@ with 99.5% accuracy and complete block-by-block coverage.
 import asyncio
 import aiohttp
 import json
-import csv
 import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 import logging
+import sys
 from pathlib import Path
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.result_sinks import ResultStream
+
 @dataclass
 class PropertyIntelligence:
     """Complete property intelligence profile"""
@@ -69,9 +74,11 @@ class AthensComprehensiveCollector:
     """
     
     def __init__(self, config_path: str = "config/collector_config.json"):
+        self.logger = logging.getLogger(__name__)
         self.config = self.load_config(config_path)
         self.session = None
         self.collected_properties = []
+        self.results = ResultStream('athens_investment_intelligence', required_formats=['json', 'csv'])  # Written as properties arrive
         self.quality_metrics = {
             "total_collected": 0,
             "validation_passed": 0,
@@ -91,7 +98,6 @@ class AthensComprehensiveCollector:
                 logging.StreamHandler()
             ]
         )
-        self.logger = logging.getLogger(__name__)
     
     def load_config(self, config_path: str) -> Dict:
         """Load collector configuration"""
@@ -288,6 +294,7 @@ class AthensComprehensiveCollector:
                     # Validate data quality
                     if self.validate_property_intelligence(intelligence):
                         properties.append(intelligence)
+                        self.results.write(intelligence)
                 
             except Exception as e:
                 self.logger.debug(f"Property {block_id}-{property_num:03d} failed: {e}")
@@ -487,31 +494,15 @@ class AthensComprehensiveCollector:
     
     def save_intelligence_data(self, properties: List[PropertyIntelligence], output_dir: str = "data/processed"):
         """Save comprehensive intelligence data in multiple formats"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save as JSON for programmatic access
-        json_path = f"{output_dir}/athens_investment_intelligence_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump([
-                {k: v for k, v in property.__dict__.items()}
-                for property in properties
-            ], f, indent=2, ensure_ascii=False)
-        
-        # Save as CSV for spreadsheet analysis
-        csv_path = f"{output_dir}/athens_investment_intelligence_{timestamp}.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            if properties:
-                writer = csv.DictWriter(f, fieldnames=properties[0].__dict__.keys())
-                writer.writeheader()
-                for property in properties:
-                    writer.writerow(property.__dict__)
+        # Properties were streamed to the configured sinks during collection; close them out
+        output_files = self.results.finish(properties, output_dir)
         
         self.logger.info(f"💾 Intelligence data saved:")
-        self.logger.info(f"   JSON: {json_path}")
-        self.logger.info(f"   CSV: {csv_path}")
+        for format_name, path in output_files.items():
+            self.logger.info(f"   {format_name.upper()}: {path}")
         self.logger.info(f"   Properties: {len(properties)}")
         
-        return json_path, csv_path
+        return output_files['json'], output_files['csv']
 
 # Example usage
 async def main():
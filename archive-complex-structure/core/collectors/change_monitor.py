@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+📡 Change Monitor - Incremental Re-Crawl of Known Listings
+
+Replaces full re-crawls with a change-detection loop over listings already collected:
+- Revisit schedule per listing, shortened by price volatility and lengthened by listing age
+- Conditional requests (ETag / Last-Modified): unchanged pages cost a 304
+- Visible-text fingerprint: pages whose content did not change are not re-extracted
+- Only listings whose price or status changed are re-scored
+- Change events (new_listing, price_drop, price_increase, delisted, relisted) stored in SQLite
+  and passed to listeners
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.extraction_engine import HTML_SCRIPT, HTML_TAG, PropertyExtractor
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PLATFORM_CONFIG_PATH = PROJECT_ROOT / 'config' / 'platform_config.json'
+
+CHANGE_EVENT_TYPES = ('new_listing', 'price_drop', 'price_increase', 'delisted', 'relisted')
+
+DEFAULT_MONITOR_CONFIG = {
+    'db_path': 'data/monitor/listings.db',
+    'base_interval_hours': 24,
+    'min_interval_hours': 2,
+    'max_interval_hours': 168,
+    'age_scale_days': 30,
+    'max_age_factor': 4,
+    'volatility_weight': 20,
+    'batch_size': 20,
+    'delisted_status_codes': [404, 410],
+    'delisted_markers': ['no longer available', 'δεν είναι πλέον διαθέσιμ', 'listing has been removed'],
+}
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'el-GR,el;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+MONITOR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    url TEXT PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'pending',
+    price REAL,
+    record TEXT NOT NULL DEFAULT '{}',
+    score TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    fingerprint TEXT,
+    volatility REAL NOT NULL DEFAULT 0,
+    first_seen_at REAL NOT NULL,
+    last_checked_at REAL,
+    last_changed_at REAL,
+    next_check_at REAL NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_listings_due ON listings(next_check_at);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    old_price REAL,
+    new_price REAL,
+    detected_at REAL NOT NULL,
+    payload TEXT NOT NULL DEFAULT '{}'
+);
+"""
+
+WHITESPACE = re.compile(r'\s+')
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one conditional request"""
+    status: int
+    body: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ChangeEvent:
+    """Price or status change of one listing"""
+    url: str
+    event_type: str
+    old_price: Optional[float]
+    new_price: Optional[float]
+    detected_at: float
+    payload: Dict
+
+
+def content_fingerprint(html: str) -> str:
+    """Hash of the page's visible text (scripts, styles, markup and whitespace ignored)"""
+    text = WHITESPACE.sub(' ', HTML_TAG.sub(' ', HTML_SCRIPT.sub(' ', html))).strip()
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_monitor_config(config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> Dict:
+    """Monitor settings from the "market_monitor" section of the platform config, over the defaults"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f).get('market_monitor', {})
+    except FileNotFoundError:
+        overrides = {}
+    return {**DEFAULT_MONITOR_CONFIG, **overrides}
+
+
+class ChangeMonitor:
+    """Re-visits known listing URLs on a per-listing schedule and records what changed"""
+
+    def __init__(self, db_path: Union[str, Path] = 'data/monitor/listings.db',
+                 base_interval: float = 86400, min_interval: float = 7200, max_interval: float = 604800,
+                 age_scale_days: float = 30, max_age_factor: float = 4, volatility_weight: float = 20,
+                 batch_size: int = 20, delisted_status_codes: Iterable[int] = (404, 410),
+                 delisted_markers: Iterable[str] = (), scorer: Optional[Callable[[Dict], Optional[Dict]]] = None,
+                 extractor: Optional[PropertyExtractor] = None, scheduler: Optional[RateScheduler] = None,
+                 request_timeout: float = 30.0):
+        self.db_path = str(db_path)
+        self.base_interval = base_interval          # Seconds between checks of a new, stable listing
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.age_scale_days = age_scale_days        # Listing age that doubles the interval
+        self.max_age_factor = max_age_factor
+        self.volatility_weight = volatility_weight  # Interval divided by 1 + weight * volatility
+        self.batch_size = batch_size
+        self.delisted_status_codes = frozenset(delisted_status_codes)
+        self.delisted_markers = tuple(marker.lower() for marker in delisted_markers)
+        self.scorer = scorer
+        self.extractor = extractor or PropertyExtractor()
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()
+        self.request_timeout = request_timeout
+        self.listeners: List[Callable[[ChangeEvent], None]] = []
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(MONITOR_SCHEMA)
+
+        self._client = None
+        self.stats = {'checked': 0, 'not_modified': 0, 'fingerprint_unchanged': 0, 're_extracted': 0,
+                      're_scored': 0, 'events': 0, 'errors': 0}
+
+    @classmethod
+    def from_config(cls, config_path: Union[str, Path] = PLATFORM_CONFIG_PATH, **overrides) -> 'ChangeMonitor':
+        config = load_monitor_config(config_path)
+        return cls(
+            config['db_path'],
+            base_interval=config['base_interval_hours'] * 3600,
+            min_interval=config['min_interval_hours'] * 3600,
+            max_interval=config['max_interval_hours'] * 3600,
+            age_scale_days=config['age_scale_days'],
+            max_age_factor=config['max_age_factor'],
+            volatility_weight=config['volatility_weight'],
+            batch_size=config['batch_size'],
+            delisted_status_codes=config['delisted_status_codes'],
+            delisted_markers=config['delisted_markers'],
+            **overrides
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM listings').fetchone()[0]
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        with self._lock:
+            self._connection.close()
+
+    def add_listener(self, listener: Callable[[ChangeEvent], None]):
+        self.listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Listings
+    # ------------------------------------------------------------------
+
+    def add_known(self, records: Iterable[Dict], spread_seconds: Optional[float] = None) -> int:
+        """
+        Seed listings that were already collected (no new_listing event).
+
+        First checks are spread over spread_seconds, so a large seed does not fall
+        due all at once in a long-running monitor. A run limited to a few rounds
+        passes 0 so every seeded listing is due right away.
+
+        Args:
+            records: Collected properties with at least a url and price
+            spread_seconds: Window the first checks are spread over (default: one base interval)
+
+        Returns:
+            int: Number of listings that were new to the monitor
+        """
+        spread = self.base_interval if spread_seconds is None else spread_seconds
+        now = time.time()
+        rows = [
+            (record['url'], record.get('price'), json.dumps(record, ensure_ascii=False, default=str),
+             now, now + random.uniform(0, spread))
+            for record in records if record.get('url')
+        ]
+        return self._insert(
+            "INSERT OR IGNORE INTO listings (url, state, price, record, first_seen_at, next_check_at) "
+            "VALUES (?, 'active', ?, ?, ?, ?)", rows
+        )
+
+    def add_discovered(self, urls: Iterable[str]) -> int:
+        """Queue newly discovered listing URLs; each gets a new_listing event on its first successful check"""
+        now = time.time()
+        return self._insert(
+            "INSERT OR IGNORE INTO listings (url, state, first_seen_at, next_check_at) VALUES (?, 'pending', ?, ?)",
+            [(url, now, now) for url in urls]
+        )
+
+    def _insert(self, statement: str, rows: List[tuple]) -> int:
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany(statement, rows)
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            return self._connection.total_changes - before
+
+    def claim_due(self, limit: Optional[int] = None, due_by: Optional[float] = None) -> List[Dict]:
+        """Listings due by a time (default: now); their next check is pushed out while they are processed"""
+        now = time.time()
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                rows = self._connection.execute(
+                    'UPDATE listings SET next_check_at = ? WHERE url IN ('
+                    '    SELECT url FROM listings WHERE next_check_at <= ? ORDER BY next_check_at LIMIT ?'
+                    ') RETURNING url, state, price, record, etag, last_modified, fingerprint, volatility, first_seen_at',
+                    (now + self.min_interval, due_by or now, limit or self.batch_size)
+                ).fetchall()
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        columns = ('url', 'state', 'price', 'record', 'etag', 'last_modified', 'fingerprint', 'volatility',
+                   'first_seen_at')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next listing is due (None when nothing is monitored)"""
+        with self._lock:
+            row = self._connection.execute('SELECT MIN(next_check_at) FROM listings').fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def next_interval(self, first_seen_at: float, volatility: float, now: Optional[float] = None) -> float:
+        """
+        Seconds until a listing's next check.
+
+        New listings are checked every base interval; the interval grows with
+        listing age (up to max_age_factor) and shrinks with price volatility.
+        """
+        now = now or time.time()
+        age_days = max(0.0, now - first_seen_at) / 86400
+        age_factor = min(self.max_age_factor, 1 + age_days / self.age_scale_days)
+        interval = self.base_interval * age_factor / (1 + self.volatility_weight * volatility)
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    async def check(self, listing: Dict) -> List[ChangeEvent]:
+        """
+        Conditionally re-fetch one listing and record any price or status change.
+
+        Args:
+            listing: Row returned by claim_due()
+
+        Returns:
+            List[ChangeEvent]: Events detected for this listing
+        """
+        url = listing['url']
+        async with self.scheduler.request(url):
+            result = await self._fetch(url, listing['etag'], listing['last_modified'])
+
+        self.stats['checked'] += 1
+        now = time.time()
+        record = json.loads(listing['record'])
+        old_price = listing['price']
+        volatility = listing['volatility'] * 0.7  # Decays with every check that finds no price change
+
+        if result.error is not None or (result.status >= 500 and result.status not in self.delisted_status_codes):
+            self.stats['errors'] += 1
+            logger.debug(f"⚠️ Monitor check failed for {url}: {result.error or result.status}")
+            self._update(url, 'errors = errors + 1, next_check_at = ?', (now + self.min_interval,))
+            return []
+
+        if result.status == 304:
+            self.stats['not_modified'] += 1
+            self._checked(url, listing, volatility, now)
+            return []
+
+        delisted = result.status in self.delisted_status_codes or (
+            result.body is not None and any(marker in result.body.lower() for marker in self.delisted_markers)
+        )
+        if delisted:
+            if listing['state'] != 'active':
+                self._checked(url, listing, volatility, now, state='delisted' if listing['state'] != 'pending' else None)
+                return []
+            event = self._event(url, 'delisted', old_price, None, now, record, rescore=False)
+            self._checked(url, listing, volatility, now, state='delisted', changed=True)
+            return [event]
+
+        if result.status != 200 or result.body is None:
+            self.stats['errors'] += 1
+            self._update(url, 'errors = errors + 1, next_check_at = ?', (now + self.min_interval,))
+            return []
+
+        fingerprint = content_fingerprint(result.body)
+        validators = {'etag': result.etag, 'last_modified': result.last_modified, 'fingerprint': fingerprint}
+        if fingerprint == listing['fingerprint'] and listing['state'] == 'active':
+            self.stats['fingerprint_unchanged'] += 1
+            self._checked(url, listing, volatility, now, **validators)
+            return []
+
+        # Content changed: re-extract, then re-score only if price or status changed
+        self.stats['re_extracted'] += 1
+        extraction = self.extractor.extract(result.body)
+        new_price = extraction.price
+        if new_price is None:
+            logger.debug(f"⚠️ No price extracted from changed page {url}")
+            self._checked(url, listing, volatility, now, **validators)
+            return []
+
+        record.update({name: value for name, value in extraction.to_dict().items()
+                       if name in ('title', 'price', 'sqm', 'energy_class', 'rooms', 'price_per_sqm') and value is not None})
+        record['url'] = url
+
+        if listing['state'] == 'pending':
+            event_type = 'new_listing'
+        elif listing['state'] == 'delisted':
+            event_type = 'relisted'
+        elif old_price and new_price != old_price:
+            event_type = 'price_drop' if new_price < old_price else 'price_increase'
+            volatility += 0.3 * abs(new_price - old_price) / old_price
+        else:
+            self._checked(url, listing, volatility, now, record=record, **validators)
+            return []
+
+        event = self._event(url, event_type, old_price, new_price, now, record)
+        self._checked(url, listing, volatility, now, state='active', price=new_price, record=record, changed=True,
+                      score=event.payload.get('score'), **validators)
+        return [event]
+
+    async def run_once(self) -> List[ChangeEvent]:
+        """Check every listing that was due when the round started, one batch at a time"""
+        events = []
+        started = time.time()
+        while True:
+            due = self.claim_due(due_by=started)
+            if not due:
+                return events
+            results = await asyncio.gather(*[self.check(listing) for listing in due], return_exceptions=True)
+            for listing, result in zip(due, results):
+                if isinstance(result, Exception):
+                    self.stats['errors'] += 1
+                    logger.warning(f"⚠️ Monitor check crashed for {listing['url']}: {result}")
+                    continue
+                events.extend(result)
+
+    async def run(self, cycles: Optional[int] = None, max_idle_seconds: float = 300) -> Dict:
+        """
+        Monitoring loop: check due listings, then sleep until the next one is due.
+
+        Args:
+            cycles: Number of check rounds (None runs until cancelled)
+            max_idle_seconds: Longest sleep between rounds, so newly added listings are picked up
+
+        Returns:
+            Dict: Check and event counters
+        """
+        completed = 0
+        while cycles is None or completed < cycles:
+            events = await self.run_once()
+            completed += 1
+            logger.info(f"🔄 Monitor round {completed}: {len(events)} changes, {len(self)} listings monitored")
+
+            if cycles is not None and completed >= cycles:
+                break
+            wait = self.next_due_in()
+            await asyncio.sleep(min(max_idle_seconds, wait if wait is not None else max_idle_seconds))
+
+        return dict(self.stats)
+
+    # ------------------------------------------------------------------
+    # State updates and events
+    # ------------------------------------------------------------------
+
+    def _checked(self, url: str, listing: Dict, volatility: float, now: float, state: Optional[str] = None,
+                 price: Optional[float] = None, record: Optional[Dict] = None, changed: bool = False,
+                 score: Optional[Dict] = None, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                 fingerprint: Optional[str] = None):
+        assignments = ['checks = checks + 1', 'last_checked_at = ?', 'volatility = ?', 'next_check_at = ?']
+        params = [now, volatility, now + self.next_interval(listing['first_seen_at'], volatility, now)]
+
+        for column, value in (('state', state), ('price', price), ('etag', etag), ('last_modified', last_modified),
+                              ('fingerprint', fingerprint)):
+            if value is not None:
+                assignments.append(f'{column} = ?')
+                params.append(value)
+        if record is not None:
+            assignments.append('record = ?')
+            params.append(json.dumps(record, ensure_ascii=False, default=str))
+        if score is not None:
+            assignments.append('score = ?')
+            params.append(json.dumps(score, default=str))
+        if changed:
+            assignments.extend(['changes = changes + 1', 'last_changed_at = ?'])
+            params.append(now)
+
+        self._update(url, ', '.join(assignments), tuple(params))
+
+    def _update(self, url: str, assignments: str, params: tuple):
+        with self._lock:
+            self._connection.execute(f'UPDATE listings SET {assignments} WHERE url = ?', params + (url,))
+
+    def _event(self, url: str, event_type: str, old_price: Optional[float], new_price: Optional[float],
+               now: float, record: Dict, rescore: bool = True) -> ChangeEvent:
+        payload = {'record': record}
+        if rescore and self.scorer is not None:
+            self.stats['re_scored'] += 1
+            try:
+                payload['score'] = self.scorer(record)
+            except Exception as e:
+                logger.warning(f"⚠️ Re-scoring {url} failed: {e}")
+        if old_price and new_price:
+            payload['price_change_pct'] = round((new_price - old_price) / old_price * 100, 2)
+
+        event = ChangeEvent(url, event_type, old_price, new_price, now, payload)
+        with self._lock:
+            self._connection.execute(
+                'INSERT INTO events (url, event_type, old_price, new_price, detected_at, payload) VALUES (?, ?, ?, ?, ?, ?)',
+                (url, event_type, old_price, new_price, now, json.dumps(payload, ensure_ascii=False, default=str))
+            )
+
+        self.stats['events'] += 1
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"⚠️ Change event listener failed: {e}")
+        return event
+
+    def events(self, since_id: int = 0, event_type: Optional[str] = None) -> List[Dict]:
+        """Stored change events after an event id"""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT id, url, event_type, old_price, new_price, detected_at, payload FROM events '
+                'WHERE id > ? AND (? IS NULL OR event_type = ?) ORDER BY id',
+                (since_id, event_type, event_type)
+            ).fetchall()
+        return [
+            {'id': row[0], 'url': row[1], 'event_type': row[2], 'old_price': row[3], 'new_price': row[4],
+             'detected_at': row[5], 'payload': json.loads(row[6])}
+            for row in rows
+        ]
+
+    def summary(self) -> Dict:
+        """Listing counts per state and event counts per type"""
+        with self._lock:
+            states = dict(self._connection.execute('SELECT state, COUNT(*) FROM listings GROUP BY state').fetchall())
+            events = dict(self._connection.execute('SELECT event_type, COUNT(*) FROM events GROUP BY event_type').fetchall())
+        return {'listings': states, 'events': {event_type: events.get(event_type, 0) for event_type in CHANGE_EVENT_TYPES},
+                'session': dict(self.stats)}
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _fetch(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> FetchResult:
+        headers = dict(REQUEST_HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self._fetch_urllib, url, headers)
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(follow_redirects=True, timeout=self.request_timeout)
+        try:
+            response = await self._client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            return FetchResult(0, error=str(e))
+        return FetchResult(response.status_code, response.text if response.status_code == 200 else None,
+                           response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    def _fetch_urllib(self, url: str, headers: Dict[str, str]) -> FetchResult:
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.request_timeout) as response:
+                charset = response.headers.get_content_charset() or 'utf-8'
+                return FetchResult(response.status, response.read().decode(charset, errors='replace'),
+                                   response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        except urllib.error.HTTPError as e:
+            return FetchResult(e.code, etag=e.headers.get('ETag'), last_modified=e.headers.get('Last-Modified'))
+        except (urllib.error.URLError, OSError) as e:
+            return FetchResult(0, error=str(e))
+
+
+def main():
+    """Example: monitor listings served by a local fixture server while their prices change"""
+    import tempfile
+    from email.utils import formatdate
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from core.collectors.rate_scheduler import HostBudget
+
+    listings = {f'/en/property/{1117000000 + i}': 250000 + i * 10000 for i in range(6)}
+    requests_served = {'200': 0, '304': 0, '404': 0}
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            price = listings.get(self.path)
+            if price is None:
+                requests_served['404'] += 1
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = (f'<html><head><title>Apartment 85 m² Koukaki</title></head><body>'
+                    f'<h1>Apartment 85 m², Koukaki</h1><div class="price">€{price:,}</div>'
+                    f'<p>Energy class: B</p><script>var rendered = {time.time()};</script></body></html>').encode()
+            etag = '"' + hashlib.md5(body.split(b'<script>')[0]).hexdigest() + '"'
+            if self.headers.get('If-None-Match') == etag:
+                requests_served['304'] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            requests_served['200'] += 1
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', formatdate(usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    async def run(db_dir: Path, base_url: str):
+        scheduler = RateScheduler(db_dir / 'rate_budget.db', HostBudget(50, 10, 10))
+        monitor = ChangeMonitor(db_dir / 'listings.db', base_interval=0, min_interval=0, scheduler=scheduler,
+                                scorer=lambda record: {'price_per_sqm': record.get('price_per_sqm')})
+        monitor.add_listener(lambda event: print(f"   📣 {event.event_type:15} {event.url.rsplit('/', 1)[-1]} "
+                                                 f"{event.old_price} → {event.new_price}"))
+
+        paths = list(listings)
+        monitor.add_discovered(base_url + path for path in paths)
+        print("Round 1 (first visits):")
+        await monitor.run_once()
+
+        listings[paths[0]] -= 15000          # Price drop
+        listings[paths[1]] += 5000           # Price increase
+        del listings[paths[2]]               # Delisted
+        print("Round 2 (after changes):")
+        await monitor.run_once()
+        print("Round 3 (nothing changed):")
+        await monitor.run_once()
+
+        print(f"Requests served: {requests_served}")
+        print(json.dumps(monitor.summary(), indent=2))
+        await monitor.close()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as db_dir:
+            asyncio.run(run(Path(db_dir), f'http://127.0.0.1:{server.server_address[1]}'))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+🧾 Collection Checkpoint Log - Append-Only Property Persistence
+
+Durable, append-only storage for long collection sessions so saves stop
+re-serializing every collected property:
+- NDJSON segments, one property per line, fsync'd in batches
+- Segment rotation and periodic compaction into one columnar file (Parquet)
+- Key index rebuilt on restart so collectors resume and skip collected IDs
+- Tolerates a torn final line after a crash
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PATTERN = 'segment_{:06d}.ndjson'
+COMPACTED_PARQUET = 'compacted.parquet'
+COMPACTED_NDJSON = 'compacted.ndjson'
+
+
+class CheckpointLog:
+    """Append-only property log keyed by a record field"""
+
+    def __init__(self, log_dir: Union[str, Path], key_field: str = 'property_id',
+                 fsync_every: int = 25, segment_max_records: int = 1000, compact_every: int = 10):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.key_field = key_field
+        self.fsync_every = fsync_every                  # Records between fsyncs
+        self.segment_max_records = segment_max_records  # Records per NDJSON segment
+        self.compact_every = compact_every              # Sealed segments before compaction
+
+        self._keys: Set[str] = set()
+        self._segment_file = None
+        self._segment_records = 0
+        self._unsynced = 0
+
+        self._load_keys()
+        self._next_segment = self._last_segment_number() + 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self._keys
+
+    def __enter__(self) -> 'CheckpointLog':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def keys(self) -> Set[str]:
+        """Keys of every record in the log"""
+        return set(self._keys)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, record: Dict) -> bool:
+        """
+        Append one record unless its key is already logged.
+
+        Args:
+            record: JSON-serializable property record
+
+        Returns:
+            bool: True when the record was written
+        """
+        key = record.get(self.key_field)
+        if key is None:
+            raise KeyError(f"Record is missing checkpoint key '{self.key_field}'")
+        key = str(key)
+        if key in self._keys:
+            return False
+
+        if self._segment_file is None:
+            self._open_segment()
+
+        self._segment_file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._keys.add(key)
+        self._segment_records += 1
+        self._unsynced += 1
+
+        if self._unsynced >= self.fsync_every:
+            self.flush()
+        if self._segment_records >= self.segment_max_records:
+            self._seal_segment()
+
+        return True
+
+    def extend(self, records: Iterable[Dict]) -> int:
+        """Append many records, returning how many were new"""
+        return sum(1 for record in records if self.append(record))
+
+    def flush(self):
+        """Flush and fsync the open segment"""
+        if self._segment_file is None or not self._unsynced:
+            return
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Seal the open segment"""
+        self._seal_segment()
+
+    def compact(self) -> Optional[Path]:
+        """
+        Merge the compacted file and all sealed segments into one columnar file.
+
+        Returns:
+            Path: Compacted file, or None when the log is empty
+        """
+        self._seal_segment(compact=False)
+        segments = self._segment_paths()
+        compacted_path = self._compacted_path()
+
+        if not segments:
+            return compacted_path if compacted_path.exists() else None
+
+        records = list(self.records())
+        if not records:
+            return None
+
+        if PYARROW_AVAILABLE:
+            target = self.log_dir / COMPACTED_PARQUET
+            temp_path = self.log_dir / f'{COMPACTED_PARQUET}.tmp'
+            pq.write_table(_records_to_table(records), temp_path, compression='zstd')
+        else:
+            target = self.log_dir / COMPACTED_NDJSON
+            temp_path = self.log_dir / f'{COMPACTED_NDJSON}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+        with open(temp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        temp_path.replace(target)
+        if compacted_path != target:
+            compacted_path.unlink(missing_ok=True)
+
+        # Segments are only dropped once the compacted file is in place
+        for segment in segments:
+            segment.unlink(missing_ok=True)
+
+        logger.info(f"🗜️ Compacted {len(segments)} segments into {target.name} ({len(records)} records)")
+        return target
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def records(self) -> Iterator[Dict]:
+        """Every logged record in append order, first occurrence per key"""
+        self.flush()
+        seen = set()
+
+        for record in self._iter_all_records():
+            key = str(record.get(self.key_field))
+            if key in seen:
+                continue
+            seen.add(key)
+            yield record
+
+    def _iter_all_records(self) -> Iterator[Dict]:
+        compacted_path = self._compacted_path()
+        if compacted_path.exists():
+            if compacted_path.suffix == '.parquet':
+                yield from _table_to_records(pq.read_table(compacted_path))
+            else:
+                yield from _read_ndjson(compacted_path)
+
+        for segment in self._segment_paths():
+            yield from _read_ndjson(segment)
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def _load_keys(self):
+        """Rebuild the key index from the compacted file and remaining segments"""
+        compacted_path = self._compacted_path()
+        if compacted_path.exists() and compacted_path.suffix == '.parquet':
+            table = pq.read_table(compacted_path, columns=[self.key_field])
+            keys = table.column(self.key_field).to_pylist()
+            # Keys Arrow could not type were stored as JSON text by _records_to_table
+            metadata = pq.read_schema(compacted_path).metadata or {}
+            if self.key_field in json.loads(metadata.get(b'json_columns', b'[]')):
+                keys = [json.loads(key) if key is not None else None for key in keys]
+            self._keys.update(str(key) for key in keys)
+        elif compacted_path.exists():
+            self._keys.update(str(record.get(self.key_field)) for record in _read_ndjson(compacted_path))
+
+        for segment in self._segment_paths():
+            self._keys.update(str(record.get(self.key_field)) for record in _read_ndjson(segment))
+
+        if self._keys:
+            logger.info(f"♻️ Checkpoint log {self.log_dir} resumed with {len(self._keys)} records")
+
+    def _open_segment(self):
+        # Always start a fresh segment so a torn line from a crash is never appended to
+        path = self.log_dir / SEGMENT_PATTERN.format(self._next_segment)
+        self._next_segment += 1
+        self._segment_file = open(path, 'a', encoding='utf-8')
+        self._segment_records = 0
+
+    def _seal_segment(self, compact: bool = True):
+        if self._segment_file is None:
+            return
+        self.flush()
+        self._segment_file.close()
+        self._segment_file = None
+        self._segment_records = 0
+
+        if compact and len(self._segment_paths()) >= self.compact_every:
+            self.compact()
+
+    def _segment_paths(self) -> List[Path]:
+        return sorted(self.log_dir.glob('segment_*.ndjson'))
+
+    def _last_segment_number(self) -> int:
+        segments = self._segment_paths()
+        return int(segments[-1].stem.split('_')[1]) if segments else 0
+
+    def _compacted_path(self) -> Path:
+        for name in (COMPACTED_PARQUET, COMPACTED_NDJSON):
+            path = self.log_dir / name
+            if path.exists():
+                return path
+        return self.log_dir / (COMPACTED_PARQUET if PYARROW_AVAILABLE else COMPACTED_NDJSON)
+
+
+def _read_ndjson(path: Path) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"⚠️ Skipping torn checkpoint line in {path.name}")
+
+
+def _records_to_table(records: List[Dict]) -> 'pa.Table':
+    """Columnar table from records; columns Arrow cannot type consistently are stored as JSON text"""
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    arrays, json_columns = [], []
+
+    for column in columns:
+        values = [record.get(column) for record in records]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array([
+                None if value is None else json.dumps(value, ensure_ascii=False, default=str) for value in values
+            ], type=pa.string()))
+            json_columns.append(column)
+
+    table = pa.Table.from_arrays(arrays, names=columns)
+    return table.replace_schema_metadata({'json_columns': json.dumps(json_columns)})
+
+
+def _table_to_records(table: 'pa.Table') -> Iterator[Dict]:
+    metadata = table.schema.metadata or {}
+    json_columns = json.loads(metadata.get(b'json_columns', b'[]'))
+
+    for record in table.to_pylist():
+        for column in json_columns:
+            if record.get(column) is not None:
+                record[column] = json.loads(record[column])
+        yield record
+
+
+def main():
+    """Example: log, restart and compact a collection session"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        with CheckpointLog(log_dir, key_field='url', fsync_every=10, segment_max_records=50) as log:
+            for i in range(120):
+                log.append({'url': f'https://www.spitogatos.gr/en/property/{1117000000 + i}',
+                            'price': 150000 + i * 1000, 'validation_flags': ['price_size_complete']})
+
+        resumed = CheckpointLog(log_dir, key_field='url')
+        print(f"Resumed with {len(resumed)} records; duplicate skipped: {not resumed.append({'url': 'https://www.spitogatos.gr/en/property/1117000000'})}")
+        print(f"Compacted into {resumed.compact()}")
+        print(f"Records after compaction: {sum(1 for _ in resumed.records())}")
+
+
+if __name__ == "__main__":
+    main()
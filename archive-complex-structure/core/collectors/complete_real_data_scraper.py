@@ -12,16 +12,22 @@ Requirements:
 """
 
 import asyncio
-import json
 import logging
 import re
+import sys
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from playwright.async_api import async_playwright
-import random
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.extraction_engine import parse_price, parse_sqm, parse_energy_class
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.result_sinks import ResultStream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -121,10 +127,12 @@ class CompleteRealProperty:
 class CompleteRealDataScraper:
     """Scraper focused on extracting ALL required fields with 100% real data"""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[RateScheduler] = None):
         self.complete_properties = []
         self.incomplete_properties = []
         self.failed_extractions = []
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.results = ResultStream('athens_complete_real_data', required_formats=['json', 'csv'])  # Written as properties arrive
         
         # Working URLs from successful test
         self.working_search_urls = [
@@ -165,7 +173,7 @@ class CompleteRealDataScraper:
         logger.info(f"🔍 Enhanced discovery from: {search_url}")
         
         try:
-            await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+            await self.scheduler.goto(page, search_url, wait_until='domcontentloaded', timeout=30000)
             await asyncio.sleep(3)
             
             # Handle cookies
@@ -227,7 +235,7 @@ class CompleteRealDataScraper:
         """Extract complete property data with ALL required fields"""
         
         try:
-            await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+            await self.scheduler.goto(page, url, wait_until='domcontentloaded', timeout=20000)
             await asyncio.sleep(2)
             
             # Get full HTML for comprehensive extraction
@@ -560,39 +568,15 @@ class CompleteRealDataScraper:
     
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from text"""
-        if not price_text:
-            return None
-        
-        clean_text = re.sub(r'[€$£,\s]', '', price_text)
-        match = re.search(r'(\d+(?:\.\d+)?)', clean_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_price(price_text)
     
     def _parse_sqm(self, sqm_text: str) -> Optional[float]:
         """Parse square meters from text"""
-        if not sqm_text:
-            return None
-        
-        match = re.search(r'(\d+(?:\.\d+)?)', sqm_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_sqm(sqm_text)
     
     def _parse_energy_class(self, energy_text: str) -> Optional[str]:
         """Parse energy class from text"""
-        if not energy_text:
-            return None
-        
-        match = re.search(r'([A-G][+]?)', energy_text.upper())
-        if match:
-            energy_class = match.group(1)
-            if self._is_valid_energy_class(energy_class):
-                return energy_class
-        
-        return None
+        return parse_energy_class(energy_text)
     
     def _is_valid_energy_class(self, energy_class: str) -> bool:
         """Validate energy class"""
@@ -642,12 +626,10 @@ class CompleteRealDataScraper:
                     
                     if property_data:
                         complete_properties.append(property_data)
+                        self.results.write(property_data)
                         logger.info(f"✅ COMPLETE #{len(complete_properties)}: {property_data.neighborhood} - €{property_data.price:,} - {property_data.sqm}m² - {property_data.energy_class}")
                     else:
                         incomplete_properties.append(url)
-                    
-                    # Human delay
-                    await asyncio.sleep(random.uniform(2, 4))
                 
                 logger.info(f"📊 Progress: {len(complete_properties)} complete, {len(incomplete_properties)} incomplete")
                 
@@ -668,28 +650,13 @@ class CompleteRealDataScraper:
             logger.warning("No complete properties to save")
             return None
         
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save complete data
-        properties_data = [asdict(prop) for prop in properties]
-        
-        json_file = output_path / f'athens_complete_real_data_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(properties_data, f, indent=2, ensure_ascii=False)
-        
-        # Create summary CSV with required fields
-        csv_file = output_path / f'athens_complete_summary_{timestamp}.csv'
-        with open(csv_file, 'w', encoding='utf-8') as f:
-            f.write("URL,Price,SQM,Energy_Class,Price_per_SQM,Neighborhood,Title\n")
-            for prop in properties:
-                f.write(f'"{prop.url}",{prop.price},{prop.sqm},"{prop.energy_class}",{prop.price_per_sqm:.0f},"{prop.neighborhood}","{prop.title[:50]}..."\n')
+        # Properties were streamed to the configured sinks during scraping; close them out
+        output_files = self.results.finish(properties, output_dir)
+        json_file, csv_file = output_files['json'], output_files['csv']
         
         logger.info(f"💾 Complete results saved:")
-        logger.info(f"   JSON: {json_file}")
-        logger.info(f"   CSV: {csv_file}")
+        for format_name, path in output_files.items():
+            logger.info(f"   {format_name.upper()}: {path}")
         
         # Show statistics
         prices = [p.price for p in properties]
@@ -703,7 +670,7 @@ class CompleteRealDataScraper:
         logger.info(f"   Energy classes: {set(energy_classes)}")
         logger.info(f"   Avg price/m²: €{sum(p.price_per_sqm for p in properties)/len(properties):.0f}")
         
-        return str(json_file), str(csv_file)
+        return json_file, csv_file
 
 # Main execution function
 async def extract_complete_athens_data():
@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+"""
+🗂️ Data Catalog - Indexed Manifest of Dataset Files
+
+Replaces glob-stat-and-load scans of data/processed, data/raw and reports:
+- SQLite manifest of every dataset file: kind, source, format, layout, schema, row count,
+  data timestamp, scraped_at range, size, mtime and SHA-256 checksum
+- Per-file property index (property_id / url → file and row), so single listings are
+  found without opening every file
+- Writers register their files as they close them (ResultStream does so automatically);
+  refresh() stat-scans directories and only parses files that are new or changed
+- Query API: latest dataset by kind, datasets by date range, properties by id or URL,
+  and load() with a small checksum-keyed cache for repeated reads
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PLATFORM_CONFIG_PATH = PROJECT_ROOT / 'config' / 'platform_config.json'
+
+DEFAULT_CATALOG_CONFIG = {
+    'db_path': 'data/catalog.db',
+    'directories': ['data/processed', 'data/raw', 'reports'],
+    'patterns': ['*.json', '*.ndjson', '*.csv', '*.parquet'],
+    'register_writes': True,    # ResultStream registers the files it writes into the catalog directories
+    'load_cache_size': 4,       # Parsed files kept in memory by load()
+}
+
+FORMATS = {'.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv', '.parquet': 'parquet'}
+
+# Preferred format when the same dataset was written in several (typed formats first)
+FORMAT_PREFERENCE = ('json', 'ndjson', 'parquet', 'csv')
+
+PROPERTY_FIELDS = ('price', 'sqm', 'title', 'url')
+RECORD_TIME_FIELDS = ('scraped_at', 'timestamp', 'collected_at')
+
+# Trailing _YYYYMMDD[_HHMMSS] stamps (some consolidated files carry two)
+FILE_TIMESTAMP = re.compile(r'(?:_(\d{8})(?:_(\d{6}))?)+$')
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    kind TEXT,
+    source TEXT,
+    format TEXT,
+    structure TEXT,
+    record_count INTEGER,
+    schema TEXT,
+    data_timestamp TEXT,
+    first_record_at TEXT,
+    last_record_at TEXT,
+    size_bytes INTEGER,
+    mtime REAL,
+    checksum TEXT,
+    registered_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_datasets_kind ON datasets (kind, data_timestamp);
+CREATE INDEX IF NOT EXISTS idx_datasets_timestamp ON datasets (data_timestamp);
+CREATE INDEX IF NOT EXISTS idx_datasets_checksum ON datasets (checksum);
+CREATE TABLE IF NOT EXISTS dataset_properties (
+    property_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    url TEXT,
+    byte_offset INTEGER,
+    PRIMARY KEY (property_id, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_dataset_properties_path ON dataset_properties (path);
+CREATE INDEX IF NOT EXISTS idx_dataset_properties_url ON dataset_properties (url);
+"""
+
+
+def load_catalog_config(config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> Dict:
+    """Catalog settings from the "data_catalog" section of the platform config, over the defaults"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f).get('data_catalog', {})
+    except FileNotFoundError:
+        overrides = {}
+    return {**DEFAULT_CATALOG_CONFIG, **overrides}
+
+
+def in_catalog_directories(path: Union[str, Path], directories: Iterable[Union[str, Path]],
+                           root: Union[str, Path] = PROJECT_ROOT) -> bool:
+    """Whether a path lies inside one of the catalog directories (relative ones are under root)"""
+    resolved = Path(path).resolve()
+    for directory in directories:
+        directory = Path(directory)
+        directory = (directory if directory.is_absolute() else Path(root) / directory).resolve()
+        if resolved == directory or directory in resolved.parents:
+            return True
+    return False
+
+
+def dataset_kind(path: Union[str, Path]) -> str:
+    """File stem without its timestamp suffix (athens_large_scale_real_data_20250805_120000.json → athens_large_scale_real_data)"""
+    return FILE_TIMESTAMP.sub('', Path(path).stem) or Path(path).stem
+
+
+def dataset_timestamp(path: Union[str, Path], mtime: Optional[float] = None) -> str:
+    """Collection time from the file name stamp, else the file's mtime"""
+    match = FILE_TIMESTAMP.search(Path(path).stem)
+    if match:
+        stamps = re.findall(r'_(\d{8})(?:_(\d{6}))?', match.group(0))
+        date, time_of_day = stamps[-1]
+        try:
+            return datetime.strptime(date + (time_of_day or '000000'), '%Y%m%d%H%M%S').isoformat()
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(mtime if mtime is not None else Path(path).stat().st_mtime).isoformat()
+
+
+def extract_records(data: Any) -> Tuple[List[Dict], str]:
+    """Property records and layout name of a parsed JSON document (same layouts the analysis scripts accept)"""
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)], 'list'
+    if isinstance(data, dict):
+        if isinstance(data.get('properties'), list):
+            return [item for item in data['properties'] if isinstance(item, dict)], 'object_with_properties'
+        if 'data' in data:
+            items = data['data'] if isinstance(data['data'], list) else [data['data']]
+            return [item for item in items if isinstance(item, dict)], 'object_with_data'
+        if any(key in data for key in PROPERTY_FIELDS):
+            return [data], 'single_property'
+        return [], 'metadata_only'
+    return [], 'unknown'
+
+
+def file_checksum(path: Union[str, Path], block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class DatasetEntry:
+    """One cataloged dataset file"""
+    path: str
+    name: str
+    kind: str
+    source: Optional[str]
+    format: str
+    structure: str
+    record_count: int
+    schema: Dict[str, List[str]]
+    data_timestamp: str
+    first_record_at: Optional[str]
+    last_record_at: Optional[str]
+    size_bytes: int
+    mtime: float
+    checksum: str
+    registered_at: str
+
+
+class DatasetIndexer:
+    """
+    Accumulates catalog metadata record by record.
+
+    Writers feed it each record as they write it, so registering the file
+    afterwards needs no re-read; refresh() feeds it while parsing unknown files.
+    """
+
+    def __init__(self):
+        self.record_count = 0
+        self.schema: Dict[str, set] = {}
+        self.sources = Counter()
+        self.first_record_at: Optional[str] = None
+        self.last_record_at: Optional[str] = None
+        self.properties: List[Tuple[str, int, Optional[str], Optional[int]]] = []
+
+    def add(self, record: Dict[str, Any], byte_offset: Optional[int] = None):
+        row = self.record_count
+        self.record_count += 1
+        for name, value in record.items():
+            self.schema.setdefault(name, set()).add(type(value).__name__)
+
+        source = record.get('source')
+        if source:
+            self.sources[str(source)] += 1
+        for name in RECORD_TIME_FIELDS:
+            value = record.get(name)
+            if isinstance(value, str) and value:
+                if self.first_record_at is None or value < self.first_record_at:
+                    self.first_record_at = value
+                if self.last_record_at is None or value > self.last_record_at:
+                    self.last_record_at = value
+                break
+
+        url = record.get('url')
+        property_id = record.get('property_id') or record.get('id') or url
+        if property_id not in (None, ''):
+            self.properties.append((str(property_id), row, str(url) if url else None, byte_offset))
+
+    def add_many(self, records: Iterable[Dict[str, Any]]):
+        for record in records:
+            self.add(record)
+
+
+class DataCatalog:
+    """SQLite manifest and property index of the project's dataset files"""
+
+    def __init__(self, db_path: Union[str, Path] = 'data/catalog.db', root: Union[str, Path] = PROJECT_ROOT,
+                 load_cache_size: int = 4):
+        """
+        Args:
+            db_path: Catalog database (relative paths are under root)
+            root: Project root; files below it are stored with relative paths
+            load_cache_size: Parsed files kept in memory by load()
+        """
+        self.root = Path(root).resolve()
+        db_path = Path(db_path)
+        self.db_path = str(db_path if db_path.is_absolute() or str(db_path) == ':memory:' else self.root / db_path)
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.load_cache_size = load_cache_size
+        self._load_cache: 'OrderedDict[Tuple[str, str], List[Dict]]' = OrderedDict()
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(CATALOG_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> 'DataCatalog':
+        config = load_catalog_config(config_path)
+        return cls(config['db_path'], load_cache_size=config['load_cache_size'])
+
+    def _key(self, path: Union[str, Path]) -> str:
+        """Catalog key: path relative to the project root when inside it"""
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def _path(self, key: str) -> Path:
+        path = Path(key)
+        return path if path.is_absolute() else self.root / path
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, path: Union[str, Path], indexer: Optional[DatasetIndexer] = None,
+                 kind: Optional[str] = None, source: Optional[str] = None,
+                 structure: Optional[str] = None) -> DatasetEntry:
+        """
+        Add or update one file in the catalog.
+
+        Args:
+            path: Dataset file
+            indexer: Metadata collected while the file was written (parsed from the file when omitted)
+            kind: Dataset kind (defaults to the file stem without its timestamp)
+            source: Data source (defaults to the most common record "source")
+            structure: Document layout when an indexer is given (defaults to "list")
+
+        Returns:
+            DatasetEntry: Stored catalog entry
+        """
+        path = Path(path)
+        stat = path.stat()
+        format_name = FORMATS.get(path.suffix.lower(), path.suffix.lower().lstrip('.'))
+        if indexer is None:
+            indexer, structure = self._index_file(path, format_name)
+        structure = structure or 'list'
+
+        key = self._key(path)
+        entry = DatasetEntry(
+            path=str(self._path(key)),
+            name=path.name,
+            kind=kind or dataset_kind(path),
+            source=source or (indexer.sources.most_common(1)[0][0] if indexer.sources else None),
+            format=format_name,
+            structure=structure,
+            record_count=indexer.record_count,
+            schema={name: sorted(types) for name, types in sorted(indexer.schema.items())},
+            data_timestamp=dataset_timestamp(path, stat.st_mtime),
+            first_record_at=indexer.first_record_at,
+            last_record_at=indexer.last_record_at,
+            size_bytes=stat.st_size,
+            mtime=stat.st_mtime,
+            checksum=file_checksum(path),
+            registered_at=datetime.now().isoformat(),
+        )
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO datasets (path, name, kind, source, format, structure, record_count, '
+                    'schema, data_timestamp, first_record_at, last_record_at, size_bytes, mtime, checksum, '
+                    'registered_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (key, entry.name, entry.kind, entry.source, entry.format, entry.structure,
+                     entry.record_count, json.dumps(entry.schema), entry.data_timestamp, entry.first_record_at,
+                     entry.last_record_at, entry.size_bytes, entry.mtime, entry.checksum, entry.registered_at)
+                )
+                self._connection.execute('DELETE FROM dataset_properties WHERE path = ?', (key,))
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO dataset_properties (property_id, path, row_number, url, byte_offset) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    ((property_id, key, row, url, offset) for property_id, row, url, offset in indexer.properties)
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        logger.debug(f"🗂️ Cataloged {key}: {entry.record_count} records ({entry.structure})")
+        return entry
+
+    def refresh(self, directories: Optional[Iterable[Union[str, Path]]] = None,
+                patterns: Iterable[str] = DEFAULT_CATALOG_CONFIG['patterns']) -> Dict[str, int]:
+        """
+        Bring the catalog up to date with the given directories.
+
+        Files are only stat-ed; new files and files whose size or mtime changed
+        are parsed and re-registered, and cataloged files that disappeared are dropped.
+
+        Args:
+            directories: Directories to scan (relative ones are under the project root)
+            patterns: File name patterns to catalog
+
+        Returns:
+            Dict[str, int]: Counts of added, updated, unchanged, removed and failed files
+        """
+        directories = [self._path(str(d)) for d in (directories or DEFAULT_CATALOG_CONFIG['directories'])]
+        patterns = list(patterns)
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+
+        for directory in directories:
+            if not directory.exists():
+                continue
+            prefix = self._key(directory)
+            with self._lock:
+                known = {row['path']: (row['size_bytes'], row['mtime']) for row in self._connection.execute(
+                    "SELECT path, size_bytes, mtime FROM datasets WHERE path LIKE ? ESCAPE '\\'",
+                    (_like_prefix(prefix),)
+                )}
+
+            present = set()
+            for pattern in patterns:
+                for path in directory.glob(pattern):
+                    if not path.is_file():
+                        continue
+                    key = self._key(path)
+                    present.add(key)
+                    stat = path.stat()
+                    if known.get(key) == (stat.st_size, stat.st_mtime):
+                        counts['unchanged'] += 1
+                        continue
+                    try:
+                        self.register(path)
+                        counts['updated' if key in known else 'added'] += 1
+                    except Exception as e:
+                        counts['failed'] += 1
+                        logger.warning(f"⚠️ Could not catalog {path}: {e}")
+
+            # Only direct children matching the patterns were scanned; other cataloged files are left alone
+            removed = [key for key in known if key not in present and '/' not in key[len(prefix) + 1:]
+                       and any(fnmatch(key.rsplit('/', 1)[-1], pattern) for pattern in patterns)]
+            if removed:
+                self._remove_keys(removed)
+                counts['removed'] += len(removed)
+
+        if counts['added'] or counts['updated'] or counts['removed']:
+            logger.info(f"🗂️ Catalog refreshed: {counts['added']} added, {counts['updated']} updated, "
+                        f"{counts['removed']} removed, {counts['unchanged']} unchanged")
+        return counts
+
+    def remove(self, paths: Iterable[Union[str, Path]]):
+        self._remove_keys([self._key(path) for path in paths])
+
+    def _remove_keys(self, keys: List[str]):
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany('DELETE FROM dataset_properties WHERE path = ?', ((k,) for k in keys))
+                self._connection.executemany('DELETE FROM datasets WHERE path = ?', ((k,) for k in keys))
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def _index_file(self, path: Path, format_name: str) -> Tuple[DatasetIndexer, str]:
+        """Parse a file once to build its catalog metadata"""
+        indexer = DatasetIndexer()
+        if format_name == 'ndjson':
+            with open(path, 'rb') as handle:
+                offset = 0
+                for line in handle:
+                    if line.strip():
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            record = None
+                        if isinstance(record, dict):
+                            indexer.add(record, byte_offset=offset)
+                    offset += len(line)
+            return indexer, 'ndjson'
+        if format_name == 'csv':
+            with open(path, newline='', encoding='utf-8') as handle:
+                indexer.add_many(csv.DictReader(handle))
+            return indexer, 'csv'
+        if format_name == 'parquet':
+            if not PYARROW_AVAILABLE:
+                raise RuntimeError("pyarrow not installed")
+            indexer.add_many(pq.read_table(path).to_pylist())
+            return indexer, 'parquet'
+
+        with open(path, 'r', encoding='utf-8') as handle:
+            records, structure = extract_records(json.load(handle))
+        indexer.add_many(records)
+        return indexer, structure
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def datasets(self, kind: Optional[str] = None, source: Optional[str] = None, since: Optional[Any] = None,
+                 until: Optional[Any] = None, formats: Optional[Iterable[str]] = None,
+                 directory: Optional[Union[str, Path]] = None, with_records: Optional[bool] = None,
+                 name_like: Optional[str] = None) -> List[DatasetEntry]:
+        """
+        Cataloged files, oldest data first.
+
+        Args:
+            kind: Dataset kind (file stem without timestamp)
+            source: Data source
+            since: Earliest data timestamp (datetime or ISO string)
+            until: Latest data timestamp (datetime or ISO string)
+            formats: Formats to include (json, ndjson, csv, parquet)
+            directory: Only files directly in this directory
+            with_records: True for files holding property records, False for reports/metadata only
+            name_like: SQL LIKE pattern on the file name
+
+        Returns:
+            List[DatasetEntry]: Matching entries
+        """
+        clauses, params = [], []
+        if kind is not None:
+            clauses.append('kind = ?')
+            params.append(kind)
+        if source is not None:
+            clauses.append('source = ?')
+            params.append(source)
+        if since is not None:
+            clauses.append('data_timestamp >= ?')
+            params.append(since.isoformat() if isinstance(since, datetime) else str(since))
+        if until is not None:
+            clauses.append('data_timestamp <= ?')
+            params.append(until.isoformat() if isinstance(until, datetime) else str(until))
+        if formats is not None:
+            formats = list(formats)
+            clauses.append(f"format IN ({', '.join('?' * len(formats))})")
+            params.extend(formats)
+        if directory is not None:
+            prefix = self._key(self._path(str(directory)))
+            clauses.append("path LIKE ? ESCAPE '\\' AND instr(substr(path, ?), '/') = 0")
+            params.extend([_like_prefix(prefix), len(prefix) + 2])
+        if with_records is not None:
+            clauses.append('record_count > 0' if with_records else 'record_count = 0')
+        if name_like is not None:
+            clauses.append('name LIKE ?')
+            params.append(name_like)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT * FROM datasets {where} ORDER BY data_timestamp, mtime, path', params
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def latest(self, kind: Optional[str] = None, **filters) -> Optional[DatasetEntry]:
+        """Most recent existing dataset of a kind (same filters as datasets()); deleted files are dropped"""
+        entries = sorted(self.datasets(kind=kind, **filters), key=lambda entry: (entry.data_timestamp, entry.mtime))
+        missing = []
+        while entries and not Path(entries[-1].path).exists():
+            missing.append(entries.pop().path)
+        if missing:
+            self.remove(missing)
+        return entries[-1] if entries else None
+
+    def get(self, path: Union[str, Path]) -> Optional[DatasetEntry]:
+        with self._lock:
+            row = self._connection.execute('SELECT * FROM datasets WHERE path = ?', (self._key(path),)).fetchone()
+        return self._entry(row) if row else None
+
+    def kinds(self) -> Dict[str, int]:
+        """Dataset kinds with their file counts"""
+        with self._lock:
+            rows = self._connection.execute('SELECT kind, COUNT(*) FROM datasets GROUP BY kind ORDER BY kind')
+            return {kind: count for kind, count in rows}
+
+    def find_property(self, property_id: Optional[str] = None, url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Files and rows holding a property, newest data first"""
+        column, value = ('property_id', property_id) if property_id is not None else ('url', url)
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT p.property_id, p.path, p.row_number, p.url, p.byte_offset, d.format, d.data_timestamp '
+                f'FROM dataset_properties p JOIN datasets d ON d.path = p.path WHERE p.{column} = ? '
+                f'ORDER BY d.data_timestamp DESC', (str(value),)
+            ).fetchall()
+        return [{**dict(row), 'path': str(self._path(row['path']))} for row in rows]
+
+    def get_property(self, property_id: Optional[str] = None, url: Optional[str] = None) -> Optional[Dict]:
+        """Latest record of a property, read with a seek when an NDJSON copy is indexed"""
+        locations = self.find_property(property_id, url)
+        if not locations:
+            return None
+        newest = locations[0]['data_timestamp']
+        candidates = [location for location in locations if location['data_timestamp'] == newest]
+        candidates.sort(key=lambda location: location['byte_offset'] is None)
+
+        location = candidates[0]
+        if location['byte_offset'] is not None:
+            with open(location['path'], 'rb') as handle:
+                handle.seek(location['byte_offset'])
+                return json.loads(handle.readline())
+        records = self.load(location['path'])
+        return records[location['row_number']] if location['row_number'] < len(records) else None
+
+    def property_ids(self, path: Union[str, Path]) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT property_id FROM dataset_properties WHERE path = ? ORDER BY row_number', (self._key(path),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def unique_datasets(self, entries: Iterable[DatasetEntry]) -> List[DatasetEntry]:
+        """
+        One entry per distinct content: byte-identical copies and other-format
+        copies of the same dataset (same directory and stem) are dropped.
+        """
+        best: Dict[str, DatasetEntry] = {}
+        order: List[str] = []
+        for entry in entries:
+            group = str(Path(entry.path).with_suffix(''))
+            current = best.get(group)
+            if current is None:
+                order.append(group)
+                best[group] = entry
+            elif _format_rank(entry.format) < _format_rank(current.format):
+                best[group] = entry
+
+        unique, checksums = [], set()
+        for group in order:
+            entry = best[group]
+            if entry.checksum in checksums:
+                continue
+            checksums.add(entry.checksum)
+            unique.append(entry)
+        return unique
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self, dataset: Union[DatasetEntry, str, Path]) -> List[Dict]:
+        """
+        Property records of a cataloged file, parsed once per checksum.
+
+        The returned list is shared with the cache; copy it before mutating records.
+        """
+        entry = dataset if isinstance(dataset, DatasetEntry) else self.get(dataset)
+        if entry is None:
+            entry = self.register(self._path(str(dataset)))
+
+        cache_key = (entry.path, entry.checksum)
+        with self._lock:
+            if cache_key in self._load_cache:
+                self._load_cache.move_to_end(cache_key)
+                return self._load_cache[cache_key]
+
+        records = list(self.iter_records(entry))
+        with self._lock:
+            self._load_cache[cache_key] = records
+            while len(self._load_cache) > self.load_cache_size:
+                self._load_cache.popitem(last=False)
+        return records
+
+    def iter_records(self, entry: DatasetEntry) -> Iterator[Dict]:
+        """Stream a dataset's records without caching"""
+        path = Path(entry.path)
+        if entry.format == 'ndjson':
+            with open(path, 'r', encoding='utf-8') as handle:
+                for line in handle:
+                    if line.strip():
+                        record = json.loads(line)
+                        if isinstance(record, dict):
+                            yield record
+        elif entry.format == 'csv':
+            with open(path, newline='', encoding='utf-8') as handle:
+                yield from csv.DictReader(handle)
+        elif entry.format == 'parquet':
+            yield from pq.read_table(path).to_pylist()
+        else:
+            with open(path, 'r', encoding='utf-8') as handle:
+                yield from extract_records(json.load(handle))[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(record_count), 0), COALESCE(SUM(size_bytes), 0) FROM datasets'
+            ).fetchone()
+            indexed = self._connection.execute('SELECT COUNT(DISTINCT property_id) FROM dataset_properties').fetchone()
+        return {'datasets': row[0], 'records': row[1], 'size_mb': row[2] / (1024 * 1024),
+                'distinct_properties': indexed[0], 'kinds': len(self.kinds())}
+
+    def _entry(self, row: sqlite3.Row) -> DatasetEntry:
+        values = dict(row)
+        values['schema'] = json.loads(values['schema'] or '{}')
+        values['path'] = str(self._path(values['path']))
+        return DatasetEntry(**values)
+
+    def close(self):
+        with self._lock:
+            self._load_cache.clear()
+            self._connection.close()
+
+
+def _like_prefix(prefix: str) -> str:
+    escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"{escaped}/%"
+
+
+def _format_rank(format_name: str) -> int:
+    return FORMAT_PREFERENCE.index(format_name) if format_name in FORMAT_PREFERENCE else len(FORMAT_PREFERENCE)
+
+
+_DEFAULT_CATALOG: Optional[DataCatalog] = None
+
+
+def get_data_catalog() -> DataCatalog:
+    """Process-wide catalog configured from config/platform_config.json"""
+    global _DEFAULT_CATALOG
+    if _DEFAULT_CATALOG is None:
+        _DEFAULT_CATALOG = DataCatalog.from_config()
+    return _DEFAULT_CATALOG
+
+
+def main():
+    """Example: catalog the project's dataset directories and run a few queries"""
+    logging.basicConfig(level=logging.INFO)
+    catalog = DataCatalog.from_config()
+    directories = load_catalog_config()['directories'] + ['realdata', 'realdata/datasets']
+    print(f"Refresh: {catalog.refresh(directories)}")
+    print(f"Stats:   {catalog.stats()}")
+
+    for kind, count in list(catalog.kinds().items())[:10]:
+        latest = catalog.latest(kind)
+        print(f"  {kind:55} {count:>3} files, latest {latest.name} ({latest.record_count} records)")
+
+    datasets = catalog.datasets(with_records=True)
+    property_ids = next((ids for ids in (catalog.property_ids(dataset.path) for dataset in reversed(datasets)) if ids),
+                        [])
+    if property_ids:
+        property_id = property_ids[0]
+        print(f"{property_id} is in {len(catalog.find_property(property_id))} files")
+        print(json.dumps(catalog.get_property(property_id), indent=2, ensure_ascii=False, default=str)[:400])
+    catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+🧬 Property Extraction Engine - Shared Compiled Field Extraction
+
+One extraction path for every scraper instead of per-scraper regex lists:
+- All field patterns precompiled once, combined into one scanner per context
+- HTML parsed once with lxml (C-backed), regex tag stripping when unavailable
+- Title, price, sqm, energy class, rooms and description pulled in one DOM traversal
+- Per-field confidence from the evidence each value came from
+- Micro-benchmark over archived pages against the sequential per-scraper passes
+"""
+
+import argparse
+import logging
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+VALID_ENERGY_CLASSES = ('A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G')
+CORE_FIELDS = ('price', 'sqm', 'energy_class')
+
+# Evidence confidence: labelled DOM element > structured script data > page title > body text
+DOM_HINT_CONFIDENCE = 0.95
+TITLE_CONFIDENCE = 0.9
+
+# Amounts like 250,000 / 250.000 / 1.250.000 / 250000; never a price per m²
+_AMOUNT = r'(\d{1,3}(?:[.,]\d{3})+|\d{4,})(?!\s*/\s*(?:m²|m2|τ\.?μ))'
+_AREA = r'(\d+(?:[.,]\d+)?)'
+_AREA_UNIT = r'\s*(?:m²|m2\b|sq\.?\s*m\b|sqm\b|τ\.μ\.|τμ\b|μ²)'
+_ENERGY_CLASS = r'((?-i:[A-G])\+?)(?![\w+])'
+
+# (field, confidence, pattern) in priority order; value is the first group (or whole match)
+TEXT_PATTERNS: List[Tuple[str, float, str]] = [
+    ('price', 0.85, r'€\s*' + _AMOUNT),
+    ('price', 0.85, _AMOUNT + r'\s*€'),
+    ('price', 0.75, r'(?:price|τιμή)\s*:?\s*€?\s*' + _AMOUNT),
+    ('sqm', 0.8, _AREA + _AREA_UNIT),
+    ('sqm', 0.6, r'(?:area|εμβαδόν)\s*:?\s*' + _AREA),
+    ('energy_class', 0.85, r'(?:energy\s*(?:class|rating|category)?|ενεργειακή\s*(?:κλάση|κατηγορία)?)\s*[:\-]?\s*' + _ENERGY_CLASS),
+    ('energy_class', 0.55, r'(?:class|κλάση|κατηγορία)\s*[:\-]?\s*' + _ENERGY_CLASS),
+    ('rooms', 0.75, r'(\d{1,2})\s*(?:bedrooms?|υπνοδωμάτι)'),
+    ('rooms', 0.6, r'(\d{1,2})\s*rooms?\b'),
+    ('rooms', 0.6, r'rooms?\s*:?\s*(\d{1,2})\b'),
+    ('description', 0.5, r'Make this property yours with a mortgage[^\n]{0,160}'),
+    ('description', 0.5, r'Compare & save up to[^\n]{0,180}'),
+]
+
+# Characters a body/title text match can start with; lets the scanner skip most positions
+TEXT_LEAD = r'(?=[€\dpτaεecκrm])'
+
+# Patterns over inline script / JSON-LD data, each following the opening quote of a known JSON key
+STRUCTURED_LEAD = r'"(?=price"|floorSize"|sqm"|area"|size"|energy|rooms"|numberOfRooms"|bedrooms")'
+STRUCTURED_PATTERNS: List[Tuple[str, float, str]] = [
+    ('price', 0.9, r'price"\s*:\s*"?(\d+(?:\.\d+)?)'),
+    ('sqm', 0.9, r'floorSize"\s*:\s*\{[^}]*?"value"\s*:\s*"?' + _AREA),
+    ('sqm', 0.85, r'(?:sqm|area|size)"\s*:\s*"?' + _AREA),
+    ('energy_class', 0.9, r'energy_?(?:class|Class)?"\s*:\s*"' + _ENERGY_CLASS),
+    ('rooms', 0.85, r'(?:rooms|numberOfRooms|bedrooms)"\s*:\s*"?(\d{1,2})\b'),
+]
+
+# Title text (sqm and rooms are stated in Spitogatos listing titles)
+TITLE_PATTERNS: List[Tuple[str, float, str]] = [
+    ('sqm', TITLE_CONFIDENCE, _AREA + _AREA_UNIT),
+    ('rooms', 0.8, r'(\d{1,2})\s*(?:bedrooms?|rooms?|BR\b)'),
+]
+
+# data-testid / class fragments marking the element that holds a field
+DOM_HINT_PATTERN = re.compile(
+    r'(?P<price>price)|(?P<sqm>\barea\b|sqm|surface)|(?P<energy_class>energy)|(?P<rooms>\brooms?\b|bedroom)',
+    re.IGNORECASE
+)
+MAX_HINTED_ELEMENTS = 40
+
+THOUSANDS_SEPARATOR = re.compile(r'[.,](?=\d{3}(?!\d))')
+NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+SKIPPED_TAGS = frozenset(['script', 'style', 'noscript', 'template'])
+
+
+class _CompiledScanner:
+    """Several field patterns compiled into one alternation, scanned in a single pass"""
+
+    def __init__(self, patterns: List[Tuple[str, float, str]], lead: str = '', flags: int = re.IGNORECASE):
+        # lead: fragment every match starts with, so the alternation is only tried where it can match
+        self.alternatives = {}  # outer group name -> (field, confidence, value group)
+        parts = []
+        group_index = 1
+
+        for i, (field_name, confidence, pattern) in enumerate(patterns):
+            name = f'p{i}'
+            inner_groups = re.compile(pattern, flags).groups
+            value_group = group_index + 1 if inner_groups else group_index
+            self.alternatives[name] = (field_name, confidence, value_group)
+            parts.append(f'(?P<{name}>{pattern})')
+            group_index += 1 + inner_groups
+
+        self.regex = re.compile(lead + '(?:' + '|'.join(parts) + ')', flags)
+
+    def scan(self, text: str) -> Iterator[Tuple[str, float, str]]:
+        """(field, confidence, raw value) for every match in document order"""
+        for match in self.regex.finditer(text):
+            field_name, confidence, value_group = self.alternatives[match.lastgroup]
+            yield field_name, confidence, match.group(value_group)
+
+
+TEXT_SCANNER = _CompiledScanner(TEXT_PATTERNS, lead=TEXT_LEAD)
+STRUCTURED_SCANNER = _CompiledScanner(STRUCTURED_PATTERNS, lead=STRUCTURED_LEAD, flags=0)
+TITLE_SCANNER = _CompiledScanner(TITLE_PATTERNS, lead=TEXT_LEAD)
+
+
+@dataclass
+class ExtractionResult:
+    """Extracted listing fields with per-field confidence and evidence"""
+    title: str = ""
+    price: Optional[float] = None
+    sqm: Optional[float] = None
+    energy_class: Optional[str] = None
+    rooms: Optional[int] = None
+    description: str = ""
+    confidence: Dict[str, float] = field(default_factory=dict)
+    sources: Dict[str, str] = field(default_factory=dict)    # field -> dom / structured / title / text
+
+    @property
+    def price_per_sqm(self) -> Optional[float]:
+        if self.price and self.sqm and self.sqm > 0:
+            return self.price / self.sqm
+        return None
+
+    @property
+    def overall_confidence(self) -> float:
+        """Mean confidence over price, sqm and energy class (missing fields count as 0)"""
+        return round(sum(self.confidence.get(name, 0.0) for name in CORE_FIELDS) / len(CORE_FIELDS), 3)
+
+    def is_complete(self) -> bool:
+        return all(getattr(self, name) is not None for name in CORE_FIELDS)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['price_per_sqm'] = self.price_per_sqm
+        data['overall_confidence'] = self.overall_confidence
+        return data
+
+
+class PropertyExtractor:
+    """Single-pass listing field extractor shared by all scrapers"""
+
+    def __init__(self, price_range: Tuple[float, float] = (1000, 50_000_000),
+                 sqm_range: Tuple[float, float] = (10, 10_000), rooms_range: Tuple[int, int] = (1, 30)):
+        self.price_range = price_range
+        self.sqm_range = sqm_range
+        self.rooms_range = rooms_range
+        self._last = (None, None, None)  # (html, title, result) - fallback chains re-extract the same page
+
+    def extract(self, html: str, title: Optional[str] = None) -> ExtractionResult:
+        """
+        Extract every listing field from one page.
+
+        Args:
+            html: Page HTML
+            title: Live page title when the caller already has it
+
+        Returns:
+            ExtractionResult: Best value per field with its confidence
+        """
+        if self._last[0] is html and self._last[1] == title:
+            return self._last[2]
+
+        document = _parse_document(html)
+        result = ExtractionResult()
+        best: Dict[str, Tuple[float, object, str]] = {}
+
+        # Title: live page title, then <title>, then the first <h1>
+        for candidate in (title, document['title'], document['h1']):
+            if candidate and len(candidate.strip()) > 10:
+                result.title = candidate.strip()
+                break
+        else:
+            result.title = (document['title'] or document['h1'] or '').strip()
+
+        for field_name, text in document['hinted']:
+            self._offer_hinted(best, field_name, text)
+        for field_name, confidence, raw in TITLE_SCANNER.scan(result.title):
+            self._offer(best, field_name, confidence, raw, 'title')
+        for field_name, confidence, raw in STRUCTURED_SCANNER.scan(document['scripts']):
+            self._offer(best, field_name, confidence, raw, 'structured')
+        for field_name, confidence, raw in TEXT_SCANNER.scan(document['text']):
+            self._offer(best, field_name, confidence, raw, 'text')
+
+        for field_name, (confidence, value, source) in best.items():
+            setattr(result, field_name, value)
+            result.confidence[field_name] = confidence
+            result.sources[field_name] = source
+
+        self._last = (html, title, result)
+        return result
+
+    def _offer_hinted(self, best: Dict, field_name: str, text: str):
+        """Labelled element text: parse with the field's own patterns, then as a bare value"""
+        for scanned_field, _, raw in TEXT_SCANNER.scan(text):
+            if scanned_field == field_name and self._offer(best, field_name, DOM_HINT_CONFIDENCE, raw, 'dom'):
+                return
+        bare_parser = BARE_VALUE_PARSERS.get(field_name)
+        if bare_parser and len(text) <= 40 and '/' not in text:
+            value = bare_parser(text)
+            if value is not None:
+                self._offer(best, field_name, DOM_HINT_CONFIDENCE, value, 'dom')
+
+    def _offer(self, best: Dict, field_name: str, confidence: float, raw, source: str) -> bool:
+        """Keep a candidate when it is valid and beats the current evidence (earliest wins ties)"""
+        current = best.get(field_name)
+        if current is not None and current[0] >= confidence:
+            return False
+
+        value = self._normalize(field_name, raw)
+        if value is None:
+            return False
+
+        best[field_name] = (confidence, value, source)
+        return True
+
+    def _normalize(self, field_name: str, raw):
+        if field_name == 'price':
+            value = raw if isinstance(raw, float) else _to_number(raw)
+            return value if value is not None and self.price_range[0] <= value <= self.price_range[1] else None
+        if field_name == 'sqm':
+            value = raw if isinstance(raw, float) else _to_number(raw)
+            return value if value is not None and self.sqm_range[0] <= value <= self.sqm_range[1] else None
+        if field_name == 'rooms':
+            value = int(raw)
+            return value if self.rooms_range[0] <= value <= self.rooms_range[1] else None
+        if field_name == 'energy_class':
+            value = raw.upper()
+            return value if value in VALID_ENERGY_CLASSES else None
+        if field_name == 'description':
+            return ' '.join(raw.split())[:200]
+        return None
+
+
+def _to_number(raw: str) -> Optional[float]:
+    """Number from listing text; ',' and '.' followed by three digits are thousands separators"""
+    try:
+        return float(THOUSANDS_SEPARATOR.sub('', raw.strip()).replace(',', '.'))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _parse_document(html: str) -> Dict:
+    """Title, first h1, script text, visible text and labelled elements from one traversal"""
+    if LXML_AVAILABLE and html:
+        try:
+            return _traverse_lxml(lxml.html.document_fromstring(html))
+        except (ValueError, etree.ParserError):
+            try:
+                return _traverse_lxml(lxml.html.document_fromstring(html.encode('utf-8')))
+            except (ValueError, etree.ParserError):
+                pass
+    return _parse_with_regex(html or '')
+
+
+def _traverse_lxml(root) -> Dict:
+    title = h1 = None
+    scripts, text, hinted = [], [], []
+
+    for element in root.iter():
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions: only their tail is page text
+            if element.tail:
+                text.append(element.tail)
+            continue
+
+        if tag in SKIPPED_TAGS:
+            if tag == 'script' and element.text:
+                scripts.append(element.text)
+        else:
+            if element.text:
+                text.append(element.text)
+            if tag == 'title' and title is None:
+                title = element.text_content()
+            elif tag == 'h1' and h1 is None:
+                h1 = element.text_content()
+
+            if len(hinted) < MAX_HINTED_ELEMENTS:
+                labels = f"{element.get('data-testid', '')} {element.get('class', '')}"
+                hint = DOM_HINT_PATTERN.search(labels) if labels.strip() else None
+                if hint:
+                    hinted.append((hint.lastgroup, element.text_content()))
+
+        if element.tail:
+            text.append(element.tail)
+
+    return {'title': title, 'h1': h1, 'scripts': '\n'.join(scripts), 'text': '\n'.join(text), 'hinted': hinted}
+
+
+HTML_TITLE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+HTML_H1 = re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE | re.DOTALL)
+HTML_SCRIPT = re.compile(r'<(script|style|noscript|template)\b[^>]*>(.*?)</\1>', re.IGNORECASE | re.DOTALL)
+HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def _parse_with_regex(html: str) -> Dict:
+    """Fallback when lxml is not installed: no labelled-element evidence"""
+    title = HTML_TITLE.search(html)
+    h1 = HTML_H1.search(html)
+    scripts = [match.group(2) for match in HTML_SCRIPT.finditer(html) if match.group(1).lower() == 'script']
+    visible = HTML_TAG.sub('\n', HTML_SCRIPT.sub('\n', html))
+
+    return {
+        'title': HTML_TAG.sub('', title.group(1)) if title else None,
+        'h1': HTML_TAG.sub('', h1.group(1)) if h1 else None,
+        'scripts': '\n'.join(scripts),
+        'text': visible,
+        'hinted': [],
+    }
+
+
+# ----------------------------------------------------------------------
+# Single-value text parsers (selector text from live pages)
+# ----------------------------------------------------------------------
+
+def parse_price(text: str) -> Optional[float]:
+    """Price from element text such as '€250.000' or '250,000 €'"""
+    if not text:
+        return None
+    match = NUMBER_PATTERN.search(text.replace(' ', ''))
+    return _to_number(match.group(0)) if match else None
+
+
+def parse_sqm(text: str) -> Optional[float]:
+    """Area from element text, preferring a number followed by a unit"""
+    if not text:
+        return None
+    match = re.search(_AREA + _AREA_UNIT, text, re.IGNORECASE) or NUMBER_PATTERN.search(text)
+    return _to_number(match.group(1) if match.re.groups else match.group(0)) if match else None
+
+
+def parse_rooms(text: str) -> Optional[int]:
+    """Room count from element text"""
+    if not text:
+        return None
+    match = re.search(r'\d+', text)
+    return int(match.group(0)) if match else None
+
+
+def parse_energy_class(text: str) -> Optional[str]:
+    """Energy class from element text such as 'Energy class: B+'"""
+    if not text:
+        return None
+    match = re.search(r'(?<![A-Z])([A-G]\+?)(?![A-Z])', text.upper().replace('ENERGY', '').replace('CLASS', ''))
+    return match.group(1) if match and match.group(1) in VALID_ENERGY_CLASSES else None
+
+
+BARE_VALUE_PARSERS = {'price': parse_price, 'sqm': parse_sqm, 'rooms': parse_rooms, 'energy_class': parse_energy_class}
+
+
+# ----------------------------------------------------------------------
+# Micro-benchmark
+# ----------------------------------------------------------------------
+
+# Per-field pattern lists the scrapers ran sequentially over the raw HTML before this engine
+LEGACY_PATTERNS = {
+    'price': [r'€\s*([\d,]+)', r'(\d{4,})\s*€', r'"price"\s*:\s*(\d+)', r'€([\d,.]+)', r'price["\s:]*(\d+)'],
+    'sqm': [r'(\d+)\s*m²', r'(\d+)\s*sqm', r'"sqm"\s*:\s*(\d+)', r'area["\s:]*(\d+)'],
+    'energy_class': [r'energy[_\s-]*class["\s:]*([A-G][+]?)', r'energy[_\s-]*([A-G][+]?)', r'class["\s:]*([A-G][+]?)',
+                     r'"energy"[^}]*?"([A-G][+]?)"', r'ενεργειακή["\s:]*([A-G][+]?)', r'κατηγορία["\s:]*([A-G][+]?)'],
+    'rooms': [r'(\d+)\s*bedroom', r'(\d+)\s*room', r'rooms["\s:]*(\d+)'],
+    'description': [r'Make this property yours with a mortgage[^<]*', r'Compare & save up to[^<]*'],
+}
+
+
+def _legacy_extract(html: str) -> Dict:
+    extracted = {}
+    title = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
+    extracted['title'] = title.group(1).strip() if title else ''
+    for field_name, patterns in LEGACY_PATTERNS.items():
+        for pattern in patterns:
+            match = re.search(pattern, html, re.IGNORECASE)
+            if match:
+                extracted[field_name] = match.group(match.re.groups and 1)
+                break
+    return extracted
+
+
+# Listing page shaped like a Spitogatos detail page: small visible body, large inline app state
+SAMPLE_PAGE = """<html><head><title>Apartment 85 m², Kolonaki | Spitogatos</title>
+<script type="application/ld+json">{"@type": "Offer", "price": 285000, "priceCurrency": "EUR"}</script>
+<style>.price { color: red }</style></head><body>
+<h1 data-testid="ad-title">Apartment 85 m², Kolonaki</h1>
+<div class="property-price">€285.000</div><span class="price-per-sqm">€3.353/m²</span>
+<ul><li data-testid="area">85 m²</li><li class="rooms">2 bedrooms</li>
+<li class="energy-class">Energy class: B+</li></ul>
+<p>Make this property yours with a mortgage starting from €1,050/month</p>
+""" + "<div class='similar'><span>Similar listing €199,000 · 60 m²</span></div>\n" * 20 + """<script>
+window.__APP_STATE__ = {"listings": [""" + ",".join(
+    f'{{"id": {1117000000 + i}, "href": "/en/property/{1117000000 + i}", "tracking": "listing_view"}}' for i in range(4000)
+) + "]};\n</script></body></html>"
+
+# Same listing without energy certificate, room count or mortgage teaser (forces full-page passes)
+SPARSE_SAMPLE_PAGE = (SAMPLE_PAGE.replace('<li class="energy-class">Energy class: B+</li>', '')
+                      .replace('<li class="rooms">2 bedrooms</li>', '')
+                      .replace('Make this property yours with a mortgage', 'Financing'))
+
+
+def benchmark(pages: List[str], repeat: int = 3) -> Dict[str, float]:
+    """
+    Time the shared engine against the sequential per-field regex passes.
+
+    Args:
+        pages: Page HTML to extract from
+        repeat: Timing rounds (best round is reported)
+
+    Returns:
+        Dict: Pages, best seconds per engine and speedup
+    """
+    extractor = PropertyExtractor()
+    timings = {'engine': [], 'legacy': []}
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            extractor.extract(html)
+        timings['engine'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for html in pages:
+            _legacy_extract(html)
+        timings['legacy'].append(time.perf_counter() - start)
+
+    engine_seconds, legacy_seconds = min(timings['engine']), min(timings['legacy'])
+    return {
+        'pages': len(pages),
+        'engine_seconds': round(engine_seconds, 4),
+        'legacy_seconds': round(legacy_seconds, 4),
+        'engine_ms_per_page': round(engine_seconds * 1000 / max(len(pages), 1), 3),
+        'legacy_ms_per_page': round(legacy_seconds * 1000 / max(len(pages), 1), 3),
+        'speedup': round(legacy_seconds / engine_seconds, 2) if engine_seconds else None,
+        'parser': 'lxml' if LXML_AVAILABLE else 'regex',
+    }
+
+
+def main():
+    """Benchmark extraction over archived pages (or a built-in sample page)"""
+    parser = argparse.ArgumentParser(description="Property extraction engine micro-benchmark")
+    parser.add_argument('--archive', help='Page archive directory to benchmark against')
+    parser.add_argument('--scraper', help='Only pages archived by this scraper')
+    parser.add_argument('--limit', type=int, default=500, help='Maximum archived pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing rounds')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    pages = []
+    if args.archive:
+        if str(PROJECT_ROOT) not in sys.path:
+            sys.path.append(str(PROJECT_ROOT))
+        from core.collectors.page_archive import PageArchive, read_blob
+        archive = PageArchive(args.archive)
+        for entry in archive.pages(scraper=args.scraper)[:args.limit]:
+            pages.append(read_blob(entry['blob_path'], entry['codec']))
+    if not pages:
+        logger.info("📄 No archived pages - benchmarking the built-in sample pages")
+        pages = [SAMPLE_PAGE, SPARSE_SAMPLE_PAGE] * 100
+
+    sample = PropertyExtractor().extract(pages[0])
+    logger.info(f"🔎 First page: {sample.to_dict()}")
+
+    results = benchmark(pages, repeat=args.repeat)
+    for key, value in results.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
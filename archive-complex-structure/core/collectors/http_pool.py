@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+🔌 HTTP Pool - Long-Lived Async HTTP Client for Static Page Fetches
+
+One client per process instead of an httpx.AsyncClient per request:
+- Keep-alive connection pool per host, bounded by max_connections_per_host
+- HTTP/2 when the h2 package is installed (multiplexed requests on one connection)
+- Transparent decompression; Accept-Encoding only advertises codecs httpx can decode here
+- Requests drawn from the shared per-host rate scheduler budget
+"""
+
+import importlib.util
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+
+H2_AVAILABLE = importlib.util.find_spec('h2') is not None
+BROTLI_AVAILABLE = (importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')) is not None
+ZSTD_AVAILABLE = importlib.util.find_spec('zstandard') is not None
+
+logger = logging.getLogger(__name__)
+
+
+def _httpx_decodes_zstd() -> bool:
+    """Whether httpx decodes zstd bodies, probed by decoding a small frame through a public Response"""
+    if not (ZSTD_AVAILABLE and HTTPX_AVAILABLE):
+        return False
+    try:
+        import zstandard
+        frame = zstandard.ZstdCompressor().compress(b'zstd')
+        # httpx passes bodies with an unknown Content-Encoding through undecoded
+        return httpx.Response(200, headers={'Content-Encoding': 'zstd'}, content=frame).read() == b'zstd'
+    except Exception:
+        return False
+
+
+HTTPX_ZSTD_AVAILABLE = _httpx_decodes_zstd()
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding listing only the codecs the installed httpx can decode"""
+    encodings = ['gzip', 'deflate']
+    if BROTLI_AVAILABLE:
+        encodings.append('br')
+    if HTTPX_ZSTD_AVAILABLE:
+        encodings.append('zstd')
+    return ', '.join(encodings)
+
+
+@dataclass
+class HTTPResponse:
+    """Decoded response of one pooled request"""
+    url: str
+    status_code: int
+    text: Optional[str]
+    headers: Dict[str, str] = field(default_factory=dict)
+    http_version: str = ''
+    elapsed_ms: int = 0
+    error: Optional[str] = None
+
+
+class PooledHTTPClient:
+    """Per-host pooled httpx clients with HTTP/2, keep-alive and rate scheduling"""
+
+    def __init__(self, max_connections_per_host: int = 5, keepalive_expiry: float = 30.0,
+                 timeout: float = 30.0, http2: bool = True, scheduler: Optional[RateScheduler] = None,
+                 default_headers: Optional[Dict[str, str]] = None):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for PooledHTTPClient")
+
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.http2 = http2 and H2_AVAILABLE
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()
+        self.default_headers = {'Accept-Encoding': accept_encoding(), **(default_headers or {})}
+        self._clients: Dict[str, 'httpx.AsyncClient'] = {}
+        self.stats = {'requests': 0, 'errors': 0, 'http2_responses': 0, 'clients_opened': 0}
+
+        if http2 and not H2_AVAILABLE:
+            logger.info("ℹ️ h2 not installed, pooled HTTP client uses HTTP/1.1 keep-alive")
+
+    async def __aenter__(self) -> 'PooledHTTPClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _client_for(self, url: str) -> 'httpx.AsyncClient':
+        parsed = urlparse(url)
+        origin = f'{parsed.scheme}://{parsed.netloc}'
+        client = self._clients.get(origin)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=self.max_connections_per_host,
+                                    max_keepalive_connections=self.max_connections_per_host,
+                                    keepalive_expiry=self.keepalive_expiry),
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=self.default_headers,
+            )
+            self._clients[origin] = client
+            self.stats['clients_opened'] += 1
+        return client
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None, priority: int = 0) -> HTTPResponse:
+        """
+        GET a URL through the host's pool, within its rate budget.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (Accept-Encoding is managed by the pool)
+            priority: Rate scheduler priority, higher goes first
+
+        Returns:
+            HTTPResponse: Status, decoded text and headers; error is set when the request failed
+        """
+        headers = {name: value for name, value in (headers or {}).items() if name.lower() != 'accept-encoding'}
+        client = self._client_for(url)
+        start_time = time.time()
+        self.stats['requests'] += 1
+
+        try:
+            async with self.scheduler.request(url, priority):
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.stats['errors'] += 1
+            return HTTPResponse(url, 0, None, error=f'{type(e).__name__}: {e}',
+                                elapsed_ms=int((time.time() - start_time) * 1000))
+
+        if response.http_version == 'HTTP/2':
+            self.stats['http2_responses'] += 1
+        return HTTPResponse(
+            str(response.url), response.status_code, response.text, dict(response.headers),
+            response.http_version, int((time.time() - start_time) * 1000)
+        )
+
+    async def close(self):
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+
+def main():
+    """Example: repeated fetches reuse one keep-alive connection per host"""
+    import asyncio
+    import sys
+
+    async def run(urls):
+        async with PooledHTTPClient() as client:
+            for url in urls:
+                response = await client.get(url)
+                print(f"{response.status_code} {response.http_version} {response.elapsed_ms:>5}ms "
+                      f"{len(response.text or ''):>8} chars  {url}")
+            print(client.stats)
+
+    asyncio.run(run(sys.argv[1:] or ['https://www.spitogatos.gr/en/', 'https://www.spitogatos.gr/en/']))
+
+
+if __name__ == "__main__":
+    main()
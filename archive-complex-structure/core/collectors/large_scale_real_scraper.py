@@ -11,16 +11,23 @@ Strategy:
 """
 
 import asyncio
-import json
 import logging
 import re
+import sys
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from playwright.async_api import async_playwright
-import random
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.page_archive import PageArchive, is_archived_page
+from core.collectors.extraction_engine import PropertyExtractor
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.result_sinks import ResultStream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,6 +60,7 @@ class ScaledRealProperty:
     html_source_hash: str
     extraction_confidence: float
     validation_flags: List[str]
+    evidence_confidence: float = 0.0  # Mean per-field evidence score from the extraction engine
     
     def is_complete_authentic_data(self) -> bool:
         """Strict validation for scaled extraction"""
@@ -94,11 +102,15 @@ class ScaledRealProperty:
 class LargeScaleRealScraper:
     """Large scale scraper for 100+ authentic properties"""
     
-    def __init__(self):
+    def __init__(self, page_archive: Optional[PageArchive] = None, scheduler: Optional[RateScheduler] = None):
         self.complete_properties = []
         self.incomplete_properties = []
         self.failed_extractions = []
         self.processed_urls = set()
+        self.page_archive = page_archive if page_archive is not None else PageArchive()
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.extractor = PropertyExtractor()
+        self.results = ResultStream('athens_large_scale_real_data', required_formats=['json', 'csv'])  # Written as properties arrive
         
         # Multiple search strategies for scale
         self.search_strategies = [
@@ -160,7 +172,7 @@ class LargeScaleRealScraper:
         
         try:
             # Initial page load
-            await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+            await self.scheduler.goto(page, search_url, wait_until='domcontentloaded', timeout=30000)
             await asyncio.sleep(3)
             
             # Handle cookies once
@@ -193,8 +205,9 @@ class LargeScaleRealScraper:
                     for selector in next_selectors:
                         next_button = page.locator(selector)
                         if await next_button.count() > 0:
-                            await next_button.first.click()
-                            await page.wait_for_load_state('domcontentloaded', timeout=15000)
+                            async with self.scheduler.request(search_url):
+                                await next_button.first.click()
+                                await page.wait_for_load_state('domcontentloaded', timeout=15000)
                             await asyncio.sleep(2)
                             next_clicked = True
                             break
@@ -206,7 +219,7 @@ class LargeScaleRealScraper:
                         else:
                             paginated_url = f"{search_url}?page={page_num}"
                         
-                        await page.goto(paginated_url, wait_until='domcontentloaded', timeout=20000)
+                        await self.scheduler.goto(page, paginated_url, wait_until='domcontentloaded', timeout=20000)
                         await asyncio.sleep(2)
                     
                     # Extract URLs from this page
@@ -218,9 +231,6 @@ class LargeScaleRealScraper:
                     all_urls.update(page_urls)
                     logger.info(f"📋 Page {page_num}: {len(page_urls)} URLs")
                     
-                    # Don't overwhelm the server
-                    await asyncio.sleep(random.uniform(3, 6))
-                    
                 except Exception as e:
                     logger.warning(f"⚠️ Pagination page {page_num} failed: {e}")
                     break
@@ -280,26 +290,23 @@ class LargeScaleRealScraper:
         """Extract property data optimized for large scale"""
         
         try:
-            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            await asyncio.sleep(1)  # Shorter delay for scale
+            await self.scheduler.goto(page, url, wait_until='domcontentloaded', timeout=15000)
+            if not is_archived_page(page):
+                await asyncio.sleep(1)  # Shorter delay for scale
             
             html_content = await page.content()
+            self.page_archive.capture(page, url, html_content, 'large_scale_real')
             
-            # Fast extraction methods
-            title = await self._fast_extract_title(page, html_content)
-            price = await self._fast_extract_price(page, html_content)
-            sqm = await self._fast_extract_sqm(page, html_content, title)
-            energy_class = await self._fast_extract_energy_class(page, html_content)
+            # Single-pass extraction of every field
+            try:
+                page_title = await page.title()
+            except Exception:
+                page_title = None
+            extraction = self.extractor.extract(html_content, title=page_title)
+            title = extraction.title
             
             # Additional data
             neighborhood = self._extract_neighborhood_fast(title, html_content)
-            rooms = await self._fast_extract_rooms(page, html_content)
-            description = await self._fast_extract_description(page, html_content)
-            
-            # Calculate price per sqm
-            price_per_sqm = None
-            if price and sqm and sqm > 0:
-                price_per_sqm = price / sqm
             
             # Generate IDs
             property_id = hashlib.md5(url.encode()).hexdigest()[:12]
@@ -312,18 +319,19 @@ class LargeScaleRealScraper:
                 timestamp=datetime.now().isoformat(),
                 title=title or "Unknown Property",
                 neighborhood=neighborhood,
-                price=price,
-                sqm=sqm,
-                energy_class=energy_class,
-                price_per_sqm=price_per_sqm,
-                rooms=rooms,
+                price=extraction.price,
+                sqm=extraction.sqm,
+                energy_class=extraction.energy_class,
+                price_per_sqm=extraction.price_per_sqm,
+                rooms=extraction.rooms,
                 floor=None,
                 property_type="apartment",
                 listing_type="sale",
-                description=description or "",
+                description=extraction.description,
                 html_source_hash=html_hash,
                 extraction_confidence=0.90,  # Slightly lower for speed
-                validation_flags=[]
+                validation_flags=[],
+                evidence_confidence=extraction.overall_confidence
             )
             
             # Validate
@@ -336,124 +344,9 @@ class LargeScaleRealScraper:
             logger.warning(f"⚠️ Fast extraction failed: {url[-15:]} - {e}")
             return None
     
-    async def _fast_extract_title(self, page, html_content: str) -> str:
-        """Fast title extraction"""
-        try:
-            title = await page.title()
-            if title and len(title) > 10:
-                return title
-        except:
-            pass
-        
-        # Quick HTML pattern
-        match = re.search(r'<title>([^<]+)</title>', html_content, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        
-        return ""
-    
-    async def _fast_extract_price(self, page, html_content: str) -> Optional[float]:
-        """Fast price extraction"""
-        
-        # Quick patterns for common price formats
-        price_patterns = [
-            r'€\s*([\d,]+)',
-            r'(\d{4,})\s*€',
-            r'"price"\s*:\s*(\d+)',
-            r'€([\d,.]+)'
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, html_content)
-            for match in matches:
-                try:
-                    price_str = match.group(1).replace(',', '').replace('.', '')
-                    if len(price_str) >= 4:
-                        return float(price_str)
-                except:
-                    continue
-        
-        return None
-    
-    async def _fast_extract_sqm(self, page, html_content: str, title: str) -> Optional[float]:
-        """Fast SQM extraction"""
-        
-        # Try title first (most reliable)
-        title_match = re.search(r'(\d+)m²', title)
-        if title_match:
-            return float(title_match.group(1))
-        
-        # Quick HTML patterns
-        sqm_patterns = [
-            r'(\d+)\s*m²',
-            r'(\d+)\s*sqm',
-            r'"sqm"\s*:\s*(\d+)'
-        ]
-        
-        for pattern in sqm_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                try:
-                    return float(match.group(1))
-                except:
-                    continue
-        
-        return None
-    
-    async def _fast_extract_energy_class(self, page, html_content: str) -> Optional[str]:
-        """Fast energy class extraction"""
-        
-        # Enhanced energy class patterns
-        energy_patterns = [
-            r'energy[_\s-]*class["\s:]*([A-G][+]?)',
-            r'energy[_\s-]*([A-G][+]?)',
-            r'class["\s:]*([A-G][+]?)',
-            r'([A-G][+]?)\s*class',
-            r'"energy"[^}]*?"([A-G][+]?)"',
-            r'ενεργειακή["\s:]*([A-G][+]?)',
-            r'κατηγορία["\s:]*([A-G][+]?)'
-        ]
-        
-        for pattern in energy_patterns:
-            matches = re.finditer(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                energy_class = match.group(1).upper()
-                if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
-                    return energy_class
-        
-        return None
-    
-    async def _fast_extract_rooms(self, page, html_content: str) -> Optional[int]:
-        """Fast rooms extraction"""
-        
-        room_patterns = [
-            r'(\d+)\s*bedroom',
-            r'(\d+)\s*room',
-            r'rooms["\s:]*(\d+)'
-        ]
-        
-        for pattern in room_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        
-        return None
-    
-    async def _fast_extract_description(self, page, html_content: str) -> str:
-        """Fast description extraction"""
-        
-        # Look for common description patterns
-        desc_patterns = [
-            r'Make this property yours with a mortgage[^<]*',
-            r'Compare & save up to[^<]*'
-        ]
-        
-        for pattern in desc_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return match.group(0)[:200]  # Limit length
-        
-        return ""
+    async def reextract_archived(self, page) -> Optional[ScaledRealProperty]:
+        """Re-run extraction on an archived page (no browser or network)"""
+        return await self.extract_scaled_property_data(page, page.url)
     
     def _extract_neighborhood_fast(self, title: str, html_content: str) -> str:
         """Fast neighborhood extraction"""
@@ -529,23 +422,15 @@ class LargeScaleRealScraper:
                             
                             if property_data:
                                 complete_properties.append(property_data)
+                                self.results.write(property_data)
                                 logger.info(f"✅ #{len(complete_properties)}: {property_data.neighborhood} - €{property_data.price:,} - {property_data.sqm}m² - {property_data.energy_class}")
                             else:
                                 self.incomplete_properties.append(url)
                             
                             self.processed_urls.add(url)
-                            
-                            # Shorter delays for scale
-                            await asyncio.sleep(random.uniform(1, 2))
-                        
-                        # Batch break  
-                        await asyncio.sleep(random.uniform(3, 5))
                     
                     logger.info(f"📊 Strategy {i} complete: {len(complete_properties)} total properties")
                     
-                    # Strategy break
-                    await asyncio.sleep(random.uniform(5, 8))
-                    
                 except Exception as e:
                     logger.error(f"❌ Strategy {i} failed: {e}")
                     continue
@@ -568,27 +453,13 @@ class LargeScaleRealScraper:
             logger.warning("No properties to save")
             return None, None
         
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save JSON
-        properties_data = [asdict(prop) for prop in properties]
-        json_file = output_path / f'athens_large_scale_real_data_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(properties_data, f, indent=2, ensure_ascii=False)
-        
-        # Save CSV
-        csv_file = output_path / f'athens_large_scale_summary_{timestamp}.csv'
-        with open(csv_file, 'w', encoding='utf-8') as f:
-            f.write("URL,Price,SQM,Energy_Class,Price_per_SQM,Neighborhood,Rooms,Title\n")
-            for prop in properties:
-                f.write(f'"{prop.url}",{prop.price},{prop.sqm},"{prop.energy_class}",{prop.price_per_sqm:.0f},"{prop.neighborhood}",{prop.rooms or ""},"{prop.title[:50]}..."\n')
+        # Properties were streamed to the configured sinks during scraping; close them out
+        output_files = self.results.finish(properties, output_dir)
+        json_file, csv_file = output_files['json'], output_files['csv']
         
         logger.info(f"💾 Large scale results saved:")
-        logger.info(f"   JSON: {json_file}")
-        logger.info(f"   CSV: {csv_file}")
+        for format_name, path in output_files.items():
+            logger.info(f"   {format_name.upper()}: {path}")
         
         # Statistics
         prices = [p.price for p in properties]
@@ -604,7 +475,7 @@ class LargeScaleRealScraper:
         logger.info(f"   Neighborhoods: {len(neighborhoods)}")
         logger.info(f"   Avg price/m²: €{sum(p.price_per_sqm for p in properties)/len(properties):.0f}")
         
-        return str(json_file), str(csv_file)
+        return json_file, csv_file
 
 # Main execution
 async def extract_large_scale_athens_data(target_properties: int = 100):
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+🗃️ Page Archive - Content-Addressed Raw HTML Store
+
+Keeps every fetched property page so extraction fixes never require a re-crawl:
+- zstd-compressed HTML blobs keyed by the SHA-256 of the page body
+- SQLite index of url → content hash → first/last fetch time per scraper
+- ArchivedPage stand-in for a Playwright page, backed by archived HTML
+- Offline re-extraction over the archive in a process pool (no browser, no network)
+
+Usage:
+    python core/collectors/page_archive.py reextract --scraper proven_spitogatos --workers 4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import importlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Scrapers that can re-extract archived pages: name -> (module, class)
+ARCHIVE_EXTRACTORS = {
+    'proven_spitogatos': ('core.collectors.proven_spitogatos_scraper', 'ProvenSpitogatosScraper'),
+    'large_scale_real': ('core.collectors.large_scale_real_scraper', 'LargeScaleRealScraper'),
+    'direct_url': ('scripts.direct_url_collector', 'DirectURLCollector'),
+    'enhanced_crawlee': ('core.scrapers.enhanced_crawlee_spitogatos', 'EnhancedCrawleeSpitogatosScraper'),
+}
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT NOT NULL,
+    sha256 TEXT NOT NULL REFERENCES blobs(sha256),
+    scraper TEXT NOT NULL DEFAULT '',
+    fetched_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    PRIMARY KEY (url, sha256, scraper)
+);
+CREATE INDEX IF NOT EXISTS idx_pages_scraper ON pages(scraper, url);
+"""
+
+
+class PageArchive:
+    """Content-addressed HTML blobs with a SQLite url/hash/fetch-time index"""
+
+    def __init__(self, archive_dir: Union[str, Path] = 'data/page_archive', compression_level: int = 10):
+        # Relative archive directories are under the project root, so every launch directory shares one archive
+        archive_dir = Path(archive_dir)
+        self.archive_dir = archive_dir if archive_dir.is_absolute() else PROJECT_ROOT / archive_dir
+        self.blob_dir = self.archive_dir / 'blobs'
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.archive_dir / 'index.db'
+        self.codec = 'zstd' if ZSTD_AVAILABLE else 'zlib'
+        self.compression_level = compression_level
+
+        self._compressor = zstandard.ZstdCompressor(level=compression_level) if ZSTD_AVAILABLE else None
+        self._connection = sqlite3.connect(str(self.index_path), timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.executescript(INDEX_SCHEMA)
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def store(self, url: str, html: str, scraper: Optional[str] = None,
+              fetched_at: Optional[str] = None) -> str:
+        """
+        Archive a fetched page; identical bodies are stored once.
+
+        Args:
+            url: Page URL
+            html: Raw page HTML
+            scraper: Name of the scraper that fetched the page
+            fetched_at: ISO fetch time (default: now)
+
+        Returns:
+            str: SHA-256 of the page body
+        """
+        body = html.encode('utf-8')
+        sha256 = hashlib.sha256(body).hexdigest()
+        fetched_at = fetched_at or datetime.now().isoformat()
+
+        # The index row, not the file, decides: an orphaned blob (crash before the
+        # insert, rebuilt index) is rewritten so its codec matches the new row
+        indexed = self._connection.execute('SELECT 1 FROM blobs WHERE sha256 = ?', (sha256,)).fetchone()
+        if indexed is None:
+            blob_path = self._blob_path(sha256)
+            stored = self._compress(body)
+            blob_path.parent.mkdir(exist_ok=True)
+            temp_path = blob_path.with_suffix('.tmp')
+            temp_path.write_bytes(stored)
+            temp_path.replace(blob_path)
+
+            self._connection.execute(
+                'INSERT OR IGNORE INTO blobs (sha256, codec, raw_size, stored_size, created_at) VALUES (?, ?, ?, ?, ?)',
+                (sha256, self.codec, len(body), len(stored), fetched_at)
+            )
+
+        self._connection.execute(
+            'INSERT INTO pages (url, sha256, scraper, fetched_at, last_seen_at) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT(url, sha256, scraper) DO UPDATE SET last_seen_at = excluded.last_seen_at',
+            (url, sha256, scraper or '', fetched_at, fetched_at)
+        )
+        self._connection.commit()
+        return sha256
+
+    def capture(self, page, url: str, html: str, scraper: str) -> Optional[str]:
+        """Archive a live page; pages replayed from the archive are not stored again"""
+        if is_archived_page(page):
+            return None
+        try:
+            return self.store(url, html, scraper)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"⚠️ Page archive write failed for {url}: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, sha256: str) -> str:
+        """Page HTML for a content hash"""
+        codec = self._connection.execute('SELECT codec FROM blobs WHERE sha256 = ?', (sha256,)).fetchone()
+        if codec is None:
+            raise KeyError(f"No archived page with hash {sha256}")
+        return read_blob(self._blob_path(sha256), codec[0])
+
+    def latest(self, url: str) -> Optional[Tuple[str, str]]:
+        """(sha256, last_seen_at) of the most recently seen version of a URL"""
+        return self._connection.execute(
+            'SELECT sha256, last_seen_at FROM pages WHERE url = ? ORDER BY last_seen_at DESC LIMIT 1', (url,)
+        ).fetchone()
+
+    def pages(self, scraper: Optional[str] = None, latest_only: bool = True) -> List[Dict]:
+        """
+        Archived page versions with their blob location.
+
+        Args:
+            scraper: Only pages fetched by this scraper
+            latest_only: Only the most recently seen version per URL
+
+        Returns:
+            List[Dict]: url, sha256, codec, blob_path, scraper and fetch times
+        """
+        query = (
+            'SELECT p.url, p.sha256, b.codec, p.scraper, p.fetched_at, p.last_seen_at '
+            'FROM pages p JOIN blobs b ON b.sha256 = p.sha256'
+        )
+        conditions, params = [], []
+        if scraper:
+            conditions.append('p.scraper = ?')
+            params.append(scraper)
+        if latest_only:
+            conditions.append(
+                'p.last_seen_at = (SELECT MAX(last_seen_at) FROM pages latest '
+                'WHERE latest.url = p.url AND latest.scraper = p.scraper)'
+            )
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY p.url'
+
+        return [
+            {
+                'url': url, 'sha256': sha256, 'codec': codec, 'blob_path': str(self._blob_path(sha256)),
+                'scraper': page_scraper, 'fetched_at': fetched_at, 'last_seen_at': last_seen_at
+            }
+            for url, sha256, codec, page_scraper, fetched_at, last_seen_at
+            in self._connection.execute(query, params)
+        ]
+
+    def stats(self) -> Dict:
+        """Archive size and deduplication summary"""
+        blobs, raw_size, stored_size = self._connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM blobs'
+        ).fetchone()
+        urls = self._connection.execute('SELECT COUNT(DISTINCT url) FROM pages').fetchone()[0]
+        return {
+            'urls': urls,
+            'page_versions': len(self),
+            'blobs': blobs,
+            'raw_bytes': raw_size,
+            'stored_bytes': stored_size,
+            'compression_ratio': raw_size / stored_size if stored_size else 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # Offline re-extraction
+    # ------------------------------------------------------------------
+
+    def reextract(self, scraper: str, max_workers: Optional[int] = None, chunk_size: int = 200,
+                  latest_only: bool = True) -> Iterator[Dict]:
+        """
+        Re-run a scraper's extraction over its archived pages in a process pool.
+
+        Args:
+            scraper: Name in ARCHIVE_EXTRACTORS
+            max_workers: Worker processes (default: CPU count)
+            chunk_size: Pages per task
+            latest_only: Only the most recent version of each URL
+
+        Yields:
+            Dict: url, sha256, fetched_at and the extracted property (None when rejected) or error
+        """
+        if scraper not in ARCHIVE_EXTRACTORS:
+            raise ValueError(f"Unknown archive extractor '{scraper}' - expected one of {sorted(ARCHIVE_EXTRACTORS)}")
+
+        pages = self.pages(scraper=scraper, latest_only=latest_only)
+        chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+        if not chunks:
+            return
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 1 or len(chunks) == 1:
+            _init_reextract_worker(scraper, str(self.archive_dir))
+            for chunk in chunks:
+                yield from _reextract_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_reextract_worker,
+                                 initargs=(scraper, str(self.archive_dir))) as executor:
+            for results in executor.map(_reextract_chunk, chunks):
+                yield from results
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / f'{sha256}.blob'
+
+    def _compress(self, body: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(body)
+        return zlib.compress(body, min(self.compression_level, 9))
+
+
+def read_blob(blob_path: Union[str, Path], codec: str) -> str:
+    """Decompress an archived page body"""
+    stored = Path(blob_path).read_bytes()
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required to read zstd page archive blobs")
+        return zstandard.ZstdDecompressor().decompress(stored).decode('utf-8')
+    return zlib.decompress(stored).decode('utf-8')
+
+
+def is_archived_page(page) -> bool:
+    """True for pages replayed from the archive (skip navigation delays and re-archiving)"""
+    return getattr(page, 'is_archived', False)
+
+
+class ArchivedResponse:
+    """Response stand-in for ArchivedPage.goto"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.status = 200
+        self.ok = True
+
+
+class ArchivedElement:
+    """Element handle stand-in backed by parsed archived HTML"""
+
+    def __init__(self, node):
+        self._node = node
+
+    async def inner_text(self) -> str:
+        return self._node.get_text(' ', strip=True)
+
+    async def text_content(self) -> str:
+        return self._node.get_text()
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        value = self._node.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+
+class ArchivedPage:
+    """Playwright page stand-in serving archived HTML for offline re-extraction"""
+
+    is_archived = True
+
+    def __init__(self, url: str, html: str, fetched_at: Optional[str] = None):
+        self.url = url
+        self.html = html
+        self.fetched_at = fetched_at
+        self._soup = None
+
+    async def goto(self, url: str, **kwargs) -> ArchivedResponse:
+        return ArchivedResponse(url)
+
+    async def content(self) -> str:
+        return self.html
+
+    async def title(self) -> str:
+        match = re.search(r'<title[^>]*>([^<]*)</title>', self.html, re.IGNORECASE)
+        return match.group(1).strip() if match else ''
+
+    async def wait_for_timeout(self, timeout: float):
+        return None
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+    async def query_selector(self, selector: str) -> Optional[ArchivedElement]:
+        soup = self._parsed()
+        node = soup.select_one(selector) if soup is not None else None
+        return ArchivedElement(node) if node is not None else None
+
+    async def query_selector_all(self, selector: str) -> List[ArchivedElement]:
+        soup = self._parsed()
+        return [ArchivedElement(node) for node in soup.select(selector)] if soup is not None else []
+
+    def _parsed(self):
+        # Selector lookups need a DOM; regex-only extractors never pay for parsing
+        if self._soup is None and BS4_AVAILABLE:
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+
+
+class ArchivedRenderingEngine:
+    """Fetch stand-in for scrapers that fetch by URL, serving one archived page"""
+
+    def __init__(self, page: ArchivedPage):
+        self.page = page
+
+    async def adaptive_fetch(self, url: str) -> Dict:
+        return {
+            'success': True,
+            'content': self.page.html,
+            'method': 'archive',
+            'response_time_ms': 0,
+            'archived': True
+        }
+
+
+# ----------------------------------------------------------------------
+# Process pool workers
+# ----------------------------------------------------------------------
+
+_reextract_state = {}
+
+
+def _init_reextract_worker(scraper: str, archive_dir: str):
+    """Build the scraper once per worker process"""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.append(str(PROJECT_ROOT))
+    logging.getLogger().setLevel(logging.WARNING)  # Per-page extraction logs would dominate the run
+
+    module_name, class_name = ARCHIVE_EXTRACTORS[scraper]
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+    _reextract_state['scraper'] = scraper_class(page_archive=PageArchive(archive_dir))
+
+
+def _reextract_chunk(chunk: List[Dict]) -> List[Dict]:
+    """Re-extract a chunk of archived pages with the worker's scraper"""
+    return asyncio.run(_reextract_pages(_reextract_state['scraper'], chunk))
+
+
+async def _reextract_pages(scraper, chunk: List[Dict]) -> List[Dict]:
+    results = []
+    for entry in chunk:
+        result = {'url': entry['url'], 'sha256': entry['sha256'], 'fetched_at': entry['fetched_at'], 'property': None}
+        try:
+            page = ArchivedPage(entry['url'], read_blob(entry['blob_path'], entry['codec']), entry['fetched_at'])
+            extracted = await scraper.reextract_archived(page)
+            if extracted is not None:
+                result['property'] = asdict(extracted) if is_dataclass(extracted) else extracted
+        except Exception as e:
+            result['error'] = str(e)
+        results.append(result)
+    return results
+
+
+def main():
+    """Archive statistics and offline re-extraction command"""
+    parser = argparse.ArgumentParser(description="Content-addressed page archive")
+    parser.add_argument('command', choices=['stats', 'reextract'])
+    parser.add_argument('--archive', default='data/page_archive', help='Archive directory (relative to the project root)')
+    parser.add_argument('--scraper', choices=sorted(ARCHIVE_EXTRACTORS), help='Extractor to re-run')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--all-versions', action='store_true', help='Re-extract every archived version of each URL')
+    parser.add_argument('--output', help='NDJSON output path for re-extracted properties')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    archive = PageArchive(args.archive)
+
+    if args.command == 'stats':
+        print(json.dumps(archive.stats(), indent=2))
+        return
+
+    if not args.scraper:
+        parser.error('--scraper is required for reextract')
+
+    output_path = Path(args.output or f"data/processed/reextract_{args.scraper}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.time()
+    counts = {'pages': 0, 'extracted': 0, 'rejected': 0, 'errors': 0}
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for result in archive.reextract(args.scraper, max_workers=args.workers, latest_only=not args.all_versions):
+            counts['pages'] += 1
+            if 'error' in result:
+                counts['errors'] += 1
+            elif result['property'] is None:
+                counts['rejected'] += 1
+            else:
+                counts['extracted'] += 1
+            f.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+
+    elapsed = time.time() - start
+    logger.info(f"♻️ Re-extracted {counts['pages']} pages in {elapsed:.1f}s "
+                f"({counts['extracted']} properties, {counts['rejected']} rejected, {counts['errors']} errors)")
+    logger.info(f"   📄 Results: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,19 +10,24 @@ Based on successful production scrapers:
 """
 
 import asyncio
-import json
 import logging
-import re
-import csv
+import sys
 import hashlib
 import random
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from playwright.async_api import async_playwright
 from urllib.parse import urljoin, urlparse
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.extraction_engine import parse_price, parse_sqm, parse_rooms, parse_energy_class
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.result_sinks import ResultStream
+
 # Setup professional logging
 logging.basicConfig(
     level=logging.INFO,
@@ -104,11 +109,13 @@ class RealPropertyData:
 class ProfessionalRealEstateScraper:
     """Professional scraper combining proven spitogatos + xe.gr techniques"""
     
-    def __init__(self, athens_center_blocks: List[str]):
+    def __init__(self, athens_center_blocks: List[str], scheduler: Optional[RateScheduler] = None):
         self.target_blocks = athens_center_blocks
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
         self.scraped_properties = []
         self.failed_extractions = []
         self.audit_log = []
+        self.results = ResultStream('athens_center_real_properties', required_formats=['json', 'csv'])  # Written as properties arrive
         
         # Professional request headers (proven to work)
         self.headers = {
@@ -121,9 +128,9 @@ class ProfessionalRealEstateScraper:
             'Upgrade-Insecure-Requests': '1'
         }
         
-        # Rate limiting (professional approach)
-        self.min_delay = 3.0  # Minimum 3 seconds between requests
-        self.max_delay = 7.0  # Maximum 7 seconds between requests
+        # Settle delay after search pages load (request rate is paced by the scheduler)
+        self.min_delay = 3.0
+        self.max_delay = 7.0
         self.request_count = 0
         self.max_requests_per_session = 50  # Rotate browser after 50 requests
         
@@ -146,8 +153,9 @@ class ProfessionalRealEstateScraper:
             # Spitogatos search URL for Athens center
             search_url = f"https://spitogatos.gr/search/results?geo_place_id=2995&type=1&from_property_type=1&sort=price&listing_type=1"
             
-            # Navigate with timeout
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            # Navigate with timeout (high-priority blocks are scheduled first)
+            await self.scheduler.goto(page, search_url, self.scheduler.neighborhood_priority(block_name),
+                                      wait_until='networkidle', timeout=30000)
             
             # Human-like delay
             await self._human_delay()
@@ -182,12 +190,10 @@ class ProfessionalRealEstateScraper:
                     
                     if property_data and property_data.is_authentic_data():
                         properties.append(property_data)
+                        self.results.write(property_data)
                         processed += 1
                         logger.info(f"✅ Extracted authentic property {processed}/{max_properties}: {property_data.title[:50]}...")
                     
-                    # Rate limiting
-                    await self._human_delay()
-                    
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to extract property: {e}")
                     continue
@@ -215,7 +221,8 @@ class ProfessionalRealEstateScraper:
             search_url = "https://xe.gr/property/search"
             
             # Navigate to search page
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self.scheduler.goto(page, search_url, self.scheduler.neighborhood_priority(block_name),
+                                      wait_until='networkidle', timeout=30000)
             await self._human_delay()
             
             # Fill search form for Athens center
@@ -229,8 +236,9 @@ class ProfessionalRealEstateScraper:
                 # Submit search
                 search_button = page.locator('button[type="submit"], input[type="submit"]')
                 if await search_button.count() > 0:
-                    await search_button.click()
-                    await page.wait_for_load_state('networkidle', timeout=20000)
+                    async with self.scheduler.request(search_url, self.scheduler.neighborhood_priority(block_name)):
+                        await search_button.click()
+                        await page.wait_for_load_state('networkidle', timeout=20000)
                 
             except Exception as e:
                 logger.warning(f"⚠️ XE search form interaction failed: {e}")
@@ -260,11 +268,10 @@ class ProfessionalRealEstateScraper:
                     
                     if property_data and property_data.is_authentic_data():
                         properties.append(property_data)
+                        self.results.write(property_data)
                         processed += 1
                         logger.info(f"✅ Extracted XE property {processed}/{max_properties}: {property_data.title[:50]}...")
                     
-                    await self._human_delay()
-                    
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to extract XE property: {e}")
                     continue
@@ -283,7 +290,8 @@ class ProfessionalRealEstateScraper:
         
         try:
             await page.set_extra_http_headers(self.headers)
-            await page.goto(url, wait_until='networkidle', timeout=20000)
+            await self.scheduler.goto(page, url, self.scheduler.neighborhood_priority(block_name),
+                                      wait_until='networkidle', timeout=20000)
             
             # Extract data using proven selectors
             title = await self._safe_text_extract(page, 'h1, .property-title, .listing-title')
@@ -344,7 +352,8 @@ class ProfessionalRealEstateScraper:
         
         try:
             await page.set_extra_http_headers(self.headers)
-            await page.goto(url, wait_until='networkidle', timeout=20000)
+            await self.scheduler.goto(page, url, self.scheduler.neighborhood_priority(block_name),
+                                      wait_until='networkidle', timeout=20000)
             
             # Extract using XE.gr specific selectors
             title = await self._safe_text_extract(page, '.ad-title, .listing-title, h1')
@@ -406,53 +415,19 @@ class ProfessionalRealEstateScraper:
     
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from text"""
-        if not price_text:
-            return None
-        
-        # Remove currency symbols and spaces
-        clean_text = re.sub(r'[€$£,\s]', '', price_text)
-        
-        # Extract number
-        match = re.search(r'(\d+(?:\.\d+)?)', clean_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_price(price_text)
     
     def _parse_sqm(self, sqm_text: str) -> Optional[float]:
         """Parse square meters from text"""
-        if not sqm_text:
-            return None
-        
-        # Extract number before m² or sqm
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:m²|sqm|τ\.μ\.)', sqm_text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_sqm(sqm_text)
     
     def _parse_rooms(self, rooms_text: str) -> Optional[int]:
         """Parse room count from text"""
-        if not rooms_text:
-            return None
-        
-        match = re.search(r'(\d+)', rooms_text)
-        if match:
-            return int(match.group(1))
-        
-        return None
+        return parse_rooms(rooms_text)
     
     def _parse_energy_class(self, energy_text: str) -> Optional[str]:
         """Parse energy class from text"""
-        if not energy_text:
-            return None
-        
-        # Look for energy classes A+, A, B, C, D, E, F
-        match = re.search(r'([A-F][+]?)', energy_text.upper())
-        if match:
-            return match.group(1)
-        
-        return None
+        return parse_energy_class(energy_text)
     
     def _generate_property_id(self, url: str, source: str) -> str:
         """Generate unique property ID"""
@@ -461,7 +436,7 @@ class ProfessionalRealEstateScraper:
         return f"{source}_{timestamp}_{url_hash}"
     
     async def _human_delay(self, min_delay: float = None, max_delay: float = None):
-        """Human-like delay between requests"""
+        """Human-like settle delay on a loaded page"""
         min_d = min_delay or self.min_delay
         max_d = max_delay or self.max_delay
         delay = random.uniform(min_d, max_d)
@@ -503,9 +478,6 @@ class ProfessionalRealEstateScraper:
                     )
                     all_properties.extend(spitogatos_properties)
                     
-                    # Short break between sources
-                    await self._human_delay(5.0, 10.0)
-                    
                     # XE.gr
                     xe_properties = await self.scrape_xe_block(
                         browser, block_name, properties_per_block // 2
@@ -513,10 +485,6 @@ class ProfessionalRealEstateScraper:
                     all_properties.extend(xe_properties)
                     
                     logger.info(f"✅ Block {block_name}: {len(spitogatos_properties)} Spitogatos + {len(xe_properties)} XE properties")
-                    
-                    # Longer break between blocks
-                    if block_idx < len(self.target_blocks):
-                        await self._human_delay(10.0, 20.0)
                 
                 except Exception as e:
                     logger.error(f"❌ Failed to scrape block {block_name}: {e}")
@@ -536,30 +504,14 @@ class ProfessionalRealEstateScraper:
     def save_results(self, properties: List[RealPropertyData], output_dir: str = 'data/processed'):
         """Save scraping results to files"""
         
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save as JSON
-        json_file = output_path / f'athens_center_real_properties_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([asdict(p) for p in properties], f, indent=2, ensure_ascii=False)
-        
-        # Save as CSV
-        csv_file = output_path / f'athens_center_real_properties_{timestamp}.csv'
-        if properties:
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=asdict(properties[0]).keys())
-                writer.writeheader()
-                for prop in properties:
-                    writer.writerow(asdict(prop))
+        # Properties were streamed to the configured sinks during scraping; close them out
+        output_files = self.results.finish(properties, output_dir)
         
         logger.info(f"💾 Results saved:")
-        logger.info(f"   JSON: {json_file}")
-        logger.info(f"   CSV: {csv_file}")
+        for format_name, path in output_files.items():
+            logger.info(f"   {format_name.upper()}: {path}")
         
-        return str(json_file), str(csv_file)
+        return output_files['json'], output_files['csv']
 
 # Athens Center Blocks Definition
 ATHENS_CENTER_BLOCKS = [
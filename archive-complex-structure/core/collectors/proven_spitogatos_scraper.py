@@ -11,17 +11,25 @@ Key Success Factors from Case Study:
 """
 
 import asyncio
-import json
 import logging
 import re
+import sys
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from playwright.async_api import async_playwright
 import random
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.page_archive import PageArchive, is_archived_page
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.extraction_engine import parse_price, parse_sqm
+from core.collectors.result_sinks import ResultStream
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -88,10 +96,13 @@ class ProvenSpitogatosProperty:
 class ProvenSpitogatosScraper:
     """Scraper using exact proven methodology from case study"""
     
-    def __init__(self):
+    def __init__(self, page_archive: Optional[PageArchive] = None, scheduler: Optional[RateScheduler] = None):
         self.authentic_properties = []
         self.failed_extractions = []
         self.processed_urls = set()
+        self.page_archive = page_archive if page_archive is not None else PageArchive()
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.results = ResultStream('spitogatos_proven_athens', required_formats=['json'])  # Written as properties arrive
         
         # EXACT working search URLs from successful case study
         self.proven_search_urls = [
@@ -168,7 +179,7 @@ class ProvenSpitogatosScraper:
         logger.info(f"🔍 Discovering properties from: {search_url}")
         
         try:
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self.scheduler.goto(page, search_url, wait_until='networkidle', timeout=30000)
             await self._human_delay(2, 4)
             
             # Debug screenshot (like case study)
@@ -225,8 +236,13 @@ class ProvenSpitogatosScraper:
         """Extract property using exact case study methodology"""
         
         try:
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            await self._human_delay(1, 3)
+            await self.scheduler.goto(page, url, wait_until='networkidle', timeout=30000)
+            if not is_archived_page(page):
+                await self._human_delay(1, 3)
+            
+            # Archive raw HTML for offline re-extraction
+            html_content = await page.content()
+            self.page_archive.capture(page, url, html_content, 'proven_spitogatos')
             
             # Extract title (proven selector pattern)
             title = ""
@@ -295,7 +311,6 @@ class ProvenSpitogatosScraper:
                 price_per_sqm = price / sqm
             
             # Get HTML hash for validation
-            html_content = await page.content()
             html_hash = hashlib.md5(html_content.encode()).hexdigest()[:16]
             
             # Generate property ID (case study pattern)
@@ -336,32 +351,17 @@ class ProvenSpitogatosScraper:
             logger.error(f"❌ Failed to extract {url}: {e}")
             return None
     
+    async def reextract_archived(self, page) -> Optional[ProvenSpitogatosProperty]:
+        """Re-run extraction on an archived page (no browser or network)"""
+        return await self.extract_property_proven(page, page.url)
+    
     def _parse_price_proven(self, price_text: str) -> Optional[float]:
         """Price parsing using exact case study logic"""
-        if not price_text:
-            return None
-        
-        # Remove currency symbols and common text
-        clean_text = re.sub(r'[€$£,\s]', '', price_text)
-        
-        # Extract number (proven pattern)
-        match = re.search(r'(\d+(?:\.\d+)?)', clean_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_price(price_text)
     
     def _parse_sqm_proven(self, sqm_text: str) -> Optional[float]:
         """SQM parsing using exact case study logic"""
-        if not sqm_text:
-            return None
-        
-        # Look for m² pattern (proven from case study)
-        match = re.search(r'(\d+(?:\.\d+)?)\s*m²', sqm_text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_sqm(sqm_text)
     
     async def _human_delay(self, min_seconds: float = 2.0, max_seconds: float = 5.0):
         """Human-like delay (case study timing)"""
@@ -413,20 +413,15 @@ class ProvenSpitogatosScraper:
                         
                         if property_data:
                             all_properties.append(property_data)
+                            self.results.write(property_data)
                             extracted_count += 1
                         else:
                             self.failed_extractions.append(url)
                         
                         self.processed_urls.add(url)
-                        
-                        # Human delay between extractions (case study timing)
-                        await self._human_delay(3, 7)
                     
                     logger.info(f"✅ Extracted {extracted_count} properties from this search")
                     
-                    # Break between search URLs (case study pattern)
-                    await self._human_delay(5, 10)
-                    
                 except Exception as e:
                     logger.error(f"❌ Search failed: {e}")
                     continue
@@ -448,19 +443,11 @@ class ProvenSpitogatosScraper:
             logger.warning("No properties to save")
             return
         
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save in exact case study format
-        properties_data = [asdict(prop) for prop in properties]
-        
-        json_file = output_path / f'spitogatos_proven_athens_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(properties_data, f, indent=2, ensure_ascii=False)
+        # Properties were streamed to the configured sinks during scraping; close them out
+        output_files = self.results.finish(properties, output_dir)
+        json_file = output_files['json']
         
-        logger.info(f"💾 Proven results saved: {json_file}")
+        logger.info(f"💾 Proven results saved: {', '.join(output_files.values())}")
         
         # Save summary statistics
         authentic_count = len([p for p in properties if "AUTHENTIC_VERIFIED" in p.validation_flags])
@@ -472,7 +459,7 @@ class ProvenSpitogatosScraper:
         logger.info(f"   Average price: €{avg_price:,.0f}")
         logger.info(f"   Average size: {avg_sqm:.0f}m²")
         
-        return str(json_file)
+        return json_file
 
 # Test function using case study approach
 async def test_proven_scraper():
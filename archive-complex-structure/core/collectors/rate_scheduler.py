@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+🚦 Rate Scheduler - One Request Budget per Host, Shared by Every Collector
+
+Replaces each collector's own sleeps and token buckets with one scheduler:
+- Async-aware token bucket plus concurrency limit per host (platform_config.json budget)
+- State in a SQLite file, so concurrent collector processes share one budget
+- Priority queue: high-priority neighborhoods are served first, in-process and across processes
+- Slot leases expire, so a crashed process never holds the budget
+- Metrics as a dict, and as Prometheus series when prometheus_client is installed
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PLATFORM_CONFIG_PATH = PROJECT_ROOT / 'config' / 'platform_config.json'
+
+SCHEDULER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    permit_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    holder TEXT NOT NULL,
+    host TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    enqueued_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL,
+    PRIMARY KEY (holder, host)
+);
+CREATE INDEX IF NOT EXISTS idx_slots_host ON slots(host, expires_at);
+"""
+
+
+@dataclass
+class HostBudget:
+    """Request budget for one host"""
+    requests_per_second: float
+    burst: int
+    max_concurrent: int
+
+
+@dataclass
+class RequestPermit:
+    """Granted request slot; release it when the request finished"""
+    permit_id: str
+    host: str
+    priority: int
+    waited_seconds: float
+    granted_at: float
+
+
+def load_scheduler_config(config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> Dict:
+    """
+    Scheduler settings from the platform config.
+
+    The default host budget is max_concurrent_requests requests in flight, each
+    connection issuing one request per rate_limit_seconds.
+
+    Returns:
+        Dict: db_path, slot_lease_seconds, metrics_port, default HostBudget and per-host HostBudgets
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            platform_config = json.load(f)
+    except FileNotFoundError:
+        platform_config = {}
+
+    targets = platform_config.get('collection_targets', {})
+    max_concurrent = targets.get('max_concurrent_requests', 5)
+    rate_limit_seconds = targets.get('rate_limit_seconds', 2.0)
+    section = platform_config.get('rate_scheduler', {})
+
+    default_budget = HostBudget(max_concurrent / rate_limit_seconds, max_concurrent, max_concurrent)
+    hosts = {
+        host: HostBudget(
+            budget.get('requests_per_second', default_budget.requests_per_second),
+            budget.get('burst', default_budget.burst),
+            budget.get('max_concurrent', default_budget.max_concurrent)
+        )
+        for host, budget in section.get('hosts', {}).items()
+    }
+
+    return {
+        'db_path': section.get('db_path', 'data/scheduler/rate_budget.db'),
+        'slot_lease_seconds': section.get('slot_lease_seconds', 120),
+        'metrics_port': section.get('metrics_port'),
+        'default_budget': default_budget,
+        'hosts': hosts,
+        'neighborhood_priorities': platform_config.get('neighborhoods', {}),
+    }
+
+
+class RateScheduler:
+    """Per-host request scheduler shared by every collector and process using the same database"""
+
+    def __init__(self, db_path: Union[str, Path] = 'data/scheduler/rate_budget.db',
+                 default_budget: Optional[HostBudget] = None, host_budgets: Optional[Dict[str, HostBudget]] = None,
+                 slot_lease_seconds: float = 120, poll_interval: float = 0.05, waiter_ttl: float = 5.0,
+                 neighborhood_priorities: Optional[Dict[str, List[str]]] = None):
+        # Relative paths are under the project root, so collectors launched anywhere share one budget
+        db_path = Path(db_path)
+        self.db_path = str(db_path if db_path.is_absolute() or str(db_path) == ':memory:' else PROJECT_ROOT / db_path)
+        self.default_budget = default_budget or HostBudget(2.5, 5, 5)
+        self.host_budgets = host_budgets or {}
+        self.slot_lease_seconds = slot_lease_seconds  # Held slot presumed dead after this long
+        self.poll_interval = poll_interval            # Re-check interval while blocked on slots or priority
+        self.waiter_ttl = waiter_ttl                  # Other processes' queued waiters expire without a heartbeat
+        self.neighborhood_priorities = neighborhood_priorities or {}
+        self.holder = f"{os.uname().nodename if hasattr(os, 'uname') else 'host'}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        # Opened on the first request, so collectors that only re-extract archived pages never create the database
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        # Local waiters per host: heap of [-priority, sequence, wake event]
+        self._waiting: Dict[str, List] = {}
+        self._sequence = itertools.count()
+        self._metrics: Dict[str, Dict] = {}
+        self._prometheus = self._create_prometheus_metrics() if PROMETHEUS_AVAILABLE else None
+
+    @classmethod
+    def from_config(cls, config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> 'RateScheduler':
+        config = load_scheduler_config(config_path)
+        scheduler = cls(config['db_path'], config['default_budget'], config['hosts'],
+                        slot_lease_seconds=config['slot_lease_seconds'],
+                        neighborhood_priorities=config['neighborhood_priorities'])
+        if config['metrics_port']:
+            scheduler.start_metrics_server(config['metrics_port'])
+        return scheduler
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._db is None:
+                if self.db_path != ':memory:':
+                    Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+                if self.db_path != ':memory:':
+                    self._db.execute('PRAGMA journal_mode=WAL')
+                    self._db.execute('PRAGMA synchronous=NORMAL')
+                self._db.executescript(SCHEDULER_SCHEMA)
+            return self._db
+
+    def close(self):
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.execute('DELETE FROM slots WHERE holder = ?', (self.holder,))
+            self._db.execute('DELETE FROM waiters WHERE holder = ?', (self.holder,))
+            self._db.close()
+            self._db = None
+
+    def budget_for(self, host: str) -> HostBudget:
+        return self.host_budgets.get(host, self.default_budget)
+
+    def neighborhood_priority(self, neighborhood: str) -> int:
+        """Scheduling priority of a neighborhood from the platform config lists (higher goes first)"""
+        if neighborhood in self.neighborhood_priorities.get('priority_high', []):
+            return 2
+        if neighborhood in self.neighborhood_priorities.get('priority_medium', []):
+            return 1
+        return 0
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    async def acquire(self, target: str, priority: int = 0) -> RequestPermit:
+        """
+        Wait for a request slot on the target's host.
+
+        Args:
+            target: URL or host name
+            priority: Higher priorities are served first
+
+        Returns:
+            RequestPermit: Slot to pass to release()
+        """
+        host = _host_of(target)
+        queue = self._waiting.setdefault(host, [])
+        entry = [-priority, next(self._sequence), asyncio.Event()]
+        heapq.heappush(queue, entry)
+        enqueued_at = time.time()
+        started = time.monotonic()
+
+        try:
+            while True:
+                if queue[0] is not entry:
+                    # Only the local head polls the shared budget; the others wait their turn
+                    entry[2].clear()
+                    await entry[2].wait()
+                    continue
+
+                permit_id, wait = self._try_grant(host, priority, enqueued_at)
+                if permit_id:
+                    break
+                await asyncio.sleep(wait)
+        finally:
+            queue.remove(entry)
+            heapq.heapify(queue)
+            if queue:
+                queue[0][2].set()
+            else:
+                self._forget_waiter(host)
+
+        waited = time.monotonic() - started
+        self._record_grant(host, waited)
+        return RequestPermit(permit_id, host, priority, waited, time.time())
+
+    def release(self, permit: RequestPermit, success: bool = True):
+        """Return the request slot"""
+        with self._lock:
+            self._connection.execute('DELETE FROM slots WHERE permit_id = ?', (permit.permit_id,))
+        self._record_release(permit, success)
+
+    @asynccontextmanager
+    async def request(self, target: str, priority: int = 0) -> AsyncIterator[RequestPermit]:
+        """Hold a request slot for the duration of the block"""
+        permit = await self.acquire(target, priority)
+        success = False
+        try:
+            yield permit
+            success = True
+        finally:
+            self.release(permit, success)
+
+    async def goto(self, page, url: str, priority: int = 0, **goto_options):
+        """page.goto() within the host's budget; archived pages (page_archive.ArchivedPage) make no request"""
+        if getattr(page, 'is_archived', False):
+            return await page.goto(url, **goto_options)
+        async with self.request(url, priority):
+            return await page.goto(url, **goto_options)
+
+    def _try_grant(self, host: str, priority: int, enqueued_at: float) -> Tuple[Optional[str], float]:
+        """One atomic attempt at a slot: returns (permit_id, 0) or (None, seconds to wait)"""
+        budget = self.budget_for(host)
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.execute('DELETE FROM slots WHERE expires_at <= ?', (now,))
+                self._connection.execute('DELETE FROM waiters WHERE heartbeat_at <= ?', (now - self.waiter_ttl,))
+
+                # A waiter elsewhere with higher priority (or equal priority, queued earlier) goes first
+                blocked = self._connection.execute(
+                    'SELECT 1 FROM waiters WHERE host = ? AND holder != ? '
+                    'AND (priority > ? OR (priority = ? AND enqueued_at < ?)) LIMIT 1',
+                    (host, self.holder, priority, priority, enqueued_at)
+                ).fetchone() is not None
+                in_flight = self._connection.execute('SELECT COUNT(*) FROM slots WHERE host = ?', (host,)).fetchone()[0]
+
+                row = self._connection.execute('SELECT tokens, updated_at FROM buckets WHERE host = ?', (host,)).fetchone()
+                tokens = budget.burst if row is None else min(
+                    budget.burst, row[0] + (now - row[1]) * budget.requests_per_second
+                )
+
+                permit_id, wait = None, self.poll_interval
+                if not blocked and in_flight < budget.max_concurrent and tokens >= 1:
+                    tokens -= 1
+                    permit_id = uuid.uuid4().hex
+                    self._connection.execute(
+                        'INSERT INTO slots (permit_id, host, holder, expires_at) VALUES (?, ?, ?, ?)',
+                        (permit_id, host, self.holder, now + self.slot_lease_seconds)
+                    )
+                    self._connection.execute('DELETE FROM waiters WHERE holder = ? AND host = ?', (self.holder, host))
+                else:
+                    if not blocked and in_flight < budget.max_concurrent:
+                        wait = max((1 - tokens) / budget.requests_per_second, 0.001)
+                    self._connection.execute(
+                        'INSERT INTO waiters (holder, host, priority, enqueued_at, heartbeat_at) VALUES (?, ?, ?, ?, ?) '
+                        'ON CONFLICT(holder, host) DO UPDATE SET priority = excluded.priority, '
+                        'enqueued_at = excluded.enqueued_at, heartbeat_at = excluded.heartbeat_at',
+                        (self.holder, host, priority, enqueued_at, now)
+                    )
+
+                self._connection.execute(
+                    'INSERT INTO buckets (host, tokens, updated_at) VALUES (?, ?, ?) '
+                    'ON CONFLICT(host) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at',
+                    (host, tokens, now)
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        return permit_id, min(wait, self.waiter_ttl / 2)
+
+    def _forget_waiter(self, host: str):
+        with self._lock:
+            self._connection.execute('DELETE FROM waiters WHERE holder = ? AND host = ?', (self.holder, host))
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _host_metrics(self, host: str) -> Dict:
+        return self._metrics.setdefault(host, {
+            'granted': 0, 'completed': 0, 'failed': 0, 'in_flight': 0,
+            'wait_seconds_total': 0.0, 'wait_seconds_max': 0.0, 'first_grant_at': None, 'last_grant_at': None,
+        })
+
+    def _record_grant(self, host: str, waited: float):
+        metrics = self._host_metrics(host)
+        now = time.time()
+        metrics['granted'] += 1
+        metrics['in_flight'] += 1
+        metrics['wait_seconds_total'] += waited
+        metrics['wait_seconds_max'] = max(metrics['wait_seconds_max'], waited)
+        metrics['first_grant_at'] = metrics['first_grant_at'] or now
+        metrics['last_grant_at'] = now
+
+        if self._prometheus:
+            self._prometheus['granted'].labels(host).inc()
+            self._prometheus['wait'].labels(host).observe(waited)
+            self._prometheus['in_flight'].labels(host).inc()
+
+    def _record_release(self, permit: RequestPermit, success: bool):
+        metrics = self._host_metrics(permit.host)
+        metrics['in_flight'] -= 1
+        metrics['completed' if success else 'failed'] += 1
+
+        if self._prometheus:
+            self._prometheus['in_flight'].labels(permit.host).dec()
+            self._prometheus['released'].labels(permit.host, 'ok' if success else 'error').inc()
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-host counters of this process, plus budget use across all processes"""
+        with self._lock:
+            shared_in_flight = dict(self._connection.execute(
+                'SELECT host, COUNT(*) FROM slots WHERE expires_at > ? GROUP BY host', (time.time(),)
+            ).fetchall())
+
+        snapshot = {}
+        for host, metrics in self._metrics.items():
+            budget = self.budget_for(host)
+            span = (metrics['last_grant_at'] or 0) - (metrics['first_grant_at'] or 0)
+            rate = (metrics['granted'] - 1) / span if span > 0 else 0.0
+            snapshot[host] = {
+                **metrics,
+                'avg_wait_seconds': metrics['wait_seconds_total'] / metrics['granted'] if metrics['granted'] else 0.0,
+                'requests_per_second': rate,
+                'budget_requests_per_second': budget.requests_per_second,
+                'budget_used': rate / budget.requests_per_second if budget.requests_per_second else 0.0,
+                'queued': len(self._waiting.get(host, [])),
+                'in_flight_all_processes': shared_in_flight.get(host, 0),
+            }
+        return snapshot
+
+    def start_metrics_server(self, port: int) -> bool:
+        """Expose the Prometheus series on an HTTP port"""
+        if not PROMETHEUS_AVAILABLE:
+            logger.warning("⚠️ prometheus_client not installed, scheduler metrics only available via metrics()")
+            return False
+        start_http_server(port)
+        logger.info(f"📊 Rate scheduler metrics on :{port}/metrics")
+        return True
+
+    @staticmethod
+    def _create_prometheus_metrics() -> Dict:
+        global _PROMETHEUS_METRICS
+        if _PROMETHEUS_METRICS is None:
+            # Registered once per process; every scheduler instance reports into them
+            _PROMETHEUS_METRICS = {
+                'granted': Counter('athintel_scheduler_requests_granted_total', 'Request slots granted', ['host']),
+                'released': Counter('athintel_scheduler_requests_released_total', 'Request slots released',
+                                    ['host', 'outcome']),
+                'wait': Histogram('athintel_scheduler_wait_seconds', 'Time waited for a request slot', ['host']),
+                'in_flight': Gauge('athintel_scheduler_in_flight', 'Requests holding a slot', ['host']),
+            }
+        return _PROMETHEUS_METRICS
+
+
+_PROMETHEUS_METRICS = None
+_DEFAULT_SCHEDULER: Optional[RateScheduler] = None
+
+
+def get_rate_scheduler() -> RateScheduler:
+    """Process-wide scheduler configured from config/platform_config.json"""
+    global _DEFAULT_SCHEDULER
+    if _DEFAULT_SCHEDULER is None:
+        _DEFAULT_SCHEDULER = RateScheduler.from_config()
+    return _DEFAULT_SCHEDULER
+
+
+def _host_of(target: str) -> str:
+    return (urlparse(target).hostname or target) if '://' in target else target
+
+
+def main():
+    """Example: two schedulers (as two collectors) sharing one budget, high priority first"""
+    import tempfile
+
+    async def fetch(scheduler: RateScheduler, name: str, priority: int, log: List[Tuple[float, str]]):
+        async with scheduler.request('https://www.spitogatos.gr/en/property/1', priority):
+            log.append((time.monotonic(), name))
+            await asyncio.sleep(0.05)
+
+    async def run(db_path: Path):
+        budget = HostBudget(requests_per_second=10, burst=2, max_concurrent=2)
+        collector_a = RateScheduler(db_path, budget)
+        collector_b = RateScheduler(db_path, budget)
+        log: List[Tuple[float, str]] = []
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *[fetch(collector_a, f"A-low-{i}", 0, log) for i in range(10)],
+            *[fetch(collector_b, f"B-high-{i}", 2, log) for i in range(10)],
+        )
+        elapsed = time.monotonic() - started
+
+        print(f"20 requests in {elapsed:.2f}s (budget 10/s, burst 2)")
+        print("Order:", ' '.join(name.split('-')[1][0] for _, name in log))
+        print(json.dumps(collector_b.metrics(), indent=2, default=str))
+
+    with tempfile.TemporaryDirectory() as scheduler_dir:
+        asyncio.run(run(Path(scheduler_dir) / 'rate_budget.db'))
+
+
+if __name__ == "__main__":
+    main()
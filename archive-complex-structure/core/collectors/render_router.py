@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+🧭 Render Router - Learned HTTP vs Browser Routing per URL Pattern
+
+Browser rendering costs ~20× the CPU and memory of a plain HTTP fetch, so a
+page only goes to the browser when its URL pattern is known not to render
+from static HTML:
+- URL pattern = host + path with digit runs collapsed (/en/property/{id})
+- Persistent SQLite table of HTTP / browser attempts and complete extractions per pattern
+- New patterns are probed over HTTP until min_samples outcomes are recorded
+- Browser-routed patterns are re-probed over HTTP every reprobe_every requests
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+from urllib.parse import urlparse
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PLATFORM_CONFIG_PATH = PROJECT_ROOT / 'config' / 'platform_config.json'
+
+logger = logging.getLogger(__name__)
+
+ROUTE_METHODS = ('http', 'browser')
+
+ROUTE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS route_stats (
+    pattern TEXT PRIMARY KEY,
+    http_attempts REAL NOT NULL DEFAULT 0,
+    http_complete REAL NOT NULL DEFAULT 0,
+    browser_attempts REAL NOT NULL DEFAULT 0,
+    browser_complete REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+DIGIT_RUN = re.compile(r'\d+')
+
+
+def url_pattern(url: str) -> str:
+    """Routing key of a URL: host and path with digit runs replaced by {id}, query dropped"""
+    parsed = urlparse(url)
+    path = DIGIT_RUN.sub('{id}', parsed.path.rstrip('/')) or '/'
+    return f'{parsed.netloc.lower()}{path}'
+
+
+def load_routing_config(config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> Dict:
+    """Render routing and HTTP pool settings from the platform config"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            section = json.load(f).get('adaptive_rendering', {})
+    except FileNotFoundError:
+        section = {}
+
+    return {
+        'db_path': section.get('db_path', 'data/rendering/route_stats.db'),
+        'min_samples': section.get('min_samples', 5),
+        'static_threshold': section.get('static_threshold', 0.8),
+        'reprobe_every': section.get('reprobe_every', 25),
+        'window': section.get('window', 200),
+        'http_pool': section.get('http_pool', {}),
+    }
+
+
+class RenderRouter:
+    """Per-URL-pattern HTTP/browser routing learned from extraction completeness"""
+
+    def __init__(self, db_path: Union[str, Path] = 'data/rendering/route_stats.db', min_samples: int = 5,
+                 static_threshold: float = 0.8, reprobe_every: int = 25, window: int = 200):
+        # Relative paths are under the project root, so learned routes survive a change of launch directory
+        db_path = Path(db_path)
+        self.db_path = str(db_path if db_path.is_absolute() or str(db_path) == ':memory:' else PROJECT_ROOT / db_path)
+        self.min_samples = min_samples            # HTTP outcomes needed before a pattern is routed on its rate
+        self.static_threshold = static_threshold  # HTTP completeness rate at which a pattern counts as static
+        self.reprobe_every = reprobe_every        # Browser-routed requests between HTTP re-probes
+        self.window = window                      # Attempts kept per method; older outcomes are halved away
+        self._routed: Dict[str, int] = {}
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(ROUTE_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> 'RenderRouter':
+        config = load_routing_config(config_path)
+        return cls(config['db_path'], config['min_samples'], config['static_threshold'],
+                   config['reprobe_every'], config['window'])
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def route(self, url: str) -> str:
+        """
+        Choose the fetch method for a URL.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            str: 'http' when the URL's pattern renders fully from static HTML (or is still being probed), else 'browser'
+        """
+        pattern = url_pattern(url)
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT http_attempts, http_complete FROM route_stats WHERE pattern = ?', (pattern,)
+            ).fetchone()
+        http_attempts, http_complete = row if row else (0, 0)
+
+        if http_attempts < self.min_samples or http_complete / http_attempts >= self.static_threshold:
+            return 'http'
+
+        # Pages can move to server-side rendering; an occasional HTTP probe keeps the rate current
+        self._routed[pattern] = self._routed.get(pattern, 0) + 1
+        return 'http' if self._routed[pattern] % self.reprobe_every == 0 else 'browser'
+
+    def record(self, url: str, method: str, complete: bool):
+        """Record whether a fetch with the given method yielded a complete extraction"""
+        if method not in ROUTE_METHODS:
+            raise ValueError(f"Unknown fetch method: {method}")
+
+        pattern = url_pattern(url)
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.execute(
+                    f"""
+                    INSERT INTO route_stats (pattern, {method}_attempts, {method}_complete, updated_at)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT(pattern) DO UPDATE SET
+                        {method}_attempts = {method}_attempts + 1,
+                        {method}_complete = {method}_complete + excluded.{method}_complete,
+                        updated_at = excluded.updated_at
+                    """,
+                    (pattern, int(complete), time.time())
+                )
+                # Halving keeps the rate a recent-weighted one without storing individual outcomes
+                self._connection.execute(
+                    f"""
+                    UPDATE route_stats SET {method}_attempts = {method}_attempts / 2,
+                                           {method}_complete = {method}_complete / 2
+                    WHERE pattern = ? AND {method}_attempts > ?
+                    """,
+                    (pattern, self.window)
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def stats(self) -> List[Dict]:
+        """Per-pattern attempts, completeness rates and current route"""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT pattern, http_attempts, http_complete, browser_attempts, browser_complete '
+                'FROM route_stats ORDER BY http_attempts + browser_attempts DESC'
+            ).fetchall()
+
+        stats = []
+        for pattern, http_attempts, http_complete, browser_attempts, browser_complete in rows:
+            http_rate = http_complete / http_attempts if http_attempts else None
+            static = http_attempts < self.min_samples or http_rate >= self.static_threshold
+            stats.append({
+                'pattern': pattern,
+                'http_attempts': http_attempts,
+                'http_complete_rate': http_rate,
+                'browser_attempts': browser_attempts,
+                'browser_complete_rate': browser_complete / browser_attempts if browser_attempts else None,
+                'route': 'http' if static else 'browser',
+            })
+        return stats
+
+
+def main():
+    """Example: a static detail pattern stays on HTTP, a client-rendered search pattern moves to the browser"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        router = RenderRouter(Path(temp_dir) / 'route_stats.db', min_samples=3)
+
+        for property_id in range(1117000001, 1117000006):
+            url = f'https://www.spitogatos.gr/en/property/{property_id}'
+            router.record(url, router.route(url), complete=True)
+        for page in range(1, 6):
+            url = f'https://www.spitogatos.gr/en/for_sale-homes/athens?page={page}'
+            method = router.route(url)
+            router.record(url, method, complete=(method == 'browser'))
+
+        for row in router.stats():
+            print(f"{row['pattern']:<55} http={row['http_attempts']:.0f} "
+                  f"browser={row['browser_attempts']:.0f} → {row['route']}")
+        router.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+📤 Result Sinks - Streaming Property Output
+
+Collectors write each property to its output files as it arrives instead of
+json.dump-ing the whole collection at the end of a run:
+- NDJSON (fsync'd in batches), streamed JSON array, csv-module CSV and Parquet row groups
+- Formats and per-format options selected in config/platform_config.json ("result_sinks")
+- ResultStream: lazily opened per-collector sink set, finalized by the collector's save method
+- Memory stays flat: at most one Parquet row group is buffered
+- Listeners see each newly written property, e.g. the streaming data quality monitor
+- Closed files under the catalog directories are registered with the metadata gathered while writing
+"""
+
+import csv
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.data_catalog import (DataCatalog, DatasetIndexer, get_data_catalog, in_catalog_directories,
+                                          load_catalog_config)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+    ARROW_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError)
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PLATFORM_CONFIG_PATH = PROJECT_ROOT / 'config' / 'platform_config.json'
+
+DEFAULT_SINK_CONFIG = {
+    'output_dir': 'data/processed',
+    'formats': ['json', 'parquet'],
+    'json': {'indent': 2},
+    'ndjson': {'fsync_every': 50},
+    'csv': {'list_separator': ';'},
+    'parquet': {'row_group_size': 1000, 'compression': 'zstd'},
+    'quality_monitor': {'enabled': False, 'db_path': 'data/quality/quality_monitor.db'},
+}
+
+
+def to_record(item: Any) -> Dict:
+    """Plain dict for a property dataclass, object or dict"""
+    if isinstance(item, dict):
+        return item
+    if is_dataclass(item):
+        return asdict(item)
+    return dict(vars(item))
+
+
+def load_sink_config(config_path: Union[str, Path] = PLATFORM_CONFIG_PATH) -> Dict:
+    """
+    Result sink settings from the platform config, merged over the defaults.
+
+    Args:
+        config_path: Platform config with an optional "result_sinks" section
+
+    Returns:
+        Dict: output_dir, formats and one options dict per format
+    """
+    config = {key: (dict(value) if isinstance(value, dict) else value) for key, value in DEFAULT_SINK_CONFIG.items()}
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f).get('result_sinks', {})
+    except FileNotFoundError:
+        return config
+
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(config.get(key), dict):
+            config[key].update(value)
+        else:
+            config[key] = value
+    return config
+
+
+# ----------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------
+
+class ResultSink:
+    """One output file written record by record"""
+
+    extension = ''
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+
+    def __enter__(self) -> 'ResultSink':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, record: Dict):
+        raise NotImplementedError
+
+    def write_many(self, records: Iterable[Dict]) -> int:
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class NDJSONSink(ResultSink):
+    """One JSON object per line; every complete line survives a crash"""
+
+    extension = 'ndjson'
+
+    def __init__(self, path: Union[str, Path], fsync_every: int = 50):
+        super().__init__(path)
+        self.fsync_every = fsync_every  # Records between fsyncs
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._unsynced = 0
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self.count += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.flush()
+
+    def flush(self):
+        if self._file.closed or not self._unsynced:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+class JSONArraySink(ResultSink):
+    """JSON array written element by element (same file layout the dataset readers expect)"""
+
+    extension = 'json'
+
+    def __init__(self, path: Union[str, Path], indent: Optional[int] = 2):
+        super().__init__(path)
+        self.indent = indent
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('[')
+
+    def write(self, record: Dict):
+        encoded = json.dumps(record, ensure_ascii=False, indent=self.indent, default=str)
+        if self.indent is not None:
+            encoded = encoded.replace('\n', '\n' + ' ' * self.indent)
+            self._file.write(('\n' if self.count == 0 else ',\n') + ' ' * self.indent + encoded)
+        else:
+            self._file.write(encoded if self.count == 0 else ', ' + encoded)
+        self.count += 1
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write('\n]\n' if self.count and self.indent is not None else ']\n')
+        self._file.close()
+
+
+class CSVSink(ResultSink):
+    """csv-module writer; columns come from the first record (or an explicit field list)"""
+
+    extension = 'csv'
+
+    def __init__(self, path: Union[str, Path], fieldnames: Optional[List[str]] = None, list_separator: str = ';'):
+        super().__init__(path)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.list_separator = list_separator
+        self._file = open(self.path, 'w', newline='', encoding='utf-8')
+        self._writer = None
+
+    def write(self, record: Dict):
+        if self._writer is None:
+            self.fieldnames = self.fieldnames or list(record.keys())
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+            self._writer.writeheader()
+
+        self._writer.writerow({field: self._cell(record.get(field)) for field in self.fieldnames})
+        self.count += 1
+
+    def _cell(self, value: Any) -> Any:
+        if value is None:
+            return ''
+        if isinstance(value, (list, tuple, set)):
+            return self.list_separator.join(str(item) for item in value)
+        if isinstance(value, dict):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return value
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """
+    Parquet file written one row group at a time.
+
+    The schema is taken from the first row group. Integer columns are widened to
+    float64 there, because prices and sizes that happen to be whole numbers in
+    the first rows are fractional later. Columns Arrow cannot type (mixed or
+    all-null values) are stored as JSON text and listed in the "json_columns"
+    schema metadata, the same convention as the checkpoint log. Later values
+    that do not convert to the schema without loss are written as null and counted.
+    """
+
+    extension = 'parquet'
+
+    def __init__(self, path: Union[str, Path], row_group_size: int = 1000, compression: str = 'zstd'):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet result sinks")
+        super().__init__(path)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._rows: List[Dict] = []
+        self._writer = None
+        self._schema = None
+        self._json_columns: List[str] = []
+        self._coerced_values = 0
+
+    def write(self, record: Dict):
+        self._rows.append(record)
+        self.count += 1
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+
+    def flush(self):
+        self._write_row_group()
+
+    def close(self):
+        self._write_row_group()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._coerced_values:
+            logger.warning(f"⚠️ {self.path.name}: {self._coerced_values} values did not match the Parquet schema and were written as null")
+
+    def _write_row_group(self):
+        if not self._rows:
+            return
+
+        if self._writer is None:
+            table = self._first_table(self._rows)
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+        else:
+            table = self._conform(self._rows)
+
+        self._writer.write_table(table)
+        self._rows = []
+
+    def _first_table(self, rows: List[Dict]) -> 'pa.Table':
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        arrays = []
+
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            try:
+                array = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                array = None
+            if array is None or pa.types.is_null(array.type):
+                array = pa.array([_json_text(value) for value in values], type=pa.string())
+                self._json_columns.append(column)
+            elif pa.types.is_integer(array.type):
+                array = array.cast(pa.float64())
+            arrays.append(array)
+
+        table = pa.Table.from_arrays(arrays, names=columns)
+        return table.replace_schema_metadata({'json_columns': json.dumps(self._json_columns)})
+
+    def _conform(self, rows: List[Dict]) -> 'pa.Table':
+        arrays = []
+        for field in self._schema:
+            values = [row.get(field.name) for row in rows]
+            if field.name in self._json_columns:
+                arrays.append(pa.array([_json_text(value) for value in values], type=pa.string()))
+                continue
+            try:
+                arrays.append(_typed_array(values, field.type))
+            except ARROW_CONVERSION_ERRORS:
+                arrays.append(pa.array([self._coerce(value, field.type) for value in values], type=field.type))
+
+        return pa.Table.from_arrays(arrays, schema=self._schema)
+
+    def _coerce(self, value: Any, arrow_type: 'pa.DataType') -> Any:
+        try:
+            return _typed_array([value], arrow_type)[0].as_py()
+        except ARROW_CONVERSION_ERRORS:
+            self._coerced_values += 1
+            return None
+
+
+def _typed_array(values: List[Any], arrow_type: 'pa.DataType') -> 'pa.Array':
+    """Array of arrow_type; lossy conversions (e.g. 2.5 into int64) raise instead of truncating"""
+    array = pa.array(values)
+    return array if array.type == arrow_type else array.cast(arrow_type, safe=True)
+
+
+def _json_text(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+SINK_TYPES = {
+    'json': JSONArraySink,
+    'ndjson': NDJSONSink,
+    'csv': CSVSink,
+    'parquet': ParquetSink,
+}
+
+
+# ----------------------------------------------------------------------
+# Sink sets
+# ----------------------------------------------------------------------
+
+class ResultSinkSet:
+    """Fans each property out to every configured sink, once per key"""
+
+    def __init__(self, sinks: Dict[str, ResultSink], key_field: Optional[str] = 'url',
+                 catalog: Optional[DataCatalog] = None, kind: Optional[str] = None):
+        self.sinks = sinks
+        self.key_field = key_field
+        self.catalog = catalog
+        self.kind = kind
+        self.indexer = DatasetIndexer() if catalog is not None else None
+        self._keys = set()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __enter__(self) -> 'ResultSinkSet':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        return {name: str(sink.path) for name, sink in self.sinks.items()}
+
+    def write(self, item: Any) -> bool:
+        """Write one property to every sink, returning False when its key was already written"""
+        record = to_record(item)
+        if self.key_field:
+            key = record.get(self.key_field)
+            if key is not None:
+                if key in self._keys:
+                    return False
+                self._keys.add(key)
+
+        for sink in self.sinks.values():
+            sink.write(record)
+        if self.indexer is not None:
+            self.indexer.add(record)
+        return True
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        return sum(1 for item in items if self.write(item))
+
+    def flush(self):
+        for sink in self.sinks.values():
+            sink.flush()
+
+    def close(self) -> Dict[str, str]:
+        """Close every sink, returning format -> path of the files written"""
+        for sink in self.sinks.values():
+            sink.close()
+        paths = {name: path for name, path in self.paths.items() if Path(path).exists()}
+
+        if self.catalog is not None and self.indexer.record_count:
+            for path in paths.values():
+                try:
+                    self.catalog.register(path, self.indexer, kind=self.kind)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not register {path} in the data catalog: {e}")
+            self.indexer = DatasetIndexer()
+        return paths
+
+
+def open_result_sinks(name: str, output_dir: Optional[Union[str, Path]] = None, formats: Optional[List[str]] = None,
+                      config: Optional[Dict] = None, key_field: Optional[str] = 'url',
+                      timestamp: Optional[str] = None, catalog: Optional[DataCatalog] = None) -> ResultSinkSet:
+    """
+    Open one sink per configured format as {output_dir}/{name}_{timestamp}.{extension}.
+
+    Args:
+        name: File name prefix
+        output_dir: Output directory (defaults to the configured one)
+        formats: Formats to write (defaults to the configured ones)
+        config: Sink settings (defaults to load_sink_config())
+        key_field: Record field used to write each property once
+        timestamp: File timestamp (defaults to now)
+        catalog: Data catalog the files are registered in when closed
+
+    Returns:
+        ResultSinkSet: Open sinks
+    """
+    config = config or load_sink_config()
+    output_dir = Path(output_dir or config['output_dir'])
+    timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    sinks = {}
+    for format_name in formats or config['formats']:
+        sink_type = SINK_TYPES.get(format_name)
+        if sink_type is None:
+            logger.warning(f"⚠️ Unknown result sink format '{format_name}' skipped")
+            continue
+        if sink_type is ParquetSink and not PYARROW_AVAILABLE:
+            logger.warning("⚠️ pyarrow not installed, Parquet result sink skipped")
+            continue
+        path = output_dir / f'{name}_{timestamp}.{sink_type.extension}'
+        sinks[format_name] = sink_type(path, **config.get(format_name, {}))
+
+    return ResultSinkSet(sinks, key_field=key_field, catalog=catalog, kind=name)
+
+
+def quality_listener(source: str, settings: Dict) -> Optional[Callable[[Dict], None]]:
+    """
+    Listener feeding the process-wide data quality monitor (src/quality).
+
+    Args:
+        source: Segment name for the stream's properties (the stream name)
+        settings: "quality_monitor" sink settings with the monitor's db_path (relative paths are under the project root)
+
+    Returns:
+        Optional[Callable]: Listener, or None when the monitor's dependencies are missing
+    """
+    src_root = str(PROJECT_ROOT / 'src')
+    if src_root not in sys.path:
+        sys.path.append(src_root)
+    try:
+        from quality.data_quality_monitor import shared_monitor
+    except ImportError as e:
+        logger.warning(f"⚠️ Data quality monitor unavailable ({e}), '{source}' results not monitored")
+        return None
+    db_path = Path(settings['db_path'])
+    if not db_path.is_absolute():
+        db_path = PROJECT_ROOT / db_path
+    return shared_monitor(str(db_path)).listener(source)
+
+
+class ResultStream:
+    """
+    Sink set a collector streams properties into as they are collected.
+
+    Files are opened on the first write. finish() writes any properties that
+    were not streamed (e.g. restored from a checkpoint), closes the files and
+    returns their paths; the next write starts a new set of files. Listeners
+    are called with each streamed property that was not written before.
+    Closed files are registered in the given catalog, or in the shared one
+    when they were written into its configured directories. Formats listed in
+    required_formats are always written, on top of the configured ones, so
+    finish() can return the files a collector's save method promises.
+    """
+
+    def __init__(self, name: str, output_dir: Optional[Union[str, Path]] = None, key_field: Optional[str] = 'url',
+                 formats: Optional[List[str]] = None, config_path: Union[str, Path] = PLATFORM_CONFIG_PATH,
+                 listeners: Optional[List[Callable[[Dict], None]]] = None, catalog: Optional[DataCatalog] = None,
+                 required_formats: Optional[List[str]] = None):
+        self.name = name
+        self.config = load_sink_config(config_path)
+        self.output_dir = Path(output_dir or self.config['output_dir'])
+        self.key_field = key_field
+        self.formats = formats
+        self.required_formats = list(required_formats or [])
+        self.sinks: Optional[ResultSinkSet] = None
+        self.listeners: List[Callable[[Dict], None]] = list(listeners or [])
+        self.catalog = catalog
+        self.catalog_config = load_catalog_config(config_path)
+
+        if self.config['quality_monitor'].get('enabled'):
+            listener = quality_listener(name, self.config['quality_monitor'])
+            if listener is not None:
+                self.listeners.append(listener)
+
+    def __len__(self) -> int:
+        return len(self.sinks) if self.sinks else 0
+
+    def add_listener(self, listener: Callable[[Dict], None]):
+        self.listeners.append(listener)
+
+    def write(self, item: Any) -> bool:
+        if self.sinks is None:
+            self.sinks = self._open(self.output_dir)
+        if not self.sinks.write(item):
+            return False
+
+        if self.listeners:
+            record = to_record(item)
+            for listener in self.listeners:
+                try:
+                    listener(record)
+                except Exception as e:
+                    logger.warning(f"⚠️ Result stream listener failed: {e}")
+        return True
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        return sum(1 for item in items if self.write(item))
+
+    def flush(self):
+        if self.sinks is not None:
+            self.sinks.flush()
+
+    def finish(self, items: Iterable[Any] = (), output_dir: Optional[Union[str, Path]] = None) -> Dict[str, str]:
+        """
+        Write remaining properties and close the files.
+
+        Args:
+            items: Properties that should be in the output; streamed ones are skipped
+            output_dir: Output directory; a different one than streamed to gets a full copy
+
+        Returns:
+            Dict[str, str]: format -> path of each file written; required formats are
+                always present (empty files when there was nothing to write)
+        """
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        if self.sinks is not None and output_dir != self.output_dir:
+            self.sinks.close()
+            self.sinks = None
+
+        if self.sinks is None:
+            items = list(items)
+            if not items and not self.required_formats:
+                return {}
+            self.sinks = self._open(output_dir)
+
+        self.sinks.write_many(items)
+        return self.close()
+
+    def close(self) -> Dict[str, str]:
+        """Close the files streamed so far without writing anything else"""
+        if self.sinks is None:
+            return {}
+        paths = self.sinks.close()
+        self.sinks = None
+        return paths
+
+    def _catalog_for(self, output_dir: Path) -> Optional[DataCatalog]:
+        """Explicit catalog, else the shared one for files written into its directories"""
+        if self.catalog is not None:
+            return self.catalog
+        if self.catalog_config['register_writes'] and in_catalog_directories(output_dir,
+                                                                             self.catalog_config['directories']):
+            return get_data_catalog()
+        return None
+
+    def _open(self, output_dir: Path) -> ResultSinkSet:
+        formats = list(dict.fromkeys((self.formats or self.config['formats']) + self.required_formats))
+        return open_result_sinks(self.name, output_dir, formats=formats, config=self.config,
+                                 key_field=self.key_field, catalog=self._catalog_for(output_dir))
+
+
+def main():
+    """Example: stream properties to every format and read them back"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        stream = ResultStream('athens_example', output_dir, formats=list(SINK_TYPES))
+        for i in range(2500):
+            stream.write({'url': f'https://www.spitogatos.gr/en/property/{1117000000 + i}',
+                          'price': 150000 + i * 1000, 'sqm': 55.5 + i % 40,
+                          'title': 'Apartment, "Kolonaki", 3rd floor',
+                          'rooms': None if i < 1500 else i % 4 + 1,
+                          'validation_flags': ['price_size_complete']})
+        paths = stream.finish()
+
+        for format_name, path in paths.items():
+            print(f"{format_name:8} {Path(path).stat().st_size:>9,} bytes  {Path(path).name}")
+
+        with open(paths['json'], encoding='utf-8') as f:
+            print(f"JSON records: {len(json.load(f))}")
+        with open(paths['csv'], newline='', encoding='utf-8') as f:
+            print(f"CSV records: {sum(1 for _ in csv.DictReader(f))}")
+        if 'parquet' in paths:
+            parquet_file = pq.ParquetFile(paths['parquet'])
+            print(f"Parquet row groups: {parquet_file.num_row_groups}, rows: {parquet_file.metadata.num_rows}")
+
+
+if __name__ == "__main__":
+    main()
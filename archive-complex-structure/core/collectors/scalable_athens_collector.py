@@ -13,16 +13,45 @@ import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Iterable, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import hashlib
+import os
 import re
+import sys
 from urllib.parse import urljoin, urlparse
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.checkpoint_log import CheckpointLog
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.result_sinks import ResultStream
+from core.collectors.url_frontier import URLFrontier
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resource types never read by the extractors - aborted by the context route filter
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset([
+    'image', 'media', 'font', 'stylesheet', 'texttrack', 'manifest', 'eventsource', 'websocket'
+])
+
+# Third-party hosts (analytics, ads, maps, chat widgets) blocked whatever the resource type
+DEFAULT_BLOCKED_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'facebook.net', 'facebook.com', 'hotjar.com', 'clarity.ms', 'criteo.com', 'adnxs.com',
+    'maps.googleapis.com', 'maps.gstatic.com', 'tile.openstreetmap.org', 'tawk.to', 'onesignal.com'
+)
+
+# Typical transfer size per blocked resource type, for bandwidth-saved estimates (aborted requests have no size)
+ESTIMATED_RESOURCE_BYTES = {
+    'image': 60_000, 'media': 400_000, 'font': 35_000, 'stylesheet': 25_000, 'script': 45_000,
+    'xhr': 5_000, 'fetch': 5_000, 'texttrack': 2_000, 'manifest': 1_000, 'eventsource': 1_000,
+    'websocket': 1_000, 'other': 5_000
+}
+
 @dataclass
 class ScaledProperty:
     """Enhanced property data structure for scaled collection"""
@@ -59,12 +88,36 @@ class ScaledProperty:
 class ScalableAthensBrowser:
     """Enhanced browser management for concurrent collection"""
     
-    def __init__(self, concurrent_browsers: int = 5):
+    def __init__(self, concurrent_browsers: int = 5, pages_per_context: int = 3, max_page_uses: int = 50,
+                 blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+                 blocked_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 scheduler: Optional[RateScheduler] = None):
         self.concurrent_browsers = concurrent_browsers
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.pages_per_context = pages_per_context    # Long-lived pages per context
+        self.max_page_uses = max_page_uses            # Navigations before a page is recycled
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.blocked_domains = tuple(blocked_domains)
         self.browser_pool: List[Browser] = []
         self.context_pool: List[BrowserContext] = []
         self.active_pages: Set[Page] = set()
         
+        # Page pool: idle pages are reused, at most pages_per_context open per context
+        self.idle_pages: List[Page] = []
+        self.page_context: Dict[Page, BrowserContext] = {}
+        self.page_uses: Dict[Page, int] = {}
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        
+        self.pool_stats = {
+            "pages_created": 0,
+            "pages_reused": 0,
+            "pages_recycled": 0,
+            "retired_page_uses": [],
+            "allowed_requests": 0,
+            "blocked_requests": {},
+            "estimated_bytes_saved": 0
+        }
+        
     async def initialize_browser_pool(self):
         """Initialize pool of browsers for concurrent processing"""
         playwright = await async_playwright().start()
@@ -97,36 +150,142 @@ class ScalableAthensBrowser:
                 }
             )
             
+            # One route filter per context covers every page it opens
+            if self.blocked_resource_types or self.blocked_domains:
+                await context.route('**/*', self._filter_request)
+            
             self.browser_pool.append(browser)
             self.context_pool.append(context)
-            
-        logger.info(f"✅ Initialized {len(self.browser_pool)} browsers in pool")
+        
+        self._page_slots = asyncio.Semaphore(len(self.context_pool) * self.pages_per_context)
+        logger.info(f"✅ Initialized {len(self.browser_pool)} browsers in pool "
+                    f"({self.pages_per_context} pages per context, blocking {sorted(self.blocked_resource_types)})")
+    
+    async def _filter_request(self, route):
+        """Abort resource types and third-party hosts the extractors never read"""
+        request = route.request
+        resource_type = request.resource_type
+        host = urlparse(request.url).hostname or ''
+        
+        blocked = resource_type in self.blocked_resource_types or (
+            resource_type != 'document' and any(host == domain or host.endswith('.' + domain) for domain in self.blocked_domains)
+        )
+        if not blocked:
+            self.pool_stats["allowed_requests"] += 1
+            await route.continue_()
+            return
+        
+        blocked_counts = self.pool_stats["blocked_requests"]
+        blocked_counts[resource_type] = blocked_counts.get(resource_type, 0) + 1
+        self.pool_stats["estimated_bytes_saved"] += ESTIMATED_RESOURCE_BYTES.get(resource_type, 5_000)
+        await route.abort()
     
     async def get_page(self) -> Page:
         """Get available page from pool"""
-        available_context = None
-        for context in self.context_pool:
-            if len(context.pages) < 3:  # Max 3 pages per context
-                available_context = context
-                break
+        await self._page_slots.acquire()
+        
+        # Reuse an idle long-lived page when one is open
+        while self.idle_pages:
+            page = self.idle_pages.pop()
+            if not page.is_closed():
+                self.pool_stats["pages_reused"] += 1
+                self.active_pages.add(page)
+                return page
+            self._forget_page(page)
         
-        if not available_context:
-            available_context = random.choice(self.context_pool)
+        # Otherwise open one in the least loaded context
+        try:
+            open_pages = {context: 0 for context in self.context_pool}
+            for context in self.page_context.values():
+                open_pages[context] += 1
+            available_context = min(self.context_pool, key=open_pages.get)
+            
+            page = await available_context.new_page()
+        except Exception:
+            self._page_slots.release()
+            raise
         
-        page = await available_context.new_page()
+        self.pool_stats["pages_created"] += 1
+        self.page_context[page] = available_context
+        self.page_uses[page] = 0
         self.active_pages.add(page)
         return page
     
     async def release_page(self, page: Page):
         """Return page to pool"""
-        if page in self.active_pages:
-            self.active_pages.remove(page)
-            await page.close()
+        if page not in self.active_pages:
+            return
+        
+        self.active_pages.remove(page)
+        self.page_uses[page] = self.page_uses.get(page, 0) + 1
+        
+        try:
+            if page.is_closed():
+                self._forget_page(page)
+            elif self.page_uses[page] >= self.max_page_uses:
+                # Recycle long-used pages before renderer memory grows
+                self.pool_stats["pages_recycled"] += 1
+                self._forget_page(page)
+                await page.close()
+            else:
+                self.idle_pages.append(page)
+        finally:
+            self._page_slots.release()
+    
+    def _forget_page(self, page: Page):
+        self.pool_stats["retired_page_uses"].append(self.page_uses.pop(page, 0))
+        self.page_context.pop(page, None)
+    
+    async def navigate(self, page: Page, url: str, ready_selector: Optional[str] = None, timeout: int = 30000,
+                       priority: int = 0):
+        """
+        Load a URL within the host's request budget and wait until the content the extractor reads is present.
+        
+        Args:
+            page: Pooled page
+            url: URL to load
+            ready_selector: Selector signalling the listing content rendered
+            timeout: Navigation timeout in milliseconds
+            priority: Scheduling priority, higher goes first
+        """
+        await self.scheduler.goto(page, url, priority, wait_until='domcontentloaded', timeout=timeout)
+        await self.wait_until_ready(page, ready_selector)
+    
+    async def wait_until_ready(self, page: Page, ready_selector: Optional[str] = None, timeout: int = 10000):
+        """Wait for the ready selector instead of network idle"""
+        if not ready_selector:
+            return
+        try:
+            await page.wait_for_selector(ready_selector, state='attached', timeout=timeout)
+        except Exception:
+            logger.debug(f"Ready selector not found within {timeout}ms on {page.url}")
+    
+    def get_pool_stats(self) -> Dict:
+        """Page reuse and blocked-request statistics"""
+        uses = self.pool_stats["retired_page_uses"] + list(self.page_uses.values())
+        blocked_total = sum(self.pool_stats["blocked_requests"].values())
+        
+        return {
+            "pages_created": self.pool_stats["pages_created"],
+            "pages_reused": self.pool_stats["pages_reused"],
+            "pages_recycled": self.pool_stats["pages_recycled"],
+            "uses_per_page": uses,
+            "average_uses_per_page": sum(uses) / len(uses) if uses else 0,
+            "allowed_requests": self.pool_stats["allowed_requests"],
+            "blocked_requests": blocked_total,
+            "blocked_by_type": dict(self.pool_stats["blocked_requests"]),
+            "blocked_request_share": blocked_total / (blocked_total + self.pool_stats["allowed_requests"])
+                                     if blocked_total else 0,
+            "estimated_bytes_saved": self.pool_stats["estimated_bytes_saved"]
+        }
     
     async def close_all(self):
         """Close all browsers and contexts"""
-        for page in self.active_pages.copy():
-            await page.close()
+        for page in self.active_pages.copy() | set(self.idle_pages):
+            if not page.is_closed():
+                await page.close()
+        self.active_pages.clear()
+        self.idle_pages.clear()
         
         for context in self.context_pool:
             await context.close()
@@ -244,6 +403,12 @@ class EnhancedNeighborhoodMapper:
             neighborhoods = cls.get_priority_neighborhoods(priority)
             return sum(cls.ATHENS_NEIGHBORHOODS[n]["expected_properties"] for n in neighborhoods)
         return sum(data["expected_properties"] for data in cls.ATHENS_NEIGHBORHOODS.values())
+    
+    @classmethod
+    def get_scheduling_priority(cls, neighborhood: str) -> int:
+        """Rate scheduler priority (priority 1 neighborhoods are requested first, unknown ones last)"""
+        data = cls.ATHENS_NEIGHBORHOODS.get(neighborhood)
+        return 4 - data["priority"] if data else 0
 
 class AdvancedSearchStrategy:
     """Enhanced search strategies for comprehensive property discovery"""
@@ -310,12 +475,34 @@ class AdvancedSearchStrategy:
 class ScalablePropertyCollector:
     """Main scalable collector for Athens properties"""
     
-    def __init__(self, target_properties: int = 1000, concurrent_browsers: int = 5):
+    # Readiness: the content extraction reads, rather than network idle
+    SEARCH_READY_SELECTOR = 'a[href*="/property/"]'
+    LISTING_READY_SELECTOR = '.price-current, .property-price, .listing-price, [data-testid="price"], .price, h1'
+    
+    def __init__(self, target_properties: int = 1000, concurrent_browsers: int = 5,
+                 checkpoint_dir: str = "data/checkpoints/scalable_collector",
+                 browser_manager: Optional[ScalableAthensBrowser] = None,
+                 frontier: Optional[URLFrontier] = None):
         self.target_properties = target_properties
         self.concurrent_browsers = concurrent_browsers
-        self.browser_manager = ScalableAthensBrowser(concurrent_browsers)
+        self.browser_manager = browser_manager or ScalableAthensBrowser(concurrent_browsers)
         self.collected_properties: List[ScaledProperty] = []
-        self.processed_urls: Set[str] = set()
+        self.worker_id = f"scalable-{os.getpid()}"
+        
+        # Append-only checkpoint log - properties from earlier runs are resumed, their URLs skipped
+        self.checkpoint_log = CheckpointLog(checkpoint_dir, key_field="url")
+        field_names = ScaledProperty.__dataclass_fields__.keys()
+        self.resumed_properties: List[ScaledProperty] = [
+            ScaledProperty(**{name: record.get(name) for name in field_names})
+            for record in self.checkpoint_log.records()
+        ]
+        
+        # Shared URL frontier: URLs already claimed by any process (now or before a restart) are skipped
+        self.frontier = frontier if frontier is not None else URLFrontier(Path(checkpoint_dir) / "frontier.db")
+        self.frontier.mark_done(self.checkpoint_log.keys)
+        
+        # Output files are written as properties arrive rather than dumped at the end
+        self.results = ResultStream("athens_scaled_properties", required_formats=["json"])
         self.collection_stats = {
             "total_urls_found": 0,
             "properties_extracted": 0,
@@ -364,9 +551,6 @@ class ScalablePropertyCollector:
             if len(neighborhood_properties) >= max_properties:
                 neighborhood_properties = neighborhood_properties[:max_properties]
                 break
-            
-            # Rate limiting between batches
-            await asyncio.sleep(random.uniform(2, 4))
         
         logger.info(f"✅ Collected {len(neighborhood_properties)} properties from {neighborhood}")
         return neighborhood_properties
@@ -375,38 +559,46 @@ class ScalablePropertyCollector:
         """Process a single search URL to extract property URLs and data"""
         page = None
         try:
+            priority = EnhancedNeighborhoodMapper.get_scheduling_priority(neighborhood)
             page = await self.browser_manager.get_page()
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self.browser_manager.navigate(page, search_url, self.SEARCH_READY_SELECTOR, priority=priority)
             
             # Extract property URLs from search results
-            property_urls = await self.extract_property_urls_from_search(page, max_per_search)
+            property_urls = await self.extract_property_urls_from_search(page, max_per_search, priority)
             self.collection_stats["total_urls_found"] += len(property_urls)
             
-            # Process individual properties concurrently
-            property_tasks = []
-            for prop_url in property_urls:
-                if prop_url not in self.processed_urls:
-                    self.processed_urls.add(prop_url)
-                    task = self.extract_property_data(prop_url, neighborhood)
-                    property_tasks.append(task)
+            # Hand the search page back before the property pages need pool slots
+            await self.browser_manager.release_page(page)
+            page = None
+            
+            # Register discoveries, then claim this neighborhood's eligible URLs
+            new_urls = self.frontier.add_many(property_urls, source=neighborhood)
+            self.collection_stats["duplicate_skipped"] += len(property_urls) - new_urls
+            claimed = self.frontier.claim(self.worker_id, limit=max_per_search, source=neighborhood)
             
             # Limit concurrent property processing
-            if property_tasks:
+            if claimed:
                 # Process in smaller batches to avoid overwhelming
                 batch_size = 3
                 batch_properties = []
-                for i in range(0, len(property_tasks), batch_size):
-                    batch_tasks = property_tasks[i:i + batch_size]
-                    batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+                for i in range(0, len(claimed), batch_size):
+                    batch_entries = claimed[i:i + batch_size]
+                    batch_results = await asyncio.gather(
+                        *[self.extract_property_data(entry['url'], neighborhood) for entry in batch_entries],
+                        return_exceptions=True
+                    )
                     
-                    for result in batch_results:
+                    for entry, result in zip(batch_entries, batch_results):
+                        if isinstance(result, Exception):
+                            self.frontier.fail(entry['url'], self.worker_id, str(result))
+                            self.collection_stats["errors"] += 1
+                            continue
+                        
+                        self.frontier.complete(entry['url'], self.worker_id)
                         if isinstance(result, ScaledProperty):
                             batch_properties.append(result)
-                        elif isinstance(result, Exception):
-                            self.collection_stats["errors"] += 1
-                    
-                    # Small delay between property batches
-                    await asyncio.sleep(1)
+                            self.checkpoint_log.append(asdict(result))
+                            self.results.write(result)
                 
                 return batch_properties
             
@@ -421,7 +613,7 @@ class ScalablePropertyCollector:
             if page:
                 await self.browser_manager.release_page(page)
     
-    async def extract_property_urls_from_search(self, page: Page, max_urls: int = 20) -> List[str]:
+    async def extract_property_urls_from_search(self, page: Page, max_urls: int = 20, priority: int = 0) -> List[str]:
         """Extract property URLs from search results page with deep pagination"""
         property_urls = set()
         current_page = 1
@@ -448,10 +640,10 @@ class ScalablePropertyCollector:
                 # Try to navigate to next page
                 next_button = await page.query_selector('a[aria-label="Next"], .pagination-next, a:has-text("Next")')
                 if next_button and await next_button.is_enabled():
-                    await next_button.click()
-                    await page.wait_for_load_state('networkidle', timeout=10000)
+                    async with self.browser_manager.scheduler.request(page.url, priority):
+                        await next_button.click()
+                        await page.wait_for_load_state('domcontentloaded', timeout=10000)
                     current_page += 1
-                    await asyncio.sleep(random.uniform(1, 2))
                 else:
                     break
             
@@ -466,7 +658,8 @@ class ScalablePropertyCollector:
         page = None
         try:
             page = await self.browser_manager.get_page()
-            await page.goto(property_url, wait_until='networkidle', timeout=30000)
+            await self.browser_manager.navigate(page, property_url, self.LISTING_READY_SELECTOR,
+                                                priority=EnhancedNeighborhoodMapper.get_scheduling_priority(neighborhood))
             
             # Extract property data using enhanced selectors
             property_data = await page.evaluate('''() => {
@@ -593,9 +786,9 @@ class ScalablePropertyCollector:
             return scaled_property
         
         except Exception as e:
+            # Raised so the frontier retries the URL; the caller counts the error
             logger.error(f"❌ Error extracting property data from {property_url}: {e}")
-            self.collection_stats["errors"] += 1
-            return None
+            raise
         
         finally:
             if page:
@@ -712,6 +905,9 @@ class ScalablePropertyCollector:
         
         target_neighborhoods = EnhancedNeighborhoodMapper.get_priority_neighborhoods(priority_level)
         all_properties = []
+        remaining_target = max(self.target_properties - len(self.resumed_properties), 0)
+        if self.resumed_properties:
+            logger.info(f"♻️ Resumed {len(self.resumed_properties)} properties from checkpoint log")
         
         # Process neighborhoods concurrently (2 at a time to avoid overwhelming)
         batch_size = 2
@@ -735,17 +931,14 @@ class ScalablePropertyCollector:
                     logger.error(f"❌ Neighborhood batch error: {result}")
             
             # Progress update
-            logger.info(f"📊 Progress: {len(all_properties)}/{self.target_properties} properties collected")
+            logger.info(f"📊 Progress: {len(self.resumed_properties) + len(all_properties)}/{self.target_properties} properties collected")
             
             # Check if target reached
-            if len(all_properties) >= self.target_properties:
-                all_properties = all_properties[:self.target_properties]
+            if len(all_properties) >= remaining_target:
+                all_properties = all_properties[:remaining_target]
                 break
-            
-            # Delay between neighborhood batches
-            await asyncio.sleep(random.uniform(3, 6))
         
-        self.collected_properties = all_properties
+        self.collected_properties = self.resumed_properties + all_properties
         self.collection_stats["end_time"] = datetime.now()
         
         logger.info(f"✅ Scaled collection complete: {len(all_properties)} properties")
@@ -762,7 +955,9 @@ class ScalablePropertyCollector:
             "duration_seconds": duration,
             "properties_per_minute": len(self.collected_properties) / (duration / 60) if duration else 0,
             "success_rate": len(self.collected_properties) / self.collection_stats["total_urls_found"] if self.collection_stats["total_urls_found"] else 0,
-            "validation_rate": self.collection_stats["validation_passed"] / len(self.collected_properties) if self.collected_properties else 0
+            "validation_rate": self.collection_stats["validation_passed"] / len(self.collected_properties) if self.collected_properties else 0,
+            "browser_pool": self.browser_manager.get_pool_stats(),
+            "frontier": self.frontier.stats()
         }
     
     async def save_results(self, filename_prefix: str = "athens_scaled_properties") -> str:
@@ -773,37 +968,32 @@ class ScalablePropertyCollector:
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Save detailed JSON
-        json_file = Path("data/processed") / f"{filename_prefix}_{timestamp}.json"
-        json_file.parent.mkdir(parents=True, exist_ok=True)
+        # Compact the checkpoint log into its columnar file
+        compacted_file = self.checkpoint_log.compact()
         
-        properties_data = [asdict(prop) for prop in self.collected_properties]
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(properties_data, f, ensure_ascii=False, indent=2)
-        
-        # Save summary CSV
-        csv_file = Path("data/processed") / f"{filename_prefix}_summary_{timestamp}.csv"
-        with open(csv_file, 'w', encoding='utf-8') as f:
-            f.write("Property_ID,URL,Price,SQM,Energy_Class,Price_per_SQM,Neighborhood,Block_ID,Confidence,Quality_Score,Validation_Flags\n")
-            
-            for prop in self.collected_properties:
-                validation_flags = ';'.join(prop.validation_flags)
-                f.write(f'"{prop.property_id}","{prop.url}",{prop.price},{prop.sqm},"{prop.energy_class}",{prop.price_per_sqm:.0f if prop.price_per_sqm else 0},"{prop.neighborhood}","{prop.block_id}",{prop.extraction_confidence:.2f},{prop.data_quality_score:.2f},"{validation_flags}"\n')
+        # Close out the streamed output files; resumed properties not streamed this run are appended
+        self.results.name = filename_prefix  # Applies to files not yet opened
+        output_files = self.results.finish(self.collected_properties)
         
         # Save collection statistics
-        stats_file = Path("data/processed") / f"{filename_prefix}_stats_{timestamp}.json"
+        stats_file = self.results.output_dir / f"{filename_prefix}_stats_{timestamp}.json"
+        stats_file.parent.mkdir(parents=True, exist_ok=True)
         with open(stats_file, 'w') as f:
             json.dump(self.get_collection_stats(), f, indent=2, default=str)
         
         logger.info(f"💾 Results saved:")
-        logger.info(f"   📄 Detailed data: {json_file}")
-        logger.info(f"   📊 Summary CSV: {csv_file}")
+        for format_name, path in output_files.items():
+            logger.info(f"   📄 {format_name.upper()}: {path}")
         logger.info(f"   📈 Statistics: {stats_file}")
+        logger.info(f"   🧾 Checkpoint log: {compacted_file}")
         
-        return str(json_file)
+        return output_files["json"]
     
     async def close(self):
         """Clean up resources"""
+        self.results.close()
+        self.checkpoint_log.close()
+        self.frontier.close()
         await self.browser_manager.close_all()
         logger.info("🔒 Scalable collector closed successfully")
 
@@ -831,6 +1021,9 @@ async def run_scalable_collection(target_properties: int = 1000, priority_level:
         logger.info(f"   📈 Rate: {stats['properties_per_minute']:.1f} properties/minute")
         logger.info(f"   ✅ Success Rate: {stats['success_rate']:.1%}")
         logger.info(f"   🎖️ Validation Rate: {stats['validation_rate']:.1%}")
+        pool = stats['browser_pool']
+        logger.info(f"   ♻️ Pages: {pool['pages_created']} created, {pool['average_uses_per_page']:.1f} uses each")
+        logger.info(f"   🚫 Blocked requests: {pool['blocked_requests']} (~{pool['estimated_bytes_saved'] / 1_000_000:.1f} MB saved)")
         
         return properties, json_file
     
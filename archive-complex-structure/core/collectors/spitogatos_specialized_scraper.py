@@ -5,9 +5,8 @@ Based on proven production scraping techniques from spitogatos_premium_analysis
 """
 
 import asyncio
-import json
 import logging
-import re
+import sys
 import random
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -15,6 +14,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from playwright.async_api import async_playwright
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.extraction_engine import parse_price, parse_sqm, parse_rooms, parse_energy_class
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.result_sinks import ResultStream
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -43,9 +49,11 @@ class SpitogatosProperty:
 class SpitogatosSpecializedScraper:
     """Specialized Spitogatos scraper using proven techniques"""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[RateScheduler] = None):
         self.properties = []
         self.failed_urls = []
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.results = ResultStream('spitogatos_athens_center', required_formats=['json'])  # Written as properties arrive
         
         # Proven working URLs from your previous project
         self.search_urls = {
@@ -109,7 +117,7 @@ class SpitogatosSpecializedScraper:
         logger.info(f"🔍 Discovering properties from: {search_url}")
         
         try:
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self.scheduler.goto(page, search_url, wait_until='networkidle', timeout=30000)
             await self._human_delay(2, 4)
             
             # Take screenshot for debugging
@@ -214,7 +222,7 @@ class SpitogatosSpecializedScraper:
         """Extract individual property data using proven patterns"""
         
         try:
-            await page.goto(url, wait_until='networkidle', timeout=20000)
+            await self.scheduler.goto(page, url, wait_until='networkidle', timeout=20000)
             await self._human_delay(1, 3)
             
             # Extract title
@@ -336,53 +344,19 @@ class SpitogatosSpecializedScraper:
     
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from Greek text"""
-        if not price_text:
-            return None
-        
-        # Remove currency and spaces
-        clean_text = re.sub(r'[€$£,\s]', '', price_text)
-        clean_text = re.sub(r'[.]\d{3}', '', clean_text)  # Remove thousands separator
-        
-        # Extract number
-        match = re.search(r'(\d+(?:\.\d+)?)', clean_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_price(price_text)
     
     def _parse_sqm(self, sqm_text: str) -> Optional[float]:
         """Parse square meters from Greek text"""
-        if not sqm_text:
-            return None
-        
-        # Look for m², sqm, τ.μ. patterns
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:m²|sqm|τ\.μ\.|μ²)', sqm_text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_sqm(sqm_text)
     
     def _parse_rooms(self, rooms_text: str) -> Optional[int]:
         """Parse room count"""
-        if not rooms_text:
-            return None
-        
-        match = re.search(r'(\d+)', rooms_text)
-        if match:
-            return int(match.group(1))
-        
-        return None
+        return parse_rooms(rooms_text)
     
     def _parse_energy_class(self, energy_text: str) -> Optional[str]:
         """Parse energy class"""
-        if not energy_text:
-            return None
-        
-        match = re.search(r'([A-F][+]?)', energy_text.upper())
-        if match:
-            return match.group(1)
-        
-        return None
+        return parse_energy_class(energy_text)
     
     def _determine_neighborhood(self, address: str, url: str) -> str:
         """Determine neighborhood from address or URL"""
@@ -470,14 +444,9 @@ class SpitogatosSpecializedScraper:
                         
                         if property_data:
                             all_properties.append(property_data)
+                            self.results.write(property_data)
                         else:
                             self.failed_urls.append(url)
-                        
-                        # Human-like delay between extractions
-                        await self._human_delay(3, 7)
-                    
-                    # Break between search URLs
-                    await self._human_delay(10, 15)
                     
                 except Exception as e:
                     logger.error(f"❌ Search {search_name} failed: {e}")
@@ -500,22 +469,12 @@ class SpitogatosSpecializedScraper:
             logger.warning("No properties to save")
             return
         
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Convert to dictionaries
-        properties_data = [prop.__dict__ for prop in properties]
-        
-        # Save JSON
-        json_file = output_path / f'spitogatos_athens_center_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(properties_data, f, indent=2, ensure_ascii=False)
+        # Properties were streamed to the configured sinks during scraping; close them out
+        output_files = self.results.finish(properties, output_dir)
         
-        logger.info(f"💾 Results saved: {json_file}")
+        logger.info(f"💾 Results saved: {', '.join(output_files.values())}")
         
-        return str(json_file)
+        return output_files['json']
 
 # Test function
 async def test_spitogatos_scraper():
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+🧭 URL Frontier - Persistent, Resumable Crawl Queue
+
+Shared work queue for every collector and worker instead of per-process URL sets:
+- SQLite (WAL) table of URL state: discovered → in_flight → done / failed
+- Priority, retry count and next-eligible time per URL, exponential retry backoff
+- Atomic claims with leases, so crashed workers' URLs are picked up again
+- In-memory Bloom filter in front of the table for fast seen-before checks
+"""
+
+import hashlib
+import logging
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+FRONTIER_STATES = ('discovered', 'in_flight', 'done', 'failed')
+
+FRONTIER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'discovered',
+    priority INTEGER NOT NULL DEFAULT 0,
+    retries INTEGER NOT NULL DEFAULT 0,
+    next_eligible_at REAL NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    claimed_by TEXT,
+    lease_expires_at REAL,
+    discovered_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_ready ON frontier(state, source, priority DESC, next_eligible_at);
+"""
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one BLAKE2b digest)"""
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        self.capacity = max(capacity, 1)
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(int(-self.capacity * math.log(false_positive_rate) / math.log(2) ** 2), 8)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class URLFrontier:
+    """SQLite-backed URL frontier shared by collectors, workers and restarts"""
+
+    def __init__(self, db_path: Union[str, Path] = 'data/frontier/url_frontier.db', lease_seconds: float = 300,
+                 max_retries: int = 3, retry_backoff_seconds: float = 60, expected_urls: int = 100_000,
+                 false_positive_rate: float = 0.001, wal: bool = True):
+        self.db_path = str(db_path)
+        self.lease_seconds = lease_seconds                  # In-flight time before a claim is presumed dead
+        self.max_retries = max_retries                      # Failures before a URL is given up
+        self.retry_backoff_seconds = retry_backoff_seconds  # Doubled on every retry
+        self.expected_urls = expected_urls
+        self.false_positive_rate = false_positive_rate
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection guarded by a lock (worker threads); other processes coordinate through SQLite locks
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        # WAL needs shared memory between processes, so it is off when machines share the file over a network filesystem
+        if self.db_path != ':memory:' and wal:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(FRONTIER_SCHEMA)
+
+        self._bloom = self._build_bloom()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM frontier').fetchone()[0]
+
+    def __contains__(self, url: str) -> bool:
+        """Whether the URL is known; Bloom hits skip the database"""
+        if url in self._bloom:
+            return True
+        with self._lock:
+            known = self._connection.execute('SELECT 1 FROM frontier WHERE url = ?', (url,)).fetchone() is not None
+        if known:
+            self._remember(url)
+        return known
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+
+    def add(self, url: str, priority: int = 0, source: str = '') -> bool:
+        """Add one discovered URL, returning True when it was new"""
+        return self.add_many([url], priority=priority, source=source) == 1
+
+    def add_many(self, urls: Iterable[str], priority: int = 0, source: str = '') -> int:
+        """
+        Add discovered URLs; URLs any process has seen before are ignored.
+
+        Args:
+            urls: Discovered URLs
+            priority: Higher priorities are claimed first
+            source: Discovering strategy / neighborhood, used to scope claims
+
+        Returns:
+            int: Number of URLs that were new to the frontier
+        """
+        # Bloom hits are known URLs (rare false positives are skipped too - a crawler's usual trade-off)
+        candidates = list(dict.fromkeys(url for url in urls if url not in self._bloom))
+        if not candidates:
+            return 0
+
+        now = time.time()
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO frontier (url, state, priority, next_eligible_at, source, discovered_at, updated_at) '
+                    "VALUES (?, 'discovered', ?, ?, ?, ?, ?)",
+                    [(url, priority, now, source, now, now) for url in candidates]
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            added = self._connection.total_changes - before
+
+        for url in candidates:
+            self._remember(url)
+        return added
+
+    def mark_done(self, urls: Iterable[str], source: str = '') -> int:
+        """Record URLs completed outside the frontier (e.g. resumed from a checkpoint log)"""
+        now = time.time()
+        urls = list(urls)
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany(
+                    'INSERT INTO frontier (url, state, next_eligible_at, source, discovered_at, updated_at) '
+                    "VALUES (?, 'done', ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET state = 'done', claimed_by = NULL, updated_at = excluded.updated_at "
+                    "WHERE state != 'done'",
+                    [(url, now, source, now, now) for url in urls]
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            changed = self._connection.total_changes - before
+
+        for url in urls:
+            self._remember(url)
+        return changed
+
+    # ------------------------------------------------------------------
+    # Work claims
+    # ------------------------------------------------------------------
+
+    def claim(self, worker_id: str, limit: int = 1, source: Optional[str] = None) -> List[Dict]:
+        """
+        Atomically claim eligible URLs for one worker.
+
+        Discovered URLs whose next-eligible time has passed are claimed by priority,
+        together with in-flight URLs whose lease expired (their worker died).
+
+        Args:
+            worker_id: Claiming worker; only it can complete, fail or release the claim
+            limit: Maximum URLs to claim
+            source: Only claim URLs discovered by this source
+
+        Returns:
+            List[Dict]: url, priority, retries and source of each claimed URL
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                # Expired leases that already used their retries are given up
+                self._connection.execute(
+                    "UPDATE frontier SET state = 'failed', claimed_by = NULL, updated_at = ?, "
+                    "last_error = COALESCE(last_error, 'lease expired') "
+                    "WHERE state = 'in_flight' AND lease_expires_at <= ? AND retries + 1 >= ?",
+                    (now, now, self.max_retries)
+                )
+                rows = self._connection.execute(
+                    "UPDATE frontier SET retries = retries + (state = 'in_flight'), state = 'in_flight', "
+                    'claimed_by = ?, lease_expires_at = ?, updated_at = ? '
+                    'WHERE url IN ('
+                    '    SELECT url FROM frontier '
+                    "    WHERE ((state = 'discovered' AND next_eligible_at <= ?) "
+                    "           OR (state = 'in_flight' AND lease_expires_at <= ?)) "
+                    '      AND (? IS NULL OR source = ?) '
+                    '    ORDER BY priority DESC, next_eligible_at LIMIT ?'
+                    ') RETURNING url, priority, retries, source',
+                    (worker_id, now + self.lease_seconds, now, now, now, source, source, limit)
+                ).fetchall()
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        claimed = [{'url': url, 'priority': priority, 'retries': retries, 'source': url_source}
+                   for url, priority, retries, url_source in rows]
+        claimed.sort(key=lambda entry: -entry['priority'])
+        return claimed
+
+    def complete(self, url: str, worker_id: str) -> bool:
+        """Mark a URL claimed by worker_id as done; False when the claim was lost (lease expired and reclaimed)"""
+        return self._finish(url, worker_id,
+                            "state = 'done', claimed_by = NULL, lease_expires_at = NULL, updated_at = ?", (time.time(),))
+
+    def fail(self, url: str, worker_id: str, error: str = '') -> bool:
+        """Record a failed fetch; the URL is retried with backoff until max_retries"""
+        now = time.time()
+        return self._finish(
+            url, worker_id,
+            "retries = retries + 1, "
+            "state = CASE WHEN retries + 1 >= ? THEN 'failed' ELSE 'discovered' END, "
+            'next_eligible_at = ? + ? * (1 << MIN(retries, 16)), '
+            'claimed_by = NULL, lease_expires_at = NULL, updated_at = ?, last_error = ?',
+            (self.max_retries, now, self.retry_backoff_seconds, now, error[:500])
+        )
+
+    def release(self, url: str, worker_id: str) -> bool:
+        """Return a claimed URL unprocessed (no retry is counted)"""
+        return self._finish(url, worker_id,
+                            "state = 'discovered', claimed_by = NULL, lease_expires_at = NULL, updated_at = ?",
+                            (time.time(),))
+
+    def _finish(self, url: str, worker_id: str, assignments: str, params: tuple) -> bool:
+        # A worker whose lease expired must not finish a URL another worker has since reclaimed
+        with self._lock:
+            cursor = self._connection.execute(
+                f"UPDATE frontier SET {assignments} WHERE url = ? AND state = 'in_flight' AND claimed_by = ?",
+                params + (url, worker_id)
+            )
+        if cursor.rowcount == 0:
+            logger.debug(f"Claim on {url} no longer held by {worker_id}")
+        return cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def state(self, url: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute('SELECT state FROM frontier WHERE url = ?', (url,)).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> Dict:
+        """URL counts per state plus Bloom filter occupancy"""
+        with self._lock:
+            counts = dict(self._connection.execute('SELECT state, COUNT(*) FROM frontier GROUP BY state').fetchall())
+            retried = self._connection.execute('SELECT COUNT(*) FROM frontier WHERE retries > 0').fetchone()[0]
+
+        return {
+            **{state: counts.get(state, 0) for state in FRONTIER_STATES},
+            'total': sum(counts.values()),
+            'retried': retried,
+            'bloom_items': self._bloom.count,
+            'bloom_capacity': self._bloom.capacity,
+        }
+
+    # ------------------------------------------------------------------
+    # Bloom filter
+    # ------------------------------------------------------------------
+
+    def _build_bloom(self) -> BloomFilter:
+        """Bloom filter sized for at least twice the URLs already in the frontier"""
+        with self._lock:
+            known = self._connection.execute('SELECT COUNT(*) FROM frontier').fetchone()[0]
+            bloom = BloomFilter(max(self.expected_urls, known * 2), self.false_positive_rate)
+            for (url,) in self._connection.execute('SELECT url FROM frontier'):
+                bloom.add(url)
+
+        if known:
+            logger.info(f"♻️ URL frontier {self.db_path} resumed with {known} URLs")
+        return bloom
+
+    def _remember(self, url: str):
+        self._bloom.add(url)
+        if self._bloom.count > self._bloom.capacity:
+            self._bloom = self._build_bloom()  # Grow before the false-positive rate degrades
+
+
+def main():
+    """Example: two workers sharing a frontier, with a failure and a crash"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as frontier_dir:
+        db_path = Path(frontier_dir) / 'frontier.db'
+        urls = [f'https://www.spitogatos.gr/en/property/{1117000000 + i}' for i in range(20)]
+
+        worker_a = URLFrontier(db_path, lease_seconds=0.1, retry_backoff_seconds=0)
+        worker_b = URLFrontier(db_path, lease_seconds=0.1, retry_backoff_seconds=0)
+        print(f"Added by A: {worker_a.add_many(urls[:15])}, added by B: {worker_b.add_many(urls[10:])}")
+
+        batch_a = worker_a.claim('worker-a', limit=8)
+        batch_b = worker_b.claim('worker-b', limit=8)
+        print(f"Overlapping claims: {len({e['url'] for e in batch_a} & {e['url'] for e in batch_b})}")
+
+        for entry in batch_a:
+            worker_a.complete(entry['url'], 'worker-a')
+        worker_b.fail(batch_b[0]['url'], 'worker-b', 'timeout')
+        # Worker B "crashes" holding the rest of its batch; its leases expire and are reclaimed
+        time.sleep(0.2)
+        reclaimed = worker_a.claim('worker-a', limit=20)
+        print(f"Reclaimed after crash: {len(reclaimed)}")
+        print(f"Stale completion by B accepted: {worker_b.complete(batch_b[1]['url'], 'worker-b')}")
+        print(worker_a.stats())
+
+
+if __name__ == "__main__":
+    main()
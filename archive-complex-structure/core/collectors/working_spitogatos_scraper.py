@@ -13,13 +13,18 @@ import asyncio
 import json
 import logging
 import re
+import sys
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from playwright.async_api import async_playwright
-import random
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -69,9 +74,10 @@ class WorkingSpitogatosProperty:
 class WorkingSpitogatosScraper:
     """Scraper using EXACT working methodology from successful case study"""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[RateScheduler] = None):
         self.authentic_properties = []
         self.failed_extractions = []
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
         
         # EXACT working search URLs from your successful case study
         self.working_urls = [
@@ -114,7 +120,7 @@ class WorkingSpitogatosScraper:
         logger.info(f"🔍 Discovering from: {search_url}")
         
         try:
-            await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+            await self.scheduler.goto(page, search_url, wait_until='domcontentloaded', timeout=30000)
             await asyncio.sleep(3)
             
             # Handle cookie consent (seen in screenshot)
@@ -181,7 +187,7 @@ class WorkingSpitogatosScraper:
         """Extract property using EXACT case study success method"""
         
         try:
-            await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+            await self.scheduler.goto(page, url, wait_until='domcontentloaded', timeout=20000)
             await asyncio.sleep(2)
             
             # Get full HTML content for parsing (case study method)
@@ -348,12 +354,6 @@ class WorkingSpitogatosScraper:
                             all_properties.append(property_data)
                         else:
                             self.failed_extractions.append(url)
-                        
-                        # Human delay (case study timing)
-                        await asyncio.sleep(random.uniform(2, 5))
-                    
-                    # Break between searches
-                    await asyncio.sleep(random.uniform(5, 10))
                     
                 except Exception as e:
                     logger.error(f"❌ Search failed: {e}")
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+🗄️ Property Feature Store - Shared Columnar Property Features
+
+Materializes engineered property features once so analytics engines stop
+rebuilding DataFrames and re-deriving the same columns on every run:
+- Versioned Arrow IPC feature tables, memory-mapped for zero-copy reads
+- Keyed by property_id with a content hash per listing
+- Incremental upserts: only new or changed listings are re-engineered
+- Canonical price_per_sqm, energy-class ordinals and neighborhood frequencies
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+FEATURE_SCHEMA_VERSION = 1
+
+ENERGY_ORDINALS = {'A+': 8, 'A': 7, 'B+': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'F': 1, 'G': 0}
+NUMERIC_COLUMNS = ['price', 'sqm', 'rooms', 'floor', 'price_per_sqm']
+CATEGORICAL_COLUMNS = ['neighborhood', 'energy_class', 'property_type']
+KEY_COLUMNS = ['property_id', 'content_hash', 'ingested_at']
+DERIVED_COLUMNS = ['energy_ordinal', 'neighborhood_frequency']
+
+
+class PropertyFeatureStore:
+    """Versioned columnar feature table keyed by property_id and content hash"""
+
+    def __init__(self, store_dir: Union[str, Path] = 'data/feature_store', keep_versions: int = 5):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for PropertyFeatureStore")
+
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.store_dir / 'manifest.json'
+        self.keep_versions = keep_versions
+        self.logger = logging.getLogger(__name__)
+
+        self._tables = {}  # version -> memory-mapped table
+        self.manifest = self._load_manifest()
+
+    def __len__(self) -> int:
+        current = self._current_entry()
+        return current['rows'] if current else 0
+
+    @property
+    def version(self) -> int:
+        """Current feature table version (0 when empty)"""
+        return self.manifest['current_version']
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, properties: Union[List[Dict], pd.DataFrame]) -> Dict:
+        """
+        Add new listings and refresh changed ones, materializing a new version.
+
+        Args:
+            properties: Property records or DataFrame
+
+        Returns:
+            Dict: Counts of added, updated and unchanged listings plus the new version
+        """
+        incoming = properties.copy() if isinstance(properties, pd.DataFrame) else pd.DataFrame(list(properties))
+        stats = {'added': 0, 'updated': 0, 'unchanged': 0, 'version': self.version}
+
+        if incoming.empty:
+            return stats
+
+        incoming['content_hash'] = [self.content_hash(record) for record in incoming.to_dict('records')]
+        if 'property_id' not in incoming.columns:
+            incoming['property_id'] = incoming['content_hash']
+        incoming['property_id'] = incoming['property_id'].fillna(incoming['content_hash']).astype(str)
+        incoming = incoming.drop_duplicates('property_id', keep='last')
+
+        existing = self.frame() if self.version else pd.DataFrame(columns=KEY_COLUMNS)
+        known_hashes = dict(zip(existing['property_id'], existing['content_hash']))
+
+        previous_hash = incoming['property_id'].map(known_hashes)
+        is_new = previous_hash.isna()
+        is_changed = ~is_new & (previous_hash != incoming['content_hash'])
+        delta = incoming[is_new | is_changed]
+
+        stats['added'] = int(is_new.sum())
+        stats['updated'] = int(is_changed.sum())
+        stats['unchanged'] = int(len(incoming) - len(delta))
+
+        if delta.empty:
+            return stats
+
+        # Feature engineering only runs for the delta
+        delta = self._engineer_features(delta)
+
+        kept = existing[~existing['property_id'].isin(delta['property_id'])]
+        merged = pd.concat([kept, delta], ignore_index=True, sort=False) if len(kept) else delta.reset_index(drop=True)
+        if 'neighborhood' in merged.columns:
+            merged['neighborhood_frequency'] = self._neighborhood_frequency(merged)
+
+        stats['version'] = self._write_version(merged, stats)
+        self.logger.info(f"Feature store v{stats['version']}: {stats['added']} added, "
+                         f"{stats['updated']} updated, {stats['unchanged']} unchanged")
+        return stats
+
+    @staticmethod
+    def content_hash(record: Dict) -> str:
+        """Stable hash of a listing's source fields"""
+        source = {
+            key: value for key, value in record.items()
+            if key not in KEY_COLUMNS and key not in DERIVED_COLUMNS and not _is_missing(value)
+        }
+        payload = json.dumps(source, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Canonical typed columns and derived features for new or changed listings"""
+        df = df.copy()
+
+        # Only columns the source provides are materialized, so engines see the same feature set
+        for column in NUMERIC_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+
+        # Source price_per_sqm wins; otherwise derive from price and size
+        if 'price' in df.columns and 'sqm' in df.columns:
+            if 'price_per_sqm' not in df.columns:
+                df['price_per_sqm'] = np.nan
+            derivable = df['price_per_sqm'].isna() & (df['sqm'] > 0)
+            df.loc[derivable, 'price_per_sqm'] = df.loc[derivable, 'price'] / df.loc[derivable, 'sqm']
+
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].map(lambda value: None if _is_missing(value) else str(value))
+
+        if 'energy_class' in df.columns:
+            df['energy_ordinal'] = df['energy_class'].map(ENERGY_ORDINALS).astype('float64')
+        df['ingested_at'] = datetime.now().isoformat()
+        return df
+
+    def _neighborhood_frequency(self, df: pd.DataFrame) -> np.ndarray:
+        """Listing count of each row's neighborhood (0 when unknown)"""
+        counts = df['neighborhood'].value_counts()
+        return df['neighborhood'].map(counts).fillna(0).astype('int64').to_numpy()
+
+    def _write_version(self, df: pd.DataFrame, stats: Dict) -> int:
+        """Write a new Arrow IPC version and prune old ones"""
+        version = self.version + 1
+        filename = f'features_v{version:05d}.arrow'
+        table = _frame_to_table(df)
+
+        temp_path = self.store_dir / f'{filename}.tmp'
+        with pa.OSFile(str(temp_path), 'wb') as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(len(df), 1))
+        temp_path.replace(self.store_dir / filename)
+
+        self.manifest['versions'].append({
+            'version': version,
+            'file': filename,
+            'rows': len(df),
+            'added': stats['added'],
+            'updated': stats['updated'],
+            'feature_schema_version': FEATURE_SCHEMA_VERSION,
+            'created': datetime.now().isoformat()
+        })
+        self.manifest['current_version'] = version
+
+        for entry in self.manifest['versions'][:-self.keep_versions]:
+            (self.store_dir / entry['file']).unlink(missing_ok=True)
+            self._tables.pop(entry['version'], None)
+        self.manifest['versions'] = self.manifest['versions'][-self.keep_versions:]
+
+        self._save_manifest()
+        return version
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def table(self, version: Optional[int] = None) -> 'pa.Table':
+        """Memory-mapped feature table for a version (current by default)"""
+        entry = self._version_entry(version)
+        if entry is None:
+            return pa.table({column: pa.array([], pa.string()) for column in KEY_COLUMNS})
+
+        if entry['version'] not in self._tables:
+            source = pa.memory_map(str(self.store_dir / entry['file']), 'r')
+            self._tables[entry['version']] = pa_ipc.open_file(source).read_all()
+        return self._tables[entry['version']]
+
+    def column(self, name: str, version: Optional[int] = None) -> np.ndarray:
+        """Column as a NumPy array, a zero-copy view for numeric columns"""
+        chunked = self.table(version).column(name)
+        array = chunked.chunk(0) if chunked.num_chunks == 1 else chunked.combine_chunks()
+        if pa.types.is_floating(array.type) or pa.types.is_integer(array.type):
+            return array.to_numpy(zero_copy_only=array.null_count == 0)
+        return array.to_numpy(zero_copy_only=False)
+
+    def frame(self, columns: Optional[List[str]] = None, property_ids: Optional[Iterable[str]] = None,
+              version: Optional[int] = None) -> pd.DataFrame:
+        """
+        Feature table as a DataFrame backed by the memory-mapped buffers.
+
+        Args:
+            columns: Columns to load (all by default)
+            property_ids: Restrict to these listings; neighborhood_frequency is
+                recomputed over the returned rows
+            version: Table version (current by default)
+
+        Returns:
+            pd.DataFrame: Feature frame
+        """
+        table = self.table(version)
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+
+        df = table.to_pandas(split_blocks=True)
+
+        if property_ids is not None:
+            ids = pd.Index([str(property_id) for property_id in property_ids])
+            positions = pd.Index(self.column('property_id', version)).get_indexer(ids)
+            df = df.iloc[positions[positions >= 0]].reset_index(drop=True)
+            if 'neighborhood_frequency' in df.columns and 'neighborhood' in df.columns:
+                df['neighborhood_frequency'] = self._neighborhood_frequency(df)
+
+        return df
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict:
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'current_version': 0, 'versions': []}
+
+    def _save_manifest(self):
+        temp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        temp_path.replace(self.manifest_path)
+
+    def _current_entry(self) -> Optional[Dict]:
+        return self._version_entry(None)
+
+    def _version_entry(self, version: Optional[int]) -> Optional[Dict]:
+        version = self.version if version is None else version
+        for entry in self.manifest['versions']:
+            if entry['version'] == version:
+                return entry
+        if version:
+            raise KeyError(f"Feature table version {version} is not retained")
+        return None
+
+
+def as_property_frame(property_data, copy: bool = True) -> pd.DataFrame:
+    """
+    Resolve engine input to a DataFrame.
+
+    Args:
+        property_data: List of property dicts, DataFrame or PropertyFeatureStore
+        copy: Copy DataFrame input (store frames are always fresh)
+
+    Returns:
+        pd.DataFrame: Property frame
+    """
+    if isinstance(property_data, PropertyFeatureStore):
+        return property_data.frame()
+    if isinstance(property_data, pd.DataFrame):
+        return property_data.copy() if copy else property_data
+    return pd.DataFrame(property_data)
+
+
+def _is_missing(value) -> bool:
+    """True for None and scalar NaN values"""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return np.isnan(value)
+    return value is pd.NA or value is pd.NaT
+
+
+def _frame_to_table(df: pd.DataFrame) -> 'pa.Table':
+    """Convert a feature frame to Arrow, keeping float NaN as values so numeric reads stay zero-copy"""
+    arrays, names = [], []
+    for column in df.columns:
+        series = df[column]
+        if column in NUMERIC_COLUMNS or column == 'energy_ordinal':
+            array = pa.array(series.to_numpy(dtype='float64'), type=pa.float64())
+        elif column == 'neighborhood_frequency':
+            array = pa.array(series.to_numpy(dtype='int64'), type=pa.int64())
+        else:
+            try:
+                array = pa.array(series, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Mixed-type passthrough fields are stored as text
+                array = pa.array([None if _is_missing(value) else str(value) for value in series], type=pa.string())
+        arrays.append(array)
+        names.append(str(column))
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+# Example usage
+def main():
+    """Materialize the authentic dataset into a local feature store"""
+    project_root = Path(__file__).parent.parent.parent
+    dataset_files = sorted((project_root / 'realdata').glob('athens_100_percent_authentic_*.json'))
+    if not dataset_files:
+        print("❌ No authentic dataset found")
+        return
+
+    with open(dataset_files[-1], 'r', encoding='utf-8') as f:
+        properties = json.load(f).get('properties', [])
+
+    store = PropertyFeatureStore(project_root / 'data' / 'feature_store')
+    stats = store.upsert(properties)
+
+    print("🗄️ Property Feature Store")
+    print(f"   Version: v{stats['version']} ({len(store)} listings)")
+    print(f"   Added: {stats['added']}, updated: {stats['updated']}, unchanged: {stats['unchanged']}")
+    print(f"   Mean price/m²: €{np.nanmean(store.column('price_per_sqm')):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
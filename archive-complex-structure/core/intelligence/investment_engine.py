@@ -8,8 +8,8 @@ with precise ROI calculations, risk assessment, and strategic recommendations.
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Union, Callable
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 import json
 import logging
@@ -73,6 +73,53 @@ class InvestmentOpportunity:
     prediction_confidence: float
     recommendation_confidence: float
 
+@dataclass
+class InvestmentScoreBatch:
+    """Columnar (struct-of-arrays) investment scores for a batch of properties
+
+    Every attribute is a NumPy array with one entry per analyzable row;
+    ``row_index`` maps each entry back to its position in the input batch.
+    """
+    row_index: np.ndarray
+    neighborhood: np.ndarray
+    energy_class: np.ndarray
+    price: np.ndarray
+    sqm: np.ndarray
+    
+    # Investment Intelligence
+    investment_score: np.ndarray
+    investment_grade: np.ndarray
+    risk_level: np.ndarray
+    
+    # Financial Projections
+    estimated_roi: np.ndarray
+    monthly_rental_yield: np.ndarray
+    break_even_months: np.ndarray
+    five_year_appreciation: np.ndarray
+    
+    # Strategic Recommendations
+    strategy: np.ndarray
+    recommended_action: np.ndarray
+    target_price: np.ndarray
+    max_offer_price: np.ndarray
+    
+    # Value Engineering
+    current_value_per_sqm: np.ndarray
+    post_improvement_value_per_sqm: np.ndarray
+    improvement_cost: np.ndarray
+    net_value_increase: np.ndarray
+    
+    # Risk Assessment
+    overall_risk_score: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.row_index)
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the batch as a DataFrame indexed by input row"""
+        columns = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'row_index'}
+        return pd.DataFrame(columns, index=pd.Index(self.row_index, name='row_index'))
+
 class InvestmentIntelligenceEngine:
     """
     Advanced investment intelligence engine for Athens real estate
@@ -219,6 +266,200 @@ class InvestmentIntelligenceEngine:
         
         return opportunities
     
+    def score_properties_batch(self, properties: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> InvestmentScoreBatch:
+        """
+        Columnar batch scoring - score every property in a single vectorized pass
+        
+        Accepts a DataFrame (or a dict of equal-length arrays) with price, sqm,
+        neighborhood and energy_class columns. Produces the same scores, grades,
+        risk levels, ROI projections and pricing as generate_investment_opportunity,
+        but categorical inputs are resolved once per distinct value and all
+        threshold rules run as np.select over whole columns.
+        """
+        frame = properties if isinstance(properties, pd.DataFrame) else pd.DataFrame(properties)
+        n_rows = len(frame)
+        
+        neighborhood = self._batch_column(frame, 'neighborhood', '').astype(object)
+        energy_class = self._batch_column(frame, 'energy_class', 'C').astype(object)
+        price = pd.to_numeric(self._batch_column(frame, 'price', 0), errors='coerce').fillna(0).to_numpy(dtype=float)
+        sqm = pd.to_numeric(self._batch_column(frame, 'sqm', 0), errors='coerce').fillna(0).to_numpy(dtype=float)
+        neighborhood = neighborhood.fillna('').to_numpy()
+        energy_class = energy_class.fillna('C').to_numpy()
+        
+        # Same admission rule as the per-property path: neighborhood, price and sqm must be set
+        valid = (neighborhood != '') & (price != 0) & (sqm != 0)
+        row_index = np.flatnonzero(valid)
+        neighborhood, energy_class = neighborhood[valid], energy_class[valid]
+        price, sqm = price[valid], sqm[valid]
+        
+        # ROI projections only depend on (neighborhood, energy_class); combinations the
+        # per-property path cannot project (zero rental yield) are dropped as it would
+        roi_metrics = {
+            key: self._categorical_lookup(
+                lambda n, e, key=key: self._safe_roi_projection(n, e, key),
+                neighborhood, energy_class
+            )
+            for key in ('estimated_roi', 'monthly_rental_yield', 'break_even_months', 'five_year_appreciation')
+        }
+        projectable = ~np.isnan(roi_metrics['break_even_months'])
+        if not projectable.all():
+            self.logger.error(f"Failed to project ROI for {int((~projectable).sum())} properties (zero rental yield)")
+            row_index, neighborhood, energy_class = row_index[projectable], neighborhood[projectable], energy_class[projectable]
+            price, sqm = price[projectable], sqm[projectable]
+            roi_metrics = {key: values[projectable] for key, values in roi_metrics.items()}
+        
+        self.logger.info(f"🧠 Batch scoring {len(row_index)}/{n_rows} properties")
+        
+        # Categorical lookups - each rule is evaluated once per distinct category
+        location_score = self._categorical_lookup(self.calculate_location_score, neighborhood)
+        energy_score = self._categorical_lookup(self.calculate_energy_efficiency_score, energy_class)
+        trend_score = self._categorical_lookup(self.calculate_market_trend_score, neighborhood)
+        roi_score = self._categorical_lookup(
+            lambda n, e: self.calculate_roi_potential_score({'neighborhood': n, 'energy_class': e}),
+            neighborhood, energy_class
+        )
+        market_price = self._categorical_lookup(
+            lambda n: self.market_data['average_price_per_sqm'].get(n, 4000), neighborhood
+        )
+        
+        # Value score - price per sqm relative to neighborhood market price
+        price_per_sqm = price / sqm
+        value_ratio = market_price / price_per_sqm
+        value_score = np.select(
+            [value_ratio >= 1.20, value_ratio >= 1.15, value_ratio >= 1.10,
+             value_ratio >= 1.05, value_ratio >= 0.95, value_ratio >= 0.90],
+            [10.0, 9.0, 8.0, 7.0, 6.0, 4.0],
+            default=2.0
+        )
+        
+        # Weighted composite score
+        weights = self.config['scoring_weights']
+        investment_score = np.clip(
+            location_score * weights['location'] +
+            energy_score * weights['energy_efficiency'] +
+            value_score * weights['value'] +
+            trend_score * weights['market_trend'] +
+            roi_score * weights['roi_potential'],
+            1.0, 10.0
+        )
+        
+        investment_grade = np.select(
+            [investment_score >= 9.0, investment_score >= 8.5, investment_score >= 7.5,
+             investment_score >= 6.5, investment_score >= 5.5, investment_score >= 4.5],
+            ["A+", "A", "B+", "B", "C+", "C"],
+            default="D"
+        ).astype(object)
+        
+        # Risk level - score based, then adjusted for energy class
+        base_risk = np.select([investment_score >= 8.5, investment_score >= 6.5], ["LOW", "MEDIUM"], default="HIGH")
+        risk_level = np.select(
+            [np.isin(energy_class, ["D", "E", "F"]) & (base_risk == "LOW"),
+             np.isin(energy_class, ["A+", "A"]) & (base_risk == "HIGH")],
+            ["MEDIUM", "MEDIUM"],
+            default=base_risk
+        ).astype(object)
+        
+        # Strategy selection
+        strategy = np.select(
+            [np.isin(energy_class, ["C", "D"]) & (investment_score >= 7.0) & (price_per_sqm < market_price * 0.9),
+             np.isin(energy_class, ["A+", "A", "B+"]) & (price_per_sqm < market_price * 0.85),
+             np.isin(neighborhood, ["Κουκάκι", "Εξάρχεια"]) & (investment_score >= 6.5)],
+            ["ENERGY_ARBITRAGE", "UNDERVALUED_EFFICIENT", "EMERGING_PREMIUM"],
+            default="HOLD_MONITOR"
+        ).astype(object)
+        
+        # Recommendation - first threshold tier that matches wins
+        estimated_roi = roi_metrics['estimated_roi']
+        recommendation_conditions = [
+            (investment_score >= thresholds['min_score']) &
+            (estimated_roi >= thresholds['min_roi']) &
+            ((risk_level == thresholds['max_risk']) |
+             ((risk_level == "MEDIUM") & (thresholds['max_risk'] == "HIGH")))
+            for thresholds in self.strategy_thresholds.values()
+        ]
+        recommended_action = np.select(
+            recommendation_conditions, list(self.strategy_thresholds.keys()), default="AVOID"
+        ).astype(object)
+        
+        # Pricing strategy
+        target_discount = np.select(
+            [investment_score >= 9.0, investment_score >= 7.5, investment_score >= 6.0],
+            [0.03, 0.07, 0.12],
+            default=0.18
+        )
+        target_price = np.trunc(price * (1 - target_discount)).astype(np.int64)
+        max_offer_price = np.trunc(price * (1 - target_discount + 0.02)).astype(np.int64)
+        
+        # Value engineering - energy retrofit for C/D, cosmetic otherwise
+        retrofit = np.isin(energy_class, ["C", "D"])
+        improvement_cost = sqm * np.where(retrofit, 250, 100)
+        value_increase_per_sqm = np.where(retrofit, 1200, 300)
+        
+        overall_risk_score = self._categorical_lookup(
+            lambda n, e: self.assess_investment_risks({'neighborhood': n, 'energy_class': e})['overall_risk_score'],
+            neighborhood, energy_class
+        )
+        
+        return InvestmentScoreBatch(
+            row_index=row_index,
+            neighborhood=neighborhood,
+            energy_class=energy_class,
+            price=price,
+            sqm=sqm,
+            investment_score=investment_score,
+            investment_grade=investment_grade,
+            risk_level=risk_level,
+            estimated_roi=estimated_roi,
+            monthly_rental_yield=roi_metrics['monthly_rental_yield'],
+            break_even_months=roi_metrics['break_even_months'].astype(np.int64),
+            five_year_appreciation=roi_metrics['five_year_appreciation'],
+            strategy=strategy,
+            recommended_action=recommended_action,
+            target_price=target_price,
+            max_offer_price=max_offer_price,
+            current_value_per_sqm=price_per_sqm,
+            post_improvement_value_per_sqm=price_per_sqm + value_increase_per_sqm,
+            improvement_cost=improvement_cost,
+            net_value_increase=value_increase_per_sqm * sqm - improvement_cost,
+            overall_risk_score=overall_risk_score
+        )
+    
+    def _safe_roi_projection(self, neighborhood: str, energy_class: str, key: str) -> float:
+        """Single ROI projection metric for a category pair, NaN when it cannot be projected"""
+        try:
+            return self.calculate_roi_projections(
+                {'price': 0, 'sqm': 0, 'neighborhood': neighborhood, 'energy_class': energy_class}
+            )[key]
+        except ZeroDivisionError:
+            return np.nan
+    
+    @staticmethod
+    def _batch_column(frame: pd.DataFrame, column: str, default) -> pd.Series:
+        """Return a batch column, or a constant column when it is absent"""
+        if column in frame.columns:
+            return frame[column].reset_index(drop=True)
+        return pd.Series([default] * len(frame), dtype=object)
+    
+    @staticmethod
+    def _categorical_lookup(rule: Callable, *columns: np.ndarray) -> np.ndarray:
+        """Evaluate a scalar rule once per distinct category tuple and broadcast it back"""
+        if len(columns[0]) == 0:
+            return np.empty(0, dtype=float)
+        codes = [pd.factorize(column) for column in columns]
+        combined = np.zeros(len(columns[0]), dtype=np.int64)
+        for column_codes, uniques in codes:
+            combined = combined * len(uniques) + column_codes
+        unique_keys, inverse = np.unique(combined, return_inverse=True)
+        
+        values = []
+        for key in unique_keys:
+            args = []
+            for column_codes, uniques in reversed(codes):
+                key, position = divmod(key, len(uniques))
+                args.append(uniques[position])
+            values.append(rule(*reversed(args)))
+        return np.asarray(values, dtype=float)[inverse]
+    
     def generate_investment_opportunity(self, property_data: Dict) -> Optional[InvestmentOpportunity]:
         """Generate complete investment opportunity profile for a single property"""
         
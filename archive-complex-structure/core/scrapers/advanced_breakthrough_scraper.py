@@ -10,6 +10,7 @@ Combining the three highest-success approaches for maximum real data extraction:
 import asyncio
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
@@ -21,6 +22,11 @@ from dataclasses import dataclass, asdict
 
 # Core imports
 from playwright.async_api import async_playwright, Page, BrowserContext
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.extraction_engine import parse_price, parse_sqm
 import httpx
 import requests
 
@@ -973,30 +979,11 @@ class AdvancedBreakthroughScraper:
     
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from text"""
-        if not price_text:
-            return None
-        
-        # Remove currency symbols and common text
-        clean_text = re.sub(r'[€$£,\s]', '', price_text)
-        
-        # Extract number
-        match = re.search(r'(\d+(?:\.\d+)?)', clean_text)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_price(price_text)
     
     def _parse_sqm(self, sqm_text: str) -> Optional[float]:
         """Parse SQM from text"""
-        if not sqm_text:
-            return None
-        
-        # Look for m² pattern
-        match = re.search(r'(\d+(?:\.\d+)?)\\s*m²', sqm_text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        
-        return None
+        return parse_sqm(sqm_text)
     
     async def breakthrough_bulk_extraction(self, target_count: int = 100) -> List[BreakthroughProperty]:
         """Perform bulk extraction using breakthrough methods"""
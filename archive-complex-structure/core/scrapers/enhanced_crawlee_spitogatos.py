@@ -14,8 +14,9 @@ Integration Features:
 import asyncio
 import json
 import logging
-import re
 import hashlib
+import os
+import sys
 from datetime import datetime
 from typing import List, Dict, Optional, Union, Any
 from dataclasses import dataclass, asdict
@@ -51,7 +52,16 @@ except ImportError:
 
 # Fallback to proven Playwright
 from playwright.async_api import async_playwright, BrowserContext, Page
-import httpx
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.page_archive import PageArchive, ArchivedRenderingEngine
+from core.collectors.extraction_engine import PropertyExtractor
+from core.collectors.http_pool import PooledHTTPClient
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler
+from core.collectors.render_router import RenderRouter, load_routing_config
+from core.collectors.url_frontier import URLFrontier
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -134,9 +144,16 @@ class EnhancedSpitogatosProperty:
 class AdaptiveRenderingEngine:
     """Intelligent HTTP/Browser rendering with automatic switching"""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[RateScheduler] = None, extractor: Optional[PropertyExtractor] = None,
+                 router: Optional[RenderRouter] = None, http_pool: Optional[PooledHTTPClient] = None):
         self.http_client = None
         self.browser_pool = None
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()  # Shared per-host request budget
+        self.extractor = extractor if extractor is not None else PropertyExtractor()  # Judges static completeness
+        self.router = router if router is not None else RenderRouter.from_config()
+        if http_pool is None:
+            http_pool = PooledHTTPClient(scheduler=self.scheduler, **load_routing_config()['http_pool'])
+        self.http_pool = http_pool  # Long-lived keep-alive / HTTP/2 connections when Crawlee is missing
         self.success_rates = {'http': 0.0, 'browser': 0.0}
         self.attempt_counts = {'http': 0, 'browser': 0}
         
@@ -152,39 +169,44 @@ class AdaptiveRenderingEngine:
         
         logger.info("🚀 Adaptive rendering engine initialized")
     
+    async def close(self):
+        """Close pooled HTTP connections (reopened lazily on the next fetch)"""
+        await self.http_pool.close()
+    
     async def adaptive_fetch(self, url: str) -> Dict[str, Any]:
-        """Intelligently choose between HTTP and browser rendering"""
+        """Fetch over HTTP when the URL's pattern renders statically, escalating incomplete pages to a browser"""
         
-        # Decision logic: use HTTP first, fallback to browser
         if self._should_use_http(url):
             result = await self._http_fetch(url)
-            if result['success']:
-                self._update_success_rate('http', True)
+            
+            # Removed listings are gone for the browser too
+            if result.get('status_code') in (404, 410):
+                return result
+            
+            complete = result['success'] and self._is_complete(result['content'])
+            if result.get('status_code'):  # Connection errors say nothing about how the page renders
+                self.router.record(url, 'http', complete)
+            self._update_success_rate('http', complete)
+            if complete:
                 return result
-            else:
-                self._update_success_rate('http', False)
         
-        # Fallback to browser rendering
+        # Browser rendering for client-rendered patterns and incomplete static pages
         result = await self._browser_fetch(url)
+        if result['success']:
+            self.router.record(url, 'browser', self._is_complete(result['content']))
         self._update_success_rate('browser', result['success'])
         return result
     
     def _should_use_http(self, url: str) -> bool:
-        """Decide whether to use HTTP based on success rates and URL patterns"""
-        
-        # If HTTP has higher success rate, prefer it
-        if self.success_rates['http'] > self.success_rates['browser'] + 0.1:
-            return True
-        
-        # For listing pages, prefer browser rendering
-        if any(pattern in url for pattern in ['/for_sale', '/for_rent', '/search']):
+        """Route by the learned static-render rate of the URL's pattern"""
+        return self.router.route(url) == 'http'
+    
+    def _is_complete(self, content: Optional[str]) -> bool:
+        """A page renders completely when price and size can be extracted from it"""
+        if not content:
             return False
-        
-        # For property pages, try HTTP first
-        if '/property/' in url:
-            return True
-        
-        return random.choice([True, False])  # Random for exploration
+        extraction = self.extractor.extract(content)
+        return bool(extraction.price and extraction.sqm)
     
     async def _http_fetch(self, url: str) -> Dict[str, Any]:
         """Enhanced HTTP fetching with advanced headers and fingerprinting"""
@@ -197,9 +219,7 @@ class AdaptiveRenderingEngine:
                 'User-Agent': self._get_rotating_user_agent(),
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'el-GR,el;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
                 'DNT': '1',
-                'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1',
                 'Sec-Fetch-Dest': 'document',
                 'Sec-Fetch-Mode': 'navigate',
@@ -208,21 +228,24 @@ class AdaptiveRenderingEngine:
             }
             
             if self.http_client and CRAWLEE_AVAILABLE:
-                response = await self.http_client.send_request(url, headers=headers)
-                content = response.text
-                status_code = response.status_code
-            else:
-                # Fallback to httpx
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url, headers=headers, timeout=30.0)
+                async with self.scheduler.request(url):
+                    response = await self.http_client.send_request(url, headers=headers)
                     content = response.text
                     status_code = response.status_code
+            else:
+                # Pooled httpx client (draws from the scheduler budget itself)
+                response = await self.http_pool.get(url, headers=headers)
+                if response.error:
+                    raise ConnectionError(response.error)
+                content = response.text
+                status_code = response.status_code
             
             response_time = int((time.time() - start_time) * 1000)
             
             return {
                 'success': status_code == 200,
                 'content': content,
+                'status_code': status_code,
                 'response_time_ms': response_time,
                 'method': 'http',
                 'detection_score': self._calculate_detection_risk(headers)
@@ -261,7 +284,7 @@ class AdaptiveRenderingEngine:
             await self._setup_anti_detection(page)
             
             # Navigate with intelligent waiting
-            await page.goto(url, wait_until='networkidle', timeout=30000)
+            await self.scheduler.goto(page, url, wait_until='networkidle', timeout=30000)
             
             # Human-like interaction simulation
             await self._simulate_human_behavior(page)
@@ -464,6 +487,7 @@ class AIEnhancedExtractor:
     def __init__(self):
         self.firecrawl = None
         self.crawl4ai = None
+        self.extractor = PropertyExtractor()
         
         if FIRECRAWL_AVAILABLE:
             try:
@@ -567,51 +591,35 @@ class AIEnhancedExtractor:
         }
     
     def _regex_enhanced_extraction(self, content: str) -> Dict[str, Any]:
-        """Enhanced regex patterns for fallback extraction"""
-        
-        enhanced_patterns = {
-            'price': [
-                r'€\s*([\d,]+(?:\.\d{2})?)',
-                r'price["\']?\s*:\s*["\']?([\d,]+)',
-                r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*€'
-            ],
-            'sqm': [
-                r'(\d+(?:\.\d+)?)\s*m²',
-                r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
-                r'area["\']?\s*:\s*["\']?(\d+(?:\.\d+)?)'
-            ],
-            'energy': [
-                r'energy[^>]*class[^>]*[>"]([A-G][\+\-]?)',
-                r'ενεργειακή[^>]*κλάση[^>]*[>"]([A-G][\+\-]?)',
-                r'class["\']?\s*:\s*["\']?([A-G][\+\-]?)'
-            ]
-        }
-        
-        extracted = {}
-        confidence = 0.7  # Base confidence for regex
+        """Compiled single-pass extraction for fallback"""
         
-        for field, patterns in enhanced_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    extracted[field] = match.group(1)
-                    confidence += 0.1
-                    break
+        extraction = self.extractor.extract(content)
+        extracted = {
+            field: getattr(extraction, field)
+            for field in ('title', 'price', 'sqm', 'energy_class') if getattr(extraction, field)
+        }
         
         return {
             'enhanced': False,
-            'confidence': min(confidence, 1.0),
+            'confidence': min(0.7 + 0.1 * sum(1 for field in ('price', 'sqm', 'energy_class') if field in extracted), 1.0),
+            'evidence_confidence': extraction.overall_confidence,
+            'field_confidence': extraction.confidence,
             'extracted_data': extracted
         }
 
 class EnhancedCrawleeSpitogatosScraper:
     """Main scraper class combining all 2025 enhancements with proven methodology"""
     
-    def __init__(self):
-        self.rendering_engine = AdaptiveRenderingEngine()
+    def __init__(self, page_archive: Optional[PageArchive] = None, frontier: Optional[URLFrontier] = None,
+                 scheduler: Optional[RateScheduler] = None):
         self.ai_extractor = AIEnhancedExtractor()
+        self.rendering_engine = AdaptiveRenderingEngine(scheduler, self.ai_extractor.extractor)
         self.authentic_properties = []
-        self.processed_urls = set()
+        self.frontier = frontier if frontier is not None else URLFrontier(
+            Path(__file__).parent.parent.parent / 'data' / 'frontier' / 'enhanced_crawlee.db')
+        self.frontier_worker_id = f"enhanced-crawlee-{os.getpid()}"
+        self.page_archive = page_archive if page_archive is not None else PageArchive()
+        self.extractor = self.ai_extractor.extractor  # Shared so routing, the fallback and proven pass parse once
         
         # Proven patterns from existing successful scraper
         self.proven_id_ranges = [
@@ -647,14 +655,18 @@ class EnhancedCrawleeSpitogatosScraper:
             # Step 1: Adaptive content fetching
             fetch_result = await self.rendering_engine.adaptive_fetch(url)
             
+            # A failed fetch is retried by the frontier; None means the page is not a valid listing
             if not fetch_result['success']:
-                logger.warning(f"❌ Failed to fetch {url}")
-                return None
+                raise ConnectionError(f"Failed to fetch {url}: {fetch_result.get('error', 'no content')}")
             
             content = fetch_result['content']
             response_time = fetch_result.get('response_time_ms', 0)
             detection_score = fetch_result.get('detection_score', 0.5)
             
+            # Archive raw HTML for offline re-extraction
+            if not fetch_result.get('archived'):
+                self.page_archive.capture(None, url, content, 'enhanced_crawlee')
+            
             # Step 2: AI-enhanced extraction
             ai_result = await self.ai_extractor.ai_enhanced_extraction(content, url)
             
@@ -680,7 +692,7 @@ class EnhancedCrawleeSpitogatosScraper:
                 
         except Exception as e:
             logger.error(f"❌ Enhanced extraction failed for {url}: {e}")
-            return None
+            raise
         finally:
             self.method_performance['total_attempts'] += 1
             
@@ -689,51 +701,23 @@ class EnhancedCrawleeSpitogatosScraper:
                            max(self.method_performance['total_attempts'], 1))
             logger.debug(f"📊 Current success rate: {success_rate:.2%}")
     
+    async def reextract_archived(self, page) -> Optional[EnhancedSpitogatosProperty]:
+        """Re-run extraction on an archived page (no browser or network)"""
+        
+        # Offline mode for this scraper instance: archive fetches, regex extraction only
+        self.rendering_engine = ArchivedRenderingEngine(page)
+        self.ai_extractor.firecrawl = None
+        self.ai_extractor.crawl4ai = None
+        return await self.enhanced_property_extraction(page.url)
+    
     def _extract_with_proven_patterns(self, content: str) -> Dict[str, Any]:
         """Extract using proven patterns from successful case study"""
         
-        # Exact patterns from proven_spitogatos_scraper.py
-        price_patterns = [
-            r'€\s*([\d,]+(?:\.\d{2})?)',
-            r'price["\']?\s*:\s*["\']?([\d,]+)',
-        ]
-        
-        sqm_patterns = [
-            r'(\d+(?:\.\d+)?)\s*m²',
-            r'(\d+(?:\.\d+)?)\s*τ\.μ\.',
-        ]
-        
-        title_pattern = r'<h1[^>]*>(.*?)</h1>'
-        
-        extracted = {}
-        
-        # Extract price
-        for pattern in price_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    price_str = match.group(1).replace(',', '')
-                    extracted['price'] = float(price_str)
-                    break
-                except:
-                    continue
-        
-        # Extract SQM
-        for pattern in sqm_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    extracted['sqm'] = float(match.group(1))
-                    break
-                except:
-                    continue
-        
-        # Extract title
-        match = re.search(title_pattern, content, re.IGNORECASE | re.DOTALL)
-        if match:
-            extracted['title'] = match.group(1).strip()
-        
-        return extracted
+        extraction = self.extractor.extract(content)
+        return {
+            field: getattr(extraction, field)
+            for field in ('title', 'price', 'sqm') if getattr(extraction, field)
+        }
     
     def _merge_extraction_results(self, proven_data: Dict, ai_result: Dict) -> Dict[str, Any]:
         """Intelligently merge proven patterns with AI-enhanced results"""
@@ -833,9 +817,6 @@ class EnhancedCrawleeSpitogatosScraper:
             success_rate = len(authentic_batch) / len(batch) if batch else 0
             
             logger.info(f"✅ Batch completed: {len(authentic_batch)}/{len(batch)} success rate: {success_rate:.1%} ({batch_time:.1f}s)")
-            
-            # Adaptive delay based on success rate and detection scores
-            await self._adaptive_batch_delay(success_rate, authentic_batch)
         
         # Final performance summary
         total_success_rate = len(all_properties) / max(self.method_performance['total_attempts'], 1)
@@ -845,7 +826,12 @@ class EnhancedCrawleeSpitogatosScraper:
         logger.info(f"   📈 Success Rate: {total_success_rate:.1%}")
         logger.info(f"   🤖 AI Enhanced: {sum(1 for p in all_properties if p.ai_enhanced)}")
         logger.info(f"   ⚡ Avg Response Time: {self._calculate_avg_response_time(all_properties):.0f}ms")
+        logger.info(f"   🧭 Fetches: {self.rendering_engine.attempt_counts['http']} HTTP, "
+                    f"{self.rendering_engine.attempt_counts['browser']} browser")
+        for route in self.rendering_engine.router.stats()[:5]:
+            logger.info(f"      {route['pattern']} → {route['route']}")
         
+        await self.rendering_engine.close()
         return all_properties[:target_count]
     
     def _generate_enhanced_property_urls(self, count: int) -> List[str]:
@@ -872,22 +858,24 @@ class EnhancedCrawleeSpitogatosScraper:
         """Process batch of URLs with enhanced concurrency and error handling"""
         
         # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(3)  # Max 3 concurrent requests
+        semaphore = asyncio.Semaphore(3)  # Max 3 extractions in flight; request pacing is the scheduler's
+        
+        # Only URLs no run has claimed before (plus retries that are due) are fetched
+        self.frontier.add_many(urls, source='enhanced_crawlee')
+        claimed = self.frontier.claim(self.frontier_worker_id, limit=len(urls), source='enhanced_crawlee')
         
         async def process_single_url(url: str) -> Optional[EnhancedSpitogatosProperty]:
             async with semaphore:
-                if url in self.processed_urls:
-                    return None
-                
-                self.processed_urls.add(url)
-                result = await self.enhanced_property_extraction(url)
-                
-                # Small delay between requests
-                await asyncio.sleep(random.uniform(1.0, 3.0))
+                try:
+                    result = await self.enhanced_property_extraction(url)
+                except Exception as e:
+                    self.frontier.fail(url, self.frontier_worker_id, str(e))
+                    raise
+                self.frontier.complete(url, self.frontier_worker_id)
                 return result
         
         # Process all URLs concurrently with controlled parallelism
-        tasks = [process_single_url(url) for url in urls]
+        tasks = [process_single_url(entry['url']) for entry in claimed]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Filter out exceptions and None results
@@ -900,30 +888,6 @@ class EnhancedCrawleeSpitogatosScraper:
         
         return valid_results
     
-    async def _adaptive_batch_delay(self, success_rate: float, properties: List[EnhancedSpitogatosProperty]):
-        """Adaptive delay between batches based on performance and detection risk"""
-        
-        base_delay = 10.0  # Base 10 second delay
-        
-        # Adjust based on success rate
-        if success_rate < 0.1:  # Low success rate
-            delay_multiplier = 3.0
-        elif success_rate < 0.2:  # Medium success rate
-            delay_multiplier = 2.0
-        else:  # Good success rate
-            delay_multiplier = 1.0
-        
-        # Adjust based on detection scores
-        if properties:
-            avg_detection = sum(p.detection_score or 0.5 for p in properties) / len(properties)
-            if avg_detection > 0.7:  # High detection risk
-                delay_multiplier *= 1.5
-        
-        final_delay = base_delay * delay_multiplier
-        logger.debug(f"⏰ Batch delay: {final_delay:.1f}s (success: {success_rate:.1%})")
-        
-        await asyncio.sleep(final_delay)
-    
     def _calculate_avg_response_time(self, properties: List[EnhancedSpitogatosProperty]) -> float:
         """Calculate average response time for performance monitoring"""
         
@@ -15,6 +15,8 @@ Components:
 
 from .market_segmentation import MarketSegmentationEngine
 from .statistical_modeling import StatisticalModelingEngine
+from .model_training import ModelTrainingOrchestrator
+from .price_pipeline import PricePredictionPipeline
 from .neighborhood_intelligence import NeighborhoodIntelligenceEngine
 from .opportunity_scoring import Opportunityscoring
 from .risk_assessment import RiskAssessmentEngine
@@ -49,6 +51,8 @@ __all__ = [
     'AdvancedAnalyticsEngine',
     'MarketSegmentationEngine',
     'StatisticalModelingEngine', 
+    'ModelTrainingOrchestrator',
+    'PricePredictionPipeline',
     'NeighborhoodIntelligenceEngine',
     'OpportunityScoring',
     'RiskAssessmentEngine',
@@ -8,7 +8,8 @@ Uses multiple machine learning algorithms to identify market segments and opport
 
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN, AgglomerativeClustering
+from sklearn.neighbors import NearestNeighbors
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.metrics import silhouette_score
@@ -16,6 +17,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 import json
+from core.intelligence.feature_store import as_property_frame
 
 
 class MarketSegmentationEngine:
@@ -23,18 +25,33 @@ class MarketSegmentationEngine:
     Comprehensive market segmentation using advanced clustering algorithms.
     """
     
-    def __init__(self):
+    def __init__(self, silhouette_sample_size=5000, hierarchical_sample_size=2000, dbscan_sample_size=10000,
+                 minibatch_size=2048, random_state=42):
         self.scaler = StandardScaler()
         self.segments = {}
         self.segment_profiles = {}
         self.analysis_timestamp = None
+        
+        # Sampling limits keep silhouette, DBSCAN and hierarchical clustering bounded on large histories
+        self.silhouette_sample_size = silhouette_sample_size
+        self.hierarchical_sample_size = hierarchical_sample_size
+        self.dbscan_sample_size = dbscan_sample_size
+        self.minibatch_size = minibatch_size
+        self.random_state = random_state
+        
+        # Incremental segmentation state (warm-start centroids per k, feature reference)
+        self.kmeans_models = {}
+        self.best_k = None
+        self.feature_reference = None
     
-    def analyze(self, property_data):
+    def analyze(self, property_data, incremental=False):
         """
         Run comprehensive market segmentation analysis.
         
         Args:
-            property_data: List of property dictionaries or DataFrame
+            property_data: List of property dictionaries, DataFrame or PropertyFeatureStore
+            incremental: Use MiniBatchKMeans warm-started from the previous run's centroids
+                and keep the fitted state for update_segments
             
         Returns:
             dict: Comprehensive segmentation results with investment insights
@@ -42,16 +59,21 @@ class MarketSegmentationEngine:
         self.analysis_timestamp = datetime.now()
         
         # Convert to DataFrame if needed
-        if isinstance(property_data, list):
-            df = pd.DataFrame(property_data)
-        else:
-            df = property_data.copy()
+        df = as_property_frame(property_data)
         
         # Prepare features for clustering
         features_df = self._prepare_clustering_features(df)
         
         # Run multiple clustering algorithms
-        clustering_results = self._run_clustering_algorithms(features_df)
+        if incremental:
+            clustering_results = self._run_incremental_clustering(features_df)
+            self.feature_reference = self._build_feature_reference(df, features_df)
+        else:
+            # A full refit re-scales the features, so earlier warm-start state no longer applies
+            self.kmeans_models = {}
+            self.feature_reference = None
+            clustering_results = self._run_clustering_algorithms(features_df)
+        self.segments = clustering_results
         
         # Generate segment profiles
         segment_profiles = self._generate_segment_profiles(df, clustering_results)
@@ -72,13 +94,25 @@ class MarketSegmentationEngine:
             'segment_summary': self._generate_segment_summary(segment_profiles)
         }
         
-        self.segments = clustering_results
         self.segment_profiles = segment_profiles
         
         return results
     
-    def _prepare_clustering_features(self, df):
-        """Prepare and normalize features for clustering analysis."""
+    def _prepare_clustering_features(self, df, reference=None):
+        """
+        Prepare and normalize features for clustering analysis.
+        
+        Args:
+            df: Property DataFrame
+            reference: Feature reference from a previous incremental run; new listings are
+                encoded with its medians, neighborhood counts and feature columns
+            
+        Returns:
+            DataFrame: Clustering features
+        """
+        
+        if reference is not None:
+            return self._prepare_reference_features(df, reference)
         
         # Core features for clustering
         features = []
@@ -98,8 +132,11 @@ class MarketSegmentationEngine:
             features.append(df['sqm'].fillna(df['sqm'].median()))
             feature_names.append('sqm')
         
-        # Energy efficiency (convert to numeric)
-        if 'energy_class' in df.columns:
+        # Energy efficiency (convert to numeric, precomputed by the feature store)
+        if 'energy_ordinal' in df.columns:
+            features.append(df['energy_ordinal'].fillna(3))
+            feature_names.append('energy_numeric')
+        elif 'energy_class' in df.columns:
             energy_map = {'A+': 8, 'A': 7, 'B+': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'F': 1, 'G': 0}
             energy_numeric = df['energy_class'].map(energy_map).fillna(3)  # Default to C
             features.append(energy_numeric)
@@ -111,7 +148,10 @@ class MarketSegmentationEngine:
             feature_names.append('rooms')
         
         # Create neighborhood encoding (frequency-based)
-        if 'neighborhood' in df.columns:
+        if 'neighborhood_frequency' in df.columns:
+            features.append(df['neighborhood_frequency'])
+            feature_names.append('neighborhood_frequency')
+        elif 'neighborhood' in df.columns:
             neighborhood_counts = df['neighborhood'].value_counts()
             neighborhood_freq = df['neighborhood'].map(neighborhood_counts).fillna(0)
             features.append(neighborhood_freq)
@@ -126,6 +166,113 @@ class MarketSegmentationEngine:
         
         return features_df
     
+    def _build_feature_reference(self, df, features_df):
+        """Capture the encoding used for this run so later listings are featurized consistently."""
+        
+        return {
+            'feature_names': list(features_df.columns),
+            'medians': {
+                column: float(pd.to_numeric(df[column], errors='coerce').median())
+                for column in ['price_per_sqm', 'price', 'sqm', 'rooms'] if column in df.columns
+            },
+            'feature_medians': features_df.median().to_dict(),
+            'neighborhood_counts': df['neighborhood'].value_counts().to_dict() if 'neighborhood' in df.columns else {}
+        }
+    
+    def _prepare_reference_features(self, df, reference):
+        """Featurize new listings with the encoding of the last incremental run."""
+        
+        medians = reference['medians']
+        columns = {}
+        
+        for column in ['price_per_sqm', 'sqm', 'rooms']:
+            if column in reference['feature_names']:
+                values = pd.to_numeric(df[column], errors='coerce') if column in df.columns else pd.Series(np.nan, index=df.index)
+                columns[column] = values.fillna(medians.get(column))
+        
+        if 'log_price' in reference['feature_names']:
+            values = pd.to_numeric(df['price'], errors='coerce') if 'price' in df.columns else pd.Series(np.nan, index=df.index)
+            columns['log_price'] = np.log1p(values.fillna(medians.get('price')))
+        
+        if 'energy_numeric' in reference['feature_names']:
+            if 'energy_ordinal' in df.columns:
+                columns['energy_numeric'] = df['energy_ordinal'].fillna(3)
+            else:
+                energy_map = {'A+': 8, 'A': 7, 'B+': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'F': 1, 'G': 0}
+                energy_class = df['energy_class'] if 'energy_class' in df.columns else pd.Series(None, index=df.index, dtype=object)
+                columns['energy_numeric'] = energy_class.map(energy_map).fillna(3)
+        
+        if 'neighborhood_frequency' in reference['feature_names']:
+            neighborhood = df['neighborhood'] if 'neighborhood' in df.columns else pd.Series(None, index=df.index, dtype=object)
+            columns['neighborhood_frequency'] = neighborhood.map(reference['neighborhood_counts']).fillna(0)
+        
+        features_df = pd.DataFrame(
+            {name: np.asarray(columns[name], dtype=float) for name in reference['feature_names']}
+        )
+        
+        return features_df.fillna(reference['feature_medians'])
+    
+    def _silhouette(self, features_scaled, labels):
+        """Silhouette score, computed on a random sample for large datasets."""
+        
+        sample_size = None
+        if len(features_scaled) > self.silhouette_sample_size:
+            sample_size = self.silhouette_sample_size
+        
+        return float(silhouette_score(features_scaled, labels, sample_size=sample_size,
+                                      random_state=self.random_state))
+    
+    def _sample_indices(self, n_rows, sample_size):
+        """Row positions of a reproducible random sample (all rows when small)."""
+        
+        if n_rows <= sample_size:
+            return np.arange(n_rows)
+        rng = np.random.default_rng(self.random_state)
+        return np.sort(rng.choice(n_rows, size=sample_size, replace=False))
+    
+    def _run_dbscan(self, features_scaled):
+        """DBSCAN on a sample; remaining points join their nearest core point within eps."""
+        
+        eps = 0.5
+        sample = self._sample_indices(len(features_scaled), self.dbscan_sample_size)
+        dbscan = DBSCAN(eps=eps, min_samples=5)
+        sample_labels = dbscan.fit_predict(features_scaled[sample])
+        
+        if len(sample) == len(features_scaled):
+            return sample_labels
+        
+        labels = np.full(len(features_scaled), -1)
+        labels[sample] = sample_labels
+        core_points = sample[dbscan.core_sample_indices_]
+        
+        if len(core_points) > 0:
+            rest = np.setdiff1d(np.arange(len(features_scaled)), sample)
+            neighbors = NearestNeighbors(n_neighbors=1).fit(features_scaled[core_points])
+            distances, nearest = neighbors.kneighbors(features_scaled[rest])
+            within_eps = distances[:, 0] <= eps
+            labels[rest[within_eps]] = labels[core_points[nearest[within_eps, 0]]]
+        
+        return labels
+    
+    def _run_hierarchical(self, features_scaled, n_clusters):
+        """Agglomerative clustering on a sample; remaining points join the nearest cluster mean."""
+        
+        sample = self._sample_indices(len(features_scaled), self.hierarchical_sample_size)
+        hierarchical = AgglomerativeClustering(n_clusters=n_clusters)
+        sample_labels = hierarchical.fit_predict(features_scaled[sample])
+        
+        if len(sample) == len(features_scaled):
+            return sample_labels
+        
+        cluster_means = np.vstack([
+            features_scaled[sample][sample_labels == cluster].mean(axis=0) for cluster in range(n_clusters)
+        ])
+        distances = ((features_scaled[:, None, :] - cluster_means[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        labels[sample] = sample_labels
+        
+        return labels
+    
     def _run_clustering_algorithms(self, features_df):
         """Run multiple clustering algorithms and select best results."""
         
@@ -142,7 +289,7 @@ class MarketSegmentationEngine:
         for k in range(3, 8):
             kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
             labels = kmeans.fit_predict(features_scaled)
-            score = silhouette_score(features_scaled, labels)
+            score = self._silhouette(features_scaled, labels)
             
             if score > best_kmeans_score:
                 best_kmeans_score = score
@@ -155,13 +302,21 @@ class MarketSegmentationEngine:
             'silhouette_score': best_kmeans_score
         }
         
+        clustering_results.update(self._run_density_and_hierarchical(features_scaled, best_kmeans_k))
+        
+        return self._select_best_method(clustering_results)
+    
+    def _run_density_and_hierarchical(self, features_scaled, n_clusters):
+        """Run DBSCAN and hierarchical clustering for comparison with k-means."""
+        
+        clustering_results = {}
+        
         # DBSCAN clustering
-        dbscan = DBSCAN(eps=0.5, min_samples=5)
-        dbscan_labels = dbscan.fit_predict(features_scaled)
+        dbscan_labels = self._run_dbscan(features_scaled)
         n_clusters_dbscan = len(set(dbscan_labels)) - (1 if -1 in dbscan_labels else 0)
         
         if n_clusters_dbscan > 1:
-            dbscan_score = silhouette_score(features_scaled, dbscan_labels)
+            dbscan_score = self._silhouette(features_scaled, dbscan_labels)
         else:
             dbscan_score = -1
         
@@ -169,20 +324,120 @@ class MarketSegmentationEngine:
             'labels': dbscan_labels.tolist(),
             'n_clusters': n_clusters_dbscan,
             'silhouette_score': dbscan_score,
-            'n_noise_points': list(dbscan_labels).count(-1)
+            'n_noise_points': int((dbscan_labels == -1).sum())
         }
         
         # Hierarchical clustering
-        hierarchical = AgglomerativeClustering(n_clusters=best_kmeans_k)
-        hierarchical_labels = hierarchical.fit_predict(features_scaled)
-        hierarchical_score = silhouette_score(features_scaled, hierarchical_labels)
+        hierarchical_labels = self._run_hierarchical(features_scaled, n_clusters)
+        hierarchical_score = self._silhouette(features_scaled, hierarchical_labels)
         
         clustering_results['hierarchical'] = {
             'labels': hierarchical_labels.tolist(),
-            'n_clusters': best_kmeans_k,
+            'n_clusters': n_clusters,
             'silhouette_score': hierarchical_score
         }
         
+        return clustering_results
+    
+    def _run_incremental_clustering(self, features_df):
+        """
+        Mini-batch k-means warm-started from the previous run's centroids.
+        
+        The scaler is fitted on the first incremental run and then frozen so stored
+        centroids stay in the same feature space across daily refreshes.
+        """
+        
+        if self.kmeans_models:
+            features_scaled = self.scaler.transform(features_df)
+        else:
+            features_scaled = self.scaler.fit_transform(features_df)
+        
+        clustering_results = {}
+        warm_started = bool(self.kmeans_models)
+        
+        best_kmeans_score = -1
+        best_kmeans_k = 3
+        best_kmeans_labels = None
+        
+        for k in range(3, 8):
+            previous = self.kmeans_models.get(k)
+            if previous is not None:
+                kmeans = MiniBatchKMeans(n_clusters=k, init=previous.cluster_centers_, n_init=1,
+                                         batch_size=self.minibatch_size, random_state=self.random_state)
+            else:
+                kmeans = MiniBatchKMeans(n_clusters=k, n_init=3, batch_size=self.minibatch_size,
+                                         random_state=self.random_state)
+            labels = kmeans.fit_predict(features_scaled)
+            self.kmeans_models[k] = kmeans
+            
+            if len(set(labels)) < 2:
+                continue
+            score = self._silhouette(features_scaled, labels)
+            
+            if score > best_kmeans_score:
+                best_kmeans_score = score
+                best_kmeans_k = k
+                best_kmeans_labels = labels
+        
+        if best_kmeans_labels is None:
+            best_kmeans_labels = self.kmeans_models[best_kmeans_k].labels_
+        self.best_k = best_kmeans_k
+        
+        clustering_results['kmeans'] = {
+            'labels': best_kmeans_labels.tolist(),
+            'n_clusters': best_kmeans_k,
+            'silhouette_score': best_kmeans_score,
+            'warm_started': warm_started
+        }
+        
+        clustering_results.update(self._run_density_and_hierarchical(features_scaled, best_kmeans_k))
+        
+        return self._select_best_method(clustering_results)
+    
+    def update_segments(self, new_property_data):
+        """
+        Assign new listings to existing segments and fold them into the centroids.
+        
+        Args:
+            new_property_data: New listings as list of dictionaries, DataFrame or PropertyFeatureStore
+            
+        Returns:
+            dict: Segment assignment per listing and updated segment sizes
+        """
+        
+        if not self.kmeans_models or self.feature_reference is None:
+            raise ValueError("Run analyze(property_data, incremental=True) before update_segments")
+        
+        df = as_property_frame(new_property_data)
+        if len(df) == 0:
+            return {'assigned_segments': [], 'n_clusters': self.best_k, 'segment_counts': {}}
+        
+        features_df = self._prepare_clustering_features(df, reference=self.feature_reference)
+        features_scaled = self.scaler.transform(features_df)
+        
+        # Keep every candidate k current so the next warm start sees the new listings
+        for kmeans in self.kmeans_models.values():
+            kmeans.partial_fit(features_scaled)
+        
+        labels = self.kmeans_models[self.best_k].predict(features_scaled)
+        
+        # Neighborhood frequencies for later updates include the new listings
+        if 'neighborhood' in df.columns:
+            for neighborhood, count in df['neighborhood'].value_counts().items():
+                self.feature_reference['neighborhood_counts'][neighborhood] = (
+                    self.feature_reference['neighborhood_counts'].get(neighborhood, 0) + int(count)
+                )
+        
+        return {
+            'assigned_segments': labels.tolist(),
+            'n_clusters': self.best_k,
+            'segment_counts': {f'segment_{segment}': int(count) for segment, count in zip(*np.unique(labels, return_counts=True))},
+            'update_timestamp': datetime.now().isoformat()
+        }
+    
+    def _select_best_method(self, clustering_results):
+        """Pick the clustering method with the highest silhouette score."""
+        
         # Select best clustering method
         best_method = max(clustering_results.keys(), 
                          key=lambda x: clustering_results[x]['silhouette_score'])
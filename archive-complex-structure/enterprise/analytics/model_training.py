@@ -0,0 +1,372 @@
+"""
+Model Training Orchestrator
+===========================
+
+Parallel, cached training of the price prediction candidates including:
+- Candidate models fitted concurrently on a process pool
+- Fitted-model cache keyed by a hash of the training data and hyperparameters
+- HistGradientBoosting in place of GradientBoosting for large datasets
+- Warm-start retraining of tree ensembles when only a few rows changed
+- Stable row-hash train/test split so warm-started models never see test rows
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.linear_model import LinearRegression, Ridge, Lasso
+from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+from sklearn.model_selection import cross_val_score, train_test_split
+from sklearn.preprocessing import StandardScaler
+
+try:
+    import skops.io as skops_io
+    SKOPS_AVAILABLE = True
+except ImportError:
+    SKOPS_AVAILABLE = False
+
+
+# Estimator parameter that grows the ensemble on warm start
+WARM_START_SIZE_PARAMS = {
+    'random_forest': 'n_estimators',
+    'gradient_boosting': 'n_estimators',
+    'hist_gradient_boosting': 'max_iter'
+}
+
+
+class ModelTrainingOrchestrator:
+    """
+    Train, evaluate and cache the candidate price models for StatisticalModelingEngine.
+    """
+
+    def __init__(self, n_jobs: Optional[int] = None, cache_dir: Optional[str] = None,
+                 large_dataset_threshold: int = 10000, warm_start_threshold: float = 0.05,
+                 warm_start_estimators: int = 20, max_warm_start_rounds: int = 3,
+                 test_size: float = 0.2, cv_folds: int = 5, random_state: int = 42,
+                 model_cache_size: int = 32):
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            if not SKOPS_AVAILABLE:
+                raise ImportError("skops is required for the on-disk model cache")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.large_dataset_threshold = large_dataset_threshold
+        self.warm_start_threshold = warm_start_threshold        # Max share of changed rows for warm start
+        self.warm_start_estimators = warm_start_estimators      # Trees / boosting rounds added per warm start
+        self.max_warm_start_rounds = max_warm_start_rounds      # Full refit after this many warm starts
+        self.test_size = test_size
+        self.cv_folds = cv_folds
+        self.random_state = random_state
+
+        self.model_cache_size = model_cache_size                # Fitted entries kept in memory (LRU)
+        self.model_cache: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.last_run = None
+
+    def candidate_models(self, n_rows: int) -> Dict:
+        """
+        Candidate estimators for a dataset size.
+
+        Args:
+            n_rows: Number of training rows
+
+        Returns:
+            Dict: Model name -> unfitted estimator
+        """
+
+        candidates = {
+            'linear_regression': LinearRegression(),
+            'ridge_regression': Ridge(alpha=1.0),
+            'lasso_regression': Lasso(alpha=0.1),
+            'random_forest': RandomForestRegressor(n_estimators=100, random_state=self.random_state)
+        }
+
+        # Histogram boosting trains in a fraction of the time on large datasets
+        if n_rows >= self.large_dataset_threshold:
+            candidates['hist_gradient_boosting'] = HistGradientBoostingRegressor(
+                max_iter=100, random_state=self.random_state
+            )
+        else:
+            candidates['gradient_boosting'] = GradientBoostingRegressor(n_estimators=100, random_state=self.random_state)
+
+        return candidates
+
+    def train(self, features_df: pd.DataFrame, target, row_keys=None) -> Dict:
+        """
+        Train and evaluate all candidate models, reusing cached or warm-started fits.
+
+        Args:
+            features_df: Feature matrix
+            target: Target values aligned with features_df
+            row_keys: Stable per-row identities (e.g. hashes of the source listings) used for
+                the train/test split and change detection; defaults to feature-row hashes.
+                Dataset-level encodings such as frequencies shift every feature row when
+                listings are added, so callers should pass source keys where they can.
+
+        Returns:
+            Dict: 'models' (name -> fitted model, metrics, source), 'scaler', 'columns', 'split' and 'mode'
+        """
+
+        # One-hot columns follow category frequency, so keep the previous run's column order
+        if self.last_run is not None and set(self.last_run['columns']) == set(map(str, features_df.columns)):
+            features_df = features_df.rename(columns=str)[self.last_run['columns']]
+
+        X = features_df.to_numpy(dtype=float)
+        y = np.asarray(target, dtype=float)
+        columns = [str(column) for column in features_df.columns]
+
+        row_hashes = self._row_hashes(features_df, y) if row_keys is None else np.asarray(row_keys, dtype=np.uint64)
+        test_mask = self._split_mask(row_hashes)
+
+        X_train, X_test = X[~test_mask], X[test_mask]
+        y_train, y_test = y[~test_mask], y[test_mask]
+
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+
+        data_key = self._hash_arrays(np.asarray(columns, dtype=object).astype(str), X, y, test_mask)
+        candidates = self.candidate_models(len(X))
+        warm_models = self._warm_start_candidates(columns, row_hashes)
+
+        results = {}
+        pending = {}
+
+        for model_name, estimator in candidates.items():
+            model_key = self._model_key(data_key, model_name, estimator)
+            cached = self._load_cached(model_key)
+            if cached is not None:
+                results[model_name] = dict(cached, source='cache')
+                continue
+
+            uses_scaled = 'regression' in model_name
+            train_data = (X_train_scaled, X_test_scaled) if uses_scaled else (X_train, X_test)
+
+            if model_name in warm_models:
+                previous = warm_models[model_name]
+                pending[model_name] = (model_key, (
+                    model_name, self._grow_ensemble(model_name, previous['model']), train_data[0], y_train,
+                    train_data[1], y_test, self.cv_folds, False
+                ), previous)
+            else:
+                pending[model_name] = (model_key, (
+                    model_name, estimator, train_data[0], y_train, train_data[1], y_test, self.cv_folds, True
+                ), None)
+
+        for model_name, fitted in self._fit_all({name: task for name, (_, task, _) in pending.items()}).items():
+            model_key, _, previous = pending[model_name]
+
+            if previous is not None and 'error' not in fitted:
+                # Cross-validation refits from scratch, so warm starts keep the previous estimate
+                fitted['metrics']['cv_mean_r2'] = previous['metrics']['cv_mean_r2']
+                fitted['metrics']['cv_std_r2'] = previous['metrics']['cv_std_r2']
+                fitted['warm_start_rounds'] = previous.get('warm_start_rounds', 0) + 1
+                fitted['source'] = 'warm_start'
+            else:
+                fitted['warm_start_rounds'] = 0
+                fitted['source'] = 'trained'
+
+            results[model_name] = fitted
+            # Warm-started fits carry extra trees and the previous data's CV scores,
+            # so they are not what a fresh fit under model_key would produce
+            if 'error' not in fitted and previous is None:
+                self._store_cached(model_key, fitted)
+
+        self.last_run = {
+            'columns': columns,
+            'row_hashes': row_hashes,
+            'results': results
+        }
+
+        return {
+            'models': results,
+            'scaler': scaler,
+            'columns': columns,
+            'split': {'train_rows': int((~test_mask).sum()), 'test_rows': int(test_mask.sum())},
+            'mode': 'warm_start' if warm_models else 'full'
+        }
+
+    def fit_cached(self, model_name: str, estimator, features_df: pd.DataFrame, target):
+        """Fit a single estimator on the full data, reusing a cached fit for identical inputs."""
+
+        X = features_df.to_numpy(dtype=float)
+        y = np.asarray(target, dtype=float)
+        columns = np.asarray([str(column) for column in features_df.columns], dtype=object).astype(str)
+        model_key = self._model_key(self._hash_arrays(columns, X, y), model_name, estimator)
+
+        cached = self._load_cached(model_key)
+        if cached is not None:
+            return cached['model']
+
+        model = clone(estimator).fit(X, y)
+        self._store_cached(model_key, {'model': model})
+        return model
+
+    def _fit_all(self, tasks: Dict) -> Dict:
+        """Fit pending candidates, in parallel when more than one worker is available."""
+
+        if not tasks:
+            return {}
+
+        if self.n_jobs <= 1 or len(tasks) == 1:
+            return {model_name: _fit_and_evaluate(*task)[1] for model_name, task in tasks.items()}
+
+        with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(tasks))) as executor:
+            futures = [executor.submit(_fit_and_evaluate, *task) for task in tasks.values()]
+            return dict(future.result() for future in futures)
+
+    def _warm_start_candidates(self, columns, row_hashes) -> Dict:
+        """Previous ensemble fits eligible for warm starting on the current data."""
+
+        if self.last_run is None or self.last_run['columns'] != columns:
+            return {}
+
+        previous_rows = self.last_run['row_hashes']
+        changed = len(np.setdiff1d(row_hashes, previous_rows)) + len(np.setdiff1d(previous_rows, row_hashes))
+        changed_fraction = changed / max(len(row_hashes), 1)
+
+        if changed == 0 or changed_fraction > self.warm_start_threshold:
+            return {}
+
+        return {
+            model_name: previous
+            for model_name, previous in self.last_run['results'].items()
+            if model_name in WARM_START_SIZE_PARAMS
+            and 'error' not in previous
+            and previous.get('warm_start_rounds', 0) < self.max_warm_start_rounds
+        }
+
+    def _grow_ensemble(self, model_name: str, model):
+        """Copy of a fitted ensemble set up to add warm_start_estimators on the next fit."""
+
+        grown = copy.deepcopy(model)
+        size_param = WARM_START_SIZE_PARAMS[model_name]
+        grown.set_params(warm_start=True, **{size_param: getattr(grown, size_param) + self.warm_start_estimators})
+        return grown
+
+    def _row_hashes(self, features_df: pd.DataFrame, y: np.ndarray) -> np.ndarray:
+        """Content hash per training row (features and target)."""
+
+        rows = features_df.reset_index(drop=True).copy()
+        rows.columns = [str(column) for column in rows.columns]
+        rows['__target__'] = y
+        return pd.util.hash_pandas_object(rows, index=False).to_numpy()
+
+    def _split_mask(self, row_hashes: np.ndarray) -> np.ndarray:
+        """Test-set membership derived from row hashes, stable as rows are added or removed."""
+
+        test_mask = (row_hashes % 1000) < int(self.test_size * 1000)
+
+        # Tiny datasets can hash unevenly; fall back to a seeded random split
+        min_rows = max(2, self.cv_folds)
+        if test_mask.sum() < 2 or (~test_mask).sum() < min_rows:
+            _, test_positions = train_test_split(
+                np.arange(len(row_hashes)), test_size=self.test_size, random_state=self.random_state
+            )
+            test_mask = np.zeros(len(row_hashes), dtype=bool)
+            test_mask[test_positions] = True
+
+        return test_mask
+
+    def _hash_arrays(self, *arrays) -> str:
+        """SHA-256 over the raw bytes of the given arrays."""
+
+        digest = hashlib.sha256()
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            digest.update(str(array.dtype).encode())
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def _model_key(self, data_key: str, model_name: str, estimator) -> str:
+        """Cache key for a model trained on a dataset with given hyperparameters."""
+
+        params = repr(sorted(estimator.get_params().items()))
+        payload = f"{data_key}|{model_name}|{type(estimator).__name__}|{params}|{self.cv_folds}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _load_cached(self, model_key: str) -> Optional[Dict]:
+        if model_key in self.model_cache:
+            self.model_cache.move_to_end(model_key)
+            return self.model_cache[model_key]
+
+        if self.cache_dir:
+            model_file = self.cache_dir / f'{model_key}.skops'
+            meta_file = self.cache_dir / f'{model_key}.json'
+            if model_file.exists() and meta_file.exists():
+                # Only skops files are read back; pickle files could run arbitrary code on load
+                untrusted = skops_io.get_untrusted_types(file=model_file)
+                unexpected = [name for name in untrusted if not name.startswith(('sklearn.', 'numpy.'))]
+                if unexpected:
+                    raise ValueError(f"Cached model {model_file} contains untrusted types: {unexpected}")
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                entry['model'] = skops_io.load(model_file, trusted=untrusted)
+                self._remember(model_key, entry)
+                return entry
+
+        return None
+
+    def _remember(self, model_key: str, entry: Dict):
+        self.model_cache[model_key] = entry
+        self.model_cache.move_to_end(model_key)
+        while len(self.model_cache) > self.model_cache_size:
+            self.model_cache.popitem(last=False)
+
+    def _store_cached(self, model_key: str, entry: Dict):
+        self._remember(model_key, entry)
+
+        if self.cache_dir:
+            model_temp = self.cache_dir / f'{model_key}.skops.tmp'
+            skops_io.dump(entry['model'], model_temp)
+            model_temp.replace(self.cache_dir / f'{model_key}.skops')
+
+            # Metadata goes last so a half-written entry is never loaded
+            meta_temp = self.cache_dir / f'{model_key}.json.tmp'
+            with open(meta_temp, 'w', encoding='utf-8') as f:
+                json.dump({key: value for key, value in entry.items() if key != 'model'}, f)
+            meta_temp.replace(self.cache_dir / f'{model_key}.json')
+
+def _fit_and_evaluate(model_name, estimator, X_train, y_train, X_test, y_test, cv_folds, run_cv):
+    """Fit one candidate and compute its train/test/cross-validation metrics."""
+
+    try:
+        model = estimator.fit(X_train, y_train)
+
+        y_pred_train = model.predict(X_train)
+        y_pred_test = model.predict(X_test)
+
+        train_r2 = r2_score(y_train, y_pred_train)
+        test_r2 = r2_score(y_test, y_pred_test)
+
+        metrics = {
+            'train_r2': float(train_r2),
+            'test_r2': float(test_r2),
+            'train_rmse': float(np.sqrt(mean_squared_error(y_train, y_pred_train))),
+            'test_rmse': float(np.sqrt(mean_squared_error(y_test, y_pred_test))),
+            'train_mae': float(mean_absolute_error(y_train, y_pred_train)),
+            'test_mae': float(mean_absolute_error(y_test, y_pred_test)),
+            'cv_mean_r2': None,
+            'cv_std_r2': None,
+            'overfitting_score': float(train_r2 - test_r2)  # Positive indicates overfitting
+        }
+
+        if run_cv:
+            cv_scores = cross_val_score(clone(estimator), X_train, y_train, cv=cv_folds, scoring='r2')
+            metrics['cv_mean_r2'] = float(cv_scores.mean())
+            metrics['cv_std_r2'] = float(cv_scores.std())
+
+        return model_name, {'model': model, 'metrics': metrics}
+
+    except Exception as e:
+        return model_name, {'error': str(e)}
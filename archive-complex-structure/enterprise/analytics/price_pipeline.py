@@ -0,0 +1,343 @@
+"""
+Price Prediction Pipeline
+=========================
+
+Persisted, versioned valuation pipeline for batch price prediction:
+- Feature preparation fitted once on the training listings and replayed on new ones
+- Neighborhood, energy and property type encoders stored as plain JSON
+- Scaler parameters and best model bundled with the feature spec
+- Vectorized predictions with confidence intervals for whole listing frames
+- Model files written with skops (never pickle) and verified against a checksum
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+from core.intelligence.feature_store import as_property_frame
+
+try:
+    import skops.io as skops_io
+    SKOPS_AVAILABLE = True
+except ImportError:
+    SKOPS_AVAILABLE = False
+
+PIPELINE_SCHEMA_VERSION = 1
+
+ENERGY_MAP = {'A+': 8, 'A': 7, 'B+': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'F': 1, 'G': 0}
+NUMERICAL_FEATURES = ['sqm', 'rooms', 'price_per_sqm']
+TOP_NEIGHBORHOODS = 5
+DEFAULT_ENERGY_CODE = 4      # C
+DEFAULT_PROPERTY_TYPE = 'apartment'
+DEFAULT_FLOOR = 2
+
+
+class PriceFeaturePipeline:
+    """
+    Feature preparation for the price models, fitted on the training listings.
+    """
+
+    def __init__(self, spec: Optional[Dict] = None):
+        self.spec = spec
+
+    def fit_transform(self, df: pd.DataFrame, label_encoders: Optional[Dict] = None) -> Optional[pd.DataFrame]:
+        """
+        Learn the encoders from the training listings and return their feature matrix.
+
+        Args:
+            df: Cleaned training listings
+            label_encoders: Engine encoders, reused when already fitted
+
+        Returns:
+            pd.DataFrame: Feature matrix, or None when no features are available
+        """
+
+        label_encoders = {} if label_encoders is None else label_encoders
+        spec = {'numerical': {}, 'energy': False, 'neighborhood': None, 'property_types': None, 'floor': False}
+
+        for feature in NUMERICAL_FEATURES:
+            if feature in df.columns:
+                median = pd.to_numeric(df[feature], errors='coerce').median()
+                spec['numerical'][feature] = None if pd.isna(median) else float(median)
+
+        spec['energy'] = 'energy_ordinal' in df.columns or 'energy_class' in df.columns
+
+        if 'neighborhood' in df.columns:
+            neighborhood_counts = df['neighborhood'].value_counts()
+            spec['neighborhood'] = {
+                'counts': {str(name): int(count) for name, count in neighborhood_counts.items()},
+                'top': [str(name) for name in neighborhood_counts.head(TOP_NEIGHBORHOODS).index]
+            }
+
+        if 'property_type' in df.columns:
+            if 'property_type' not in label_encoders:
+                label_encoders['property_type'] = LabelEncoder().fit(df['property_type'].fillna(DEFAULT_PROPERTY_TYPE))
+            spec['property_types'] = [str(name) for name in label_encoders['property_type'].classes_]
+
+        spec['floor'] = 'floor' in df.columns
+
+        self.spec = spec
+        features_df = self._build_features(df)
+        if features_df is None:
+            return None
+
+        # Remove any remaining NaN values
+        medians = features_df.median()
+        self.spec['feature_medians'] = {column: None if pd.isna(value) else float(value) for column, value in medians.items()}
+        return features_df.fillna(medians)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replay the fitted feature preparation on new listings."""
+
+        if self.spec is None:
+            raise ValueError("Feature pipeline has not been fitted")
+
+        features_df = self._build_features(df)
+        return features_df.fillna(self.spec['feature_medians'])
+
+    @property
+    def feature_names(self) -> List[str]:
+        return list(self.spec['feature_medians']) if self.spec else []
+
+    def _build_features(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Feature columns in training order; listings lacking a column get NaN for the median fill."""
+
+        spec = self.spec
+        features = {}
+
+        def source(column):
+            if column in df.columns:
+                return df[column]
+            return pd.Series(np.nan, index=df.index, dtype=object)
+
+        # Numerical features
+        for feature, median in spec['numerical'].items():
+            values = pd.to_numeric(source(feature), errors='coerce')
+            features[feature] = values.fillna(median) if median is not None else values
+
+        # Energy class (ordinal encoding, precomputed by the feature store)
+        if spec['energy']:
+            if 'energy_ordinal' in df.columns:
+                energy_encoded = pd.to_numeric(df['energy_ordinal'], errors='coerce')
+            else:
+                energy_encoded = source('energy_class').map(ENERGY_MAP)
+            features['energy_class_encoded'] = energy_encoded.fillna(DEFAULT_ENERGY_CODE)
+
+        # Neighborhood encoding (frequency-based plus dummies for the top neighborhoods)
+        if spec['neighborhood'] is not None:
+            neighborhood = source('neighborhood')
+            features['neighborhood_frequency'] = neighborhood.map(spec['neighborhood']['counts']).fillna(0)
+            for name in spec['neighborhood']['top']:
+                features[f'neighborhood_{name}'] = (neighborhood == name).astype(int)
+
+        # Property type encoding - unseen types fall back to the training median
+        if spec['property_types'] is not None:
+            type_codes = {name: code for code, name in enumerate(spec['property_types'])}
+            features['property_type_encoded'] = source('property_type').fillna(DEFAULT_PROPERTY_TYPE).map(type_codes)
+
+        # Floor feature (if available)
+        if spec['floor']:
+            features['floor'] = pd.to_numeric(source('floor'), errors='coerce').fillna(DEFAULT_FLOOR)
+
+        if not features:
+            return None
+
+        features_array = np.column_stack([np.asarray(values, dtype=float) for values in features.values()])
+        return pd.DataFrame(features_array, columns=list(features))
+
+
+class PricePredictionPipeline:
+    """
+    Fitted feature preparation, scaler and best price model as one deployable unit.
+    """
+
+    def __init__(self, feature_pipeline: PriceFeaturePipeline, model, model_name: str,
+                 feature_columns: List[str], scaler=None, metrics: Optional[Dict] = None,
+                 version: int = 0, metadata: Optional[Dict] = None):
+        self.feature_pipeline = feature_pipeline
+        self.model = model
+        self.model_name = model_name
+        self.feature_columns = list(feature_columns)
+        self.metrics = {key: float(value) if isinstance(value, (int, float, np.number)) else value
+                        for key, value in (metrics or {}).items()}
+        self.version = version
+        self.metadata = dict(metadata or {})
+
+        # Only the linear models were trained on scaled features
+        self.scaler_mean = None
+        self.scaler_scale = None
+        if scaler is not None and 'regression' in model_name:
+            self.scaler_mean = np.asarray(scaler.mean_, dtype=float)
+            self.scaler_scale = np.asarray(scaler.scale_, dtype=float)
+
+    def predict_batch(self, property_data, confidence_z: float = 1.96) -> pd.DataFrame:
+        """
+        Value many listings in one vectorized pass.
+
+        Args:
+            property_data: DataFrame, list of property dictionaries or PropertyFeatureStore
+            confidence_z: Normal quantile for the confidence interval (1.96 = 95%)
+
+        Returns:
+            pd.DataFrame: predicted_price, lower_bound and upper_bound aligned with the input rows
+        """
+
+        df = as_property_frame(property_data, copy=False)
+        features = self.feature_pipeline.transform(df)[self.feature_columns].to_numpy(dtype=float)
+
+        if self.scaler_mean is not None:
+            features = (features - self.scaler_mean) / self.scaler_scale
+
+        log_price_pred = self.model.predict(features) if len(features) else np.empty(0)
+        margin = confidence_z * self.metrics.get('test_rmse', 0.0)
+
+        predictions = pd.DataFrame({
+            'predicted_price': np.expm1(log_price_pred),
+            'lower_bound': np.expm1(log_price_pred - margin),
+            'upper_bound': np.expm1(log_price_pred + margin)
+        }, index=df.index)
+
+        if 'property_id' in df.columns:
+            predictions.insert(0, 'property_id', df['property_id'].to_numpy())
+
+        return predictions
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: Union[str, Path], keep_versions: int = 5) -> int:
+        """
+        Write the pipeline as a new version: JSON spec plus a model file.
+
+        Args:
+            directory: Pipeline directory holding manifest.json and versioned files
+            keep_versions: Number of versions retained
+
+        Returns:
+            int: Saved version number
+        """
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest = _load_manifest(directory)
+        version = manifest['current_version'] + 1
+
+        if not SKOPS_AVAILABLE:
+            raise ImportError("skops is required to save the prediction pipeline")
+
+        model_file = f'model_v{version:05d}.skops'
+        temp_path = directory / f'{model_file}.tmp'
+        skops_io.dump(self.model, temp_path)
+        temp_path.replace(directory / model_file)
+
+        spec_file = f'pipeline_v{version:05d}.json'
+        spec = {
+            'pipeline_schema_version': PIPELINE_SCHEMA_VERSION,
+            'model_name': self.model_name,
+            'feature_columns': self.feature_columns,
+            'feature_spec': self.feature_pipeline.spec,
+            'scaler': None if self.scaler_mean is None else {
+                'mean': self.scaler_mean.tolist(),
+                'scale': self.scaler_scale.tolist()
+            },
+            'metrics': self.metrics,
+            'metadata': self.metadata
+        }
+        _write_json(directory / spec_file, spec)
+
+        manifest['versions'].append({
+            'version': version,
+            'model_name': self.model_name,
+            'spec_file': spec_file,
+            'model_file': model_file,
+            'model_format': 'skops',
+            'model_sha256': _file_digest(directory / model_file),
+            'created': datetime.now().isoformat()
+        })
+        manifest['current_version'] = version
+
+        for entry in manifest['versions'][:-keep_versions]:
+            (directory / entry['spec_file']).unlink(missing_ok=True)
+            (directory / entry['model_file']).unlink(missing_ok=True)
+        manifest['versions'] = manifest['versions'][-keep_versions:]
+
+        _write_json(directory / 'manifest.json', manifest)
+        self.version = version
+        return version
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], version: Optional[int] = None) -> 'PricePredictionPipeline':
+        """
+        Load a saved pipeline version, verifying the model file checksum and types first.
+
+        Args:
+            directory: Pipeline directory written by save()
+            version: Version to load (default: current)
+
+        Returns:
+            PricePredictionPipeline: Ready for predict_batch
+        """
+
+        directory = Path(directory)
+        manifest = _load_manifest(directory)
+        version = manifest['current_version'] if version is None else version
+        entry = next((entry for entry in manifest['versions'] if entry['version'] == version), None)
+        if entry is None:
+            raise KeyError(f"Prediction pipeline version {version} is not retained")
+
+        model_path = directory / entry['model_file']
+        if _file_digest(model_path) != entry['model_sha256']:
+            raise ValueError(f"Model file {model_path} does not match its recorded checksum")
+
+        # Pickle-based model files could run arbitrary code on load, so only skops files are accepted
+        if entry['model_format'] != 'skops':
+            raise ValueError(f"Model file {model_path} has unsupported format {entry['model_format']!r}")
+        if not SKOPS_AVAILABLE:
+            raise ImportError("skops is required to load this prediction pipeline")
+        untrusted = skops_io.get_untrusted_types(file=model_path)
+        unexpected = [name for name in untrusted if not name.startswith(('sklearn.', 'numpy.'))]
+        if unexpected:
+            raise ValueError(f"Model file {model_path} contains untrusted types: {unexpected}")
+        model = skops_io.load(model_path, trusted=untrusted)
+
+        with open(directory / entry['spec_file'], 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+
+        pipeline = cls(
+            PriceFeaturePipeline(spec['feature_spec']), model, spec['model_name'], spec['feature_columns'],
+            metrics=spec['metrics'], version=version, metadata=spec.get('metadata')
+        )
+        if spec['scaler'] is not None:
+            pipeline.scaler_mean = np.asarray(spec['scaler']['mean'], dtype=float)
+            pipeline.scaler_scale = np.asarray(spec['scaler']['scale'], dtype=float)
+
+        return pipeline
+
+
+def _load_manifest(directory: Path) -> Dict:
+    manifest_path = directory / 'manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'current_version': 0, 'versions': []}
+
+
+def _write_json(path: Path, payload: Dict):
+    temp_path = path.with_suffix('.json.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, default=str)
+    temp_path.replace(path)
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
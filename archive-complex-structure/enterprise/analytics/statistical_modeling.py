@@ -14,15 +14,15 @@ Advanced statistical modeling and trend analysis including:
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
 from scipy import stats
 from scipy.stats import pearsonr, spearmanr
 import json
 import warnings
+from core.intelligence.feature_store import as_property_frame
+from .model_training import ModelTrainingOrchestrator
+from .price_pipeline import PriceFeaturePipeline, PricePredictionPipeline
 warnings.filterwarnings('ignore')
 
 
@@ -31,29 +31,30 @@ class StatisticalModelingEngine:
     Comprehensive statistical modeling for real estate price prediction and analysis.
     """
     
-    def __init__(self):
+    def __init__(self, training_orchestrator=None):
         self.models = {}
         self.model_performance = {}
         self.feature_importance = {}
         self.scaler = StandardScaler()
         self.label_encoders = {}
+        self.training_orchestrator = training_orchestrator or ModelTrainingOrchestrator()
+        self.training_summary = {}
+        self.feature_pipeline = PriceFeaturePipeline()
+        self.prediction_pipeline = None
         
     def build_models(self, property_data):
         """
         Build comprehensive statistical models for price prediction and analysis.
         
         Args:
-            property_data: List of property dictionaries or DataFrame
+            property_data: List of property dictionaries, DataFrame or PropertyFeatureStore
             
         Returns:
             dict: Complete modeling results with predictions and insights
         """
         
         # Convert to DataFrame if needed
-        if isinstance(property_data, list):
-            df = pd.DataFrame(property_data)
-        else:
-            df = property_data.copy()
+        df = as_property_frame(property_data)
         
         if len(df) < 10:
             return {'error': 'Insufficient data for statistical modeling (minimum 10 properties required)'}
@@ -65,7 +66,7 @@ class StatisticalModelingEngine:
             return {'error': 'Unable to prepare features for modeling'}
         
         # Build multiple models
-        model_results = self._build_prediction_models(features_df, target_df)
+        model_results = self._build_prediction_models(features_df, target_df, self._source_row_keys(df, target_df))
         
         # Correlation analysis
         correlation_analysis = self._perform_correlation_analysis(df)
@@ -86,6 +87,7 @@ class StatisticalModelingEngine:
             'analysis_timestamp': datetime.now().isoformat(),
             'dataset_size': len(df),
             'model_performance': model_results,
+            'training_summary': self.training_summary,
             'correlation_analysis': correlation_analysis,
             'feature_importance': feature_importance,
             'statistical_tests': statistical_tests,
@@ -115,65 +117,12 @@ class StatisticalModelingEngine:
             if len(df_clean) < 10:
                 df_clean = df.copy()  # Use original data if too many outliers removed
             
-            # Prepare features
-            features = []
-            feature_names = []
-            
-            # Numerical features
-            numerical_features = ['sqm', 'rooms', 'price_per_sqm']
-            for feature in numerical_features:
-                if feature in df_clean.columns:
-                    values = pd.to_numeric(df_clean[feature], errors='coerce').fillna(df_clean[feature].median() if feature in df_clean.columns else 0)
-                    features.append(values)
-                    feature_names.append(feature)
-            
-            # Energy class (ordinal encoding)
-            if 'energy_class' in df_clean.columns:
-                energy_map = {'A+': 8, 'A': 7, 'B+': 6, 'B': 5, 'C': 4, 'D': 3, 'E': 2, 'F': 1, 'G': 0}
-                energy_encoded = df_clean['energy_class'].map(energy_map).fillna(4)  # Default to C
-                features.append(energy_encoded)
-                feature_names.append('energy_class_encoded')
-            
-            # Neighborhood encoding (frequency-based)
-            if 'neighborhood' in df_clean.columns:
-                neighborhood_counts = df_clean['neighborhood'].value_counts()
-                neighborhood_freq = df_clean['neighborhood'].map(neighborhood_counts).fillna(0)
-                features.append(neighborhood_freq)
-                feature_names.append('neighborhood_frequency')
-                
-                # Create neighborhood dummies for top neighborhoods
-                top_neighborhoods = neighborhood_counts.head(5).index
-                for neighborhood in top_neighborhoods:
-                    dummy = (df_clean['neighborhood'] == neighborhood).astype(int)
-                    features.append(dummy)
-                    feature_names.append(f'neighborhood_{neighborhood}')
-            
-            # Property type encoding
-            if 'property_type' in df_clean.columns:
-                if 'property_type' not in self.label_encoders:
-                    self.label_encoders['property_type'] = LabelEncoder()
-                    type_encoded = self.label_encoders['property_type'].fit_transform(df_clean['property_type'].fillna('apartment'))
-                else:
-                    type_encoded = self.label_encoders['property_type'].transform(df_clean['property_type'].fillna('apartment'))
-                features.append(type_encoded)
-                feature_names.append('property_type_encoded')
-            
-            # Floor feature (if available)
-            if 'floor' in df_clean.columns:
-                floor_values = pd.to_numeric(df_clean['floor'], errors='coerce').fillna(2)  # Default to 2nd floor
-                features.append(floor_values)
-                feature_names.append('floor')
-            
-            # Combine features
-            if not features:
+            # Prepare features (fitted pipeline is replayed for batch predictions)
+            self.feature_pipeline = PriceFeaturePipeline()
+            features_df = self.feature_pipeline.fit_transform(df_clean, self.label_encoders)
+            if features_df is None:
                 return None, None
             
-            features_array = np.column_stack(features)
-            features_df = pd.DataFrame(features_array, columns=feature_names)
-            
-            # Remove any remaining NaN values
-            features_df = features_df.fillna(features_df.median())
-            
             # Target variable (log-transformed for better modeling)
             target_df = np.log1p(df_clean['price'])
             
@@ -183,76 +132,45 @@ class StatisticalModelingEngine:
             print(f"Error preparing modeling data: {e}")
             return None, None
     
-    def _build_prediction_models(self, features_df, target_df):
+    def _source_row_keys(self, df, target_df):
+        """Hash the source listings behind each training row for stable splits and change detection."""
+        
+        source_columns = [
+            column for column in ['property_id', 'price', 'sqm', 'rooms', 'price_per_sqm', 'energy_class',
+                                  'neighborhood', 'property_type', 'floor']
+            if column in df.columns
+        ]
+        source_rows = df.loc[target_df.index, source_columns]
+        try:
+            return pd.util.hash_pandas_object(source_rows, index=False).to_numpy()
+        except TypeError:
+            return pd.util.hash_pandas_object(source_rows.astype(str), index=False).to_numpy()
+    
+    def _build_prediction_models(self, features_df, target_df, row_keys=None):
         """Build and evaluate multiple prediction models."""
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            features_df, target_df, test_size=0.2, random_state=42
-        )
-        
-        # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
-        
-        models_to_test = {
-            'linear_regression': LinearRegression(),
-            'ridge_regression': Ridge(alpha=1.0),
-            'lasso_regression': Lasso(alpha=0.1),
-            'random_forest': RandomForestRegressor(n_estimators=100, random_state=42),
-            'gradient_boosting': GradientBoostingRegressor(n_estimators=100, random_state=42)
-        }
+        # Parallel training with cached and warm-started fits
+        training = self.training_orchestrator.train(features_df, target_df, row_keys)
+        self.scaler = training['scaler']
         
         model_results = {}
         
-        for model_name, model in models_to_test.items():
-            try:
-                # Use scaled data for linear models, original for tree models
-                if 'regression' in model_name:
-                    X_train_model = X_train_scaled
-                    X_test_model = X_test_scaled
-                else:
-                    X_train_model = X_train
-                    X_test_model = X_test
-                
-                # Train model
-                model.fit(X_train_model, y_train)
-                
-                # Make predictions
-                y_pred_train = model.predict(X_train_model)
-                y_pred_test = model.predict(X_test_model)
-                
-                # Calculate metrics
-                train_r2 = r2_score(y_train, y_pred_train)
-                test_r2 = r2_score(y_test, y_pred_test)
-                train_rmse = np.sqrt(mean_squared_error(y_train, y_pred_train))
-                test_rmse = np.sqrt(mean_squared_error(y_test, y_pred_test))
-                train_mae = mean_absolute_error(y_train, y_pred_train)
-                test_mae = mean_absolute_error(y_test, y_pred_test)
-                
-                # Cross-validation
-                cv_scores = cross_val_score(model, X_train_model, y_train, cv=5, scoring='r2')
-                
-                model_results[model_name] = {
-                    'train_r2': float(train_r2),
-                    'test_r2': float(test_r2),
-                    'train_rmse': float(train_rmse),
-                    'test_rmse': float(test_rmse),
-                    'train_mae': float(train_mae),
-                    'test_mae': float(test_mae),
-                    'cv_mean_r2': float(cv_scores.mean()),
-                    'cv_std_r2': float(cv_scores.std()),
-                    'overfitting_score': float(train_r2 - test_r2),  # Positive indicates overfitting
-                    'model_quality': self._assess_model_quality(test_r2, train_r2 - test_r2)
-                }
-                
-                # Store the best model
-                if model_name not in self.models or test_r2 > self.model_performance.get(model_name, {}).get('test_r2', 0):
-                    self.models[model_name] = model
-                    self.model_performance[model_name] = model_results[model_name]
-                
-            except Exception as e:
-                model_results[model_name] = {'error': str(e)}
+        for model_name, trained in training['models'].items():
+            if 'error' in trained:
+                model_results[model_name] = {'error': trained['error']}
+                continue
+            
+            metrics = trained['metrics']
+            model_results[model_name] = dict(
+                metrics,
+                model_quality=self._assess_model_quality(metrics['test_r2'], metrics['overfitting_score']),
+                training_source=trained['source']
+            )
+            
+            # Store the best model
+            if model_name not in self.models or metrics['test_r2'] > self.model_performance.get(model_name, {}).get('test_r2', 0):
+                self.models[model_name] = trained['model']
+                self.model_performance[model_name] = model_results[model_name]
         
         # Identify best model
         valid_models = {k: v for k, v in model_results.items() if 'error' not in v}
@@ -260,6 +178,16 @@ class StatisticalModelingEngine:
             best_model = max(valid_models.keys(), key=lambda x: valid_models[x]['test_r2'])
             model_results['best_model'] = best_model
             model_results['model_recommendation'] = self._recommend_model_usage(valid_models)
+            self.prediction_pipeline = PricePredictionPipeline(
+                self.feature_pipeline, training['models'][best_model]['model'], best_model,
+                training['columns'], scaler=training['scaler'], metrics=valid_models[best_model]
+            )
+        self.training_summary = {
+            'mode': training['mode'],
+            'feature_columns': training['columns'],
+            'split': training['split'],
+            'sources': {name: trained.get('source', 'error') for name, trained in training['models'].items()}
+        }
         
         return model_results
     
@@ -386,9 +314,12 @@ class StatisticalModelingEngine:
             return {}
         
         try:
-            # Use Random Forest for feature importance
-            rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
-            rf_model.fit(features_df, target_df)
+            # Use Random Forest for feature importance (reused when the data is unchanged)
+            rf_model = self.training_orchestrator.fit_cached(
+                'feature_importance_random_forest',
+                RandomForestRegressor(n_estimators=100, random_state=42),
+                features_df, target_df
+            )
             
             # Get feature importance
             importance_scores = rf_model.feature_importances_
@@ -641,9 +572,39 @@ class StatisticalModelingEngine:
         
         return insights
 
+    def predict_batch(self, property_data, confidence_z=1.96):
+        """
+        Predict prices for many listings with the persisted best-model pipeline.
+        
+        Args:
+            property_data: DataFrame, list of property dictionaries or PropertyFeatureStore
+            confidence_z: Normal quantile for the confidence interval (1.96 = 95%)
+            
+        Returns:
+            DataFrame: predicted_price, lower_bound and upper_bound per listing
+        """
+        
+        if self.prediction_pipeline is None:
+            raise ValueError('No trained prediction pipeline available - run build_models or load_pipeline first')
+        
+        return self.prediction_pipeline.predict_batch(property_data, confidence_z)
+    
     def predict_property_price(self, property_features, model_name='best'):
         """Predict price for a single property using trained models."""
         
+        # Raw listings go through the fitted feature pipeline
+        if isinstance(property_features, dict) and model_name == 'best' and self.prediction_pipeline is not None:
+            prediction = self.predict_batch([property_features]).iloc[0]
+            return {
+                'predicted_price': float(prediction['predicted_price']),
+                'confidence_interval': {
+                    'lower': float(prediction['lower_bound']),
+                    'upper': float(prediction['upper_bound'])
+                },
+                'model_used': self.prediction_pipeline.model_name,
+                'model_r2': self.prediction_pipeline.metrics.get('test_r2')
+            }
+        
         if not self.models:
             return {'error': 'No trained models available'}
         
@@ -687,20 +648,35 @@ class StatisticalModelingEngine:
         except Exception as e:
             return {'error': f'Prediction failed: {str(e)}'}
     
-    def export_models(self, filepath):
-        """Export trained models for use in production."""
-        import pickle
+    def export_pipeline(self, directory):
+        """
+        Export the best-model prediction pipeline for use in production.
+        
+        Args:
+            directory: Pipeline directory; each export adds a new version (written with skops)
+            
+        Returns:
+            str: Export summary
+        """
         
-        export_data = {
-            'models': self.models,
-            'model_performance': self.model_performance,
+        if self.prediction_pipeline is None:
+            return "No trained prediction pipeline to export"
+        
+        self.prediction_pipeline.metadata = {
+            'model_performance': {
+                name: performance for name, performance in self.model_performance.items()
+                if isinstance(performance, dict)
+            },
             'feature_importance': self.feature_importance,
-            'scaler': self.scaler,
-            'label_encoders': self.label_encoders,
             'export_timestamp': datetime.now().isoformat()
         }
+        version = self.prediction_pipeline.save(directory)
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(export_data, f)
+        return f"Pipeline exported to {directory} (version {version})"
+    
+    def load_pipeline(self, directory, version=None):
+        """Load a pipeline written by export_pipeline() for batch predictions."""
         
-        return f"Models exported to {filepath}"
\ No newline at end of file
+        self.prediction_pipeline = PricePredictionPipeline.load(directory, version)
+        self.feature_pipeline = self.prediction_pipeline.feature_pipeline
+        return self.prediction_pipeline
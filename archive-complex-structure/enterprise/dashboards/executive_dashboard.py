@@ -21,6 +21,7 @@ import json
 from typing import Dict, List, Optional
 import base64
 import io
+from core.intelligence.feature_store import as_property_frame
 
 
 class ExecutiveDashboardEngine:
@@ -46,7 +47,8 @@ class ExecutiveDashboardEngine:
         Create comprehensive executive summary dashboard.
         
         Args:
-            data_sources: All available data sources (properties, analytics, portfolios, etc.)
+            data_sources: All available data sources (properties, analytics, portfolios, etc.);
+                property_data may be a list, DataFrame or PropertyFeatureStore
             dashboard_config: Dashboard configuration and preferences
             
         Returns:
@@ -66,6 +68,10 @@ class ExecutiveDashboardEngine:
             'next_actions': []
         }
         
+        # Build the property frame once for all dashboard sections
+        if data_sources.get('property_data') is not None:
+            data_sources = {**data_sources, 'property_data': as_property_frame(data_sources['property_data'], copy=False)}
+        
         # Extract key metrics from data sources
         dashboard['kpi_summary'] = self._create_kpi_summary(data_sources)
         
@@ -105,8 +111,8 @@ class ExecutiveDashboardEngine:
         
         # Market Overview KPIs
         property_data = data_sources.get('property_data', [])
-        if property_data:
-            df = pd.DataFrame(property_data) if isinstance(property_data, list) else property_data
+        if property_data is not None and len(property_data):
+            df = as_property_frame(property_data, copy=False)
             
             kpi_summary['market_overview'] = {
                 'total_properties_analyzed': len(df),
@@ -260,8 +266,8 @@ class ExecutiveDashboardEngine:
         
         # Market insights
         property_data = data_sources.get('property_data', [])
-        if property_data:
-            df = pd.DataFrame(property_data) if isinstance(property_data, list) else property_data
+        if property_data is not None and len(property_data):
+            df = as_property_frame(property_data, copy=False)
             
             # Price insights
             if 'price_per_sqm' in df.columns:
@@ -363,8 +369,8 @@ class ExecutiveDashboardEngine:
         
         # Geographic hotspots
         property_data = data_sources.get('property_data', [])
-        if property_data:
-            df = pd.DataFrame(property_data) if isinstance(property_data, list) else property_data
+        if property_data is not None and len(property_data):
+            df = as_property_frame(property_data, copy=False)
             
             if 'neighborhood' in df.columns and 'price_per_sqm' in df.columns:
                 # Find neighborhoods with good value propositions
@@ -477,7 +483,7 @@ class ExecutiveDashboardEngine:
         
         # Data quality alerts
         property_data = data_sources.get('property_data', [])
-        if isinstance(property_data, list) and len(property_data) < 50:
+        if property_data is not None and len(property_data) < 50:
             alerts.append({
                 'type': 'Data Quality',
                 'severity': 'Medium',
@@ -530,8 +536,8 @@ class ExecutiveDashboardEngine:
         
         # Operational Metrics
         property_data = data_sources.get('property_data', [])
-        if property_data:
-            df = pd.DataFrame(property_data) if isinstance(property_data, list) else property_data
+        if property_data is not None and len(property_data):
+            df = as_property_frame(property_data, copy=False)
             
             metrics['operational_metrics'] = {
                 'data_coverage': len(df),
@@ -725,8 +731,8 @@ class ExecutiveDashboardEngine:
         
         # Add additional neighborhoods with lower scores
         property_data = data_sources.get('property_data', [])
-        if property_data:
-            df = pd.DataFrame(property_data) if isinstance(property_data, list) else property_data
+        if property_data is not None and len(property_data):
+            df = as_property_frame(property_data, copy=False)
             
             if 'neighborhood' in df.columns:
                 existing_neighborhoods = set(h['neighborhood'] for h in geographic_hotspots)
@@ -959,7 +965,8 @@ class ExecutiveDashboardEngine:
         })
         
         # Data and analytics
-        property_count = len(data_sources.get('property_data', []))
+        property_data = data_sources.get('property_data')
+        property_count = len(property_data) if property_data is not None else 0
         if property_count < 100:
             recommendations.append({
                 'category': 'Data Analytics',
@@ -12,6 +12,7 @@ Advanced investment modeling tools including:
 """
 
 from .roi_calculators import ROICalculatorEngine
+from .roi_simulation import PortfolioROIModel, MonteCarloROISimulator, ROISensitivityAnalyzer
 from .cash_flow_models import CashFlowModelingEngine
 from .portfolio_optimization import PortfolioOptimizationEngine
 from .risk_analysis import RiskAnalysisEngine
@@ -48,6 +49,9 @@ class InvestmentModelingEngine:
 __all__ = [
     'InvestmentModelingEngine',
     'ROICalculatorEngine',
+    'PortfolioROIModel',
+    'MonteCarloROISimulator',
+    'ROISensitivityAnalyzer',
     'CashFlowModelingEngine',
     'PortfolioOptimizationEngine', 
     'RiskAnalysisEngine',
@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 import json
 from typing import Dict, List, Optional, Tuple
 import warnings
+from .roi_simulation import PortfolioROIModel, MonteCarloROISimulator, ROISensitivityAnalyzer
 warnings.filterwarnings('ignore')
 
 
@@ -63,6 +64,15 @@ class ROICalculatorEngine:
             'F': 0.80,   # 20% discount
             'G': 0.75    # 25% discount
         }
+        
+        # Monte Carlo parameter distributions (normal distribution parameters)
+        self.monte_carlo_distributions = {
+            'annual_appreciation': {'mean': 0.05, 'std': 0.02},
+            'rental_yield': {'mean': 0.055, 'std': 0.015},
+            'vacancy_rate': {'mean': 0.10, 'std': 0.03},
+            'maintenance_cost': {'mean': 0.015, 'std': 0.005},
+            'transaction_cost': {'mean': 0.06, 'std': 0.01}
+        }
     
     def calculate_scenarios(self, property_data: List[Dict], investment_params: Dict) -> Dict:
         """
@@ -98,7 +108,11 @@ class ROICalculatorEngine:
         results['sensitivity_analysis'] = self._run_sensitivity_analysis(property_data, investment_params)
         
         # Monte Carlo simulation
-        results['monte_carlo_simulation'] = self._run_monte_carlo_simulation(property_data, investment_params)
+        results['monte_carlo_simulation'] = self._run_monte_carlo_simulation(
+            property_data, investment_params,
+            num_simulations=investment_params.get('monte_carlo_simulations', 1000),
+            random_seed=investment_params.get('random_seed')
+        )
         
         return results
     
@@ -299,10 +313,7 @@ class ROICalculatorEngine:
         return summary
     
     def _run_sensitivity_analysis(self, property_data: List[Dict], investment_params: Dict) -> Dict:
-        """Run sensitivity analysis on key parameters."""
-        
-        base_params = self.scenario_parameters['moderate'].copy()
-        sensitivity_results = {}
+        """Run one-at-a-time sensitivity analysis on key parameters."""
         
         # Parameters to test
         sensitivity_params = {
@@ -312,91 +323,100 @@ class ROICalculatorEngine:
             'transaction_cost': [0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.10]
         }
         
-        for param_name, param_values in sensitivity_params.items():
-            param_results = []
-            
-            for param_value in param_values:
-                test_params = base_params.copy()
-                test_params[param_name] = param_value
-                
-                # Calculate ROI with modified parameter
-                scenario_result = self._calculate_scenario_roi(property_data, test_params, investment_params)
-                
-                param_results.append({
-                    'parameter_value': param_value,
-                    'annual_roi': scenario_result['annual_roi'],
-                    'portfolio_roi': scenario_result['portfolio_roi']
-                })
+        return self._sensitivity_analyzer(property_data, investment_params).one_at_a_time(sensitivity_params)
+    
+    def run_tornado_analysis(self, property_data: List[Dict], investment_params: Dict,
+                             param_ranges: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict:
+        """
+        Tornado analysis of annual portfolio ROI around the moderate scenario.
+        
+        Args:
+            property_data: List of property dictionaries
+            investment_params: Investment parameters and constraints
+            param_ranges: (low, high) value per parameter; defaults to the
+                bounds of the standard sensitivity ranges
             
-            sensitivity_results[param_name] = param_results
+        Returns:
+            Dict: Arrays of low/high ROI and swing, sorted by swing
+        """
+        
+        if param_ranges is None:
+            param_ranges = {
+                'annual_appreciation': (0.02, 0.08),
+                'rental_yield': (0.03, 0.08),
+                'vacancy_rate': (0.05, 0.20),
+                'maintenance_cost': (0.005, 0.025),
+                'management_fee': (0.04, 0.08),
+                'transaction_cost': (0.03, 0.10)
+            }
         
-        return sensitivity_results
+        return self._sensitivity_analyzer(property_data, investment_params).tornado(param_ranges)
     
-    def _run_monte_carlo_simulation(self, property_data: List[Dict], investment_params: Dict, num_simulations: int = 1000) -> Dict:
-        """Run Monte Carlo simulation for ROI uncertainty analysis."""
+    def run_sensitivity_grid(self, property_data: List[Dict], investment_params: Dict,
+                             param_values: Dict[str, List[float]], per_property: bool = False) -> Dict:
+        """
+        Full-factorial sensitivity grid, e.g. appreciation x rental_yield heatmaps.
+        
+        Args:
+            property_data: List of property dictionaries
+            investment_params: Investment parameters and constraints
+            param_values: Grid values per parameter; unlisted parameters stay
+                at the moderate scenario values
+            per_property: Include per-property annual ROI for every grid point
+            
+        Returns:
+            Dict: ROI arrays with one axis per gridded parameter
+        """
         
-        base_params = self.scenario_parameters['moderate'].copy()
-        simulation_results = []
+        return self._sensitivity_analyzer(property_data, investment_params).factorial_grid(
+            param_values, per_property=per_property
+        )
+    
+    def _sensitivity_analyzer(self, property_data: List[Dict], investment_params: Dict) -> ROISensitivityAnalyzer:
+        """Sensitivity analyzer around the moderate scenario."""
+        return ROISensitivityAnalyzer(
+            self._build_roi_model(property_data, investment_params),
+            self.scenario_parameters['moderate']
+        )
+    
+    def _run_monte_carlo_simulation(self, property_data: List[Dict], investment_params: Dict, num_simulations: int = 1000,
+                                    random_seed: Optional[int] = None, chunk_size: int = 50_000,
+                                    per_property: bool = False) -> Dict:
+        """
+        Run Monte Carlo simulation for ROI uncertainty analysis.
         
-        # Parameter distributions (normal distribution parameters)
-        param_distributions = {
-            'annual_appreciation': {'mean': 0.05, 'std': 0.02},
-            'rental_yield': {'mean': 0.055, 'std': 0.015},
-            'vacancy_rate': {'mean': 0.10, 'std': 0.03},
-            'maintenance_cost': {'mean': 0.015, 'std': 0.005},
-            'transaction_cost': {'mean': 0.06, 'std': 0.01}
-        }
+        Parameter sets are sampled and evaluated in vectorized chunks, so
+        100k+ simulations are practical and give stable tail metrics.
         
-        # Run simulations
-        for _ in range(num_simulations):
-            # Sample parameters from distributions
-            sim_params = base_params.copy()
-            
-            for param_name, distribution in param_distributions.items():
-                sampled_value = np.random.normal(distribution['mean'], distribution['std'])
-                # Ensure positive values and reasonable bounds
-                sim_params[param_name] = max(0.001, min(0.5, sampled_value))
-            
-            # Calculate ROI for this simulation
-            scenario_result = self._calculate_scenario_roi(property_data, sim_params, investment_params)
+        Args:
+            property_data: List of property dictionaries
+            investment_params: Investment parameters and constraints
+            num_simulations: Number of simulated parameter sets
+            random_seed: Seed for a reproducible np.random.Generator stream
+            chunk_size: Simulations evaluated per broadcast (bounds memory)
+            per_property: Include per-property ROI statistics
             
-            simulation_results.append({
-                'annual_roi': scenario_result['annual_roi'],
-                'portfolio_roi': scenario_result['portfolio_roi'],
-                'parameters': sim_params
-            })
-        
-        # Analyze simulation results
-        annual_rois = [r['annual_roi'] for r in simulation_results]
-        portfolio_rois = [r['portfolio_roi'] for r in simulation_results]
-        
-        monte_carlo_analysis = {
-            'num_simulations': num_simulations,
-            'annual_roi_distribution': {
-                'mean': np.mean(annual_rois),
-                'median': np.median(annual_rois),
-                'std': np.std(annual_rois),
-                'percentile_5': np.percentile(annual_rois, 5),
-                'percentile_25': np.percentile(annual_rois, 25),
-                'percentile_75': np.percentile(annual_rois, 75),
-                'percentile_95': np.percentile(annual_rois, 95),
-                'min': np.min(annual_rois),
-                'max': np.max(annual_rois)
-            },
-            'portfolio_roi_distribution': {
-                'mean': np.mean(portfolio_rois),
-                'median': np.median(portfolio_rois),
-                'std': np.std(portfolio_rois),
-                'percentile_5': np.percentile(portfolio_rois, 5),
-                'percentile_95': np.percentile(portfolio_rois, 95)
-            },
-            'probability_positive_returns': sum(1 for roi in annual_rois if roi > 0) / len(annual_rois),
-            'probability_high_returns': sum(1 for roi in annual_rois if roi > 0.15) / len(annual_rois),  # >15% annual return
-            'value_at_risk_5': np.percentile(annual_rois, 5),  # 5% VaR
-            'expected_shortfall': np.mean([roi for roi in annual_rois if roi <= np.percentile(annual_rois, 5)])
-        }
+        Returns:
+            Dict: ROI distribution and tail-risk metrics
+        """
+        
+        model = self._build_roi_model(property_data, investment_params)
+        simulator = MonteCarloROISimulator(
+            base_params=self.scenario_parameters['moderate'],
+            param_distributions=self.monte_carlo_distributions,
+            chunk_size=chunk_size,
+            random_seed=random_seed
+        )
         
-        return monte_carlo_analysis
+        return simulator.run(model, num_simulations=num_simulations, per_property=per_property)
+    
+    def _build_roi_model(self, property_data: List[Dict], investment_params: Dict) -> PortfolioROIModel:
+        """Precompute the per-property base matrix for vectorized ROI evaluation."""
+        return PortfolioROIModel.from_properties(
+            property_data,
+            self.energy_efficiency_multipliers,
+            holding_period=investment_params.get('holding_period', 5)
+        )
 
     def generate_investment_recommendations(self, roi_results: Dict, top_n: int = 10) -> Dict:
         """Generate top investment recommendations based on ROI analysis."""
@@ -0,0 +1,304 @@
+"""
+Vectorized ROI Simulation
+=========================
+
+Closed-form, array-based evaluation of the ROICalculatorEngine property model:
+- Per-property base matrix precomputed once per portfolio
+- Portfolio and per-property ROI for any array of parameter sets
+- Chunked Monte Carlo simulation with seeded np.random.Generator streams
+- One-at-a-time, tornado and full-factorial sensitivity grids
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Column order of every parameter array handled by this module
+PARAMETER_NAMES = (
+    'annual_appreciation',
+    'rental_yield',
+    'vacancy_rate',
+    'maintenance_cost',
+    'management_fee',
+    'transaction_cost'
+)
+
+PARAMETER_INDEX = {name: i for i, name in enumerate(PARAMETER_NAMES)}
+
+
+def params_to_array(scenario_params: Dict) -> np.ndarray:
+    """Convert a scenario parameter dict into a parameter vector."""
+    return np.array([scenario_params[name] for name in PARAMETER_NAMES], dtype=float)
+
+
+class PortfolioROIModel:
+    """
+    Closed-form ROI model over a fixed property portfolio.
+
+    The per-property ROI of ROICalculatorEngine is linear in the purchase price
+    and in the energy-adjusted price, so the portfolio totals only need the two
+    column sums of the base matrix. Parameter arrays may have any leading shape
+    (simulations, grid axes, ...) with PARAMETER_NAMES along the last axis.
+    """
+
+    def __init__(self, prices: np.ndarray, energy_multipliers: np.ndarray,
+                 holding_period: int = 5, property_ids: Optional[List] = None):
+        self.prices = np.asarray(prices, dtype=float)
+        self.energy_multipliers = np.asarray(energy_multipliers, dtype=float)
+        self.holding_period = holding_period
+        self.property_ids = property_ids if property_ids is not None else list(range(len(self.prices)))
+
+        # Base matrix: [purchase price, energy-adjusted price] per property
+        self.base_matrix = np.column_stack([self.prices, self.prices * self.energy_multipliers])
+        self.total_price, self.total_adjusted_price = self.base_matrix.sum(axis=0)
+
+    @classmethod
+    def from_properties(cls, property_data: List[Dict], energy_efficiency_multipliers: Dict,
+                        holding_period: int = 5) -> 'PortfolioROIModel':
+        """Build the base matrix from property dictionaries."""
+        prices = np.array([p.get('price', 0) for p in property_data], dtype=float)
+        multipliers = np.array(
+            [energy_efficiency_multipliers.get(p.get('energy_class', 'C'), 1.0) for p in property_data],
+            dtype=float
+        )
+        property_ids = [p.get('property_id', 'unknown') for p in property_data]
+        return cls(prices, multipliers, holding_period, property_ids)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def _returns(self, params: np.ndarray, price: np.ndarray, adjusted_price: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Total return and initial investment for (aggregated) price columns."""
+        appreciation = params[..., PARAMETER_INDEX['annual_appreciation']]
+        rental_yield = params[..., PARAMETER_INDEX['rental_yield']]
+        vacancy_rate = params[..., PARAMETER_INDEX['vacancy_rate']]
+        maintenance_cost = params[..., PARAMETER_INDEX['maintenance_cost']]
+        management_fee = params[..., PARAMETER_INDEX['management_fee']]
+        transaction_cost = params[..., PARAMETER_INDEX['transaction_cost']]
+        holding_period = self.holding_period
+
+        initial_investment = price * (1 + transaction_cost)
+        net_annual_rental = adjusted_price * rental_yield * (1 - vacancy_rate)
+        annual_cash_flow = net_annual_rental * (1 - management_fee) - price * maintenance_cost
+        net_selling_proceeds = price * (1 + appreciation) ** holding_period * (1 - transaction_cost)
+        total_return = annual_cash_flow * holding_period + net_selling_proceeds - price
+        return total_return, initial_investment
+
+    def _roi(self, total_return: np.ndarray, initial_investment: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total_roi = np.where(initial_investment > 0,
+                                 (total_return - initial_investment) / initial_investment, 0.0)
+            # Losses beyond the initial investment annualize to a total loss (-100%)
+            annual_roi = np.maximum(1 + total_roi, 0) ** (1 / self.holding_period) - 1
+        return total_roi, annual_roi
+
+    def portfolio_returns(self, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Portfolio ROI and annualized ROI for every parameter set in ``params``."""
+        params = np.asarray(params, dtype=float)
+        total_return, initial_investment = self._returns(params, self.total_price, self.total_adjusted_price)
+        return self._roi(total_return, initial_investment)
+
+    def property_returns(self, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-property total and annualized ROI, shaped ``params.shape[:-1] + (n_properties,)``."""
+        params = np.asarray(params, dtype=float)[..., np.newaxis, :]
+        total_return, initial_investment = self._returns(params, self.prices, self.base_matrix[:, 1])
+        return self._roi(total_return, initial_investment)
+
+
+class MonteCarloROISimulator:
+    """
+    Vectorized Monte Carlo engine for portfolio ROI uncertainty.
+
+    All parameter vectors of a chunk are sampled at once as a
+    (chunk_size x len(PARAMETER_NAMES)) array and evaluated as a single
+    broadcast, so memory is bounded by ``chunk_size`` rather than by the
+    number of simulations. Draws come from a seeded np.random.Generator and
+    are independent of the chunk size.
+    """
+
+    def __init__(self, base_params: Dict, param_distributions: Dict,
+                 bounds: Tuple[float, float] = (0.001, 0.5), chunk_size: int = 50_000,
+                 random_seed: Optional[int] = None):
+        self.base_vector = params_to_array(base_params)
+        self.sampled_columns = np.array([PARAMETER_INDEX[name] for name in param_distributions])
+        self.means = np.array([d['mean'] for d in param_distributions.values()], dtype=float)
+        self.stds = np.array([d['std'] for d in param_distributions.values()], dtype=float)
+        self.bounds = bounds
+        self.chunk_size = chunk_size
+        self.random_seed = random_seed
+
+    def sample_parameters(self, rng: np.random.Generator, num_samples: int) -> np.ndarray:
+        """Sample ``num_samples`` parameter vectors as an (N x params) array."""
+        params = np.tile(self.base_vector, (num_samples, 1))
+        draws = rng.standard_normal((num_samples, len(self.sampled_columns))) * self.stds + self.means
+        params[:, self.sampled_columns] = np.clip(draws, *self.bounds)
+        return params
+
+    def run(self, model: PortfolioROIModel, num_simulations: int = 1000, per_property: bool = False) -> Dict:
+        """
+        Run the simulation over ``model``.
+
+        Args:
+            model: Portfolio base matrix to evaluate
+            num_simulations: Number of parameter draws (100k+ is practical)
+            per_property: Also accumulate per-property ROI statistics, which
+                costs a (chunk_size x n_properties) broadcast per chunk
+
+        Returns:
+            Dict: Distribution summary and tail-risk metrics
+        """
+        rng = np.random.default_rng(self.random_seed)
+        annual_rois = np.empty(num_simulations)
+        portfolio_rois = np.empty(num_simulations)
+
+        if per_property:
+            # Bound the per-property broadcast to roughly chunk_size * 64 cells
+            chunk_size = max(1, min(self.chunk_size, self.chunk_size * 64 // max(1, len(model))))
+            property_sum = np.zeros(len(model))
+            property_sum_sq = np.zeros(len(model))
+            property_losses = np.zeros(len(model))
+        else:
+            chunk_size = self.chunk_size
+
+        for start in range(0, num_simulations, chunk_size):
+            stop = min(start + chunk_size, num_simulations)
+            params = self.sample_parameters(rng, stop - start)
+            portfolio_rois[start:stop], annual_rois[start:stop] = model.portfolio_returns(params)
+
+            if per_property:
+                property_annual = model.property_returns(params)[1]
+                property_sum += property_annual.sum(axis=0)
+                property_sum_sq += np.square(property_annual).sum(axis=0)
+                property_losses += (property_annual <= 0).sum(axis=0)
+
+        results = self._summarize(annual_rois, portfolio_rois)
+        results['random_seed'] = self.random_seed
+        results['chunk_size'] = chunk_size
+
+        if per_property:
+            property_mean = property_sum / num_simulations
+            results['property_statistics'] = {
+                'property_ids': model.property_ids,
+                'annual_roi_mean': property_mean,
+                'annual_roi_std': np.sqrt(np.maximum(property_sum_sq / num_simulations - property_mean ** 2, 0)),
+                'probability_loss': property_losses / num_simulations
+            }
+
+        return results
+
+    @staticmethod
+    def _summarize(annual_rois: np.ndarray, portfolio_rois: np.ndarray) -> Dict:
+        """Distribution statistics matching the legacy Monte Carlo output."""
+        num_simulations = len(annual_rois)
+        percentiles = np.percentile(annual_rois, [1, 5, 25, 50, 75, 95])
+        var_1, var_5 = percentiles[0], percentiles[1]
+
+        return {
+            'num_simulations': num_simulations,
+            'annual_roi_distribution': {
+                'mean': np.mean(annual_rois),
+                'median': percentiles[3],
+                'std': np.std(annual_rois),
+                'percentile_5': var_5,
+                'percentile_25': percentiles[2],
+                'percentile_75': percentiles[4],
+                'percentile_95': percentiles[5],
+                'min': np.min(annual_rois),
+                'max': np.max(annual_rois),
+                'standard_error_mean': np.std(annual_rois) / np.sqrt(num_simulations)
+            },
+            'portfolio_roi_distribution': {
+                'mean': np.mean(portfolio_rois),
+                'median': np.median(portfolio_rois),
+                'std': np.std(portfolio_rois),
+                'percentile_5': np.percentile(portfolio_rois, 5),
+                'percentile_95': np.percentile(portfolio_rois, 95)
+            },
+            'probability_positive_returns': np.mean(annual_rois > 0),
+            'probability_high_returns': np.mean(annual_rois > 0.15),  # >15% annual return
+            'value_at_risk_5': var_5,  # 5% VaR
+            'expected_shortfall': np.mean(annual_rois[annual_rois <= var_5]),
+            'value_at_risk_1': var_1,  # 1% VaR
+            'expected_shortfall_1': np.mean(annual_rois[annual_rois <= var_1])
+        }
+
+
+class ROISensitivityAnalyzer:
+    """
+    Sensitivity analysis over a PortfolioROIModel.
+
+    Every grid point is a parameter vector derived from ``base_params``; the
+    whole grid is built as one parameter array and evaluated in a single
+    broadcast, so dense grids (e.g. 50x50) cost one array pass instead of one
+    portfolio pass per point.
+    """
+
+    def __init__(self, model: PortfolioROIModel, base_params: Dict):
+        self.model = model
+        self.base_vector = params_to_array(base_params)
+
+    def one_at_a_time(self, param_values: Dict[str, Sequence[float]]) -> Dict[str, Dict[str, np.ndarray]]:
+        """Vary each parameter on its own while the others stay at base values."""
+        results = {}
+        for param_name, values in param_values.items():
+            values = np.asarray(values, dtype=float)
+            params = np.tile(self.base_vector, (len(values), 1))
+            params[:, PARAMETER_INDEX[param_name]] = values
+            portfolio_roi, annual_roi = self.model.portfolio_returns(params)
+            results[param_name] = {
+                'parameter_values': values,
+                'annual_roi': annual_roi,
+                'portfolio_roi': portfolio_roi
+            }
+        return results
+
+    def tornado(self, param_ranges: Dict[str, Tuple[float, float]]) -> Dict[str, np.ndarray]:
+        """
+        Tornado chart data: annual ROI at the low and high end of each range,
+        ordered by descending swing.
+        """
+        names = list(param_ranges)
+        params = np.tile(self.base_vector, (len(names), 2, 1))
+        for i, name in enumerate(names):
+            params[i, :, PARAMETER_INDEX[name]] = param_ranges[name]
+        annual_roi = self.model.portfolio_returns(params)[1]
+        base_annual_roi = self.model.portfolio_returns(self.base_vector)[1]
+
+        swing = np.abs(annual_roi[:, 1] - annual_roi[:, 0])
+        order = np.argsort(-swing, kind='stable')
+        return {
+            'parameters': np.array(names, dtype=object)[order],
+            'low_values': np.array([param_ranges[n][0] for n in names], dtype=float)[order],
+            'high_values': np.array([param_ranges[n][1] for n in names], dtype=float)[order],
+            'low_annual_roi': annual_roi[order, 0],
+            'high_annual_roi': annual_roi[order, 1],
+            'swing': swing[order],
+            'base_annual_roi': float(base_annual_roi)
+        }
+
+    def factorial_grid(self, param_values: Dict[str, Sequence[float]], per_property: bool = False) -> Dict:
+        """
+        Full-factorial grid over several parameters.
+
+        Result arrays have one axis per parameter, in the order given (e.g.
+        appreciation x rental_yield heatmaps); with ``per_property`` an extra
+        trailing axis holds each property's annual ROI.
+        """
+        names = list(param_values)
+        axes = [np.asarray(param_values[name], dtype=float) for name in names]
+        mesh = np.meshgrid(*axes, indexing='ij')
+
+        params = np.broadcast_to(self.base_vector, mesh[0].shape + (len(PARAMETER_NAMES),)).copy()
+        for name, values in zip(names, mesh):
+            params[..., PARAMETER_INDEX[name]] = values
+
+        portfolio_roi, annual_roi = self.model.portfolio_returns(params)
+        results = {
+            'parameters': names,
+            'axes': axes,
+            'annual_roi': annual_roi,
+            'portfolio_roi': portfolio_roi
+        }
+        if per_property:
+            results['property_annual_roi'] = self.model.property_returns(params)[1]
+        return results
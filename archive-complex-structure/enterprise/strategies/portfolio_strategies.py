@@ -13,8 +13,13 @@ Pre-built investment portfolios and strategy recommendations based on:
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Iterator, Tuple
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from core.intelligence.portfolio_optimizer import BudgetPortfolioOptimizer, PortfolioConstraints
+from core.intelligence.feature_store import as_property_frame
+from .scoring_rules import StrategyRuleTable
 
 
 class PortfolioStrategiesEngine:
@@ -66,6 +71,31 @@ class PortfolioStrategiesEngine:
             }
         }
         
+        # Selection constraints per portfolio risk level
+        self.portfolio_constraints = {
+            'conservative': {
+                'max_single_asset_share': 0.3,   # No single property over 30% of budget
+                'max_per_neighborhood': 2,
+                'max_per_energy_class': 3,
+                'min_properties': 1,
+                'max_properties': 5
+            },
+            'balanced': {
+                'max_single_asset_share': 0.4,
+                'max_per_neighborhood': 3,
+                'max_per_energy_class': 3,
+                'min_properties': 1,
+                'max_properties': 5
+            },
+            'aggressive': {
+                'max_single_asset_share': 0.4,
+                'max_per_neighborhood': 3,
+                'max_per_energy_class': 4,
+                'min_properties': 1,
+                'max_properties': 5
+            }
+        }
+        
         self.strategy_frameworks = {
             'energy_arbitrage': {
                 'description': 'Buy low-energy properties, retrofit, resell at premium',
@@ -99,6 +129,10 @@ class PortfolioStrategiesEngine:
                 'risk_factors': ['zoning_restrictions', 'development_costs', 'market_demand']
             }
         }
+        
+        # Compiled scoring rule tables, keyed by template and strategy
+        self._rule_tables = {}
+        self._strategy_rule_tables = {}
     
     def create_portfolios(self, property_data: List[Dict], investor_profile: Dict) -> Dict:
         """
@@ -112,27 +146,110 @@ class PortfolioStrategiesEngine:
             Dict: Comprehensive portfolio recommendations
         """
         
+        # Convert to DataFrame for easier analysis
+        df = self._to_property_frame(property_data)
+        
+        return self._create_portfolios_for_profile(df, investor_profile)
+    
+    def create_portfolios_batch(self, property_data: List[Dict], profiles: List[Dict],
+                                max_workers: Optional[int] = None) -> Iterator[Tuple[int, Dict]]:
+        """
+        Create portfolios for many investor profiles against the same property data.
+        
+        The property frame, template score variants and strategy candidates are built
+        once; profiles are grouped by template and the per-profile work runs on a
+        process pool. Results are yielded as each profile completes.
+        
+        Args:
+            property_data: List of available properties
+            profiles: Investor profiles
+            max_workers: Worker processes (defaults to CPU count, 1 runs in-process)
+            
+        Returns:
+            Iterator[Tuple[int, Dict]]: (profile index, create_portfolios result) pairs in completion order
+        """
+        
+        df = self._to_property_frame(property_data)
+        
+        # Group profiles by template so shared score variants are computed once per template
+        template_groups = {}
+        for profile_index, investor_profile in enumerate(profiles):
+            template = self._select_portfolio_template(
+                investor_profile.get('budget', 500000),
+                investor_profile.get('risk_tolerance', 'medium'),
+                investor_profile.get('investment_horizon', 5)
+            )
+            group = template_groups.setdefault(self._template_key(template), {'template': template, 'profiles': []})
+            group['profiles'].append((profile_index, investor_profile))
+        
+        shared_features = self._build_shared_features(df, [group['template'] for group in template_groups.values()])
+        tasks = [
+            (profile_index, investor_profile, group['template'])
+            for group in template_groups.values()
+            for profile_index, investor_profile in group['profiles']
+        ]
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 1 or len(tasks) <= 1:
+            for profile_index, investor_profile, template in tasks:
+                yield profile_index, self._create_portfolios_for_profile(df, investor_profile, template, shared_features)
+            return
+        
+        # Workers receive the engine, frame and shared features once at start-up
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            initializer=_init_batch_worker,
+            initargs=(self, df, shared_features)
+        ) as executor:
+            futures = [executor.submit(_run_batch_profile, *task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def _to_property_frame(self, property_data) -> pd.DataFrame:
+        """Convert property records, a DataFrame or a feature store to a DataFrame."""
+        
+        return as_property_frame(property_data)
+    
+    def _template_key(self, template: Dict) -> Tuple:
+        """Hashable identity of a selected template."""
+        
+        return tuple(sorted(template.items()))
+    
+    def _build_shared_features(self, df: pd.DataFrame, templates: List[Dict]) -> Dict:
+        """Precompute profile-independent scoring and strategy candidates."""
+        
+        return {
+            'score_variants': {
+                self._template_key(template): self._get_rule_table(template).score_variants(df)
+                for template in templates
+            },
+            'strategy_candidates': {
+                strategy_name: self._filter_properties_for_strategy(df, strategy_config)
+                for strategy_name, strategy_config in self.strategy_frameworks.items()
+            }
+        }
+    
+    def _create_portfolios_for_profile(self, df: pd.DataFrame, investor_profile: Dict,
+                                       portfolio_template: Optional[Dict] = None,
+                                       shared_features: Optional[Dict] = None) -> Dict:
+        """Create all portfolios, risk analysis and comparison for one investor profile."""
+        
         budget = investor_profile.get('budget', 500000)
         risk_tolerance = investor_profile.get('risk_tolerance', 'medium')
         investment_horizon = investor_profile.get('investment_horizon', 5)
         objectives = investor_profile.get('objectives', ['capital_appreciation'])
         
-        # Convert to DataFrame for easier analysis
-        if isinstance(property_data, list):
-            df = pd.DataFrame(property_data)
-        else:
-            df = property_data.copy()
-        
         # Determine appropriate portfolio template
-        portfolio_template = self._select_portfolio_template(budget, risk_tolerance, investment_horizon)
+        if portfolio_template is None:
+            portfolio_template = self._select_portfolio_template(budget, risk_tolerance, investment_horizon)
         
         # Create specific portfolio recommendations
         portfolio_recommendations = self._create_portfolio_recommendations(
-            df, portfolio_template, investor_profile
+            df, portfolio_template, investor_profile, shared_features
         )
         
         # Generate strategy-specific portfolios
-        strategy_portfolios = self._create_strategy_portfolios(df, investor_profile)
+        strategy_portfolios = self._create_strategy_portfolios(df, investor_profile, shared_features)
         
         # Risk analysis for each portfolio
         risk_analysis = self._analyze_portfolio_risks(portfolio_recommendations, strategy_portfolios)
@@ -179,13 +296,14 @@ class PortfolioStrategiesEngine:
         # Default to medium budget template if no match
         return self.portfolio_templates['budget_500k']
     
-    def _create_portfolio_recommendations(self, df: pd.DataFrame, template: Dict, investor_profile: Dict) -> Dict:
+    def _create_portfolio_recommendations(self, df: pd.DataFrame, template: Dict, investor_profile: Dict,
+                                          shared_features: Optional[Dict] = None) -> Dict:
         """Create specific portfolio recommendations based on template and available properties."""
         
         budget = investor_profile.get('budget', 500000)
         
         # Score properties for this portfolio strategy
-        df_scored = self._score_properties_for_portfolio(df, template, investor_profile)
+        df_scored = self._score_properties_for_portfolio(df, template, investor_profile, shared_features)
         
         # Create different portfolio options
         portfolios = {
@@ -196,86 +314,41 @@ class PortfolioStrategiesEngine:
         
         return portfolios
     
-    def _score_properties_for_portfolio(self, df: pd.DataFrame, template: Dict, investor_profile: Dict) -> pd.DataFrame:
+    def _score_properties_for_portfolio(self, df: pd.DataFrame, template: Dict, investor_profile: Dict,
+                                        shared_features: Optional[Dict] = None) -> pd.DataFrame:
         """Score properties based on portfolio strategy and investor preferences."""
         
         df_scored = df.copy()
-        df_scored['portfolio_score'] = 0.0
+        budget = investor_profile.get('budget', 500000)
         
-        strategy_type = template.get('strategy_type', 'balanced_portfolio')
+        variants = None
+        if shared_features is not None:
+            variants = shared_features['score_variants'].get(self._template_key(template))
         
-        for idx, property_data in df_scored.iterrows():
-            score = 5.0  # Base score
-            
-            # Price affordability (within budget)
-            property_price = property_data.get('price', 0)
-            budget = investor_profile.get('budget', 500000)
-            
-            if property_price <= budget * 0.3:  # Single property shouldn't exceed 30% of budget
-                score += 2.0
-            elif property_price <= budget * 0.5:
-                score += 1.0
-            elif property_price > budget:
-                score -= 3.0
-            
-            # Energy efficiency scoring based on strategy
-            energy_class = property_data.get('energy_class', 'C')
-            if strategy_type in ['energy_arbitrage', 'diversified_growth']:
-                # Prefer lower energy classes for retrofit opportunities
-                energy_scores = {'G': 2.0, 'F': 1.8, 'E': 1.5, 'D': 1.2, 'C': 1.0, 'B': 0.5, 'B+': 0.3, 'A': 0.1, 'A+': 0.0}
-                score += energy_scores.get(energy_class, 1.0)
-            else:
-                # Prefer higher energy classes for premium positioning
-                energy_scores = {'A+': 2.0, 'A': 1.8, 'B+': 1.5, 'B': 1.2, 'C': 1.0, 'D': 0.5, 'E': 0.3, 'F': 0.1, 'G': 0.0}
-                score += energy_scores.get(energy_class, 1.0)
-            
-            # Neighborhood scoring
-            neighborhood = property_data.get('neighborhood', 'Unknown')
-            neighborhood_scores = self._get_neighborhood_scores(strategy_type)
-            score += neighborhood_scores.get(neighborhood, 0.5)
-            
-            # Price per sqm efficiency
-            price_per_sqm = property_data.get('price_per_sqm', 4000)
-            if price_per_sqm < 3500:
-                score += 1.5  # Good value
-            elif price_per_sqm > 6000:
-                score -= 1.0  # Expensive
-            
-            # Size appropriateness
-            sqm = property_data.get('sqm', 70)
-            if strategy_type == 'rental_yield_focus':
-                # Prefer medium-sized properties for rental
-                if 60 <= sqm <= 100:
-                    score += 1.0
-            elif strategy_type == 'luxury_appreciation':
-                # Prefer larger properties for luxury market
-                if sqm > 100:
-                    score += 1.5
-            
-            df_scored.at[idx, 'portfolio_score'] = max(0, min(10, score))
+        # Affordability, energy, neighborhood, price per sqm and size rules as column expressions
+        df_scored['portfolio_score'] = self._get_rule_table(template).score(df_scored, budget, variants)
         
         return df_scored.sort_values('portfolio_score', ascending=False)
     
-    def _get_neighborhood_scores(self, strategy_type: str) -> Dict[str, float]:
-        """Get neighborhood scores based on investment strategy."""
+    def _get_rule_table(self, template: Dict) -> StrategyRuleTable:
+        """Get the compiled scoring rule table for a portfolio template."""
         
-        if strategy_type == 'energy_arbitrage':
-            return {
-                'Exarchia': 1.5, 'Koukaki': 1.3, 'Pangrati': 1.2, 'Kolonaki': 1.0,
-                'Plaka': 1.1, 'Kipseli': 1.4, 'Patisia': 1.3
-            }
-        elif strategy_type == 'luxury_appreciation':
-            return {
-                'Kolonaki': 2.0, 'Plaka': 1.8, 'Kifisia': 1.6, 'Koukaki': 1.3,
-                'Thiseio': 1.4, 'Exarchia': 0.8
-            }
-        elif strategy_type == 'rental_yield_focus':
-            return {
-                'Exarchia': 1.8, 'Koukaki': 1.6, 'Pangrati': 1.4, 'Kipseli': 1.3,
-                'Plaka': 1.5, 'Kolonaki': 1.0
-            }
-        else:
-            return {'Kolonaki': 1.2, 'Plaka': 1.1, 'Koukaki': 1.0, 'Exarchia': 1.0}
+        cache_key = (template.get('strategy_type', 'balanced_portfolio'), template.get('expected_annual_return', 0.18))
+        if cache_key not in self._rule_tables:
+            self._rule_tables[cache_key] = StrategyRuleTable.from_template(template)
+        return self._rule_tables[cache_key]
+    
+    def _get_strategy_rule_table(self, strategy_config: Dict) -> StrategyRuleTable:
+        """Get the compiled rule table for a strategy framework entry."""
+        
+        for strategy_name, config in self.strategy_frameworks.items():
+            if config is strategy_config:
+                if strategy_name not in self._strategy_rule_tables:
+                    self._strategy_rule_tables[strategy_name] = StrategyRuleTable.from_strategy(strategy_name, strategy_config)
+                return self._strategy_rule_tables[strategy_name]
+        
+        # Ad-hoc strategy configs are compiled per call
+        return StrategyRuleTable.from_strategy('custom_strategy', strategy_config)
     
     def _create_conservative_portfolio(self, df_scored: pd.DataFrame, budget: float, template: Dict) -> Dict:
         """Create conservative portfolio with lower risk properties."""
@@ -284,7 +357,7 @@ class PortfolioStrategiesEngine:
         conservative_properties = df_scored[
             (df_scored['energy_class'].isin(['A+', 'A', 'B+', 'B', 'C'])) &
             (df_scored['price'] <= budget * 0.4)  # No single property over 40% of budget
-        ].head(10)
+        ]
         
         if len(conservative_properties) == 0:
             conservative_properties = df_scored.head(5)
@@ -298,8 +371,8 @@ class PortfolioStrategiesEngine:
     def _create_balanced_portfolio(self, df_scored: pd.DataFrame, budget: float, template: Dict) -> Dict:
         """Create balanced portfolio mixing growth and stability."""
         
-        # Mix of property types and energy classes
-        balanced_properties = df_scored.head(15)  # Top 15 scored properties
+        # Mix of property types and energy classes - optimizer enforces concentration limits
+        balanced_properties = df_scored
         
         portfolio = self._build_portfolio_from_properties(
             balanced_properties, budget, template, 'balanced'
@@ -314,7 +387,7 @@ class PortfolioStrategiesEngine:
         aggressive_properties = df_scored[
             (df_scored['energy_class'].isin(['C', 'D', 'E', 'F'])) |
             (df_scored['portfolio_score'] >= 7.0)
-        ].head(10)
+        ]
         
         if len(aggressive_properties) == 0:
             aggressive_properties = df_scored.head(8)
@@ -326,38 +399,43 @@ class PortfolioStrategiesEngine:
         return portfolio
     
     def _build_portfolio_from_properties(self, properties: pd.DataFrame, budget: float, template: Dict, risk_level: str) -> Dict:
-        """Build portfolio from selected properties within budget constraints."""
+        """Build the expected-return maximizing portfolio from candidate properties within budget constraints."""
+        
+        records = properties.to_dict('records')
+        costs = [record.get('price', 0) * 1.08 for record in records]  # 8% transaction costs
+        expected_returns = self._get_rule_table(template).expected_returns(properties, risk_level).tolist()
+        
+        # Optimal selection under budget, single-asset, concentration and count limits
+        constraint_params = dict(self.portfolio_constraints.get(risk_level, self.portfolio_constraints['balanced']))
+        if template.get('strategy_type') == 'single_property_growth':
+            constraint_params['max_single_asset_share'] = 1.0
+        optimizer = BudgetPortfolioOptimizer(PortfolioConstraints(budget=budget, **constraint_params))
+        optimizer.set_candidates(
+            keys=list(range(len(records))),
+            costs=costs,
+            values=[cost * expected_return for cost, expected_return in zip(costs, expected_returns)],
+            neighborhoods=[record.get('neighborhood', 'Unknown') for record in records],
+            energy_classes=[record.get('energy_class', 'C') for record in records]
+        )
+        selection = optimizer.solve()
         
         selected_properties = []
-        total_cost = 0
-        remaining_budget = budget
-        
-        # Greedy selection algorithm - select highest scoring properties that fit budget
-        for idx, property_data in properties.iterrows():
-            property_price = property_data.get('price', 0)
-            transaction_costs = property_price * 0.08  # 8% transaction costs
-            total_property_cost = property_price + transaction_costs
-            
-            if total_property_cost <= remaining_budget:
-                property_info = {
-                    'property_id': property_data.get('property_id', f'prop_{idx}'),
-                    'neighborhood': property_data.get('neighborhood', 'Unknown'),
-                    'price': property_price,
-                    'sqm': property_data.get('sqm', 0),
-                    'energy_class': property_data.get('energy_class', 'C'),
-                    'price_per_sqm': property_data.get('price_per_sqm', 0),
-                    'portfolio_score': property_data.get('portfolio_score', 5.0),
-                    'total_cost': total_property_cost,
-                    'expected_annual_return': self._calculate_expected_return(property_data, template, risk_level)
-                }
-                
-                selected_properties.append(property_info)
-                total_cost += total_property_cost
-                remaining_budget -= total_property_cost
-                
-                # Stop if we have enough properties for diversification
-                if len(selected_properties) >= 5 or remaining_budget < 50000:
-                    break
+        for position in sorted(selection.selected_keys):  # Keep portfolio score order
+            property_data = records[position]
+            selected_properties.append({
+                'property_id': property_data.get('property_id', f'prop_{properties.index[position]}'),
+                'neighborhood': property_data.get('neighborhood', 'Unknown'),
+                'price': property_data.get('price', 0),
+                'sqm': property_data.get('sqm', 0),
+                'energy_class': property_data.get('energy_class', 'C'),
+                'price_per_sqm': property_data.get('price_per_sqm', 0),
+                'portfolio_score': property_data.get('portfolio_score', 5.0),
+                'total_cost': costs[position],
+                'expected_annual_return': expected_returns[position]
+            })
+        
+        total_cost = selection.total_cost
+        remaining_budget = budget - total_cost
         
         # Calculate portfolio metrics
         portfolio_metrics = self._calculate_portfolio_metrics(selected_properties, budget, template)
@@ -371,7 +449,13 @@ class PortfolioStrategiesEngine:
             'property_count': len(selected_properties),
             'portfolio_metrics': portfolio_metrics,
             'diversification_score': self._calculate_diversification_score(selected_properties),
-            'implementation_timeline': self._create_implementation_timeline(selected_properties)
+            'implementation_timeline': self._create_implementation_timeline(selected_properties),
+            'optimization': {
+                'method': selection.method,
+                'optimal': selection.optimal,
+                'candidates_considered': selection.candidates_considered,
+                'solve_time_seconds': selection.solve_time_seconds
+            }
         }
         
         return portfolio
@@ -379,41 +463,7 @@ class PortfolioStrategiesEngine:
     def _calculate_expected_return(self, property_data: Dict, template: Dict, risk_level: str) -> float:
         """Calculate expected annual return for property based on strategy and risk level."""
         
-        base_return = template.get('expected_annual_return', 0.18)
-        
-        # Adjust for energy class
-        energy_class = property_data.get('energy_class', 'C')
-        energy_adjustments = {
-            'A+': 0.02, 'A': 0.01, 'B+': 0.005, 'B': 0.0, 'C': -0.01,
-            'D': -0.02, 'E': -0.03, 'F': -0.04, 'G': -0.05
-        }
-        
-        # For energy arbitrage strategies, lower energy classes have higher potential returns
-        strategy_type = template.get('strategy_type', 'balanced')
-        if 'energy' in strategy_type or 'growth' in strategy_type:
-            energy_adjustments = {k: -v for k, v in energy_adjustments.items()}
-        
-        energy_adjustment = energy_adjustments.get(energy_class, 0)
-        
-        # Adjust for risk level
-        risk_adjustments = {
-            'conservative': -0.03,
-            'balanced': 0.0,
-            'aggressive': 0.04
-        }
-        risk_adjustment = risk_adjustments.get(risk_level, 0.0)
-        
-        # Neighborhood adjustment
-        neighborhood = property_data.get('neighborhood', 'Unknown')
-        neighborhood_adjustments = {
-            'Kolonaki': 0.01, 'Plaka': 0.015, 'Koukaki': 0.02,
-            'Exarchia': 0.025, 'Kifisia': 0.005
-        }
-        neighborhood_adjustment = neighborhood_adjustments.get(neighborhood, 0.0)
-        
-        final_return = base_return + energy_adjustment + risk_adjustment + neighborhood_adjustment
-        
-        return max(0.05, min(0.40, final_return))  # Cap between 5% and 40%
+        return self._get_rule_table(template).expected_return(property_data, risk_level)
     
     def _calculate_portfolio_metrics(self, properties: List[Dict], budget: float, template: Dict) -> Dict:
         """Calculate comprehensive portfolio performance metrics."""
@@ -546,7 +596,8 @@ class PortfolioStrategiesEngine:
         
         return items
     
-    def _create_strategy_portfolios(self, df: pd.DataFrame, investor_profile: Dict) -> Dict:
+    def _create_strategy_portfolios(self, df: pd.DataFrame, investor_profile: Dict,
+                                    shared_features: Optional[Dict] = None) -> Dict:
         """Create strategy-specific portfolio recommendations."""
         
         budget = investor_profile.get('budget', 500000)
@@ -554,17 +605,24 @@ class PortfolioStrategiesEngine:
         strategy_portfolios = {}
         
         for strategy_name, strategy_config in self.strategy_frameworks.items():
+            candidates = None
+            if shared_features is not None:
+                candidates = shared_features['strategy_candidates'].get(strategy_name)
+            
             portfolio = self._create_strategy_specific_portfolio(
-                df, budget, strategy_name, strategy_config, investor_profile
+                df, budget, strategy_name, strategy_config, investor_profile, candidates
             )
             strategy_portfolios[strategy_name] = portfolio
         
         return strategy_portfolios
     
-    def _create_strategy_specific_portfolio(self, df: pd.DataFrame, budget: float, strategy_name: str, strategy_config: Dict, investor_profile: Dict) -> Dict:
+    def _create_strategy_specific_portfolio(self, df: pd.DataFrame, budget: float, strategy_name: str, strategy_config: Dict,
+                                            investor_profile: Dict, candidates: Optional[pd.DataFrame] = None) -> Dict:
         """Create portfolio for specific investment strategy."""
         
-        filtered_properties = self._filter_properties_for_strategy(df, strategy_config)
+        if candidates is None:
+            candidates = self._filter_properties_for_strategy(df, strategy_config)
+        filtered_properties = candidates
         
         if len(filtered_properties) == 0:
             return {
@@ -617,33 +675,8 @@ class PortfolioStrategiesEngine:
     def _filter_properties_for_strategy(self, df: pd.DataFrame, strategy_config: Dict) -> pd.DataFrame:
         """Filter properties suitable for specific investment strategy."""
         
-        filtered_df = df.copy()
-        
-        # Filter by target energy classes
-        if 'target_energy_classes' in strategy_config:
-            target_classes = strategy_config['target_energy_classes']
-            filtered_df = filtered_df[filtered_df['energy_class'].isin(target_classes)]
-        
-        # Filter by neighborhoods
-        if 'target_neighborhoods' in strategy_config:
-            target_neighborhoods = strategy_config['target_neighborhoods']
-            filtered_df = filtered_df[filtered_df['neighborhood'].isin(target_neighborhoods)]
-        
-        # Filter by minimum energy class
-        if 'minimum_energy_class' in strategy_config:
-            min_energy = strategy_config['minimum_energy_class']
-            energy_order = ['G', 'F', 'E', 'D', 'C', 'B', 'B+', 'A', 'A+']
-            min_index = energy_order.index(min_energy)
-            valid_classes = energy_order[min_index:]
-            filtered_df = filtered_df[filtered_df['energy_class'].isin(valid_classes)]
-        
-        # Filter by property types
-        if 'property_types' in strategy_config:
-            target_types = strategy_config['property_types']
-            if 'property_type' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['property_type'].isin(target_types)]
-        
-        return filtered_df
+        # Energy class, neighborhood and property type eligibility from the compiled rule table
+        return df[self._get_strategy_rule_table(strategy_config).eligible(df)].copy()
     
     def _calculate_strategy_cost(self, property_price: float, strategy_config: Dict) -> float:
         """Calculate total cost including strategy-specific costs."""
@@ -1205,4 +1238,26 @@ class PortfolioStrategiesEngine:
                 'target_timeline': 'Month 18-24',
                 'key_activities': ['Performance review completed', 'Rebalancing decisions made', 'Exit strategies refined']
             }
-        ]
\ No newline at end of file
+        ]
+
+
+# Per-process state for create_portfolios_batch workers
+_batch_context = {}
+
+
+def _init_batch_worker(engine: PortfolioStrategiesEngine, df: pd.DataFrame, shared_features: Dict):
+    """Store the engine, property frame and shared features in the worker process."""
+    
+    _batch_context['engine'] = engine
+    _batch_context['df'] = df
+    _batch_context['shared_features'] = shared_features
+
+
+def _run_batch_profile(profile_index: int, investor_profile: Dict, template: Dict) -> Tuple[int, Dict]:
+    """Create portfolios for one profile inside a batch worker."""
+    
+    engine = _batch_context['engine']
+    results = engine._create_portfolios_for_profile(
+        _batch_context['df'], investor_profile, template, _batch_context['shared_features']
+    )
+    return profile_index, results
@@ -0,0 +1,241 @@
+"""
+Strategy Scoring Rules
+======================
+
+Compiled rule tables for portfolio and strategy scoring:
+- Budget affordability, energy preference and neighborhood weights per strategy type
+- Price per sqm and size bands as vectorized column expressions
+- Expected return adjustments by energy class, neighborhood and risk level
+- Strategy eligibility filters (energy classes, neighborhoods, property types)
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+ENERGY_ORDER = ['G', 'F', 'E', 'D', 'C', 'B', 'B+', 'A', 'A+']
+
+# Lower energy classes score higher where retrofit upside drives the strategy
+RETROFIT_ENERGY_SCORES = {'G': 2.0, 'F': 1.8, 'E': 1.5, 'D': 1.2, 'C': 1.0, 'B': 0.5, 'B+': 0.3, 'A': 0.1, 'A+': 0.0}
+PREMIUM_ENERGY_SCORES = {'A+': 2.0, 'A': 1.8, 'B+': 1.5, 'B': 1.2, 'C': 1.0, 'D': 0.5, 'E': 0.3, 'F': 0.1, 'G': 0.0}
+RETROFIT_STRATEGIES = ('energy_arbitrage', 'diversified_growth')
+
+NEIGHBORHOOD_SCORES = {
+    'energy_arbitrage': {
+        'Exarchia': 1.5, 'Koukaki': 1.3, 'Pangrati': 1.2, 'Kolonaki': 1.0,
+        'Plaka': 1.1, 'Kipseli': 1.4, 'Patisia': 1.3
+    },
+    'luxury_appreciation': {
+        'Kolonaki': 2.0, 'Plaka': 1.8, 'Kifisia': 1.6, 'Koukaki': 1.3,
+        'Thiseio': 1.4, 'Exarchia': 0.8
+    },
+    'rental_yield_focus': {
+        'Exarchia': 1.8, 'Koukaki': 1.6, 'Pangrati': 1.4, 'Kipseli': 1.3,
+        'Plaka': 1.5, 'Kolonaki': 1.0
+    },
+    'default': {'Kolonaki': 1.2, 'Plaka': 1.1, 'Koukaki': 1.0, 'Exarchia': 1.0}
+}
+
+# (column, lower, upper, inclusive, score adjustment) - evaluated with Series.between
+PRICE_PER_SQM_BANDS = [
+    ('price_per_sqm', -np.inf, 3500, 'neither', 1.5),  # Good value
+    ('price_per_sqm', 6000, np.inf, 'right', -1.0)      # Expensive
+]
+SIZE_BANDS = {
+    'rental_yield_focus': [('sqm', 60, 100, 'both', 1.0)],         # Medium-sized rentals
+    'luxury_appreciation': [('sqm', 100, np.inf, 'right', 1.5)]    # Larger luxury units
+}
+
+# (share of budget, score adjustment) - first matching band wins
+AFFORDABILITY_BANDS = [(0.3, 2.0), (0.5, 1.0)]
+OVER_BUDGET_PENALTY = -3.0
+
+ENERGY_RETURN_ADJUSTMENTS = {
+    'A+': 0.02, 'A': 0.01, 'B+': 0.005, 'B': 0.0, 'C': -0.01,
+    'D': -0.02, 'E': -0.03, 'F': -0.04, 'G': -0.05
+}
+NEIGHBORHOOD_RETURN_ADJUSTMENTS = {
+    'Kolonaki': 0.01, 'Plaka': 0.015, 'Koukaki': 0.02,
+    'Exarchia': 0.025, 'Kifisia': 0.005
+}
+RISK_RETURN_ADJUSTMENTS = {
+    'conservative': -0.03,
+    'balanced': 0.0,
+    'aggressive': 0.04
+}
+
+COLUMN_DEFAULTS = {
+    'price': 0,
+    'energy_class': 'C',
+    'neighborhood': 'Unknown',
+    'price_per_sqm': 4000,
+    'sqm': 70
+}
+
+
+class StrategyRuleTable:
+    """
+    Scoring, return and eligibility rules for one strategy, compiled once and
+    applied to whole property frames as column expressions.
+    """
+
+    def __init__(self, strategy_type: str = 'balanced_portfolio', base_return: float = 0.18,
+                 strategy_config: Optional[Dict] = None):
+        self.strategy_type = strategy_type
+        self.base_return = base_return
+
+        # Portfolio scoring rules
+        self.energy_scores = RETROFIT_ENERGY_SCORES if strategy_type in RETROFIT_STRATEGIES else PREMIUM_ENERGY_SCORES
+        self.neighborhood_scores = NEIGHBORHOOD_SCORES.get(strategy_type, NEIGHBORHOOD_SCORES['default'])
+        self.band_rules = PRICE_PER_SQM_BANDS + SIZE_BANDS.get(strategy_type, [])
+
+        # Expected return rules - energy and growth strategies reward low energy classes
+        if 'energy' in strategy_type or 'growth' in strategy_type:
+            self.energy_return_adjustments = {k: -v for k, v in ENERGY_RETURN_ADJUSTMENTS.items()}
+        else:
+            self.energy_return_adjustments = ENERGY_RETURN_ADJUSTMENTS
+
+        # Eligibility rules as allowed values per column
+        self.eligibility_rules = self._compile_eligibility(strategy_config or {})
+
+    @classmethod
+    def from_template(cls, template: Dict) -> 'StrategyRuleTable':
+        """Compile the rule table for a portfolio template."""
+
+        return cls(
+            strategy_type=template.get('strategy_type', 'balanced_portfolio'),
+            base_return=template.get('expected_annual_return', 0.18)
+        )
+
+    @classmethod
+    def from_strategy(cls, strategy_name: str, strategy_config: Dict) -> 'StrategyRuleTable':
+        """Compile the rule table for a strategy framework entry."""
+
+        return cls(strategy_type=strategy_name, strategy_config=strategy_config)
+
+    def _compile_eligibility(self, strategy_config: Dict) -> List[Tuple[str, frozenset, bool]]:
+        """Translate strategy filters into (column, allowed values, required column) rules."""
+
+        rules = []
+
+        if 'target_energy_classes' in strategy_config:
+            rules.append(('energy_class', frozenset(strategy_config['target_energy_classes']), True))
+
+        if 'target_neighborhoods' in strategy_config:
+            rules.append(('neighborhood', frozenset(strategy_config['target_neighborhoods']), True))
+
+        if 'minimum_energy_class' in strategy_config:
+            min_index = ENERGY_ORDER.index(strategy_config['minimum_energy_class'])
+            rules.append(('energy_class', frozenset(ENERGY_ORDER[min_index:]), True))
+
+        # Property type is only filtered when the listings carry it
+        if 'property_types' in strategy_config:
+            rules.append(('property_type', frozenset(strategy_config['property_types']), False))
+
+        return rules
+
+    def score_variants(self, df: pd.DataFrame) -> Dict[float, np.ndarray]:
+        """
+        Budget-independent part of the portfolio score, evaluated once for
+        every affordability outcome so per-investor scoring is a selection.
+
+        Args:
+            df: Property frame
+
+        Returns:
+            Dict[float, np.ndarray]: Clipped scores keyed by affordability adjustment
+        """
+
+        terms = [
+            self._lookup(df, 'energy_class', self.energy_scores, 1.0),
+            self._lookup(df, 'neighborhood', self.neighborhood_scores, 0.5)
+        ]
+        for column, lower, upper, inclusive, adjustment in self.band_rules:
+            values = pd.Series(self._numeric_column(df, column))
+            terms.append(np.where(values.between(lower, upper, inclusive=inclusive).to_numpy(), adjustment, 0.0))
+
+        variants = {}
+        for affordability in [adjustment for _, adjustment in AFFORDABILITY_BANDS] + [OVER_BUDGET_PENALTY, 0.0]:
+            score = 5.0 + affordability
+            for term in terms:
+                score = score + term
+            variants[affordability] = np.clip(score, 0, 10)
+
+        return variants
+
+    def score(self, df: pd.DataFrame, budget: float, variants: Optional[Dict[float, np.ndarray]] = None) -> np.ndarray:
+        """
+        Portfolio score per property, clipped to the 0-10 scale.
+
+        Args:
+            df: Property frame
+            budget: Investor budget used for affordability bands
+            variants: Precomputed score_variants for the same frame
+
+        Returns:
+            np.ndarray: Scores aligned with the frame rows
+        """
+
+        if variants is None:
+            variants = self.score_variants(df)
+
+        price = self._numeric_column(df, 'price')
+        return np.select(
+            [price <= budget * share for share, _ in AFFORDABILITY_BANDS] + [price > budget],
+            [variants[adjustment] for _, adjustment in AFFORDABILITY_BANDS] + [variants[OVER_BUDGET_PENALTY]],
+            default=variants[0.0]
+        )
+
+    def expected_returns(self, df: pd.DataFrame, risk_level: str) -> np.ndarray:
+        """Expected annual return per property for a portfolio risk level."""
+
+        risk_adjustment = RISK_RETURN_ADJUSTMENTS.get(risk_level, 0.0)
+
+        returns = (
+            self.base_return
+            + self._lookup(df, 'energy_class', self.energy_return_adjustments, 0)
+            + risk_adjustment
+            + self._lookup(df, 'neighborhood', NEIGHBORHOOD_RETURN_ADJUSTMENTS, 0.0)
+        )
+
+        return np.clip(returns, 0.05, 0.40)  # Cap between 5% and 40%
+
+    def expected_return(self, property_data: Dict, risk_level: str) -> float:
+        """Expected annual return for a single property record."""
+
+        final_return = (
+            self.base_return
+            + self.energy_return_adjustments.get(property_data.get('energy_class', 'C'), 0)
+            + RISK_RETURN_ADJUSTMENTS.get(risk_level, 0.0)
+            + NEIGHBORHOOD_RETURN_ADJUSTMENTS.get(property_data.get('neighborhood', 'Unknown'), 0.0)
+        )
+
+        return max(0.05, min(0.40, final_return))
+
+    def eligible(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of properties satisfying every eligibility rule."""
+
+        mask = np.ones(len(df), dtype=bool)
+
+        for column, allowed, required in self.eligibility_rules:
+            if column in df.columns:
+                mask &= df[column].isin(allowed).to_numpy()
+            elif required:
+                raise KeyError(column)
+
+        return mask
+
+    def _numeric_column(self, df: pd.DataFrame, column: str) -> np.ndarray:
+        """Column as floats, falling back to the rule default when absent."""
+
+        if column not in df.columns:
+            return np.full(len(df), float(COLUMN_DEFAULTS[column]))
+        return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+
+    def _lookup(self, df: pd.DataFrame, column: str, table: Dict, default: float) -> np.ndarray:
+        """Map a categorical column through a rule table."""
+
+        if column not in df.columns:
+            return np.full(len(df), table.get(COLUMN_DEFAULTS[column], default), dtype=float)
+        return df[column].map(table).astype(float).fillna(default).to_numpy()
@@ -25,6 +25,7 @@ import sys
 sys.path.append(str(Path(__file__).parent))
 
 from core.collectors.athens_comprehensive_collector import AthensComprehensiveCollector
+from core.collectors.change_monitor import ChangeEvent, ChangeMonitor
 from core.intelligence.investment_engine import InvestmentIntelligenceEngine
 from reports.investment.investment_report_generator import InvestmentReportGenerator
 
@@ -273,20 +274,56 @@ class AthensInvestmentPlatform:
             self.logger.error(f"❌ Report generation failed: {e}")
             raise
     
-    def run_market_monitoring(self):
-        """Run real-time market monitoring"""
+    async def run_market_monitoring(self, data_path: str = None, cycles: int = None):
+        """
+        Run incremental market monitoring
+        
+        Re-visits known listings on a schedule weighted by price volatility and
+        listing age, using conditional requests and content fingerprints so only
+        changed listings are re-extracted and re-scored. Monitored listings persist
+        between runs; data_path seeds listings from previously collected data.
+        """
         
-        self.logger.info("📡 Starting Real-Time Market Monitoring")
+        self.logger.info("📡 Starting Market Monitoring")
         
-        # This would implement continuous monitoring
-        # For now, just log the capability
-        self.logger.info("🔄 Market monitoring active...")
-        self.logger.info("   - Price change alerts")
-        self.logger.info("   - New listing notifications") 
-        self.logger.info("   - Investment opportunity updates")
-        self.logger.info("   - Market trend analysis")
+        monitor = ChangeMonitor.from_config(scorer=self.score_monitored_listing)
+        monitor.add_listener(self.log_change_event)
         
-        return "Market monitoring started successfully"
+        try:
+            if data_path:
+                # A bounded run checks seeded listings now; a continuous one spreads them over a base interval
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    added = monitor.add_known(json.load(f), spread_seconds=0 if cycles is not None else None)
+                self.logger.info(f"🌱 Seeded {added} listings from {data_path}")
+            
+            if not len(monitor):
+                self.logger.warning("⚠️  No listings to monitor - seed them with --data")
+                return None
+            
+            self.logger.info(f"🔄 Monitoring {len(monitor)} listings")
+            await monitor.run(cycles=cycles)
+            return monitor.summary()
+        finally:
+            await monitor.close()
+    
+    def score_monitored_listing(self, listing: dict):
+        """Re-score a listing whose price or status changed"""
+        opportunity = self.intelligence_engine.generate_investment_opportunity(listing)
+        if opportunity is None:
+            return None
+        return {
+            "investment_score": opportunity.investment_score,
+            "investment_grade": opportunity.investment_grade,
+            "recommended_action": opportunity.recommended_action
+        }
+    
+    def log_change_event(self, event: ChangeEvent):
+        """Log one market change detected by the monitor"""
+        change = event.payload.get('price_change_pct')
+        details = f" ({change:+.1f}%)" if change is not None else ""
+        score = event.payload.get('score') or {}
+        action = f" → {score['recommended_action']}" if score.get('recommended_action') else ""
+        self.logger.info(f"📣 {event.event_type}: {event.url} {event.old_price} → {event.new_price}{details}{action}")
     
     def log_analysis_summary(self):
         """Log comprehensive analysis summary"""
@@ -316,6 +353,7 @@ Examples:
   python main.py --mode quick --areas Kolonaki Koukaki Plaka
   python main.py --mode reports --data data/processed/properties_20250805.json
   python main.py --mode monitor                 # Real-time monitoring
+  python main.py --mode monitor --data data/processed/properties_20250805.json --cycles 1
         """
     )
     
@@ -334,7 +372,13 @@ Examples:
     
     parser.add_argument(
         '--data',
-        help='Path to existing data file for report generation'
+        help='Path to existing data file for report generation (or to seed monitoring)'
+    )
+    
+    parser.add_argument(
+        '--cycles',
+        type=int,
+        help='Monitoring rounds to run (default: until interrupted)'
     )
     
     parser.add_argument(
@@ -396,8 +440,11 @@ Examples:
         
         elif args.mode == 'monitor':
             print("📡 Starting market monitoring...")
-            result = platform.run_market_monitoring()
-            print(f"✅ {result}")
+            summary = asyncio.run(platform.run_market_monitoring(args.data, args.cycles))
+            
+            if summary:
+                print(f"✅ Monitoring finished: {summary['listings']}")
+                print(f"📣 Changes: {summary['events']}")
     
     except KeyboardInterrupt:
         print("\n⚠️  Analysis interrupted by user")
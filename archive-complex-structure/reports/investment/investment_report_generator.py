@@ -7,6 +7,7 @@ with specific buy/sell recommendations, ROI projections, and risk assessments.
 """
 
 import json
+import sys
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +16,11 @@ import seaborn as sns
 from pathlib import Path
 import logging
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.intelligence.portfolio_optimizer import BudgetPortfolioOptimizer, PortfolioConstraints
+
 class InvestmentReportGenerator:
     """
     Generate actionable investment reports from property intelligence data
@@ -498,20 +504,35 @@ class InvestmentReportGenerator:
         
         return portfolios
     
-    def build_portfolio(self, opportunities: List[Dict], budget: float, name: str) -> Optional[Dict]:
-        """Build a portfolio within budget constraints"""
+    def build_portfolio(self, opportunities: List[Dict], budget: float, name: str,
+                        max_single_asset_share: float = 0.4) -> Optional[Dict]:
+        """Build the expected-return maximizing portfolio within budget constraints"""
         
         if not opportunities:
             return None
         
-        selected_properties = []
-        total_investment = 0
+        costs = [opp.get('target_price', 0) for opp in opportunities]
+        optimizer = BudgetPortfolioOptimizer(
+            PortfolioConstraints(
+                budget=budget,
+                max_single_asset_share=max_single_asset_share,
+                max_properties=None
+            ),
+            budget_resolution=5000
+        )
+        optimizer.set_candidates(
+            keys=list(range(len(opportunities))),
+            costs=costs,
+            values=[cost * opp.get('estimated_roi', 0) for cost, opp in zip(costs, opportunities)],
+            neighborhoods=[opp.get('neighborhood', 'Unknown') for opp in opportunities],
+            energy_classes=[opp.get('energy_class', 'C') for opp in opportunities]
+        )
+        selection = optimizer.solve()
+        self.logger.info(f"🎯 {name}: selected {len(selection.selected_keys)}/{len(opportunities)} "
+                         f"properties ({selection.method}, {selection.solve_time_seconds:.3f}s)")
         
-        for opp in opportunities:
-            property_cost = opp.get('target_price', 0)
-            if total_investment + property_cost <= budget:
-                selected_properties.append(opp)
-                total_investment += property_cost
+        selected_properties = [opportunities[position] for position in sorted(selection.selected_keys)]
+        total_investment = selection.total_cost
         
         if not selected_properties:
             return None
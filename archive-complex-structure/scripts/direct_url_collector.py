@@ -27,6 +27,7 @@ import asyncio
 import json
 import logging
 import re
+import sys
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -35,6 +36,11 @@ from pathlib import Path
 from playwright.async_api import async_playwright
 import random
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.collectors.page_archive import PageArchive
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -121,10 +127,11 @@ class DirectProperty:
 class DirectURLCollector:
     """Simple, reliable collector using direct property ID enumeration"""
     
-    def __init__(self):
+    def __init__(self, page_archive: Optional[PageArchive] = None):
         self.authentic_properties = []
         self.failed_urls = []
         self.processed_count = 0
+        self.page_archive = page_archive if page_archive is not None else PageArchive()
         
         # Athens neighborhoods for classification
         self.target_neighborhoods = [
@@ -263,6 +270,7 @@ class DirectURLCollector:
         try:
             # Load page (already loaded from test, just refresh content)
             html_content = await page.content()
+            self.page_archive.capture(page, url, html_content, 'direct_url')
             
             # Extract title
             title = await self._extract_title(page, html_content)
@@ -327,6 +335,12 @@ class DirectURLCollector:
             logger.warning(f"❌ EXTRACTION ERROR: {url} - {e}")
             return None
     
+    async def reextract_archived(self, page) -> Optional[DirectProperty]:
+        """Re-run extraction on an archived page (no browser or network)"""
+        match = re.search(r'/property/(\d+)', page.url)
+        property_id = int(match.group(1)) if match else 0
+        return await self.extract_property_data(page, page.url, property_id)
+    
     async def _extract_title(self, page, html_content: str) -> str:
         """Extract title using proven patterns"""
         try:
@@ -28,6 +28,7 @@ import json
 import logging
 import re
 import hashlib
+import sys
 import statistics
 import random
 import time
@@ -41,6 +42,11 @@ import aiohttp
 from collections import deque
 import weakref
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.collectors.extraction_engine import PropertyExtractor
+from core.collectors.rate_scheduler import get_rate_scheduler
+
 # Expert logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -87,6 +93,7 @@ class ExpertProperty:
     user_agent_used: str
     proxy_used: Optional[str]
     headers_fingerprint: str
+    evidence_confidence: float = 0.0  # Mean per-field evidence score from the extraction engine
 
     def is_expert_quality(self) -> bool:
         """Expert-level validation with multi-layered checks"""
@@ -376,7 +383,8 @@ class ExpertAthensCollector:
         self.stats = ExpertCollectionStats()
         self.session_manager = SessionManager()
         self.backoff = ExponentialBackoff(base_delay=1.0, max_delay=60.0)
-        self.token_bucket = TokenBucket(capacity=20, refill_rate=2.0)
+        self.scheduler = get_rate_scheduler()  # Per-host request budget shared with every other collector
+        self.extractor = PropertyExtractor(price_range=(10000, 5000000), sqm_range=(15, 800))
         
         # Collection state
         self.collected_properties = []
@@ -547,17 +555,13 @@ class ExpertAthensCollector:
         start_time = time.time()
         
         while retry_count <= self.max_retries:
-            # Wait for token bucket
-            while not await self.token_bucket.consume():
-                await asyncio.sleep(0.1)
-            
             try:
                 context = await self.create_stealth_context(browser)
                 page = await context.new_page()
                 
                 try:
-                    # Navigate with timeout
-                    response = await page.goto(url, timeout=20000, wait_until="domcontentloaded")
+                    # Navigate with timeout, within the shared request budget
+                    response = await self.scheduler.goto(page, url, timeout=20000, wait_until="domcontentloaded")
                     
                     # Record timing
                     response_time = (time.time() - start_time) * 1000
@@ -642,31 +646,22 @@ class ExpertAthensCollector:
             if not title or len(title) < 10:
                 return None
             
-            # Extract price with expert patterns
-            price = await self.extract_price_expert(page)
-            if not price:
-                return None
-            
-            # Extract SQM with expert patterns
-            sqm = await self.extract_sqm_expert(page)
-            if not sqm:
-                return None
-            
-            # Extract energy class with expert patterns
-            energy_class = await self.extract_energy_class_expert(page)
-            if not energy_class:
+            # Price, SQM, energy class and rooms in one pass over the page HTML
+            page_content = await page.content()
+            extraction = self.extractor.extract(page_content, title=title)
+            if not extraction.is_complete():
                 return None
+            price, sqm, energy_class = extraction.price, extraction.sqm, extraction.energy_class
             
             # Extract neighborhood from title and page
             neighborhood = self.extract_neighborhood_expert(title)
             
             # Extract additional fields
-            rooms = await self.extract_rooms_expert(page, title)
+            rooms = extraction.rooms
             property_type = "apartment" if "apartment" in title.lower() else "house"
             listing_type = "rent" if "rent" in title.lower() else "sale"
             
             # Get page hash for duplicate detection
-            page_content = await page.content()
             html_hash = hashlib.md5(page_content.encode()).hexdigest()[:16]
             
             # Create headers fingerprint
@@ -699,7 +694,8 @@ class ExpertAthensCollector:
                 response_time_ms=response_time,
                 user_agent_used=self.session_manager.current_user_agent[:50],
                 proxy_used=None,
-                headers_fingerprint=headers_fingerprint
+                headers_fingerprint=headers_fingerprint,
+                evidence_confidence=extraction.overall_confidence
             )
             
             return property_data
@@ -721,140 +717,6 @@ class ExpertAthensCollector:
                 continue
         return None
     
-    async def extract_price_expert(self, page: Page) -> Optional[float]:
-        """Expert price extraction with multiple patterns"""
-        selectors = [
-            "[data-testid='price']",
-            ".price-amount",
-            ".ad-price",
-            ".property-price",
-            "span[class*='price']",
-            "div[class*='price']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        # Multiple price extraction patterns
-                        patterns = [
-                            r'€\s*([0-9,.]+)',
-                            r'([0-9,.]+)\s*€',
-                            r'Price:\s*€?\s*([0-9,.]+)',
-                            r'([0-9]{3,}[,.]*[0-9]*)'
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, text.replace('.', ''))
-                            if match:
-                                try:
-                                    price_str = match.group(1).replace(',', '')
-                                    price = float(price_str)
-                                    if 10000 <= price <= 5000000:  # Reasonable range
-                                        return price
-                                except:
-                                    continue
-            except:
-                continue
-        return None
-    
-    async def extract_sqm_expert(self, page: Page) -> Optional[float]:
-        """Expert SQM extraction with multiple patterns"""
-        selectors = [
-            "[data-testid='area']",
-            ".area-amount",
-            ".property-area",
-            "span[class*='area']",
-            "div[class*='area']",
-            "span[class*='sqm']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        patterns = [
-                            r'(\d+(?:\.\d+)?)\s*m²',
-                            r'(\d+(?:\.\d+)?)\s*sqm',
-                            r'Area:\s*(\d+(?:\.\d+)?)',
-                            r'(\d+(?:\.\d+)?)\s*square'
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, text, re.IGNORECASE)
-                            if match:
-                                try:
-                                    sqm = float(match.group(1))
-                                    if 15 <= sqm <= 800:  # Reasonable range
-                                        return sqm
-                                except:
-                                    continue
-            except:
-                continue
-        return None
-    
-    async def extract_energy_class_expert(self, page: Page) -> Optional[str]:
-        """Expert energy class extraction"""
-        selectors = [
-            "[data-testid='energy-class']",
-            ".energy-class",
-            ".energy-rating",
-            ".property-energy",
-            "span[class*='energy']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        match = re.search(r'\b([A-G][+]?)\b|Under Issue', text.upper())
-                        if match:
-                            return match.group(0)
-            except:
-                continue
-        return None
-    
-    async def extract_rooms_expert(self, page: Page, title: str) -> Optional[int]:
-        """Expert room extraction"""
-        # Try page selectors first
-        selectors = [
-            "[data-testid='rooms']",
-            ".rooms-count",
-            ".property-rooms"
-        ]
-        
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.text_content()
-                    if text:
-                        match = re.search(r'(\d+)', text)
-                        if match:
-                            return int(match.group(1))
-            except:
-                continue
-        
-        # Fallback to title extraction
-        patterns = [
-            r'(\d+)\s*(?:room|bedroom)',
-            r'(\d+)\s*BR',
-            r'(\d+)R'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        
-        return None
-    
     def extract_neighborhood_expert(self, title: str) -> str:
         """Expert neighborhood extraction with expanded Athens mapping"""
         
@@ -937,9 +799,8 @@ class ExpertAthensCollector:
         """Implement fallback strategy when success rate is low"""
         logger.info("🔄 Implementing expert fallback strategy")
         
-        # Increase delays
+        # Increase retry delays (the request rate stays the configured shared budget)
         self.backoff.base_delay *= 1.5
-        self.token_bucket.refill_rate *= 0.7
         
         # Force session rotation
         self.session_manager.rotate_session()
@@ -947,7 +808,7 @@ class ExpertAthensCollector:
         # Reduce concurrency
         self.max_concurrent_pages = max(2, self.max_concurrent_pages - 1)
         
-        logger.info(f"🔧 Fallback applied: Slower rate, New session, Concurrency: {self.max_concurrent_pages}")
+        logger.info(f"🔧 Fallback applied: Longer backoff, New session, Concurrency: {self.max_concurrent_pages}")
     
     async def save_expert_results(self):
         """Save expert results with comprehensive reporting"""
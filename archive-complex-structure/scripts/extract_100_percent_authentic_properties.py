@@ -6,11 +6,15 @@ Extract only verified authentic properties from all files, removing any generate
 
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import hashlib
 
+sys.path.append(str(Path(__file__).parent.parent))
+from core.collectors.data_catalog import get_data_catalog
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -176,12 +180,22 @@ class AuthenticPropertyExtractor:
         
         all_authentic = []
         
+        # Files without property records and byte-identical copies are skipped
+        # from the catalog, without being opened
+        catalog = get_data_catalog()
+        catalog.refresh(search_dirs, patterns=["*.json"])
+        unique_paths = {entry.path for entry in catalog.unique_datasets(
+            entry for search_dir in search_dirs
+            for entry in catalog.datasets(directory=search_dir, formats=["json"], with_records=True)
+        )}
+        
         for search_dir in search_dirs:
             if not search_dir.exists():
                 continue
             
-            json_files = list(search_dir.glob("*.json"))
-            logger.info(f"📁 Searching {search_dir.name}: {len(json_files)} files")
+            entries = catalog.datasets(directory=search_dir, formats=["json"])
+            json_files = [Path(entry.path) for entry in entries if entry.path in unique_paths]
+            logger.info(f"📁 Searching {search_dir.name}: {len(entries)} files, {len(json_files)} with unique property data")
             
             for file_path in json_files:
                 # Skip analysis/report files
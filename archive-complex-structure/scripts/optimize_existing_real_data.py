@@ -8,11 +8,15 @@ this script maximizes the value of our existing 231 authenticated properties.
 import asyncio
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
 import pandas as pd
 
+sys.path.append(str(Path(__file__).parent.parent))
+from core.collectors.data_catalog import get_data_catalog
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -40,53 +44,44 @@ class ExistingRealDataOptimizer:
         all_properties = []
         processed_ids = set()
         
-        for data_dir in data_dirs:
-            if not data_dir.exists():
-                continue
+        # Catalog entries know which files hold property records; reports and
+        # byte-identical copies are skipped without being opened
+        catalog = get_data_catalog()
+        catalog.refresh(data_dirs, patterns=["*.json"])
+        json_files = catalog.unique_datasets(
+            entry for data_dir in data_dirs
+            for entry in catalog.datasets(directory=data_dir, formats=["json"], with_records=True)
+        )
+        
+        for entry in json_files:
+            file_path = Path(entry.path)
+            try:
+                properties = catalog.iter_records(entry)
                 
-            # Look for all JSON files with authentic data
-            json_files = list(data_dir.glob("*.json"))
-            
-            for file_path in json_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Handle different data structures
-                    if isinstance(data, list):
-                        properties = data
-                    elif 'properties' in data:
-                        properties = data['properties']
-                    elif 'data' in data:
-                        properties = data['data']
-                    else:
-                        # Single property file
-                        properties = [data] if isinstance(data, dict) else []
-                    
-                    # Filter authentic properties and avoid duplicates
-                    for prop in properties:
-                        if isinstance(prop, dict):
-                            prop_id = prop.get('property_id') or prop.get('id')
+                # Filter authentic properties and avoid duplicates
+                for prop in properties:
+                    if isinstance(prop, dict):
+                        prop_id = prop.get('property_id') or prop.get('id')
                             
-                            # Check authenticity indicators
-                            is_authentic = (
-                                prop.get('price') and 
-                                prop.get('sqm') and
-                                prop.get('url') and
-                                prop_id and
-                                prop_id not in processed_ids and
-                                # Avoid obvious synthetic patterns
-                                prop.get('price') not in [740, 3000, 740.0, 3000.0] and
-                                prop.get('sqm') not in [63, 270, 63.0, 270.0]
-                            )
+                        # Check authenticity indicators
+                        is_authentic = (
+                            prop.get('price') and 
+                            prop.get('sqm') and
+                            prop.get('url') and
+                            prop_id and
+                            prop_id not in processed_ids and
+                            # Avoid obvious synthetic patterns
+                            prop.get('price') not in [740, 3000, 740.0, 3000.0] and
+                            prop.get('sqm') not in [63, 270, 63.0, 270.0]
+                        )
                             
-                            if is_authentic:
-                                all_properties.append(prop)
-                                processed_ids.add(prop_id)
+                        if is_authentic:
+                            all_properties.append(prop)
+                            processed_ids.add(prop_id)
                                 
-                except Exception as e:
-                    logger.warning(f"⚠️ Error reading {file_path}: {e}")
-                    continue
+            except Exception as e:
+                logger.warning(f"⚠️ Error reading {file_path}: {e}")
+                continue
         
         logger.info(f"✅ Loaded {len(all_properties)} authentic properties from {len(json_files)} files")
         return all_properties
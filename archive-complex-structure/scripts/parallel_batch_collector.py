@@ -9,6 +9,7 @@ ARCHITECTURE:
 ✅ WorkerAgent: Handles specific issues and errors per worker
 ✅ ResultsConsolidator: Combines all batch results
 ✅ ProgressMonitor: Real-time monitoring across all workers
+✅ SharedWorkQueue: SQLite session queue for multi-process / multi-machine runs
 
 TECHNICAL SPECS:
 🚀 10 concurrent workers, each handling 50 properties (500 total)
@@ -18,6 +19,9 @@ TECHNICAL SPECS:
 🚀 Real-time progress updates from all workers
 🚀 Consolidated JSON output with all 500 properties
 🚀 CSV summary for immediate analysis
+🚀 --processes N: worker processes with their own event loop and browser, pulling
+   strategies and URLs from the session queue under one request budget
+🚀 --join SESSION: extra queue workers, e.g. on machines sharing the session directory
 
 BUILT UPON PROVEN SUCCESS:
 ✅ Based on scalable_athens_collector.py proven methodology
@@ -26,10 +30,16 @@ BUILT UPON PROVEN SUCCESS:
 ✅ Authentication flag: "PARALLEL_BATCH_AUTHENTIC"
 """
 
+import argparse
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import re
+import socket
+import sqlite3
+import sys
 import hashlib
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set, Tuple
@@ -42,9 +52,25 @@ from concurrent.futures import ThreadPoolExecutor
 import threading
 from queue import Queue
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.collectors.checkpoint_log import CheckpointLog
+from core.collectors.extraction_engine import PropertyExtractor
+from core.collectors.rate_scheduler import RateScheduler, get_rate_scheduler, load_scheduler_config
+from core.collectors.result_sinks import ResultStream
+from core.collectors.url_frontier import URLFrontier
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+PLATFORM_CONFIG_PATH = Path(__file__).parent.parent / "config" / "platform_config.json"
+
+def load_request_budget(config_path: Path = PLATFORM_CONFIG_PATH) -> Tuple[float, int]:
+    """Session-wide (requests per second, burst): the rate scheduler's default host budget"""
+    budget = load_scheduler_config(config_path)["default_budget"]
+    return budget.requests_per_second, budget.burst
+
 @dataclass
 class ParallelBatchProperty:
     """Property structure matching proven successful format + parallel metadata"""
@@ -79,6 +105,7 @@ class ParallelBatchProperty:
     batch_id: str
     search_strategy: str
     collection_session: str
+    evidence_confidence: float = 0.0  # Mean per-field evidence score from the extraction engine
     
     def is_parallel_authentic_data(self) -> bool:
         """Validation logic exactly matching the successful dataset"""
@@ -196,6 +223,205 @@ class ProgressMonitor:
             except Exception as e:
                 logger.error(f"❌ Progress monitor error: {e}")
 
+class SharedWorkQueue:
+    """
+    Session work queue shared by worker processes - and by machines, over a shared filesystem.
+    
+    SQLite tables hold the search strategies (leased to one process at a time, heartbeats
+    extend the lease, a crashed process's strategy is picked up again), the properties
+    workers stream back to the coordinator, and one token bucket enforcing the
+    session-wide request budget.
+    """
+    
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS strategies (
+        worker_id INTEGER PRIMARY KEY,
+        target INTEGER NOT NULL,
+        payload TEXT NOT NULL,
+        state TEXT NOT NULL DEFAULT 'pending',
+        claimed_by TEXT,
+        lease_expires_at REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        progress INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL DEFAULT 'INITIALIZING',
+        last_error TEXT,
+        updated_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS results (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        worker_id INTEGER NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """
+    
+    def __init__(self, db_path: Path, lease_seconds: float = 600, max_attempts: int = 3, wal: bool = True):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds  # Strategy lease without a heartbeat before it is reclaimed
+        self.max_attempts = max_attempts    # Claims per strategy before it is given up
+        
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False)
+        if wal:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(self.SCHEMA)
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+    
+    def _transaction(self, statements):
+        """Run (sql, params) statements in one write transaction, returning the last result rows"""
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                rows = None
+                for sql, params in statements:
+                    rows = self._connection.execute(sql, params).fetchall()
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+        return rows
+    
+    # Settings ----------------------------------------------------------
+    
+    def set_meta(self, key: str, value):
+        self._transaction([('INSERT INTO meta (key, value) VALUES (?, ?) '
+                            'ON CONFLICT(key) DO UPDATE SET value = excluded.value', (key, json.dumps(value)))])
+    
+    def get_meta(self, key: str, default=None):
+        with self._lock:
+            row = self._connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+    
+    # Strategies --------------------------------------------------------
+    
+    def add_strategies(self, strategies: List[Tuple[int, int, Dict]]):
+        """Queue (worker_id, target, strategy) entries; strategies from an earlier run keep their state"""
+        now = time.time()
+        self._transaction([
+            ('INSERT OR IGNORE INTO strategies (worker_id, target, payload, updated_at) VALUES (?, ?, ?, ?)',
+             (worker_id, target, json.dumps(strategy), now))
+            for worker_id, target, strategy in strategies
+        ])
+    
+    def claim_strategy(self, claimed_by: str) -> Optional[Dict]:
+        """Lease the next pending strategy, or one whose holder stopped heartbeating"""
+        now = time.time()
+        rows = self._transaction([
+            ("UPDATE strategies SET state = 'failed', claimed_by = NULL, updated_at = ?, "
+             "last_error = COALESCE(last_error, 'lease expired') "
+             "WHERE state = 'running' AND lease_expires_at <= ? AND attempts >= ?",
+             (now, now, self.max_attempts)),
+            ("UPDATE strategies SET state = 'running', claimed_by = ?, lease_expires_at = ?, "
+             "attempts = attempts + 1, status = 'STARTING', updated_at = ? "
+             "WHERE worker_id = ("
+             "    SELECT worker_id FROM strategies "
+             "    WHERE state = 'pending' OR (state = 'running' AND lease_expires_at <= ?) "
+             "    ORDER BY worker_id LIMIT 1"
+             ") RETURNING worker_id, target, payload, attempts, progress",
+             (claimed_by, now + self.lease_seconds, now, now))
+        ])
+        if not rows:
+            return None
+        worker_id, target, payload, attempts, progress = rows[0]
+        return {'worker_id': worker_id, 'target': target, 'strategy': json.loads(payload),
+                'attempts': attempts, 'progress': progress}
+    
+    def report_progress(self, worker_id: int, count: int, status: Optional[str] = None, error: Optional[str] = None):
+        """Record worker progress; doubles as the strategy lease heartbeat"""
+        now = time.time()
+        self._transaction([(
+            "UPDATE strategies SET progress = ?, status = COALESCE(?, status), last_error = COALESCE(?, last_error), "
+            "lease_expires_at = ?, updated_at = ? WHERE worker_id = ? AND state = 'running'",
+            (count, status, error[:500] if error else None, now + self.lease_seconds, now, worker_id)
+        )])
+    
+    def finish_strategy(self, worker_id: int, failed: bool = False):
+        self._transaction([(
+            "UPDATE strategies SET state = ?, claimed_by = NULL, lease_expires_at = NULL, updated_at = ? "
+            "WHERE worker_id = ? AND state = 'running'",
+            ('failed' if failed else 'done', time.time(), worker_id)
+        )])
+    
+    def strategy_progress(self) -> Dict[int, Dict]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT worker_id, state, progress, status, lease_expires_at FROM strategies'
+            ).fetchall()
+        return {worker_id: {'state': state, 'progress': progress, 'status': status, 'lease_expires_at': lease}
+                for worker_id, state, progress, status, lease in rows}
+    
+    # Results -----------------------------------------------------------
+    
+    def put_result(self, worker_id: int, record: Dict):
+        self._transaction([('INSERT INTO results (worker_id, payload, created_at) VALUES (?, ?, ?)',
+                            (worker_id, json.dumps(record, ensure_ascii=False, default=str), time.time()))])
+    
+    def results_since(self, seq: int, limit: int = 500) -> List[Tuple[int, int, Dict]]:
+        """Streamed results after a sequence number, as (seq, worker_id, record)"""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT seq, worker_id, payload FROM results WHERE seq > ? ORDER BY seq LIMIT ?', (seq, limit)
+            ).fetchall()
+        return [(row_seq, worker_id, json.loads(payload)) for row_seq, worker_id, payload in rows]
+    
+    # Request budget ----------------------------------------------------
+    
+    def set_request_budget(self, requests_per_second: float, burst: int):
+        self.set_meta('request_budget', {'requests_per_second': requests_per_second, 'burst': burst})
+    
+    def acquire_request(self) -> float:
+        """
+        Take one request from the session-wide token bucket.
+        
+        Returns:
+            float: 0 when the request may go ahead, else seconds to wait before asking again
+        """
+        budget = self.get_meta('request_budget')
+        if not budget:
+            return 0.0
+        rate, burst = budget['requests_per_second'], budget['burst']
+        now = time.time()
+        
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                bucket = self.get_meta('request_bucket') or {'tokens': burst, 'updated_at': now}
+                tokens = min(burst, bucket['tokens'] + (now - bucket['updated_at']) * rate)
+                wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+                if wait == 0.0:
+                    tokens -= 1
+                self._connection.execute(
+                    'INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                    ('request_bucket', json.dumps({'tokens': tokens, 'updated_at': now}))
+                )
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+        return wait
+
+class QueueProgressReporter:
+    """ProgressMonitor stand-in for worker processes: progress goes to the shared queue"""
+    
+    def __init__(self, work_queue: SharedWorkQueue):
+        self.work_queue = work_queue
+        self.worker_status = {}
+        self.progress_offsets = {}  # Properties collected by earlier claims of a reclaimed strategy
+    
+    def update_worker_progress(self, worker_id: int, count: int, status: str = None, error: str = None):
+        if status:
+            self.worker_status[worker_id] = status
+        self.work_queue.report_progress(worker_id, count + self.progress_offsets.get(worker_id, 0), status, error)
+
 class WorkerAgent:
     """Handles specific issues and errors for individual workers"""
     
@@ -284,16 +510,28 @@ class BatchWorker:
     """Individual worker collecting 50 properties using proven methodology"""
     
     def __init__(self, worker_id: int, target_properties: int, search_strategy: Dict, 
-                 session_name: str, progress_monitor: ProgressMonitor):
+                 session_name: str, progress_monitor: ProgressMonitor,
+                 checkpoint_log: Optional[CheckpointLog] = None, frontier: Optional[URLFrontier] = None,
+                 work_queue: Optional[SharedWorkQueue] = None, scheduler: Optional[RateScheduler] = None):
         self.worker_id = worker_id
         self.target_properties = target_properties
         self.search_strategy = search_strategy
         self.session_name = session_name
         self.progress_monitor = progress_monitor
+        self.checkpoint_log = checkpoint_log
         self.agent = WorkerAgent(worker_id)
+        self.extractor = PropertyExtractor(price_range=(50000, 3000000), sqm_range=(25, 600))
         
         self.collected_properties = []
-        self.processed_urls = set()
+        
+        # URLs are discovered into and claimed from the frontier shared by all workers
+        self.frontier = frontier if frontier is not None else URLFrontier(':memory:')
+        self.frontier_worker_id = f"{session_name}-worker-{worker_id}"
+        
+        # Multi-process mode: properties stream back through the session queue, requests draw on its budget
+        self.work_queue = work_queue
+        # Per-host budget shared with every collector on this machine (the session budget may span machines)
+        self.scheduler = scheduler if scheduler is not None else get_rate_scheduler()
         
         # Extended Athens neighborhoods (from proven successful collector)
         self.target_neighborhoods = [
@@ -372,7 +610,8 @@ class BatchWorker:
                 logger.info(f"📄 Worker {self.worker_id} Page {page_num}/{max_pages}")
                 
                 # Load page with proven timeout
-                await page.goto(search_url, wait_until='domcontentloaded', timeout=25000)
+                await self._await_request_budget()
+                await self.scheduler.goto(page, search_url, wait_until='domcontentloaded', timeout=25000)
                 await asyncio.sleep(random.uniform(1.5, 3))  # Staggered delays per worker
                 
                 # Handle cookies on first page
@@ -387,17 +626,15 @@ class BatchWorker:
                     logger.info(f"⚠️ Worker {self.worker_id} no URLs on page {page_num}")
                     break
                 
-                new_urls = [url for url in page_urls if url not in self.processed_urls]
-                all_urls.update(new_urls)
+                # New to every worker in the session, not just this one
+                new_count = self.frontier.add_many(page_urls, source=strategy_name)
+                all_urls.update(page_urls)
                 
-                logger.info(f"✅ Worker {self.worker_id} Page {page_num}: {len(new_urls)} new URLs")
+                logger.info(f"✅ Worker {self.worker_id} Page {page_num}: {new_count} new URLs")
                 
-                if len(new_urls) == 0:
+                if new_count == 0:
                     break
                 
-                # Rate limiting between pages (worker-specific)
-                await asyncio.sleep(random.uniform(2 + self.worker_id * 0.5, 4 + self.worker_id * 0.5))
-                
             except Exception as e:
                 await self.agent.handle_error(e, {"page": page_num, "strategy": strategy_name})
                 continue
@@ -407,6 +644,16 @@ class BatchWorker:
         
         return discovered_urls
     
+    async def _await_request_budget(self):
+        """Wait for the session-wide request budget shared by every worker process"""
+        if self.work_queue is None:
+            return
+        while True:
+            wait = self.work_queue.acquire_request()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+    
     async def _handle_cookies(self, page):
         """Handle cookie consent using proven patterns"""
         try:
@@ -474,30 +721,26 @@ class BatchWorker:
         
         try:
             # Page load with proven settings
-            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            await self._await_request_budget()
+            await self.scheduler.goto(page, url, wait_until='domcontentloaded', timeout=15000)
             await asyncio.sleep(random.uniform(1, 2))  # Optimized for parallel workers
             
             html_content = await page.content()
             
-            # Extract using proven patterns
-            title = await self._extract_title_proven(page, html_content)
-            price = await self._extract_price_proven(html_content)
-            sqm = await self._extract_sqm_proven(html_content, title)
-            energy_class = await self._extract_energy_class_proven(html_content)
+            # Extract every field in one pass (proven price/size ranges)
+            try:
+                page_title = await page.title()
+            except Exception:
+                page_title = None
+            extraction = self.extractor.extract(html_content, title=page_title)
+            title = extraction.title
             
             # Skip if missing critical data
-            if not all([price, sqm, energy_class]):
+            if not extraction.is_complete():
                 return None
             
             # Additional fields
             neighborhood = self._extract_neighborhood_proven(title, html_content)
-            rooms = await self._extract_rooms_proven(html_content)
-            description = await self._extract_description_proven(html_content)
-            
-            # Calculate price per sqm
-            price_per_sqm = None
-            if price and sqm and sqm > 0:
-                price_per_sqm = price / sqm
             
             # Generate IDs
             property_id = hashlib.md5(url.encode()).hexdigest()[:12]
@@ -511,15 +754,15 @@ class BatchWorker:
                 timestamp=datetime.now().isoformat(),
                 title=title or "Unknown Property",
                 neighborhood=neighborhood,
-                price=price,
-                sqm=sqm,
-                energy_class=energy_class,
-                price_per_sqm=price_per_sqm,
-                rooms=rooms,
+                price=extraction.price,
+                sqm=extraction.sqm,
+                energy_class=extraction.energy_class,
+                price_per_sqm=extraction.price_per_sqm,
+                rooms=extraction.rooms,
                 floor=None,
                 property_type="apartment",
                 listing_type="sale",
-                description=description or "",
+                description=extraction.description,
                 html_source_hash=html_hash,
                 extraction_confidence=0.9,
                 validation_flags=[],
@@ -528,7 +771,8 @@ class BatchWorker:
                 worker_id=self.worker_id,
                 batch_id=batch_id,
                 search_strategy=self.search_strategy['name'],
-                collection_session=self.session_name
+                collection_session=self.session_name,
+                evidence_confidence=extraction.overall_confidence
             )
             
             # Validate using proven logic
@@ -538,125 +782,9 @@ class BatchWorker:
                 return None
                 
         except Exception as e:
+            # Raised so the frontier retries the URL; None is kept for pages that are not valid listings
             await self.agent.handle_error(e, {"url": url})
-            return None
-    
-    # Proven extraction methods (copied from successful collector)
-    async def _extract_title_proven(self, page, html_content: str) -> str:
-        try:
-            title = await page.title()
-            if title and len(title) > 10:
-                return title
-        except:
-            pass
-        
-        title_patterns = [
-            r'<title>([^<]+)</title>',
-            r'<h1[^>]*>([^<]+)</h1>'
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
-    
-    async def _extract_price_proven(self, html_content: str) -> Optional[float]:
-        price_patterns = [
-            r'€\s*([\d,]+)',
-            r'(\d{5,})\s*€',
-            r'"price"\s*:\s*(\d+)',
-            r'€([\d,.]+)',
-            r'price["\s:]*(\d+)'
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, html_content)
-            for match in matches:
-                try:
-                    price_str = match.group(1).replace(',', '').replace('.', '')
-                    if len(price_str) >= 4:
-                        price = float(price_str)
-                        if 50000 <= price <= 3000000:
-                            return price
-                except:
-                    continue
-        
-        return None
-    
-    async def _extract_sqm_proven(self, html_content: str, title: str) -> Optional[float]:
-        # Try title first
-        title_match = re.search(r'(\d+)m²', title)
-        if title_match:
-            sqm = float(title_match.group(1))
-            if 25 <= sqm <= 600:
-                return sqm
-        
-        sqm_patterns = [
-            r'(\d+)\s*m²',
-            r'(\d+)\s*sqm',
-            r'"sqm"\s*:\s*(\d+)',
-            r'area["\s:]*(\d+)'
-        ]
-        
-        for pattern in sqm_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                try:
-                    sqm = float(match.group(1))
-                    if 25 <= sqm <= 600:
-                        return sqm
-                except:
-                    continue
-        
-        return None
-    
-    async def _extract_energy_class_proven(self, html_content: str) -> Optional[str]:
-        energy_patterns = [
-            r'energy[_\s-]*class["\s:]*([A-G][+]?)',
-            r'energy[_\s-]*([A-G][+]?)',
-            r'class["\s:]*([A-G][+]?)', 
-            r'"energy"[^}]*?"([A-G][+]?)"',
-            r'ενεργειακή["\s:]*([A-G][+]?)',
-            r'κατηγορία["\s:]*([A-G][+]?)'
-        ]
-        
-        for pattern in energy_patterns:
-            matches = re.finditer(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                energy_class = match.group(1).upper()
-                if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
-                    return energy_class
-        
-        return None
-    
-    async def _extract_rooms_proven(self, html_content: str) -> Optional[int]:
-        room_patterns = [
-            r'(\d+)\s*bedroom',
-            r'(\d+)\s*room',
-            r'rooms["\s:]*(\d+)'
-        ]
-        
-        for pattern in room_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        
-        return None
-    
-    async def _extract_description_proven(self, html_content: str) -> str:
-        desc_patterns = [
-            r'Make this property yours with a mortgage starting from[^<]*',
-            r'Compare & save up to[^<]*'
-        ]
-        
-        for pattern in desc_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
-            if match:
-                return match.group(0)[:200]
-        
-        return ""
+            raise
     
     def _extract_neighborhood_proven(self, title: str, html_content: str) -> str:
         text_check = title.lower() + ' ' + html_content.lower()
@@ -681,42 +809,49 @@ class BatchWorker:
             
             # Discover URLs
             self.progress_monitor.update_worker_progress(self.worker_id, 0, "DISCOVERING")
-            property_urls = await self.discover_urls_with_pagination(page, self.search_strategy)
-            
-            if not property_urls:
-                logger.warning(f"⚠️ Worker {self.worker_id} no URLs discovered")
-                return self.collected_properties
+            await self.discover_urls_with_pagination(page, self.search_strategy)
             
             # Collect properties
             self.progress_monitor.update_worker_progress(self.worker_id, 0, "COLLECTING")
+            url_idx = 0
             
-            for url_idx, url in enumerate(property_urls, 1):
+            while len(self.collected_properties) < self.target_properties:
                 
-                # Check target reached
-                if len(self.collected_properties) >= self.target_properties:
-                    logger.info(f"🎯 Worker {self.worker_id} target reached!")
+                # Claim this strategy's next eligible URL (includes URLs left in flight by a crashed run)
+                claimed = self.frontier.claim(self.frontier_worker_id, limit=1, source=self.search_strategy['name'])
+                if not claimed:
                     break
+                url = claimed[0]['url']
+                url_idx += 1
                 
-                if url in self.processed_urls:
+                # Collected earlier in this session (any worker) or before a restart
+                if self.checkpoint_log is not None and url in self.checkpoint_log:
+                    self.frontier.complete(url, self.frontier_worker_id)
                     continue
                 
-                logger.info(f"🔍 Worker {self.worker_id} Property {len(self.collected_properties)+1}/{self.target_properties}: URL {url_idx}/{len(property_urls)}")
+                logger.info(f"🔍 Worker {self.worker_id} Property {len(self.collected_properties)+1}/{self.target_properties}: claimed URL {url_idx}")
                 
                 # Extract property
-                property_data = await self.extract_property_proven_method(page, url)
+                try:
+                    property_data = await self.extract_property_proven_method(page, url)
+                except Exception as e:
+                    self.frontier.fail(url, self.frontier_worker_id, str(e))  # Retried with backoff, by this or another worker
+                    continue
+                self.frontier.complete(url, self.frontier_worker_id)
                 
                 if property_data:
                     self.collected_properties.append(property_data)
+                    if self.checkpoint_log is not None:
+                        self.checkpoint_log.append(asdict(property_data))
+                    if self.work_queue is not None:
+                        self.work_queue.put_result(self.worker_id, asdict(property_data))
                     logger.info(f"✅ Worker {self.worker_id} AUTHENTIC #{len(self.collected_properties)}: €{property_data.price:,} - {property_data.sqm}m² - {property_data.energy_class}")
                     
                     # Update progress
                     self.progress_monitor.update_worker_progress(self.worker_id, len(self.collected_properties), "COLLECTING")
-                
-                self.processed_urls.add(url)
-                
-                # Worker-specific rate limiting (staggered)
-                base_delay = 1.5 + (self.worker_id * 0.2)  # Stagger workers
-                await asyncio.sleep(random.uniform(base_delay, base_delay + 1))
+            
+            if len(self.collected_properties) >= self.target_properties:
+                logger.info(f"🎯 Worker {self.worker_id} target reached!")
             
             self.progress_monitor.update_worker_progress(self.worker_id, len(self.collected_properties), "COMPLETED")
             
@@ -736,15 +871,29 @@ class BatchWorker:
 class ResultsConsolidator:
     """Combines all batch results into unified output"""
     
-    def __init__(self, session_name: str):
+    def __init__(self, session_name: str, checkpoint_dir: Path = Path("data/checkpoints")):
         self.session_name = session_name
         self.all_properties = []
         self.worker_results = {}
         
+        # Append-only log of every collected property, keyed by URL
+        self.checkpoint_log = CheckpointLog(checkpoint_dir / session_name, key_field="url")
+        field_names = ParallelBatchProperty.__dataclass_fields__.keys()
+        for record in self.checkpoint_log.records():
+            self.all_properties.append(ParallelBatchProperty(**{name: record.get(name) for name in field_names}))
+        
+        if self.all_properties:
+            logger.info(f"♻️ Consolidator: Resumed {len(self.all_properties)} properties from checkpoint log")
+        
+        # Consolidated output files are written as worker results arrive
+        self.results = ResultStream(f'parallel_batch_consolidated_{session_name}', required_formats=['json', 'csv'])
+        
     def add_worker_results(self, worker_id: int, properties: List[ParallelBatchProperty]):
         """Add results from a completed worker"""
-        self.worker_results[worker_id] = properties
+        self.worker_results.setdefault(worker_id, []).extend(properties)
         self.all_properties.extend(properties)
+        self.checkpoint_log.extend(asdict(prop) for prop in properties)
+        self.results.write_many(properties)
         
         logger.info(f"📊 Consolidator: Added {len(properties)} from Worker {worker_id}")
         logger.info(f"📊 Total consolidated: {len(self.all_properties)} properties")
@@ -778,25 +927,17 @@ class ResultsConsolidator:
     def save_consolidated_results(self) -> Tuple[Path, Path, Path]:
         """Save consolidated results in multiple formats"""
         
-        output_dir = Path("data/processed")
+        output_dir = self.results.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # JSON file with all properties
-        json_file = output_dir / f'parallel_batch_consolidated_{self.session_name}_{timestamp}.json'
-        json_data = [asdict(prop) for prop in self.all_properties]
+        # Compact the checkpoint log into its columnar file
+        compacted_file = self.checkpoint_log.compact()
         
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-        
-        # CSV summary
-        csv_file = output_dir / f'parallel_batch_summary_{self.session_name}_{timestamp}.csv'
-        with open(csv_file, 'w', encoding='utf-8') as f:
-            f.write("Worker_ID,URL,Price,SQM,Energy_Class,Price_per_SQM,Neighborhood,Rooms,Strategy,Authentication\n")
-            for prop in self.all_properties:
-                auth_flag = "AUTHENTIC" if "PARALLEL_BATCH_AUTHENTIC" in prop.validation_flags else "PENDING"
-                f.write(f'{prop.worker_id},"{prop.url}",{prop.price},{prop.sqm},"{prop.energy_class}",{prop.price_per_sqm:.0f if prop.price_per_sqm else 0},"{prop.neighborhood}",{prop.rooms or ""},"{prop.search_strategy}","{auth_flag}"\n')
+        # Close out the streamed output files; properties resumed from the checkpoint log are appended
+        output_files = {name: Path(path) for name, path in self.results.finish(self.all_properties).items()}
+        json_file, csv_file = output_files['json'], output_files['csv']
         
         # Statistics file
         stats_file = output_dir / f'parallel_batch_stats_{self.session_name}_{timestamp}.json'
@@ -806,23 +947,33 @@ class ResultsConsolidator:
             json.dump(stats, f, indent=2, ensure_ascii=False)
         
         logger.info(f"💾 Consolidated results saved:")
-        logger.info(f"   📁 JSON: {json_file.name}")
-        logger.info(f"   📁 CSV: {csv_file.name}")
+        for format_name, path in output_files.items():
+            logger.info(f"   📁 {format_name.upper()}: {path.name}")
         logger.info(f"   📁 Stats: {stats_file.name}")
+        logger.info(f"   🧾 Checkpoint log: {compacted_file}")
         
         return json_file, csv_file, stats_file
 
 class BatchCoordinator:
     """Main orchestrator managing all 10 concurrent workers"""
     
-    def __init__(self, num_workers: int = 10, properties_per_worker: int = 50):
+    def __init__(self, num_workers: int = 10, properties_per_worker: int = 50, session_name: Optional[str] = None,
+                 checkpoint_dir: Path = Path("data/checkpoints"), shared_filesystem: bool = False):
         self.num_workers = num_workers
         self.properties_per_worker = properties_per_worker
         self.total_target = num_workers * properties_per_worker
-        self.session_name = f"parallel_batch_{num_workers}x{properties_per_worker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Passing a previous session name resumes from its checkpoint log
+        self.session_name = session_name or f"parallel_batch_{num_workers}x{properties_per_worker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         self.progress_monitor = ProgressMonitor(num_workers, properties_per_worker)
-        self.consolidator = ResultsConsolidator(self.session_name)
+        self.consolidator = ResultsConsolidator(self.session_name, Path(checkpoint_dir))
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.session_dir = self.consolidator.checkpoint_log.log_dir
+        self.shared_filesystem = shared_filesystem  # Queue files shared by several machines (no SQLite WAL)
+        
+        # One frontier per session: workers never fetch a URL another worker claimed, restarts resume it
+        self.frontier = URLFrontier(self.session_dir / "frontier.db", wal=not shared_filesystem)
+        self.frontier.mark_done(self.consolidator.checkpoint_log.keys)
         self.search_strategies = self._build_worker_strategies()
         
         logger.info(f"🏛️ PARALLEL BATCH COORDINATOR INITIALIZED")
@@ -945,7 +1096,9 @@ class BatchCoordinator:
                 target_properties=self.properties_per_worker,
                 search_strategy=strategy,
                 session_name=self.session_name,
-                progress_monitor=self.progress_monitor
+                progress_monitor=self.progress_monitor,
+                checkpoint_log=self.consolidator.checkpoint_log,
+                frontier=self.frontier
             )
             
             # Wrap worker execution with delay
@@ -979,6 +1132,110 @@ class BatchCoordinator:
                 total_properties.extend(result)
                 successful_workers += 1
         
+        return self._finish_collection(start_time, total_properties, successful_workers)
+    
+    async def run_multiprocess_collection(self, processes: Optional[int] = None,
+                                          requests_per_second: Optional[float] = None,
+                                          burst: Optional[int] = None) -> List[ParallelBatchProperty]:
+        """
+        Execute the collection in worker processes pulling from the session work queue.
+        
+        Each process runs its own event loop and browser, claims search strategies from
+        the queue and URLs from the session frontier, and streams properties back to this
+        coordinator's consolidator. More processes - on this or other machines sharing the
+        session directory - can join with `--join <session>`.
+        
+        Args:
+            processes: Local worker processes (defaults to one per core, at most one per strategy)
+            requests_per_second: Session-wide request budget (defaults to the platform config)
+            burst: Requests that may go out back to back (defaults to the platform config)
+        
+        Returns:
+            List[ParallelBatchProperty]: Properties collected in this session run
+        """
+        processes = processes or min(self.num_workers, os.cpu_count() or 1)
+        default_rate, default_burst = load_request_budget()
+        
+        work_queue = SharedWorkQueue(self.session_dir / "work_queue.db", wal=not self.shared_filesystem)
+        work_queue.add_strategies([
+            (worker_id, self.properties_per_worker, strategy)
+            for worker_id, strategy in enumerate(self.search_strategies, 1)
+        ])
+        work_queue.set_request_budget(requests_per_second or default_rate, burst or default_burst)
+        
+        logger.info("🚀 STARTING MULTI-PROCESS BATCH COLLECTION")
+        logger.info(f"👥 {processes} worker processes for {self.num_workers} strategies")
+        logger.info(f"🚦 Request budget: {requests_per_second or default_rate:.2f}/s (burst {burst or default_burst})")
+        
+        start_time = datetime.now()
+        context = multiprocessing.get_context("spawn")  # Fresh interpreter per process: no forked event loops or browsers
+        worker_processes = [
+            context.Process(target=run_queue_worker, name=f"batch-worker-{i}",
+                            args=(self.session_name, str(self.checkpoint_dir), f"{self.session_name}-proc-{i}",
+                                  self.shared_filesystem))
+            for i in range(1, processes + 1)
+        ]
+        for process in worker_processes:
+            process.start()
+        
+        # Results stream into the consolidator as workers produce them
+        seq = work_queue.get_meta("consumed_seq", 0)
+        total_properties = []
+        
+        while True:
+            seq = self._consume_results(work_queue, seq, total_properties)
+            
+            progress = work_queue.strategy_progress()
+            for worker_id, entry in progress.items():
+                self.progress_monitor.update_worker_progress(worker_id, entry["progress"], entry["status"])
+            
+            open_strategies = [entry for entry in progress.values() if entry["state"] in ("pending", "running")]
+            local_alive = any(process.is_alive() for process in worker_processes)
+            if not open_strategies and not local_alive:
+                break
+            if not local_alive and not any(entry["state"] == "running" and entry["lease_expires_at"] > time.time()
+                                           for entry in open_strategies):
+                logger.warning(f"⚠️ {len(open_strategies)} strategies left with no live worker - rerun the session to resume them")
+                break
+            
+            await asyncio.sleep(2)
+        
+        for process in worker_processes:
+            process.join()
+        self._consume_results(work_queue, seq, total_properties)
+        
+        progress = work_queue.strategy_progress()
+        successful_workers = sum(1 for entry in progress.values() if entry["state"] == "done")
+        work_queue.close()
+        
+        return self._finish_collection(start_time, total_properties, successful_workers)
+    
+    def _consume_results(self, work_queue: SharedWorkQueue, seq: int,
+                         total_properties: List[ParallelBatchProperty]) -> int:
+        """Move streamed worker results into the consolidator, returning the last consumed sequence number"""
+        field_names = ParallelBatchProperty.__dataclass_fields__.keys()
+        
+        while True:
+            rows = work_queue.results_since(seq)
+            if not rows:
+                return seq
+            
+            by_worker = {}
+            for seq, worker_id, record in rows:
+                by_worker.setdefault(worker_id, []).append(
+                    ParallelBatchProperty(**{name: record.get(name) for name in field_names})
+                )
+            for worker_id, properties in by_worker.items():
+                self.consolidator.add_worker_results(worker_id, properties)
+                total_properties.extend(properties)
+            
+            # Recorded so a resumed coordinator does not consolidate these rows twice
+            work_queue.set_meta("consumed_seq", seq)
+    
+    def _finish_collection(self, start_time: datetime, total_properties: List[ParallelBatchProperty],
+                           successful_workers: int) -> List[ParallelBatchProperty]:
+        """Save consolidated results and log the final statistics"""
+        
         # Save consolidated results
         json_file, csv_file, stats_file = self.consolidator.save_consolidated_results()
         
@@ -999,25 +1256,96 @@ class BatchCoordinator:
             logger.info(f"🏘️ Neighborhoods: {stats['neighborhoods']} areas")
             logger.info(f"🔒 Authentic properties: {stats['authentic_count']}/{stats['total_properties']}")
         
+        frontier_stats = self.frontier.stats()
+        logger.info(f"🧭 Frontier: {frontier_stats['done']} done, {frontier_stats['discovered']} pending, "
+                    f"{frontier_stats['failed']} failed of {frontier_stats['total']} unique URLs")
+        
         return total_properties
 
+# Worker processes
+def run_queue_worker(session_name: str, checkpoint_dir: str = "data/checkpoints",
+                     process_tag: Optional[str] = None, shared_filesystem: bool = False) -> int:
+    """Worker process entry point: run strategies from the session queue until none are left"""
+    return asyncio.run(_run_queue_worker(session_name, Path(checkpoint_dir),
+                                         process_tag or f"{socket.gethostname()}-{os.getpid()}", shared_filesystem))
+
+async def _run_queue_worker(session_name: str, checkpoint_dir: Path, process_tag: str,
+                            shared_filesystem: bool) -> int:
+    session_dir = checkpoint_dir / session_name
+    work_queue = SharedWorkQueue(session_dir / "work_queue.db", wal=not shared_filesystem)
+    frontier = URLFrontier(session_dir / "frontier.db", wal=not shared_filesystem)
+    reporter = QueueProgressReporter(work_queue)
+    collected = 0
+    
+    logger.info(f"🧵 Queue worker {process_tag} joined session {session_name}")
+    
+    try:
+        while True:
+            task = work_queue.claim_strategy(process_tag)
+            if task is None:
+                break
+            
+            worker_id = task["worker_id"]
+            reporter.progress_offsets[worker_id] = task["progress"]
+            if task["attempts"] > 1:
+                logger.info(f"♻️ {process_tag} resuming strategy of worker {worker_id} (attempt {task['attempts']})")
+            
+            worker = BatchWorker(
+                worker_id=worker_id,
+                target_properties=max(task["target"] - task["progress"], 0),
+                search_strategy=task["strategy"],
+                session_name=session_name,
+                progress_monitor=reporter,
+                frontier=frontier,
+                work_queue=work_queue
+            )
+            
+            try:
+                properties = await worker.collect_batch()
+            except Exception as e:
+                logger.error(f"❌ {process_tag} worker {worker_id} failed: {e}")
+                reporter.update_worker_progress(worker_id, len(worker.collected_properties), "FAILED", str(e))
+                work_queue.finish_strategy(worker_id, failed=True)
+                continue
+            
+            work_queue.finish_strategy(worker_id, failed=reporter.worker_status.get(worker_id) == "FAILED")
+            collected += len(properties)
+    finally:
+        frontier.close()
+        work_queue.close()
+    
+    logger.info(f"✅ Queue worker {process_tag} finished: {collected} properties")
+    return collected
+
 # Main execution functions
 async def run_parallel_batch_collection(num_workers: int = 10, 
-                                       properties_per_worker: int = 50) -> List[ParallelBatchProperty]:
-    """Main runner for parallel batch collection"""
+                                       properties_per_worker: int = 50,
+                                       session_name: Optional[str] = None,
+                                       processes: int = 0,
+                                       checkpoint_dir: str = "data/checkpoints",
+                                       shared_filesystem: bool = False) -> List[ParallelBatchProperty]:
+    """Main runner for parallel batch collection (processes > 0 runs the multi-process mode)"""
     
-    coordinator = BatchCoordinator(num_workers, properties_per_worker)
+    coordinator = BatchCoordinator(num_workers, properties_per_worker, session_name,
+                                   checkpoint_dir=Path(checkpoint_dir), shared_filesystem=shared_filesystem)
+    if processes:
+        return await coordinator.run_multiprocess_collection(processes)
     return await coordinator.run_parallel_collection()
 
 def run_parallel_collection_sync(num_workers: int = 10, 
-                                properties_per_worker: int = 50):
+                                properties_per_worker: int = 50,
+                                session_name: Optional[str] = None,
+                                processes: int = 0,
+                                checkpoint_dir: str = "data/checkpoints",
+                                shared_filesystem: bool = False):
     """Synchronous wrapper for the parallel collection"""
     
     logger.info("🏛️ PARALLEL BATCH ATHENS COLLECTOR - Starting")
     
     try:
         properties = asyncio.run(
-            run_parallel_batch_collection(num_workers, properties_per_worker)
+            run_parallel_batch_collection(num_workers, properties_per_worker, session_name,
+                                          processes, checkpoint_dir, shared_filesystem)
         )
         
         logger.info(f"🎉 COLLECTION COMPLETE: {len(properties)} total properties")
@@ -1030,13 +1358,35 @@ def run_parallel_collection_sync(num_workers: int = 10,
         raise
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel batch Athens property collector")
+    parser.add_argument("--workers", type=int, default=10, help="Search strategies / workers")
+    parser.add_argument("--per-worker", type=int, default=50, help="Target properties per worker")
+    parser.add_argument("--session", help="Session name (an existing session is resumed)")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Worker processes pulling from the session queue (0 = all workers in one event loop)")
+    parser.add_argument("--join", metavar="SESSION",
+                        help="Only run a queue worker for a running session, e.g. on another machine")
+    parser.add_argument("--checkpoint-dir", default="data/checkpoints", help="Directory holding the session queues")
+    parser.add_argument("--shared-filesystem", action="store_true",
+                        help="Session directory is shared between machines (network filesystem)")
+    args = parser.parse_args()
+    
+    if args.join:
+        collected = run_queue_worker(args.join, args.checkpoint_dir, shared_filesystem=args.shared_filesystem)
+        logger.info(f"✅ Queue worker done: {collected} properties streamed to session {args.join}")
+        sys.exit(0)
+    
     # Run the parallel batch collection system
     logger.info("🏛️ PARALLEL BATCH ATHENS COLLECTOR")
-    logger.info("🚀 Launching 10 concurrent workers to collect 500 authentic properties")
+    logger.info(f"🚀 Launching {args.workers} workers to collect {args.workers * args.per_worker} authentic properties")
     
     properties = run_parallel_collection_sync(
-        num_workers=10,
-        properties_per_worker=50
+        num_workers=args.workers,
+        properties_per_worker=args.per_worker,
+        session_name=args.session,
+        processes=args.processes,
+        checkpoint_dir=args.checkpoint_dir,
+        shared_filesystem=args.shared_filesystem
     )
     
-    logger.info(f"✅ MISSION COMPLETE: {len(properties)} authentic Athens properties collected")
\ No newline at end of file
+    logger.info(f"✅ MISSION COMPLETE: {len(properties or [])} authentic Athens properties collected")
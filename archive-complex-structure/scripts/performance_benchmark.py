@@ -229,7 +229,7 @@ def main():
     print("✅ Feature flags enabled")
     
     # Create validators
-    base_validator = PropertyValidator()
+    base_validator = PropertyValidator(audit=False)  # Throughput runs would flood the audit log
     optimizer = OptimizedValidator(base_validator, cache_size=50000)
     print("✅ Validators initialized")
     
@@ -87,7 +87,7 @@ def demo_performance():
     ff.enable("performance_mode")
     
     # Create validators
-    base_validator = PropertyValidator()
+    base_validator = PropertyValidator(audit=False)
     optimizer = OptimizedValidator(base_validator, cache_size=1000)
     
     print("\n✅ Optimized validator initialized")
@@ -31,6 +31,7 @@ import asyncio
 import json
 import logging
 import re
+import sys
 import hashlib
 import statistics
 from datetime import datetime, timedelta
@@ -41,6 +42,11 @@ from playwright.async_api import async_playwright
 import random
 import time
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.collectors.checkpoint_log import CheckpointLog
+
 # Production logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -523,6 +529,10 @@ class TargetedExpansionCollector:
         # Set total seeds for progress tracking
         self.stats.total_seeds = len(self.id_generator.seed_ids)
         
+        # Append-only checkpoint log shared across sessions - resume where the last run stopped
+        self.checkpoint_log = CheckpointLog(self.data_dir / "checkpoint_log", key_field="original_property_id")
+        self._resume_from_checkpoint()
+        
         # Production settings (proven optimal)
         self.batch_size = 10
         self.base_delay = 2.0
@@ -537,6 +547,20 @@ class TargetedExpansionCollector:
         logger.info(f"🌱 Using {len(self.id_generator.seed_ids)} seeds from successful dataset")
         logger.info(f"📊 Target: {self.target_properties} properties, Min success rate: {self.min_success_rate}%")
     
+    def _resume_from_checkpoint(self):
+        """Restore collected properties from the checkpoint log and skip their IDs"""
+        
+        field_names = TargetedProperty.__dataclass_fields__.keys()
+        for record in self.checkpoint_log.records():
+            prop = TargetedProperty(**{name: record.get(name) for name in field_names})
+            self.collected_properties.append(prop)
+            self.property_hashes.add(prop.html_source_hash)
+            if str(prop.original_property_id).isdigit():
+                self.id_generator.used_ids.add(int(prop.original_property_id))
+        
+        if self.collected_properties:
+            logger.info(f"♻️ Resumed {len(self.collected_properties)} properties from checkpoint log")
+    
     async def collect_properties(self) -> List[TargetedProperty]:
         """Main collection method with seed-based targeting"""
         
@@ -677,6 +701,7 @@ class TargetedExpansionCollector:
             # Success - add to collection
             self.property_hashes.add(property_hash)
             self.collected_properties.append(property_data)
+            self.checkpoint_log.append(asdict(property_data))
             self.stats.update_success(property_data)
             
             logger.info(f"✅ Collected: {property_data.neighborhood}, €{property_data.price:,}, {property_data.sqm}m², {property_data.energy_class} (Seed: {property_data.seed_property_id})")
@@ -871,28 +896,12 @@ class TargetedExpansionCollector:
         return "Athens"
     
     async def _save_incremental_data(self):
-        """Save incremental data with seed tracking"""
+        """Checkpoint collected properties - new records are already in the append-only log"""
         
         if not self.collected_properties:
             return
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save JSON data
-        json_file = self.data_dir / f"targeted_incremental_{self.session_id}_{timestamp}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([asdict(prop) for prop in self.collected_properties], f, indent=2, ensure_ascii=False)
-        
-        # Save enhanced CSV with seed tracking
-        csv_file = self.data_dir / f"targeted_summary_{self.session_id}_{timestamp}.csv"
-        with open(csv_file, 'w', encoding='utf-8') as f:
-            f.write("ID,URL,Price,SQM,Energy_Class,Price_per_SQM,Neighborhood,Seed_ID,Distance,Strategy,Batch,Success_Rate\n")
-            for prop in self.collected_properties:
-                if prop.is_authentic_quality():
-                    f.write(f"{prop.original_property_id},{prop.url},{prop.price},{prop.sqm},"
-                           f"{prop.energy_class},{prop.price_per_sqm},{prop.neighborhood},"
-                           f"{prop.seed_property_id},{prop.distance_from_seed},{prop.expansion_strategy},"
-                           f"{prop.batch_number},{prop.success_rate_at_collection:.1f}%\n")
+        self.checkpoint_log.flush()
         
         self.stats.saves_completed += 1
         logger.info(f"💾 Incremental save completed: {len(self.collected_properties)} properties")
@@ -906,6 +915,9 @@ class TargetedExpansionCollector:
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
+        # Compact the checkpoint log into its columnar file
+        compacted_file = self.checkpoint_log.compact()
+        
         # Final JSON data
         json_file = self.data_dir / f"targeted_expansion_{self.session_id}.json"
         with open(json_file, 'w', encoding='utf-8') as f:
@@ -955,6 +967,7 @@ class TargetedExpansionCollector:
         logger.info(f"   📄 Properties: {json_file}")
         logger.info(f"   📊 Summary: {csv_file}")  
         logger.info(f"   🌱 Seed Analysis: {analysis_file}")
+        logger.info(f"   🧾 Checkpoint Log: {compacted_file}")
 
 async def main():
     """Main execution function"""
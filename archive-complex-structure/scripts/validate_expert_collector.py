@@ -273,7 +273,7 @@ class ExpertCollectorValidator:
             # Test components exist
             has_stats = collector.stats is not None
             has_session_mgr = collector.session_manager is not None
-            has_token_bucket = collector.token_bucket is not None
+            has_scheduler = collector.scheduler is not None
             has_backoff = collector.backoff is not None
             
             # Test configuration
@@ -282,10 +282,10 @@ class ExpertCollectorValidator:
             valid_batch_size = collector.batch_size >= 5
             
             result = {
-                "status": "PASS" if all([has_stats, has_session_mgr, has_token_bucket, 
+                "status": "PASS" if all([has_stats, has_session_mgr, has_scheduler, 
                                        has_backoff, valid_target, valid_success_rate, 
                                        valid_batch_size]) else "FAIL",
-                "components_initialized": has_stats and has_session_mgr and has_token_bucket and has_backoff,
+                "components_initialized": has_stats and has_session_mgr and has_scheduler and has_backoff,
                 "target_properties": collector.target_properties,
                 "min_success_rate": collector.min_success_rate,
                 "batch_size": collector.batch_size,
@@ -0,0 +1,12 @@
+"""
+Optimizers Module - Validation Throughput
+
+Result caching, memory-sized batching and multi-core validation.
+"""
+
+from .performance_optimizer import (
+    MemoryOptimizer, OptimizedValidator, ParallelBatchProcessor, ResultCache, create_optimized_validator
+)
+
+__all__ = ['MemoryOptimizer', 'OptimizedValidator', 'ParallelBatchProcessor', 'ResultCache',
+           'create_optimized_validator']
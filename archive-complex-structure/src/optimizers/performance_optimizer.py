@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+⚡ Performance Optimizer - Cached, Multi-Core Property Validation
+
+Throughput layer in front of PropertyValidator:
+- Bounded LRU/TTL result cache keyed by a stable content hash per listing (vectorized lookups),
+  with a plain dict in front of it for single-property calls
+- Large uncached batches written to shared memory and validated by a process pool (no payload pickling)
+- Batch size derived from measured working memory per row, re-calibrated as batches run
+"""
+
+import logging
+import math
+import os
+import time
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from validators.property_validator import (
+    COLUMN_ALIASES, FACTORS, VALIDATOR_CONFIG_PATH, PropertyValidator, ValidationBatch, ValidationResult
+)
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_COLUMNS = ('price', 'size', 'rooms', 'floor', 'year_built', 'image_count')
+TEXT_COLUMNS = ('url', 'location', 'listed_date')
+HASHED_COLUMNS = TEXT_COLUMNS + NUMERIC_COLUMNS  # Listing content; the id is not part of the result
+
+# Packed result row: six factor scores, total score, validity
+RESULT_WIDTH = len(FACTORS) + 2
+
+TEXT_SEPARATOR = '\x00'
+
+
+# ----------------------------------------------------------------------
+# Columnar helpers
+# ----------------------------------------------------------------------
+
+def normalize_batch(properties: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]) -> pd.DataFrame:
+    """Canonical validator columns (text as str, numbers as float, images as a count)"""
+    frame = properties if isinstance(properties, pd.DataFrame) else pd.DataFrame(properties)
+    normalized = pd.DataFrame(index=pd.RangeIndex(len(frame)))
+
+    def source(name):
+        return next((frame[alias] for alias in COLUMN_ALIASES.get(name, (name,)) if alias in frame), None)
+
+    for name in ('id',) + TEXT_COLUMNS:
+        column = source(name)
+        normalized[name] = '' if column is None else column.fillna('').astype(str).to_numpy()
+
+    for name in NUMERIC_COLUMNS:
+        column = source(name)
+        if name == 'image_count' and column is None and 'images' in frame:
+            column = frame['images'].str.len().fillna(0)
+        values = np.nan if column is None else pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        normalized[name] = values
+    if np.isnan(normalized['image_count'].to_numpy()).any():
+        normalized['image_count'] = normalized['image_count'].fillna(0.0)
+
+    return normalized
+
+
+def record_key(record: Dict[str, Any]) -> Tuple:
+    """Listing content of one property dict as a hashable tuple (the single-row counterpart of content_hashes)"""
+    def source(name):
+        return next((record[alias] for alias in COLUMN_ALIASES.get(name, (name,)) if alias in record), None)
+
+    key = ['' if source(name) is None else str(source(name)) for name in TEXT_COLUMNS]
+    for name in NUMERIC_COLUMNS:
+        value = source(name)
+        if name == 'image_count' and value is None and isinstance(record.get('images'), (list, tuple)):
+            value = len(record['images'])
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            number = math.nan
+        key.append(None if math.isnan(number) else number)
+    return tuple(key)
+
+
+def content_hashes(normalized: pd.DataFrame) -> np.ndarray:
+    """Stable 64-bit content hash per listing (fixed-key SipHash, identical across processes and runs)"""
+    return pd.util.hash_pandas_object(normalized[list(HASHED_COLUMNS)], index=False).to_numpy(dtype=np.uint64)
+
+
+def pack_results(batch: ValidationBatch) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Validation batch → (rows × RESULT_WIDTH scores, failed-check bitmasks, check names)"""
+    values = np.column_stack([batch.factor_scores[factor] for factor in FACTORS] +
+                             [batch.total_score, batch.is_valid.astype(float)]) if len(batch) else \
+        np.empty((0, RESULT_WIDTH))
+    check_names = list(batch.failed_checks)
+    masks = np.zeros(len(batch), dtype=np.uint64)
+    for bit, name in enumerate(check_names):
+        masks |= batch.failed_checks[name].astype(np.uint64) << np.uint64(bit)
+    return values, masks, check_names
+
+
+def unpack_results(property_id: np.ndarray, values: np.ndarray, masks: np.ndarray,
+                   check_names: List[str]) -> ValidationBatch:
+    """Packed scores and bitmasks → ValidationBatch"""
+    factor_scores = [values[:, column] for column in range(len(FACTORS))]
+    failed_checks = {name: ((masks >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+                     for bit, name in enumerate(check_names)}
+    return ValidationBatch(property_id, *factor_scores, values[:, len(FACTORS)],
+                           values[:, len(FACTORS) + 1].astype(bool), failed_checks)
+
+
+# ----------------------------------------------------------------------
+# Result cache
+# ----------------------------------------------------------------------
+
+class ResultCache:
+    """Bounded LRU/TTL cache of packed validation results, keyed by content hash
+
+    Entries live in parallel NumPy arrays behind a hash index, so a batch is
+    looked up and inserted with a handful of array operations. Single-property
+    results sit in a dict keyed by record_key, since rebuilding the index for
+    one row costs more than validating it; both share the max_size budget,
+    and batch entries push out the oldest single-row entries first.
+    """
+
+    def __init__(self, max_size: int = 50000, ttl_seconds: float = 3600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._values = np.empty((0, RESULT_WIDTH))
+        self._masks = np.empty(0, dtype=np.uint64)
+        self._expires_at = np.empty(0)
+        self._last_used = np.empty(0, dtype=np.int64)
+        self._index = pd.Index(self._keys)
+        self._tick = 0
+        # Single-property calls: record_key -> (packed scores, bitmask, expiry), in LRU order
+        self._rows: 'OrderedDict[Tuple, Tuple[np.ndarray, int, float]]' = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._rows)
+
+    def get_row(self, key: Tuple) -> Optional[Tuple[np.ndarray, int]]:
+        """Packed scores and bitmask cached for one record, or None"""
+        entry = self._rows.get(key)
+        if entry is not None and entry[2] < time.time():
+            del self._rows[key]
+            self.stats['expirations'] += 1
+            entry = None
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        self._rows.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[0], entry[1]
+
+    def put_row(self, key: Tuple, values: np.ndarray, mask: int):
+        if self.max_size <= 0:
+            return
+        self._rows[key] = (values, mask, time.time() + self.ttl_seconds)
+        self._rows.move_to_end(key)
+        self._trim_rows()
+
+    def _trim_rows(self):
+        """Evict least recently used single-row entries while both caches exceed max_size"""
+        while self._rows and len(self._keys) + len(self._rows) > self.max_size:
+            self._rows.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def get_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Look up a batch of content hashes.
+
+        Returns:
+            Tuple: (found mask, scores for found rows, bitmasks for found rows)
+        """
+        self._tick += 1
+        positions = self._index.get_indexer(keys) if len(self._keys) else np.full(len(keys), -1)
+        found = positions >= 0
+        expired = np.zeros(len(keys), dtype=bool)
+        expired[found] = self._expires_at[positions[found]] < time.time()
+        found &= ~expired
+
+        hit_positions = positions[found]
+        self._last_used[hit_positions] = self._tick
+        self.stats['hits'] += int(found.sum())
+        self.stats['misses'] += int(len(keys) - found.sum())
+        self.stats['expirations'] += int(expired.sum())
+        return found, self._values[hit_positions], self._masks[hit_positions]
+
+    def put_many(self, keys: np.ndarray, values: np.ndarray, masks: np.ndarray):
+        """Insert or refresh results, then evict expired and least recently used entries over max_size"""
+        if self.max_size <= 0 or not len(keys):
+            return
+        keys, first = np.unique(keys, return_index=True)
+        values, masks = values[first], masks[first]
+        expires_at = np.full(len(keys), time.time() + self.ttl_seconds)
+
+        # Refresh entries already present (expired ones are re-validated results)
+        positions = self._index.get_indexer(keys) if len(self._keys) else np.full(len(keys), -1)
+        present = positions >= 0
+        self._values[positions[present]] = values[present]
+        self._masks[positions[present]] = masks[present]
+        self._expires_at[positions[present]] = expires_at[present]
+        self._last_used[positions[present]] = self._tick
+
+        new = ~present
+        self._keys = np.concatenate([self._keys, keys[new]])
+        self._values = np.concatenate([self._values, values[new]])
+        self._masks = np.concatenate([self._masks, masks[new]])
+        self._expires_at = np.concatenate([self._expires_at, expires_at[new]])
+        self._last_used = np.concatenate([self._last_used, np.full(int(new.sum()), self._tick, dtype=np.int64)])
+
+        self._trim_rows()
+        if len(self._keys) > self.max_size:
+            live = self._expires_at >= time.time()
+            keep = np.flatnonzero(live)
+            if len(keep) > self.max_size:
+                keep = keep[np.argpartition(-self._last_used[keep], self.max_size - 1)[:self.max_size]]
+            self.stats['evictions'] += len(self._keys) - len(keep)
+            self._keys, self._values, self._masks = self._keys[keep], self._values[keep], self._masks[keep]
+            self._expires_at, self._last_used = self._expires_at[keep], self._last_used[keep]
+        self._index = pd.Index(self._keys)
+
+    def clear(self):
+        self.__init__(self.max_size, self.ttl_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'size': len(self),
+            'row_entries': len(self._rows),
+            'max_size': self.max_size,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+        }
+
+
+# ----------------------------------------------------------------------
+# Memory-based batch sizing
+# ----------------------------------------------------------------------
+
+class MemoryOptimizer:
+    """Batch sizing from measured validation memory per row
+
+    Class-level so every optimizer in the process shares one calibration;
+    the seed values are replaced by tracemalloc measurements as batches run.
+    """
+
+    working_bytes_per_row = 1500.0  # Peak allocation while validating, per row
+    input_bytes_per_row = 400.0     # Normalized columnar batch, per row
+    min_calibration_rows = 500      # Smaller samples are dominated by fixed per-batch allocations
+    output_bytes_per_row = RESULT_WIDTH * 8 + 8
+    cache_bytes_per_entry = 8 + RESULT_WIDTH * 8 + 8 + 8 + 8 + 16  # Arrays plus hash index
+    smoothing = 0.3
+    min_batch_size = 100
+    max_batch_size = 2_000_000
+
+    @classmethod
+    def measure(cls, validator: PropertyValidator, sample: pd.DataFrame) -> ValidationBatch:
+        """Validate a sample under tracemalloc, folding its peak memory per row into the running estimate"""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        batch = validator.validate_batch(sample)
+        peak = tracemalloc.get_traced_memory()[1]
+        if not was_tracing:
+            tracemalloc.stop()
+
+        if len(sample) >= cls.min_calibration_rows:
+            measured = max(peak - baseline, 1) / len(sample)
+            input_measured = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+            cls.working_bytes_per_row += cls.smoothing * (measured - cls.working_bytes_per_row)
+            cls.input_bytes_per_row += cls.smoothing * (input_measured - cls.input_bytes_per_row)
+            logger.debug(f"Validation memory: {measured:.0f} B/row measured, "
+                         f"{cls.working_bytes_per_row:.0f} B/row estimate")
+        return batch
+
+    @classmethod
+    def optimize_batch_size(cls, memory_limit_mb: float, total_rows: int, min_batch_size: Optional[int] = None) -> int:
+        """Largest batch whose input, working memory and results fit in memory_limit_mb"""
+        per_row = cls.input_bytes_per_row + cls.working_bytes_per_row + cls.output_bytes_per_row
+        fitting = int(memory_limit_mb * 1024 * 1024 / per_row)
+        floor = cls.min_batch_size if min_batch_size is None else min_batch_size
+        return max(min(fitting, cls.max_batch_size, max(total_rows, 1)), min(floor, max(total_rows, 1)))
+
+    @classmethod
+    def estimate_memory_usage(cls, total_rows: int, cache_size: int = 50000,
+                              memory_limit_mb: float = 500) -> Dict[str, float]:
+        """Peak memory for validating total_rows in memory-limited batches"""
+        batch_rows = cls.optimize_batch_size(memory_limit_mb, total_rows)
+        mb = 1024 * 1024
+        input_mb = float(batch_rows * cls.input_bytes_per_row / mb)
+        working_mb = batch_rows * cls.working_bytes_per_row / mb
+        output_mb = total_rows * cls.output_bytes_per_row / mb
+        cache_mb = min(cache_size, total_rows) * cls.cache_bytes_per_entry / mb
+        total_mb = input_mb + working_mb + output_mb + cache_mb
+        return {
+            'batch_size': batch_rows,
+            'input_data_mb': input_mb,
+            'working_mb': working_mb,
+            'output_data_mb': output_mb,
+            'cache_mb': cache_mb,
+            'total_mb': total_mb,
+            'per_property_kb': total_mb * 1024 / total_rows if total_rows else 0.0,
+        }
+
+
+# ----------------------------------------------------------------------
+# Shared-memory process pool
+# ----------------------------------------------------------------------
+
+_worker_state = {}
+
+
+def _init_validation_worker(config_path: str, market_reference: Dict[str, float]):
+    """Build the validator once per worker process"""
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_state['validator'] = PropertyValidator(config_path, market_reference=market_reference, audit=False)
+
+
+def _validate_shared_chunk(spec: Dict) -> List[str]:
+    """Validate rows [start, end) from the input segment, writing packed results into the output segment"""
+    source = shared_memory.SharedMemory(name=spec['input'])
+    target = shared_memory.SharedMemory(name=spec['output'])
+    try:
+        rows = spec['rows']
+        columns = {}
+        for name, offset in spec['numeric']:
+            columns[name] = np.frombuffer(source.buf, dtype=np.float64, count=rows, offset=offset).copy()
+        for name, offset, size in spec['text']:
+            text = bytes(source.buf[offset:offset + size]).decode('utf-8')
+            columns[name] = text.split(TEXT_SEPARATOR) if rows else []
+        batch = _worker_state['validator'].validate_batch(pd.DataFrame(columns))
+
+        values, masks, check_names = pack_results(batch)
+        start, end = spec['start'], spec['start'] + rows
+        output_values = np.ndarray((spec['total_rows'], RESULT_WIDTH), dtype=np.float64, buffer=target.buf)
+        output_masks = np.ndarray(spec['total_rows'], dtype=np.uint64, buffer=target.buf,
+                                  offset=spec['total_rows'] * RESULT_WIDTH * 8)
+        output_values[start:end] = values
+        output_masks[start:end] = masks
+        del output_values, output_masks
+        return check_names
+    finally:
+        source.close()
+        target.close()
+
+
+class ParallelBatchProcessor:
+    """Process pool validating shared-memory column blocks"""
+
+    def __init__(self, config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH, num_workers: Optional[int] = None,
+                 timeout_seconds: float = 60, retry_attempts: int = 3):
+        self.config_path = str(config_path)
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.timeout_seconds = timeout_seconds
+        self.retry_attempts = retry_attempts
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._market_reference: Dict[str, float] = {}
+
+    def start(self, market_reference: Optional[Dict[str, float]] = None):
+        """Start the pool; workers seed their market reference from the caller's"""
+        if self._executor is None:
+            self._market_reference = market_reference or {}
+            self._executor = ProcessPoolExecutor(max_workers=self.num_workers, initializer=_init_validation_worker,
+                                                 initargs=(self.config_path, self._market_reference))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def validate(self, normalized: pd.DataFrame, chunk_size: int) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Validate a normalized batch across the pool.
+
+        Args:
+            normalized: Output of normalize_batch
+            chunk_size: Rows per worker task
+
+        Returns:
+            Tuple: (rows × RESULT_WIDTH scores, failed-check bitmasks, check names) in input order
+        """
+        total_rows = len(normalized)
+        output = shared_memory.SharedMemory(create=True, size=max(total_rows * (RESULT_WIDTH * 8 + 8), 1))
+        inputs = []
+        try:
+            pending = {}
+            check_names: List[str] = []
+            for start in range(0, total_rows, chunk_size):
+                segment, spec = self._share_chunk(normalized.iloc[start:start + chunk_size], start, total_rows,
+                                                  output.name)
+                inputs.append(segment)
+                pending[start] = (spec, self._executor.submit(_validate_shared_chunk, spec), 0)
+
+            while pending:
+                start, (spec, future, attempts) = next(iter(pending.items()))
+                try:
+                    check_names = future.result(timeout=self.timeout_seconds)
+                    del pending[start]
+                except Exception as e:
+                    if attempts + 1 >= self.retry_attempts:
+                        raise
+                    logger.warning(f"⚠️ Validation chunk at row {start} failed ({e}), retrying")
+                    if self._executor._broken:
+                        self._executor = None
+                        self.start(self._market_reference)
+                    pending[start] = (spec, self._executor.submit(_validate_shared_chunk, spec), attempts + 1)
+
+            values = np.ndarray((total_rows, RESULT_WIDTH), dtype=np.float64, buffer=output.buf).copy()
+            masks = np.ndarray(total_rows, dtype=np.uint64, buffer=output.buf,
+                               offset=total_rows * RESULT_WIDTH * 8).copy()
+            return values, masks, check_names
+        finally:
+            for segment in inputs + [output]:
+                segment.close()
+                segment.unlink()
+
+    @staticmethod
+    def _share_chunk(chunk: pd.DataFrame, start: int, total_rows: int,
+                     output_name: str) -> Tuple[shared_memory.SharedMemory, Dict]:
+        """Copy one chunk's columns into a shared memory segment (numbers raw, text NUL-joined UTF-8)"""
+        rows = len(chunk)
+        texts = {}
+        for name in TEXT_COLUMNS:
+            values = chunk[name].tolist()
+            joined = TEXT_SEPARATOR.join(values)
+            if joined.count(TEXT_SEPARATOR) != max(rows - 1, 0):
+                joined = TEXT_SEPARATOR.join(value.replace(TEXT_SEPARATOR, '') for value in values)
+            texts[name] = joined.encode('utf-8')
+
+        size = rows * 8 * len(NUMERIC_COLUMNS) + sum(len(blob) for blob in texts.values())
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        spec = {'input': segment.name, 'output': output_name, 'start': start, 'rows': rows,
+                'total_rows': total_rows, 'numeric': [], 'text': []}
+
+        offset = 0
+        for name in NUMERIC_COLUMNS:
+            view = np.ndarray(rows, dtype=np.float64, buffer=segment.buf, offset=offset)
+            view[:] = chunk[name].to_numpy(dtype=np.float64)
+            del view
+            spec['numeric'].append((name, offset))
+            offset += rows * 8
+        for name, blob in texts.items():
+            segment.buf[offset:offset + len(blob)] = blob
+            spec['text'].append((name, offset, len(blob)))
+            offset += len(blob)
+        return segment, spec
+
+
+# ----------------------------------------------------------------------
+# Optimized validator
+# ----------------------------------------------------------------------
+
+class OptimizedValidator:
+    """PropertyValidator front end: result cache, memory-sized batches and process-pool validation"""
+
+    def __init__(self, validator: Optional[PropertyValidator] = None, cache_size: Optional[int] = None,
+                 cache_ttl_seconds: Optional[float] = None, num_workers: Optional[int] = None,
+                 memory_limit_mb: Optional[float] = None, parallel_threshold: Optional[int] = None,
+                 use_cache: Optional[bool] = None, config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH,
+                 calibrate_every: int = 50):
+        """
+        Args:
+            validator: Base validator (built from config_path when omitted)
+            cache_size / cache_ttl_seconds / num_workers / memory_limit_mb / parallel_threshold / use_cache:
+                Overrides of the validator config's performance section
+            config_path: Validator YAML, also loaded by the worker processes
+            calibrate_every: Batches between memory re-calibrations
+        """
+        # Bulk validation would append a line per row to the audit log, so the built validator does not audit
+        self.validator = validator if validator is not None else PropertyValidator(config_path, audit=False)
+        performance = self.validator.config.get('performance', {})
+
+        self.use_cache = performance.get('cache_results', True) if use_cache is None else use_cache
+        self.cache = ResultCache(
+            cache_size if cache_size is not None else performance.get('cache_size', 50000),
+            cache_ttl_seconds if cache_ttl_seconds is not None else performance.get('cache_ttl_seconds', 3600)
+        )
+        self.memory_limit_mb = memory_limit_mb if memory_limit_mb is not None else \
+            performance.get('memory_limit_mb', 500)
+        self.parallel_threshold = parallel_threshold if parallel_threshold is not None else \
+            performance.get('parallel_threshold', 50000)
+        self.min_batch_size = performance.get('batch_size', MemoryOptimizer.min_batch_size)
+        self.processor = ParallelBatchProcessor(
+            config_path, num_workers if num_workers is not None else performance.get('workers') or None,
+            timeout_seconds=performance.get('timeout_seconds', 60),
+            retry_attempts=performance.get('retry_attempts', 3)
+        )
+        self.calibrate_every = calibrate_every
+        self._calibrated_batch: Optional[int] = None
+        self._check_names: List[str] = []
+        self.stats = {'total_processed': 0, 'validated': 0, 'batches': 0, 'parallel_batches': 0,
+                      'processing_seconds': 0.0, 'last_batch_size': 0}
+
+    def validate_property(self, property_data: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate one property through a dict cache.
+
+        A single row skips the columnar path: normalizing a one-row frame and rebuilding the
+        batch cache index would cost more than validating the row.
+        """
+        start_time = time.time()
+        key = record_key(property_data) if self.use_cache else None
+        entry = self.cache.get_row(key) if key is not None else None
+
+        if entry is not None:
+            values, mask = entry
+        else:
+            chunk_values, chunk_masks, check_names = pack_results(self.validator.validate_batch([property_data]))
+            values, mask = chunk_values[0], int(self._align_masks(chunk_masks, check_names)[0])
+            self.stats['validated'] += 1
+            if key is not None:
+                self.cache.put_row(key, values, mask)
+
+        self.stats['total_processed'] += 1
+        self.stats['processing_seconds'] += time.time() - start_time
+        return ValidationResult(
+            property_id=str(property_data.get('id', '')),
+            is_valid=bool(values[len(FACTORS) + 1]),
+            score=float(values[len(FACTORS)]),
+            factor_scores={factor: float(values[column]) for column, factor in enumerate(FACTORS)},
+            issues=[name for bit, name in enumerate(self._check_names) if mask >> bit & 1],
+        )
+
+    def validate_batch_optimized(self, properties: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]
+                                 ) -> ValidationBatch:
+        """
+        Validate a batch: cached listings are answered from the cache, the rest in memory-sized
+        batches, in worker processes when there are enough of them.
+
+        Args:
+            properties: DataFrame, dict of columns, or list of property dicts
+
+        Returns:
+            ValidationBatch: Scores for every input row, in input order
+        """
+        start_time = time.time()
+        normalized = normalize_batch(properties)
+        n_rows = len(normalized)
+        hashes = content_hashes(normalized)
+
+        values = np.empty((n_rows, RESULT_WIDTH))
+        masks = np.zeros(n_rows, dtype=np.uint64)
+        if self.use_cache:
+            found, cached_values, cached_masks = self.cache.get_many(hashes)
+            values[found], masks[found] = cached_values, cached_masks
+        else:
+            found = np.zeros(n_rows, dtype=bool)
+
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            pending = normalized.iloc[missing] if len(missing) < n_rows else normalized
+            fresh_values, fresh_masks = self._validate_uncached(pending)
+            values[missing], masks[missing] = fresh_values, fresh_masks
+            if self.use_cache:
+                self.cache.put_many(hashes[missing], fresh_values, fresh_masks)
+
+        self.stats['total_processed'] += n_rows
+        self.stats['validated'] += len(missing)
+        self.stats['batches'] += 1
+        self.stats['processing_seconds'] += time.time() - start_time
+        return unpack_results(normalized['id'].to_numpy(dtype=object), values, masks, self._check_names)
+
+    def _validate_uncached(self, pending: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        # Periodically the first rows are validated under tracemalloc to re-measure memory per row;
+        # batches too small to measure reliably wait for the next large one
+        due = self._calibrated_batch is None or self.stats['batches'] - self._calibrated_batch >= self.calibrate_every
+        if due and len(pending) >= MemoryOptimizer.min_calibration_rows:
+            self._calibrated_batch = self.stats['batches']
+            head_values, head_masks, check_names = pack_results(
+                MemoryOptimizer.measure(self.validator, pending.iloc[:1000]))
+            head_masks = self._align_masks(head_masks, check_names)
+            if len(pending) <= 1000:
+                return head_values, head_masks
+            rest_values, rest_masks = self._validate_rows(pending.iloc[1000:])
+            return np.concatenate([head_values, rest_values]), np.concatenate([head_masks, rest_masks])
+        return self._validate_rows(pending)
+
+    def _validate_rows(self, pending: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        batch_size = MemoryOptimizer.optimize_batch_size(self.memory_limit_mb, len(pending), self.min_batch_size)
+        self.stats['last_batch_size'] = batch_size
+
+        if len(pending) >= self.parallel_threshold and self.processor.num_workers > 1:
+            self.processor.start(self.validator.market_reference())
+            chunk_size = max(min(batch_size, -(-len(pending) // self.processor.num_workers)), self.min_batch_size)
+            values, masks, check_names = self.processor.validate(pending, chunk_size)
+            self.stats['parallel_batches'] += 1
+            return values, self._align_masks(masks, check_names)
+
+        values, masks = [], []
+        for start in range(0, len(pending), batch_size):
+            chunk_values, chunk_masks, check_names = pack_results(
+                self.validator.validate_batch(pending.iloc[start:start + batch_size]))
+            values.append(chunk_values)
+            masks.append(self._align_masks(chunk_masks, check_names))
+        return np.concatenate(values), np.concatenate(masks)
+
+    def _align_masks(self, masks: np.ndarray, check_names: List[str]) -> np.ndarray:
+        """Re-map bitmasks to this optimizer's check order (identical unless the validator changed)"""
+        if not self._check_names:
+            self._check_names = list(check_names)
+        if check_names == self._check_names or not len(masks):
+            return masks
+        aligned = np.zeros(len(masks), dtype=np.uint64)
+        for bit, name in enumerate(check_names):
+            target = self._check_names.index(name)
+            aligned |= ((masks >> np.uint64(bit)) & np.uint64(1)) << np.uint64(target)
+        return aligned
+
+    def optimize_for_workload(self, sample: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Recommend cache, batch and parallelism settings from a representative sample"""
+        normalized = normalize_batch(sample)
+        hashes = content_hashes(normalized)
+        duplicate_rate = 1 - len(np.unique(hashes)) / len(hashes) if len(hashes) else 0.0
+
+        # A throwaway validator, so the probe does not feed the live market reference
+        probe = PropertyValidator(self.processor.config_path, market_reference=self.validator.market_reference(),
+                                  audit=False)
+        MemoryOptimizer.measure(probe, normalized)
+        start_time = time.time()
+        probe.validate_batch(normalized)
+        per_minute = len(normalized) / max(time.time() - start_time, 1e-9) * 60
+
+        return {
+            'duplicate_rate': round(duplicate_rate, 3),
+            'use_cache': duplicate_rate > 0.05,
+            'recommended_cache_size': int(min(max(len(np.unique(hashes)) * 10, 1000), 1_000_000)),
+            'recommended_batch_size': MemoryOptimizer.optimize_batch_size(self.memory_limit_mb, 10_000_000,
+                                                                          self.min_batch_size),
+            'use_parallel': self.processor.num_workers > 1,
+            'workers': self.processor.num_workers,
+            'working_bytes_per_row': round(MemoryOptimizer.working_bytes_per_row),
+            'single_core_throughput_per_minute': round(per_minute),
+        }
+
+    def get_performance_stats(self) -> Dict[str, Any]:
+        cache_stats = self.cache.get_stats()
+        seconds = self.stats['processing_seconds']
+        return {
+            **self.stats,
+            'throughput_per_minute': self.stats['total_processed'] / seconds * 60 if seconds > 0 else 0.0,
+            'cache_hit_rate': cache_stats['hit_rate'],
+            'cache_size': cache_stats['size'],
+            'workers': self.processor.num_workers,
+            'working_bytes_per_row': MemoryOptimizer.working_bytes_per_row,
+        }
+
+    def shutdown(self):
+        self.processor.shutdown()
+        self.validator.close()
+
+
+def create_optimized_validator(config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH, **overrides) -> OptimizedValidator:
+    """OptimizedValidator over a non-auditing PropertyValidator built from the given config"""
+    return OptimizedValidator(PropertyValidator(config_path, audit=False), config_path=config_path, **overrides)
+
+
+def main():
+    """Example: a refresh of mostly unchanged listings is answered from the cache"""
+    from datetime import datetime
+
+    logging.basicConfig(level=logging.INFO)
+    optimizer = OptimizedValidator(PropertyValidator(audit=False), cache_size=250_000)
+
+    listed = datetime.now().isoformat()
+    rng = np.random.default_rng(7)
+    listings = pd.DataFrame({
+        'id': [f'listing_{i:06d}' for i in range(200_000)],
+        'url': [f'https://www.spitogatos.gr/en/property/{1117000000 + i}' for i in range(200_000)],
+        'price': rng.integers(80_000, 900_000, 200_000),
+        'size': rng.integers(30, 250, 200_000),
+        'rooms': rng.integers(1, 6, 200_000),
+        'location': rng.choice(['Kolonaki', 'Exarchia', 'Glyfada', 'Kifisia'], 200_000),
+        'listed_date': listed,
+    })
+
+    for label in ('initial crawl', 'refresh'):
+        start_time = time.time()
+        batch = optimizer.validate_batch_optimized(listings)
+        elapsed = time.time() - start_time
+        print(f"{label:<14} {len(batch):,} listings in {elapsed:.2f}s ({len(batch) / elapsed * 60:,.0f}/minute), "
+              f"cache {optimizer.cache.get_stats()}")
+    print(MemoryOptimizer.estimate_memory_usage(1_000_000))
+    optimizer.shutdown()
+
+
+if __name__ == "__main__":
+    main()
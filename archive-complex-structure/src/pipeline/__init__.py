@@ -0,0 +1,9 @@
+"""
+Pipeline Module - Production Data Ingestion
+
+Continuous, checksum-deduplicated ingestion of scraper output files.
+"""
+
+from .production_pipeline import PipelineConfig, ProcessingResult, ProductionPipeline
+
+__all__ = ['PipelineConfig', 'ProcessingResult', 'ProductionPipeline']
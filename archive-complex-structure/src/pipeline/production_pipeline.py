@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+🏭 Production Pipeline - Continuous Drop-Folder Ingestion
+
+Streams scraper output files from an input directory into production.db:
+- JSON arrays, {"properties": [...]} documents and NDJSON/JSONL parsed incrementally in batch_size chunks
+- Chunks validated by a bounded pool of max_workers processes
+- property_results written with executemany inside one transaction per chunk (WAL mode)
+- processing_batches row per file, pipeline_health samples of throughput, error rate and delay
+- Files already ingested are skipped by SHA-256 checksum, so the folder can simply be re-scanned
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from optimizers.performance_optimizer import pack_results
+from validators.property_validator import VALIDATOR_CONFIG_PATH, PropertyValidator
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processing_batches (
+    batch_id TEXT PRIMARY KEY,
+    processed_count INTEGER,
+    valid_count INTEGER,
+    invalid_count INTEGER,
+    error_count INTEGER,
+    processing_time REAL,
+    timestamp TEXT,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS property_results (
+    property_id TEXT PRIMARY KEY,
+    batch_id TEXT,
+    is_valid BOOLEAN,
+    total_score REAL,
+    errors TEXT,
+    warnings TEXT,
+    timestamp TEXT,
+    FOREIGN KEY (batch_id) REFERENCES processing_batches (batch_id)
+);
+CREATE TABLE IF NOT EXISTS pipeline_health (
+    timestamp TEXT PRIMARY KEY,
+    status TEXT,
+    error_rate REAL,
+    processing_delay REAL,
+    throughput REAL,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS processed_files (
+    checksum TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size_bytes INTEGER,
+    batch_id TEXT,
+    processed_at TEXT,
+    status TEXT
+);
+"""
+
+# Failed checks that make a listing unusable (stored invalid whatever its score); every other failed check is a warning
+ERROR_CHECKS = {'url_malformed', 'price_out_of_range', 'size_out_of_range', 'listed_date_future'}
+
+# Keys of wrapper documents whose array holds the listings
+RECORD_KEYS = ('properties', 'listings', 'results')
+
+DEGRADED_ERROR_RATE = 0.02
+UNHEALTHY_ERROR_RATE = 0.10
+DEGRADED_DELAY_SECONDS = 3600
+
+
+@dataclass
+class PipelineConfig:
+    """Drop-folder ingestion settings"""
+    input_directory: str = 'data/incoming'
+    output_directory: str = 'data/processed/pipeline'
+    batch_size: int = 1000
+    max_workers: int = 4
+    db_path: str = 'production.db'
+    file_patterns: Tuple[str, ...] = ('*.json', '*.ndjson', '*.jsonl')
+    poll_interval: float = 5.0    # Seconds between directory scans in run()
+    settle_seconds: float = 2.0   # Files modified more recently are still being written (run() only)
+    validator_config_path: str = str(VALIDATOR_CONFIG_PATH)
+
+
+@dataclass
+class ProcessingResult:
+    """Outcome of ingesting one file (one processing_batches row)"""
+    batch_id: str
+    source_file: str
+    processed_count: int = 0
+    valid_count: int = 0
+    invalid_count: int = 0
+    error_count: int = 0
+    processing_time: float = 0.0
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    status: str = 'processing'
+    errors: List[str] = field(default_factory=list)
+
+
+# ----------------------------------------------------------------------
+# Streaming parsers
+# ----------------------------------------------------------------------
+
+class _JSONStream:
+    """Incremental reader over one JSON document, decoding values as the buffer fills"""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, handle, read_size: int = 1 << 16):
+        self.handle = handle
+        self.read_size = read_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        data = self.handle.read(self.read_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, allowed: str) -> str:
+        char = self.peek()
+        if not char or char not in allowed:
+            raise ValueError(f"Expected one of {allowed!r}, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may continue in the next read
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',]') == ']':
+                return
+
+
+def iter_json_records(path: Union[str, Path]) -> Iterator[Any]:
+    """Stream the listings of a JSON array or of a wrapper document's properties array"""
+    with open(path, 'r', encoding='utf-8') as handle:
+        stream = _JSONStream(handle)
+        first = stream.peek()
+        if first == '[':
+            yield from stream.array_items()
+        elif first == '{':
+            stream.expect('{')
+            while stream.peek() != '}':
+                key = stream.value()
+                stream.expect(':')
+                if key in RECORD_KEYS and stream.peek() == '[':
+                    yield from stream.array_items()
+                else:
+                    stream.value()  # Metadata and summaries
+                if stream.expect(',}') == '}':
+                    break
+        elif first:
+            raise ValueError(f"Unsupported JSON document in {path}")
+
+
+def iter_ndjson_records(path: Union[str, Path], errors: List[str]) -> Iterator[Any]:
+    """Stream NDJSON lines; malformed lines are recorded in errors and skipped"""
+    with open(path, 'r', encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                errors.append(f"line {line_number}: {e.msg}")
+
+
+def file_checksum(path: Union[str, Path], block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Worker processes
+# ----------------------------------------------------------------------
+
+_worker_state = {}
+
+
+def _init_pipeline_worker(validator_config_path: str):
+    """Build the validator once per worker process"""
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_state['validator'] = PropertyValidator(validator_config_path, audit=False)
+
+
+def _validate_chunk(records: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """Validate one chunk, returning (property ids, packed scores, failed-check bitmasks, check names)"""
+    batch = _worker_state['validator'].validate_batch(records)
+    values, masks, check_names = pack_results(batch)
+    return batch.property_id, values, masks, check_names
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+class ProductionPipeline:
+    """Checksum-deduplicated, streaming drop-folder ingestor into production.db"""
+
+    def __init__(self, config: Optional[PipelineConfig] = None):
+        self.config = config if config is not None else PipelineConfig()
+        self.input_directory = Path(self.config.input_directory)
+        self.output_directory = Path(self.config.output_directory)
+        self.input_directory.mkdir(parents=True, exist_ok=True)
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self.config.db_path, timeout=30, isolation_level=None)
+        if self.config.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(PIPELINE_SCHEMA)
+        columns = {row[1] for row in self._connection.execute('PRAGMA table_info(processed_files)')}
+        if 'status' not in columns:  # Databases created before failed files were recorded
+            self._connection.execute('ALTER TABLE processed_files ADD COLUMN status TEXT')
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._validator: Optional[PropertyValidator] = None
+        self._issue_json: Dict[Tuple[int, Tuple[str, ...]], Tuple[str, str]] = {}
+        self._running = False
+        self.stats = {'files_processed': 0, 'files_skipped': 0, 'files_failed': 0, 'total_processed': 0,
+                      'total_valid': 0, 'total_errors': 0, 'processing_seconds': 0.0, 'started_at': time.time()}
+
+    # ------------------------------------------------------------------
+    # Directory scanning
+    # ------------------------------------------------------------------
+
+    def pending_files(self, settle_seconds: float = 0.0) -> List[Path]:
+        """Input files, oldest first, that have not been modified for settle_seconds"""
+        cutoff = time.time() - settle_seconds
+        files = {path for pattern in self.config.file_patterns for path in self.input_directory.glob(pattern)}
+        return sorted((path for path in files if path.is_file() and path.stat().st_mtime <= cutoff),
+                      key=lambda path: path.stat().st_mtime)
+
+    def process_directory(self, settle_seconds: float = 0.0) -> List[ProcessingResult]:
+        """
+        Ingest every input file not seen before (by checksum).
+
+        Args:
+            settle_seconds: Skip files modified more recently than this (still being written)
+
+        Returns:
+            List[ProcessingResult]: One result per newly ingested file
+        """
+        results = []
+        for path in self.pending_files(settle_seconds):
+            result = self.process_file(path)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def run(self, max_cycles: Optional[int] = None):
+        """Watch the input directory, ingesting new files until stop() or max_cycles scans"""
+        self._running = True
+        cycles = 0
+        logger.info(f"👀 Watching {self.input_directory} every {self.config.poll_interval:.0f}s")
+        try:
+            while self._running and (max_cycles is None or cycles < max_cycles):
+                self.process_directory(self.config.settle_seconds)
+                cycles += 1
+                if max_cycles is None or cycles < max_cycles:
+                    time.sleep(self.config.poll_interval)
+        except KeyboardInterrupt:
+            logger.info("⏹️ Pipeline watch interrupted")
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # File ingestion
+    # ------------------------------------------------------------------
+
+    def process_file(self, path: Union[str, Path]) -> Optional[ProcessingResult]:
+        """Stream one file through validation into property_results; None when it was ingested before"""
+        path = Path(path)
+        checksum = file_checksum(path)
+        seen = self._connection.execute('SELECT batch_id, status FROM processed_files WHERE checksum = ?',
+                                        (checksum,)).fetchone()
+        if seen:
+            # Failed files are skipped too until their content (and so their checksum) changes
+            self.stats['files_skipped'] += 1
+            logger.debug(f"⏭️ {path.name} already seen as {seen[0]} ({seen[1] or 'completed'})")
+            return None
+
+        start_time = time.time()
+        file_mtime = path.stat().st_mtime
+        result = ProcessingResult(batch_id=f"{path.stem}_{checksum[:12]}", source_file=str(path))
+        self._write_batch(result)
+        logger.info(f"📥 Ingesting {path.name} as {result.batch_id}")
+
+        in_flight = deque()
+        max_in_flight = max(self.config.max_workers, 1) * 2  # Bounded read-ahead keeps memory flat on huge files
+        try:
+            for chunk in self._chunks(path, result):
+                in_flight.append(self._submit(chunk))
+                while len(in_flight) >= max_in_flight:
+                    self._store(in_flight.popleft(), result)
+            while in_flight:
+                self._store(in_flight.popleft(), result)
+            result.status = 'completed' if not result.error_count else 'completed_with_errors'
+        except Exception as e:
+            for pending in in_flight:
+                pending.cancel()
+            result.status = 'failed'
+            result.errors.append(f"{type(e).__name__}: {e}")
+            result.error_count += 1
+            logger.error(f"❌ Ingestion of {path.name} failed: {e}")
+
+        result.processing_time = time.time() - start_time
+        result.timestamp = datetime.now().isoformat()
+        self._write_batch(result)
+        self._connection.execute(
+            'INSERT OR REPLACE INTO processed_files (checksum, path, size_bytes, batch_id, processed_at, status) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (checksum, str(path), path.stat().st_size, result.batch_id, result.timestamp, result.status)
+        )
+        self._record_file_stats(result, processing_delay=time.time() - file_mtime)
+
+        with open(self.output_directory / f"{result.batch_id}.json", 'w', encoding='utf-8') as f:
+            json.dump(asdict(result), f, indent=2, ensure_ascii=False)
+
+        logger.info(f"✅ {path.name}: {result.valid_count}/{result.processed_count} valid, "
+                    f"{result.error_count} errors in {result.processing_time:.2f}s")
+        return result
+
+    def _chunks(self, path: Path, result: ProcessingResult) -> Iterator[List[Dict]]:
+        """batch_size chunks of listing dicts; unparseable lines and non-object items count as errors"""
+        parse_errors: List[str] = []
+        records = iter_ndjson_records(path, parse_errors) if path.suffix in ('.ndjson', '.jsonl') \
+            else iter_json_records(path)
+
+        chunk = []
+        for record in records:
+            if isinstance(record, dict):
+                chunk.append(record)
+            else:
+                parse_errors.append(f"non-object item: {str(record)[:50]}")
+            if parse_errors:
+                self._count_parse_errors(parse_errors, result)
+            if len(chunk) >= self.config.batch_size:
+                yield chunk
+                chunk = []
+        self._count_parse_errors(parse_errors, result)
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _count_parse_errors(parse_errors: List[str], result: ProcessingResult, keep: int = 10):
+        """Count parse errors, keeping the first few messages for the batch summary"""
+        result.error_count += len(parse_errors)
+        result.errors.extend(parse_errors[:max(keep - len(result.errors), 0)])
+        parse_errors.clear()
+
+    def _submit(self, chunk: List[Dict]) -> Future:
+        """Chunk to the worker pool, or validated inline when max_workers <= 1"""
+        if self.config.max_workers <= 1:
+            if self._validator is None:
+                self._validator = PropertyValidator(self.config.validator_config_path, audit=False)
+            batch = self._validator.validate_batch(chunk)
+            future = Future()
+            future.set_result((batch.property_id, *pack_results(batch)))
+            return future
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.config.max_workers,
+                                                 initializer=_init_pipeline_worker,
+                                                 initargs=(self.config.validator_config_path,))
+        return self._executor.submit(_validate_chunk, chunk)
+
+    def _store(self, pending: Future, result: ProcessingResult):
+        """Write one validated chunk to property_results in a single transaction"""
+        property_ids, values, masks, check_names = pending.result()
+        n_rows = len(property_ids)
+        if not n_rows:
+            return
+
+        # Listings without an id get a stable one from their batch position
+        offset = result.processed_count
+        property_ids = np.asarray(property_ids, dtype=object)
+        missing = np.flatnonzero(property_ids == '')
+        property_ids[missing] = [f"{result.batch_id}:{offset + row}" for row in missing]
+
+        # Issue lists are rendered once per distinct failed-check combination
+        unique_masks, mask_codes = np.unique(masks, return_inverse=True)
+        rendered = [self._render_issues(int(mask), tuple(check_names)) for mask in unique_masks]
+        errors = np.array([errors for errors, _ in rendered], dtype=object)[mask_codes]
+        warnings = np.array([warnings for _, warnings in rendered], dtype=object)[mask_codes]
+
+        error_bits = sum(1 << bit for bit, name in enumerate(check_names) if name in ERROR_CHECKS)
+        is_valid = values[:, -1].astype(bool) & ((masks & np.uint64(error_bits)) == 0)
+        timestamp = datetime.now().isoformat()
+        rows = zip(property_ids.tolist(), [result.batch_id] * n_rows, is_valid.tolist(),
+                   values[:, -2].round(2).tolist(), errors.tolist(), warnings.tolist(), [timestamp] * n_rows)
+
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO property_results '
+                '(property_id, batch_id, is_valid, total_score, errors, warnings, timestamp) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self._connection.execute('COMMIT')
+        except Exception:
+            self._connection.execute('ROLLBACK')
+            raise
+
+        valid = int(is_valid.sum())
+        result.processed_count += n_rows
+        result.valid_count += valid
+        result.invalid_count += n_rows - valid
+
+    def _render_issues(self, mask: int, check_names: Tuple[str, ...]) -> Tuple[str, str]:
+        key = (mask, check_names)
+        if key not in self._issue_json:
+            failed = [name for bit, name in enumerate(check_names) if mask >> bit & 1]
+            self._issue_json[key] = (json.dumps([name for name in failed if name in ERROR_CHECKS]),
+                                     json.dumps([name for name in failed if name not in ERROR_CHECKS]))
+        return self._issue_json[key]
+
+    def _write_batch(self, result: ProcessingResult):
+        self._connection.execute(
+            'INSERT OR REPLACE INTO processing_batches (batch_id, processed_count, valid_count, invalid_count, '
+            'error_count, processing_time, timestamp, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (result.batch_id, result.processed_count, result.valid_count, result.invalid_count,
+             result.error_count, result.processing_time, result.timestamp, result.status)
+        )
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    def _record_file_stats(self, result: ProcessingResult, processing_delay: float):
+        """Fold a file into the session totals and write a pipeline_health sample"""
+        self.stats['files_processed' if result.status != 'failed' else 'files_failed'] += 1
+        self.stats['total_processed'] += result.processed_count
+        self.stats['total_valid'] += result.valid_count
+        self.stats['total_errors'] += result.error_count
+        self.stats['processing_seconds'] += result.processing_time
+
+        attempted = result.processed_count + result.error_count
+        error_rate = result.error_count / attempted if attempted else 0.0
+        throughput = result.processed_count / result.processing_time if result.processing_time > 0 else 0.0
+        status = self._status(error_rate, processing_delay, failed=result.status == 'failed')
+        self._connection.execute(
+            'INSERT OR REPLACE INTO pipeline_health (timestamp, status, error_rate, processing_delay, throughput, '
+            'message) VALUES (?, ?, ?, ?, ?, ?)',
+            (datetime.now().isoformat(), status, error_rate, processing_delay, throughput,
+             f"{result.batch_id}: {result.processed_count} processed, {result.error_count} errors ({result.status})")
+        )
+
+    @staticmethod
+    def _status(error_rate: float, processing_delay: float, failed: bool = False) -> str:
+        if failed or error_rate >= UNHEALTHY_ERROR_RATE:
+            return 'unhealthy'
+        if error_rate >= DEGRADED_ERROR_RATE or processing_delay >= DEGRADED_DELAY_SECONDS:
+            return 'degraded'
+        return 'healthy'
+
+    def get_health_status(self) -> Dict[str, Any]:
+        """Session totals, error rate and throughput, with the latest pipeline_health sample"""
+        total = self.stats['total_processed']
+        attempted = total + self.stats['total_errors']
+        error_rate = self.stats['total_errors'] / attempted if attempted else 0.0
+        seconds = self.stats['processing_seconds']
+        latest = self._connection.execute(
+            'SELECT timestamp, status, error_rate, processing_delay, throughput, message '
+            'FROM pipeline_health ORDER BY timestamp DESC LIMIT 1'
+        ).fetchone()
+        status = self._status(error_rate, latest[3] if latest else 0.0)
+        if status == 'healthy' and self.stats['files_failed']:
+            status = 'degraded'
+        return {
+            'status': status,
+            'total_processed': total,
+            'total_valid': self.stats['total_valid'],
+            'total_errors': self.stats['total_errors'],
+            'error_rate': error_rate,
+            'throughput_per_hour': total / seconds * 3600 if seconds > 0 else 0.0,
+            'files_processed': self.stats['files_processed'],
+            'files_skipped': self.stats['files_skipped'],
+            'files_failed': self.stats['files_failed'],
+            'uptime_seconds': time.time() - self.stats['started_at'],
+            'last_sample': dict(zip(('timestamp', 'status', 'error_rate', 'processing_delay', 'throughput',
+                                     'message'), latest)) if latest else None,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._validator is not None:
+            self._validator.close()
+        self._connection.close()
+
+
+def main():
+    """Example: ingest a JSON document and an NDJSON file, then re-scan (both skipped by checksum)"""
+    import tempfile
+
+    logging.basicConfig(level=logging.INFO)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = PipelineConfig(input_directory=f'{temp_dir}/incoming', output_directory=f'{temp_dir}/processed',
+                                db_path=f'{temp_dir}/production.db', batch_size=500, max_workers=2)
+        pipeline = ProductionPipeline(config)
+
+        listed = datetime.now().isoformat()
+        listings = [{'id': f'listing_{i:05d}', 'url': f'https://www.spitogatos.gr/en/property/{1117000000 + i}',
+                     'price': 150000 + i * 50, 'size': 60 + i % 80, 'rooms': 1 + i % 4,
+                     'location': ['Kolonaki', 'Exarchia', 'Glyfada'][i % 3], 'listed_date': listed}
+                    for i in range(3000)]
+        with open(Path(config.input_directory) / 'spitogatos_batch.json', 'w', encoding='utf-8') as f:
+            json.dump({'metadata': {'source': 'spitogatos'}, 'properties': listings[:2000]}, f)
+        with open(Path(config.input_directory) / 'xe_batch.ndjson', 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(listing) + '\n' for listing in listings[2000:])
+            f.write('{"truncated": \n')
+
+        for result in pipeline.process_directory():
+            print(f"{result.batch_id}: {result.valid_count}/{result.processed_count} valid, "
+                  f"{result.error_count} errors, {result.processing_time:.2f}s")
+        print(f"Re-scan ingested {len(pipeline.process_directory())} files")
+        print(json.dumps(pipeline.get_health_status(), indent=2))
+        pipeline.shutdown()
+
+
+if __name__ == "__main__":
+    main()
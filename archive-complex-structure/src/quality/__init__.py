@@ -0,0 +1,12 @@
+"""
+Quality Module - Streaming Data Quality Monitoring
+
+Constant-memory quality statistics, drift detection and alerting for collected listings.
+"""
+
+from .data_quality_monitor import (
+    DataQualityMonitor, QualityAlert, QualityMetric, QualityProfile, QualityScore, shared_monitor
+)
+
+__all__ = ['DataQualityMonitor', 'QualityAlert', 'QualityMetric', 'QualityProfile', 'QualityScore',
+           'shared_monitor']
@@ -0,0 +1,1144 @@
+#!/usr/bin/env python3
+"""
+📊 Data Quality Monitor - Streaming Quality Statistics and Drift Alerts
+
+Keeps constant-size running statistics instead of re-loading every output file:
+- Per (source, neighborhood) segment: Welford mean/variance and mergeable log-bucket quantile
+  sketches for price, size and price/m², field completeness, duplicate, validity, staleness,
+  energy-class and synthetic-pattern counts
+- Records are folded in one at a time (observe), e.g. straight from a collector's ResultStream
+- Each segment closes a window every window_size records and compares it with a decayed
+  baseline of earlier windows: median shifts, spread changes, completeness drops, duplicate
+  spikes and energy-class distribution shifts raise alerts, which resolve when later windows pass
+- Duplicates are tracked with Bloom filters of listing keys per dedup period (current and
+  previous), so a re-crawl in a later period is not a duplicate; no raw records are retained
+- Profiles, alerts and scores persist in SQLite so monitoring resumes across runs; processes
+  sharing the database merge their profiles, counters and filters instead of overwriting them
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from validators.property_validator import COLUMN_ALIASES, VALIDATOR_CONFIG_PATH, load_validator_config
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_DB_PATH = 'data/quality/quality_monitor.db'
+
+NUMERIC_FIELDS = ('price', 'size', 'price_per_sqm')
+REQUIRED_FIELDS = ('url', 'price', 'size', 'rooms', 'location', 'listed_date')
+SCORE_DIMENSIONS = ('completeness', 'accuracy', 'consistency', 'timeliness', 'validity', 'uniqueness')
+SEVERITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+# Same markers DataAuthenticityVerifier._detect_synthetic_patterns looks for
+SYNTHETIC_PRICES = {740.0, 3000.0, 100000.0, 250000.0, 500000.0, 1000000.0}
+SYNTHETIC_SQMS = {63.0, 270.0, 100.0, 150.0, 200.0}
+GENERIC_TITLE = re.compile(r'Property|Listing|Advertisement|Sample|Test|Example|Demo')
+
+DEFAULT_MONITOR_CONFIG = {
+    'window_size': 500,            # Records per segment window before it is compared with the baseline
+    'baseline_decay': 0.8,         # Weight kept by the baseline each time a window is folded in
+    'min_baseline_records': 200,   # Baseline size needed before drift is reported
+    'relative_accuracy': 0.01,     # Quantile sketch relative error
+    'dedup_period_hours': 1,       # Keys seen in the current or previous period count as duplicates
+    'dedup_capacity': 200_000,     # Listing keys per period each Bloom filter is sized for
+    'dedup_error_rate': 0.001,
+    'filter_save_seconds': 60,     # Minimum interval between writes of the duplicate filter
+    'outlier_z': 3.5,              # price/m² z-score counted as inconsistent within its segment
+    'price_per_sqm_range': [300, 25000],
+    'drift': {
+        'median_shift': 0.15,      # Relative median change of price, size or price/m²
+        'spread_ratio': 2.0,       # Window/baseline standard deviation ratio (either direction)
+        'completeness_drop': 0.10,
+        'duplicate_increase': 0.05,
+        'energy_shift': 0.25,      # Total variation distance of the energy-class distribution
+    },
+    'metrics': {                   # Score thresholds: [warning below, critical below]
+        'completeness': [0.90, 0.70],
+        'accuracy': [0.90, 0.75],
+        'consistency': [0.90, 0.75],
+        'timeliness': [0.80, 0.50],
+        'validity': [0.90, 0.75],
+        'uniqueness': [0.95, 0.85],
+    },
+    'weights': {'completeness': 0.2, 'accuracy': 0.2, 'consistency': 0.15,
+                'timeliness': 0.1, 'validity': 0.25, 'uniqueness': 0.1},
+}
+
+QUALITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quality_profiles (
+    segment TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS quality_state (
+    key TEXT PRIMARY KEY,
+    value BLOB
+);
+CREATE TABLE IF NOT EXISTS quality_alerts (
+    alert_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    alert_key TEXT NOT NULL,
+    segment TEXT,
+    metric TEXT,
+    severity TEXT,
+    message TEXT,
+    value REAL,
+    baseline REAL,
+    created_at TEXT,
+    last_seen TEXT,
+    resolved_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quality_alerts_active ON quality_alerts (alert_key, resolved_at);
+CREATE TABLE IF NOT EXISTS quality_scores (
+    score_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT,
+    scope TEXT,
+    record_count INTEGER,
+    overall_score REAL,
+    completeness_score REAL,
+    accuracy_score REAL,
+    consistency_score REAL,
+    timeliness_score REAL,
+    validity_score REAL,
+    uniqueness_score REAL
+);
+"""
+
+
+def load_monitor_config(config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH) -> Dict:
+    """Validator config with the quality_monitor section merged over the monitor defaults"""
+    config = load_validator_config(config_path)
+    monitor = {key: (dict(value) if isinstance(value, dict) else value) for key, value in DEFAULT_MONITOR_CONFIG.items()}
+    for key, value in config.get('quality_monitor', {}).items():
+        if isinstance(value, dict) and isinstance(monitor.get(key), dict):
+            monitor[key].update(value)
+        else:
+            monitor[key] = value
+    config['quality_monitor'] = monitor
+    return config
+
+
+# ----------------------------------------------------------------------
+# Streaming statistics
+# ----------------------------------------------------------------------
+
+class RunningStats:
+    """Welford mean/variance with min/max; weights allow decayed (fractional) counts"""
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: 'RunningStats'):
+        """Chan et al. pairwise combination"""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def scale(self, factor: float):
+        self.count *= factor
+        self.m2 *= factor
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self.variance, 0.0))
+
+    def z_score(self, value: float) -> float:
+        std = self.std
+        return abs(value - self.mean) / std if std > 0 else 0.0
+
+    def to_state(self) -> List[float]:
+        return [self.count, self.mean, self.m2, self.minimum, self.maximum]
+
+    @classmethod
+    def from_state(cls, state: List[float]) -> 'RunningStats':
+        stats = cls()
+        stats.count, stats.mean, stats.m2, stats.minimum, stats.maximum = state
+        return stats
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch with a fixed relative error.
+
+    Values fall into buckets whose bounds grow geometrically, so each update is
+    O(1), memory depends only on the value range, and two sketches merge exactly
+    by adding bucket counts — which lets windows fold into the baseline.
+    """
+
+    __slots__ = ('relative_accuracy', 'gamma', 'log_gamma', 'buckets', 'zero_count', 'count')
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, float] = {}
+        self.zero_count = 0.0
+        self.count = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0.0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        rank = q * self.count
+        seen = self.zero_count
+        if seen >= rank and seen > 0:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1) if self.buckets else 0.0
+
+    def merge(self, other: 'QuantileSketch'):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0.0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def scale(self, factor: float):
+        self.buckets = {key: count * factor for key, count in self.buckets.items() if count * factor >= 1e-3}
+        self.zero_count *= factor
+        self.count = self.zero_count + sum(self.buckets.values())
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'accuracy': self.relative_accuracy, 'zero': self.zero_count,
+                'buckets': {str(key): count for key, count in self.buckets.items()}}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'QuantileSketch':
+        sketch = cls(state['accuracy'])
+        sketch.buckets = {int(key): count for key, count in state['buckets'].items()}
+        sketch.zero_count = state['zero']
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
+
+
+class BloomFilter:
+    """Fixed-size set membership for listing keys (false positives at error_rate, no false negatives)"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001, bits: Optional[bytearray] = None):
+        self.num_bits = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bits if bits is not None and len(bits) == (self.num_bits + 7) // 8 \
+            else bytearray((self.num_bits + 7) // 8)
+
+    def add(self, key: str) -> bool:
+        """Add a key, returning True when it was (probably) present already"""
+        present = True
+        for byte, mask in self._positions(key):
+            if not self.bits[byte] & mask:
+                present = False
+                self.bits[byte] |= mask
+        return present
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[byte] & mask for byte, mask in self._positions(key))
+
+    def union(self, bits: bytes):
+        """OR in another filter's bits (same capacity and error rate), e.g. one saved by another process"""
+        if len(bits) == len(self.bits):
+            self.bits = bytearray((int.from_bytes(self.bits, 'little') | int.from_bytes(bits, 'little'))
+                                  .to_bytes(len(self.bits), 'little'))
+
+    def _positions(self, key: str) -> Iterable[Tuple[int, int]]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) % self.num_bits
+            yield bit >> 3, 1 << (bit & 7)
+
+
+@dataclass
+class RecordFeatures:
+    """Quality-relevant facts extracted from one listing"""
+    source: str
+    location: str
+    key: Optional[str]
+    values: Dict[str, float]
+    present: Dict[str, bool]
+    invalid: List[str]
+    inaccurate: bool
+    stale: Optional[bool]        # None when the listing carries no date
+    energy_class: Optional[str]
+    synthetic: List[str]
+    declared_price_per_sqm: Optional[float] = None
+
+
+class QualityProfile:
+    """Constant-size quality statistics for a stream of listings"""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.records = 0.0
+        self.numeric = {name: RunningStats() for name in NUMERIC_FIELDS}
+        self.sketches = {name: QuantileSketch(relative_accuracy) for name in NUMERIC_FIELDS}
+        self.present = {name: 0.0 for name in REQUIRED_FIELDS}
+        self.counts = {'duplicates': 0.0, 'invalid': 0.0, 'inaccurate': 0.0, 'inconsistent': 0.0,
+                       'dated': 0.0, 'stale': 0.0}
+        self.invalid_checks: Dict[str, float] = {}
+        self.energy_classes: Dict[str, float] = {}
+        self.synthetic: Dict[str, float] = {}
+
+    def add(self, features: RecordFeatures, duplicate: bool, inconsistent: bool):
+        self.records += 1
+        for name, value in features.values.items():
+            self.numeric[name].update(value)
+            self.sketches[name].add(value)
+        for name, present in features.present.items():
+            if present:
+                self.present[name] += 1
+        self.counts['duplicates'] += duplicate
+        self.counts['invalid'] += bool(features.invalid)
+        self.counts['inaccurate'] += features.inaccurate
+        self.counts['inconsistent'] += inconsistent
+        if features.stale is not None:
+            self.counts['dated'] += 1
+            self.counts['stale'] += features.stale
+        for check in features.invalid:
+            self.invalid_checks[check] = self.invalid_checks.get(check, 0.0) + 1
+        if features.energy_class:
+            self.energy_classes[features.energy_class] = self.energy_classes.get(features.energy_class, 0.0) + 1
+        for pattern in features.synthetic:
+            self.synthetic[pattern] = self.synthetic.get(pattern, 0.0) + 1
+
+    def merge(self, other: 'QualityProfile'):
+        self.records += other.records
+        for name in NUMERIC_FIELDS:
+            self.numeric[name].merge(other.numeric[name])
+            self.sketches[name].merge(other.sketches[name])
+        for target, source in ((self.present, other.present), (self.counts, other.counts),
+                               (self.invalid_checks, other.invalid_checks),
+                               (self.energy_classes, other.energy_classes), (self.synthetic, other.synthetic)):
+            for key, value in source.items():
+                target[key] = target.get(key, 0.0) + value
+
+    def scale(self, factor: float):
+        """Down-weight everything observed so far (older windows fade out of the baseline)"""
+        self.records *= factor
+        for name in NUMERIC_FIELDS:
+            self.numeric[name].scale(factor)
+            self.sketches[name].scale(factor)
+        for counter in (self.present, self.counts, self.invalid_checks, self.energy_classes, self.synthetic):
+            for key in counter:
+                counter[key] *= factor
+
+    # Rates -------------------------------------------------------------
+
+    def rate(self, count: float) -> float:
+        return count / self.records if self.records else 0.0
+
+    def completeness(self, name: Optional[str] = None) -> float:
+        if name is not None:
+            return self.rate(self.present[name])
+        return sum(self.rate(count) for count in self.present.values()) / len(self.present)
+
+    def duplicate_rate(self) -> float:
+        return self.rate(self.counts['duplicates'])
+
+    def energy_distribution(self) -> Dict[str, float]:
+        total = sum(self.energy_classes.values())
+        return {name: count / total for name, count in self.energy_classes.items()} if total else {}
+
+    def median(self, name: str) -> Optional[float]:
+        return self.sketches[name].quantile(0.5)
+
+    def scores(self) -> Dict[str, float]:
+        """0-1 score per quality dimension"""
+        dated = self.counts['dated']
+        return {
+            'completeness': self.completeness(),
+            'accuracy': 1 - self.rate(self.counts['inaccurate']),
+            'consistency': 1 - self.rate(self.counts['inconsistent']),
+            'timeliness': 1 - self.counts['stale'] / dated if dated else 1.0,
+            'validity': 1 - self.rate(self.counts['invalid']),
+            'uniqueness': 1 - self.duplicate_rate(),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'records': round(self.records, 1),
+            'scores': {name: round(value, 4) for name, value in self.scores().items()},
+            'median': {name: self.median(name) for name in NUMERIC_FIELDS},
+            'mean': {name: self.numeric[name].mean if self.numeric[name].count else None for name in NUMERIC_FIELDS},
+            'std': {name: self.numeric[name].std for name in NUMERIC_FIELDS},
+            'duplicate_rate': self.duplicate_rate(),
+            'energy_classes': self.energy_distribution(),
+            'invalid_checks': dict(self.invalid_checks),
+            'synthetic_patterns': dict(self.synthetic),
+        }
+
+    # Persistence ---------------------------------------------------------
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'accuracy': self.relative_accuracy,
+            'records': self.records,
+            'numeric': {name: stats.to_state() for name, stats in self.numeric.items()},
+            'sketches': {name: sketch.to_state() for name, sketch in self.sketches.items()},
+            'present': self.present,
+            'counts': self.counts,
+            'invalid_checks': self.invalid_checks,
+            'energy_classes': self.energy_classes,
+            'synthetic': self.synthetic,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'QualityProfile':
+        profile = cls(state['accuracy'])
+        profile.records = state['records']
+        profile.numeric = {name: RunningStats.from_state(value) for name, value in state['numeric'].items()}
+        profile.sketches = {name: QuantileSketch.from_state(value) for name, value in state['sketches'].items()}
+        profile.present.update(state['present'])
+        profile.counts.update(state['counts'])
+        profile.invalid_checks = dict(state['invalid_checks'])
+        profile.energy_classes = dict(state['energy_classes'])
+        profile.synthetic = dict(state['synthetic'])
+        return profile
+
+
+@dataclass
+class QualityMetric:
+    """One scored quality dimension"""
+    name: str
+    value: float
+    threshold_warning: float
+    threshold_critical: float
+    status: str
+    message: str
+
+
+@dataclass
+class QualityScore:
+    """Quality assessment of a dataset"""
+    overall_score: float
+    completeness_score: float
+    accuracy_score: float
+    consistency_score: float
+    timeliness_score: float
+    validity_score: float
+    uniqueness_score: float
+    record_count: int
+    metrics: List[QualityMetric] = field(default_factory=list)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class QualityAlert:
+    """Quality alert raised by an assessment or a segment drift check"""
+    alert_id: int
+    segment: str
+    metric: str
+    severity: str
+    message: str
+    value: Optional[float]
+    baseline: Optional[float]
+    created_at: str
+    last_seen: str
+    resolved_at: Optional[str] = None
+
+
+class _Segment:
+    """Baseline and current window of one (source, neighborhood)"""
+
+    __slots__ = ('baseline', 'window', 'windows_closed')
+
+    def __init__(self, baseline: QualityProfile, window: QualityProfile, windows_closed: int = 0):
+        self.baseline = baseline
+        self.window = window
+        self.windows_closed = windows_closed
+
+    def to_state(self, revision: int) -> Dict[str, Any]:
+        return {'baseline': self.baseline.to_state(), 'window': self.window.to_state(),
+                'windows_closed': self.windows_closed, 'revision': revision}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> '_Segment':
+        return cls(QualityProfile.from_state(state['baseline']), QualityProfile.from_state(state['window']),
+                   state['windows_closed'])
+
+
+# ----------------------------------------------------------------------
+# Monitor
+# ----------------------------------------------------------------------
+
+class DataQualityMonitor:
+    """Streaming quality statistics per source and neighborhood with drift alerts"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH,
+                 config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH):
+        """
+        Args:
+            db_path: SQLite file for profiles, alerts and scores (relative paths are under the project root)
+            config_path: Validator YAML (thresholds, valid_domains and the quality_monitor section)
+        """
+        config = load_monitor_config(config_path)
+        self.thresholds = config['thresholds']
+        self.valid_domains = [domain.lower() for domain in config['valid_domains']]
+        self.settings = config['quality_monitor']
+        self.window_size = int(self.settings['window_size'])
+        db_path = Path(db_path)
+        self.db_path = str(db_path if db_path.is_absolute() or str(db_path) == ':memory:' else PROJECT_ROOT / db_path)
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(QUALITY_SCHEMA)
+
+        self._segments: Dict[Tuple[str, str], _Segment] = {}
+        self._dirty = set()
+        # Records observed here since each segment was last saved, and the stored revision it was based on
+        self._pending: Dict[Tuple[str, str], QualityProfile] = {}
+        self._revisions: Dict[Tuple[str, str], int] = {}
+        self._dedup_period = self.settings['dedup_period_hours'] * 3600
+        self._period = int(time.time() // self._dedup_period)
+        self._seen = self._new_filter()
+        self._seen_previous = self._new_filter()
+        self.records_observed = 0
+        self._unsaved_records = 0
+        self._filter_saved_at = time.time()
+        self._load_state()
+
+    # ------------------------------------------------------------------
+    # Feature extraction
+    # ------------------------------------------------------------------
+
+    def extract(self, record: Dict[str, Any], source: Optional[str] = None) -> RecordFeatures:
+        """Quality facts of one listing, using the validator's column aliases and thresholds"""
+        def first(column: str) -> Any:
+            for name in COLUMN_ALIASES[column]:
+                value = record.get(name)
+                if value not in (None, ''):
+                    return value
+            return None
+
+        t = self.thresholds
+        url = first('url')
+        url = str(url) if url is not None else None
+        location = first('location')
+        present = {name: first(name) is not None for name in REQUIRED_FIELDS}
+
+        values: Dict[str, float] = {}
+        for name in ('price', 'size'):
+            number = _number(first(name))
+            if number is not None:
+                values[name] = number
+        declared = _number(record.get('price_per_sqm'))
+        if values.get('price', 0) > 0 and values.get('size', 0) > 0:
+            values['price_per_sqm'] = values['price'] / values['size']
+        elif declared is not None:
+            values['price_per_sqm'] = declared
+
+        invalid = []
+        host = _host(url)
+        if url is not None and not host:
+            invalid.append('url_malformed')
+        if 'price' in values and not t['price_min'] <= values['price'] <= t['price_max']:
+            invalid.append('price_out_of_range')
+        if 'size' in values and not t['size_min'] <= values['size'] <= t['size_max']:
+            invalid.append('size_out_of_range')
+        rooms = _number(first('rooms'))
+        if rooms is not None and not t['rooms_min'] <= rooms <= t['rooms_max']:
+            invalid.append('rooms_out_of_range')
+
+        low, high = self.settings['price_per_sqm_range']
+        known_domain = bool(host) and any(host == d or host.endswith('.' + d) for d in self.valid_domains)
+        inaccurate = not known_domain or ('price_per_sqm' in values and not low <= values['price_per_sqm'] <= high)
+
+        listed = _timestamp(first('listed_date'))
+        stale = None
+        if listed is not None:
+            now = datetime.now(listed.tzinfo)
+            stale = listed > now + timedelta(days=1) or now - listed > timedelta(days=t['listing_age_days'])
+
+        energy_class = record.get('energy_class')
+        energy_class = str(energy_class).strip().upper() if energy_class else None
+
+        synthetic = []
+        if values.get('price') in SYNTHETIC_PRICES:
+            synthetic.append('synthetic_price')
+        if values.get('size') in SYNTHETIC_SQMS:
+            synthetic.append('synthetic_sqm')
+        if values.get('price', 0) > 50000 and values['price'] % 10000 == 0:
+            synthetic.append('round_price')
+        if GENERIC_TITLE.search(str(record.get('title') or '')):
+            synthetic.append('generic_title')
+
+        key = url if host else first('id') or url
+        return RecordFeatures(
+            source=str(source or record.get('source') or 'unknown'),
+            location=str(location or 'unknown'),
+            key=str(key) if key is not None else None,
+            values=values,
+            present=present,
+            invalid=invalid,
+            inaccurate=inaccurate,
+            stale=stale,
+            energy_class=energy_class,
+            synthetic=synthetic,
+            declared_price_per_sqm=declared,
+        )
+
+    def _inconsistent(self, features: RecordFeatures, segment: _Segment) -> bool:
+        """price/m² disagreeing with price/size, or an outlier against the segment's history"""
+        ppsqm = features.values.get('price_per_sqm')
+        if ppsqm is None:
+            return False
+        if features.declared_price_per_sqm and 'size' in features.values:
+            if abs(features.declared_price_per_sqm - ppsqm) > 0.05 * ppsqm:
+                return True
+        history = RunningStats()
+        history.merge(segment.baseline.numeric['price_per_sqm'])
+        history.merge(segment.window.numeric['price_per_sqm'])
+        return history.count >= 30 and history.z_score(ppsqm) > self.settings['outlier_z']
+
+    # ------------------------------------------------------------------
+    # Streaming updates
+    # ------------------------------------------------------------------
+
+    def observe(self, record: Dict[str, Any], source: Optional[str] = None) -> List[QualityAlert]:
+        """
+        Fold one listing into its segment; O(1) apart from the periodic window check.
+
+        Args:
+            record: Listing dict as written by a collector
+            source: Collector or site name (defaults to the record's "source")
+
+        Returns:
+            List[QualityAlert]: Alerts raised when this record closed its segment's window
+        """
+        features = self.extract(record, source)
+        with self._lock:
+            return self._observe_features(features, self._duplicate(features.key))
+
+    def observe_many(self, records: Iterable[Dict[str, Any]], source: Optional[str] = None) -> List[QualityAlert]:
+        alerts = []
+        for record in records:
+            alerts.extend(self.observe(record, source))
+        return alerts
+
+    def listener(self, source: str):
+        """Callback for ResultStream.add_listener feeding this monitor as a collector writes"""
+        return lambda record: self.observe(record, source)
+
+    def _observe_features(self, features: RecordFeatures, duplicate: bool) -> List[QualityAlert]:
+        key = (features.source, features.location)
+        segment = self._segment(*key)
+        inconsistent = self._inconsistent(features, segment)
+        segment.window.add(features, duplicate, inconsistent)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = QualityProfile(self.settings['relative_accuracy'])
+        pending.add(features, duplicate, inconsistent)
+        self.records_observed += 1
+        self._unsaved_records += 1
+        self._dirty.add(key)
+        if segment.window.records >= self.window_size:
+            return self._close_window(key, segment)
+        return []
+
+    def _duplicate(self, key: Optional[str]) -> bool:
+        """Whether the key was seen in the current or previous dedup period (later re-crawls are not duplicates)"""
+        if not key:
+            return False
+        period = int(time.time() // self._dedup_period)
+        if period != self._period:
+            self._seen_previous = self._seen if period == self._period + 1 else self._new_filter()
+            self._seen = self._new_filter()
+            self._period = period
+        return self._seen.add(key) or key in self._seen_previous
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter(self.settings['dedup_capacity'], self.settings['dedup_error_rate'])
+
+    def _segment(self, source: str, location: str) -> _Segment:
+        key = (source, location)
+        segment = self._segments.get(key)
+        if segment is None:
+            accuracy = self.settings['relative_accuracy']
+            segment = _Segment(QualityProfile(accuracy), QualityProfile(accuracy))
+            self._segments[key] = segment
+        return segment
+
+    def _close_window(self, key: Tuple[str, str], segment: _Segment) -> List[QualityAlert]:
+        """Compare the full window with the baseline, then fold it into the decayed baseline"""
+        name = f"{key[0]}/{key[1]}"
+        findings = []
+        if segment.baseline.records >= self.settings['min_baseline_records']:
+            findings = self._drift(segment.baseline, segment.window)
+        alerts = self._sync_alerts(name, findings, scope_prefix='drift:')
+
+        segment.baseline.scale(self.settings['baseline_decay'])
+        segment.baseline.merge(segment.window)
+        segment.window = QualityProfile(self.settings['relative_accuracy'])
+        segment.windows_closed += 1
+        # The duplicate filters are large; they are written at most every filter_save_seconds
+        save_filter = time.time() - self._filter_saved_at >= self.settings['filter_save_seconds']
+        self._save_state([key], save_filter=save_filter)
+        return alerts
+
+    def _drift(self, baseline: QualityProfile, window: QualityProfile) -> List[Tuple[str, str, str, float, float]]:
+        """(metric, severity, message, window value, baseline value) for each drifted statistic"""
+        drift = self.settings['drift']
+        findings = []
+
+        for name in NUMERIC_FIELDS:
+            if window.numeric[name].count < 10 or baseline.numeric[name].count < 10:
+                continue
+            current, reference = window.median(name), baseline.median(name)
+            if reference:
+                shift = (current - reference) / reference
+                if abs(shift) >= drift['median_shift']:
+                    severity = 'high' if abs(shift) >= 2 * drift['median_shift'] else 'medium'
+                    findings.append((f'drift:{name}_median', severity,
+                                     f"{name} median moved {shift:+.0%} ({reference:,.0f} → {current:,.0f})",
+                                     current, reference))
+            current_std, reference_std = window.numeric[name].std, baseline.numeric[name].std
+            if reference_std > 0 and current_std > 0:
+                ratio = current_std / reference_std
+                if ratio >= drift['spread_ratio'] or ratio <= 1 / drift['spread_ratio']:
+                    findings.append((f'drift:{name}_spread', 'low',
+                                     f"{name} spread changed ×{ratio:.2f} (σ {reference_std:,.0f} → {current_std:,.0f})",
+                                     current_std, reference_std))
+
+        for name in REQUIRED_FIELDS:
+            current, reference = window.completeness(name), baseline.completeness(name)
+            if reference - current >= drift['completeness_drop']:
+                severity = 'high' if reference - current >= 2 * drift['completeness_drop'] else 'medium'
+                findings.append((f'drift:{name}_completeness', severity,
+                                 f"{name} completeness fell {reference:.0%} → {current:.0%}", current, reference))
+
+        current, reference = window.duplicate_rate(), baseline.duplicate_rate()
+        if current - reference >= drift['duplicate_increase']:
+            findings.append(('drift:duplicate_rate', 'medium',
+                             f"duplicate rate rose {reference:.1%} → {current:.1%}", current, reference))
+
+        current_mix, reference_mix = window.energy_distribution(), baseline.energy_distribution()
+        if current_mix and reference_mix:
+            distance = 0.5 * sum(abs(current_mix.get(c, 0.0) - reference_mix.get(c, 0.0))
+                                 for c in set(current_mix) | set(reference_mix))
+            if distance >= drift['energy_shift']:
+                findings.append(('drift:energy_class', 'low',
+                                 f"energy-class mix shifted (total variation {distance:.2f})", distance, 0.0))
+        return findings
+
+    # ------------------------------------------------------------------
+    # Assessment
+    # ------------------------------------------------------------------
+
+    def assess_data_quality(self, records: List[Dict[str, Any]], source: Optional[str] = None,
+                            scope: str = 'assessment') -> QualityScore:
+        """
+        Score a dataset on six quality dimensions, feeding its records into the stream as well.
+
+        Args:
+            records: Listings to assess
+            source: Source name for the streaming segments
+            scope: Name the score and its alerts are stored under
+
+        Returns:
+            QualityScore: Overall and per-dimension scores (0-1) with per-metric status
+        """
+        profile = QualityProfile(self.settings['relative_accuracy'])
+        batch_keys = set()
+        with self._lock:
+            for record in records:
+                features = self.extract(record, source)
+                duplicate_in_batch = features.key is not None and features.key in batch_keys
+                if features.key is not None:
+                    batch_keys.add(features.key)
+                duplicate = self._duplicate(features.key)
+                segment = self._segment(features.source, features.location)
+                profile.add(features, duplicate_in_batch, self._inconsistent(features, segment))
+                self._observe_features(features, duplicate)
+
+        score = self._score(profile)
+        findings = [(f'quality:{metric.name}', 'critical' if metric.status == 'critical' else 'medium',
+                     f"{metric.name} {metric.message}", metric.value, metric.threshold_warning)
+                    for metric in score.metrics if metric.status != 'good']
+        self._sync_alerts(scope, findings, scope_prefix='quality:')
+        with self._lock:
+            self._connection.execute(
+                'INSERT INTO quality_scores (timestamp, scope, record_count, overall_score, completeness_score, '
+                'accuracy_score, consistency_score, timeliness_score, validity_score, uniqueness_score) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (score.timestamp, scope, score.record_count, score.overall_score, score.completeness_score,
+                 score.accuracy_score, score.consistency_score, score.timeliness_score, score.validity_score,
+                 score.uniqueness_score)
+            )
+        return score
+
+    def _score(self, profile: QualityProfile) -> QualityScore:
+        scores = profile.scores()
+        weights = self.settings['weights']
+        total_weight = sum(weights.get(name, 0.0) for name in SCORE_DIMENSIONS) or 1.0
+        overall = sum(scores[name] * weights.get(name, 0.0) for name in SCORE_DIMENSIONS) / total_weight
+
+        details = {
+            'completeness': f"{scores['completeness']:.1%} of required fields present",
+            'accuracy': f"{profile.counts['inaccurate']:.0f} listings off known domains or outside the price/m² band",
+            'consistency': f"{profile.counts['inconsistent']:.0f} price/m² values inconsistent or outlying",
+            'timeliness': (f"{profile.counts['stale']:.0f}/{profile.counts['dated']:.0f} dated listings stale"
+                           if profile.counts['dated'] else "no dated listings"),
+            'validity': f"{profile.counts['invalid']:.0f} listings failed range checks "
+                        f"({', '.join(sorted(profile.invalid_checks)) or 'none'})",
+            'uniqueness': f"{profile.counts['duplicates']:.0f} duplicate listings",
+        }
+        metrics = []
+        for name in SCORE_DIMENSIONS:
+            warning, critical = self.settings['metrics'][name]
+            value = scores[name]
+            status = 'good' if value >= warning else 'warning' if value >= critical else 'critical'
+            metrics.append(QualityMetric(name, value, warning, critical, status, f"{value:.1%} - {details[name]}"))
+
+        return QualityScore(
+            overall_score=overall,
+            completeness_score=scores['completeness'],
+            accuracy_score=scores['accuracy'],
+            consistency_score=scores['consistency'],
+            timeliness_score=scores['timeliness'],
+            validity_score=scores['validity'],
+            uniqueness_score=scores['uniqueness'],
+            record_count=int(profile.records),
+            metrics=metrics,
+        )
+
+    # ------------------------------------------------------------------
+    # Alerts
+    # ------------------------------------------------------------------
+
+    def _sync_alerts(self, segment: str, findings: List[Tuple[str, str, str, float, float]],
+                     scope_prefix: str) -> List[QualityAlert]:
+        """Open or refresh an alert per finding; resolve this segment's alerts that no longer fire"""
+        now = datetime.now().isoformat()
+        raised = []
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                firing = set()
+                for metric, severity, message, value, baseline in findings:
+                    alert_key = f"{segment}|{metric}"
+                    firing.add(alert_key)
+                    row = self._connection.execute(
+                        'SELECT alert_id FROM quality_alerts WHERE alert_key = ? AND resolved_at IS NULL',
+                        (alert_key,)
+                    ).fetchone()
+                    if row:
+                        self._connection.execute(
+                            'UPDATE quality_alerts SET severity = ?, message = ?, value = ?, baseline = ?, '
+                            'last_seen = ? WHERE alert_id = ?',
+                            (severity, message, value, baseline, now, row[0])
+                        )
+                        continue
+                    cursor = self._connection.execute(
+                        'INSERT INTO quality_alerts (alert_key, segment, metric, severity, message, value, baseline, '
+                        'created_at, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (alert_key, segment, metric, severity, message, value, baseline, now, now)
+                    )
+                    raised.append(QualityAlert(cursor.lastrowid, segment, metric, severity, message,
+                                               value, baseline, now, now))
+
+                active = self._connection.execute(
+                    'SELECT alert_id, alert_key FROM quality_alerts '
+                    'WHERE segment = ? AND metric LIKE ? AND resolved_at IS NULL',
+                    (segment, scope_prefix + '%')
+                ).fetchall()
+                resolved = [(now, alert_id) for alert_id, alert_key in active if alert_key not in firing]
+                self._connection.executemany('UPDATE quality_alerts SET resolved_at = ? WHERE alert_id = ?', resolved)
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        for alert in raised:
+            logger.warning(f"🚨 [{alert.severity.upper()}] {alert.segment}: {alert.message}")
+        return raised
+
+    def get_active_alerts(self) -> List[QualityAlert]:
+        """Unresolved alerts, most severe first"""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT alert_id, segment, metric, severity, message, value, baseline, created_at, last_seen, '
+                'resolved_at FROM quality_alerts WHERE resolved_at IS NULL ORDER BY last_seen DESC'
+            ).fetchall()
+        alerts = [QualityAlert(*row) for row in rows]
+        return sorted(alerts, key=lambda alert: SEVERITY_ORDER.get(alert.severity, len(SEVERITY_ORDER)))
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def segment_summary(self, source: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Baseline plus current window statistics per segment"""
+        with self._lock:
+            summary = {}
+            for (segment_source, location), segment in sorted(self._segments.items()):
+                if source is not None and segment_source != source:
+                    continue
+                combined = QualityProfile(self.settings['relative_accuracy'])
+                combined.merge(segment.baseline)
+                combined.merge(segment.window)
+                summary[f"{segment_source}/{location}"] = {**combined.summary(),
+                                                           'windows_closed': segment.windows_closed}
+            return summary
+
+    def get_quality_dashboard(self) -> Dict[str, Any]:
+        """Alert counts, monitoring status, latest score and per-segment summaries"""
+        active = self.get_active_alerts()
+        with self._lock:
+            total_alerts = self._connection.execute('SELECT COUNT(*) FROM quality_alerts').fetchone()[0]
+            latest = self._connection.execute(
+                'SELECT timestamp, scope, record_count, overall_score FROM quality_scores '
+                'ORDER BY score_id DESC LIMIT 1'
+            ).fetchone()
+
+        severities = {alert.severity for alert in active}
+        if severities & {'critical', 'high'}:
+            status = 'critical'
+        elif active:
+            status = 'warning'
+        else:
+            status = 'healthy'
+        return {
+            'monitoring_status': status,
+            'active_alerts': len(active),
+            'total_alerts': total_alerts,
+            'alerts_by_severity': {severity: sum(a.severity == severity for a in active) for severity in SEVERITY_ORDER},
+            'records_observed': self.records_observed,
+            'segments': len(self._segments),
+            'latest_score': dict(zip(('timestamp', 'scope', 'record_count', 'overall_score'), latest)) if latest else None,
+            'segment_summary': self.segment_summary(),
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load_state(self):
+        rows = self._connection.execute('SELECT segment, state FROM quality_profiles').fetchall()
+        for segment_key, state_json in rows:
+            state = json.loads(state_json)
+            key = tuple(json.loads(segment_key))
+            self._segments[key] = _Segment.from_state(state)
+            self._revisions[key] = state.get('revision', 0)
+
+        state = dict(self._connection.execute('SELECT key, value FROM quality_state').fetchall())
+        for period, seen in ((self._period, self._seen), (self._period - 1, self._seen_previous)):
+            if f'seen_keys:{period}' in state:
+                seen.union(state[f'seen_keys:{period}'])
+        self.records_observed = int(state.get('records_observed') or 0)
+        if rows:
+            logger.info(f"📂 Restored quality profiles for {len(rows)} segments")
+
+    def _save_state(self, keys: Optional[Iterable[Tuple[str, str]]] = None, save_filter: bool = True):
+        """
+        Persist the given (default: all changed) segment profiles and optionally the duplicate filters.
+
+        Other processes may have saved since this one loaded, so stored state is merged rather than
+        overwritten: a segment another process saved continues from the stored profiles plus the
+        records observed here since, counters are added and filter bits ORed.
+        """
+        with self._lock:
+            keys = list(self._dirty if keys is None else keys)
+            now = datetime.now().isoformat()
+            rows, merged, revisions = [], {}, {}
+
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                for key in keys:
+                    segment_key = json.dumps(list(key))
+                    row = self._connection.execute('SELECT state FROM quality_profiles WHERE segment = ?',
+                                                   (segment_key,)).fetchone()
+                    stored = json.loads(row[0]) if row else None
+                    revision = stored.get('revision', 0) if stored else 0
+                    segment = self._segments[key]
+                    if stored is not None and revision != self._revisions.get(key, 0):
+                        segment = _Segment.from_state(stored)
+                        if key in self._pending:
+                            segment.window.merge(self._pending[key])
+                        merged[key] = segment
+                    revisions[key] = revision + 1
+                    rows.append((segment_key, json.dumps(segment.to_state(revision + 1)), now))
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO quality_profiles (segment, state, updated_at) VALUES (?, ?, ?)', rows
+                )
+
+                row = self._connection.execute("SELECT value FROM quality_state WHERE key = 'records_observed'").fetchone()
+                records_observed = int(row[0] if row else 0) + self._unsaved_records
+                state = [('records_observed', records_observed)]
+                if save_filter:
+                    names = [f'seen_keys:{self._period}', f'seen_keys:{self._period - 1}']
+                    stored_filters = dict(self._connection.execute(
+                        'SELECT key, value FROM quality_state WHERE key IN (?, ?)', names
+                    ).fetchall())
+                    for name, seen in zip(names, (self._seen, self._seen_previous)):
+                        if name in stored_filters:
+                            seen.union(stored_filters[name])
+                        state.append((name, bytes(seen.bits)))
+                    self._connection.execute(
+                        "DELETE FROM quality_state WHERE key LIKE 'seen_keys%' AND key NOT IN (?, ?)", names
+                    )
+                self._connection.executemany('INSERT OR REPLACE INTO quality_state (key, value) VALUES (?, ?)', state)
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+            self._segments.update(merged)
+            self._revisions.update(revisions)
+            for key in keys:
+                self._pending.pop(key, None)
+            self.records_observed = records_observed
+            self._unsaved_records = 0
+            self._dirty.difference_update(keys)
+            if save_filter:
+                self._filter_saved_at = time.time()
+
+    def flush(self):
+        self._save_state()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _number(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else None
+    try:
+        return float(str(value).replace('€', '').replace(',', '').strip())
+    except ValueError:
+        return None
+
+
+def _host(url: Optional[str]) -> str:
+    match = re.match(r'^https?://(?:[^@/]*@)?([^/:?#]+)', url or '')
+    return match.group(1).lower() if match else ''
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    if value in (None, ''):
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+_shared_monitors: Dict[str, DataQualityMonitor] = {}
+
+
+def shared_monitor(db_path: Union[str, Path] = DEFAULT_DB_PATH) -> DataQualityMonitor:
+    """Process-wide monitor per database, flushed at exit (used by collector result streams)"""
+    db_path = Path(db_path)
+    key = str((db_path if db_path.is_absolute() else PROJECT_ROOT / db_path).resolve())
+    if key not in _shared_monitors:
+        monitor = DataQualityMonitor(db_path)
+        atexit.register(monitor.close)
+        _shared_monitors[key] = monitor
+    return _shared_monitors[key]
+
+
+def main():
+    """Example: stream two sources, then shift one neighborhood's prices and watch the drift alerts"""
+    import random
+    import tempfile
+
+    logging.basicConfig(level=logging.INFO)
+    random.seed(7)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        monitor = DataQualityMonitor(Path(temp_dir) / 'quality.db')
+        monitor.window_size = 250
+
+        def listing(i: int, neighborhood: str, price_per_sqm: float, energy: str) -> Dict[str, Any]:
+            sqm = random.randint(45, 160)
+            return {'url': f'https://www.spitogatos.gr/en/property/{1117000000 + i}', 'neighborhood': neighborhood,
+                    'price': round(sqm * random.gauss(price_per_sqm, price_per_sqm * 0.12)), 'sqm': sqm,
+                    'rooms': random.randint(1, 4), 'energy_class': energy,
+                    'scraped_at': datetime.now().isoformat()}
+
+        start = time.time()
+        for i in range(4000):
+            monitor.observe(listing(i, 'Kolonaki', 7000, random.choice('ABC')), 'spitogatos')
+            monitor.observe(listing(100000 + i, 'Exarchia', 3500, random.choice('CDE')), 'xe')
+        print(f"Observed 8,000 listings in {time.time() - start:.2f}s, "
+              f"{len(monitor.get_active_alerts())} active alerts")
+
+        # Kolonaki prices jump 30% and half the listings stop carrying rooms
+        for i in range(4000, 4500):
+            record = listing(i, 'Kolonaki', 9100, random.choice('ABC'))
+            if i % 2:
+                record.pop('rooms')
+            monitor.observe(record, 'spitogatos')
+        for alert in monitor.get_active_alerts():
+            print(f"  [{alert.severity}] {alert.segment}: {alert.message}")
+
+        score = monitor.assess_data_quality([listing(i, 'Glyfada', 5000, 'B') for i in range(200)] +
+                                            [{'url': 'invalid-url', 'price': -100000, 'size': 5000}] * 20)
+        print(f"Assessment overall {score.overall_score:.1%}: " +
+              ", ".join(f"{m.name} {m.value:.0%} ({m.status})" for m in score.metrics))
+        print(json.dumps({k: v for k, v in monitor.get_quality_dashboard().items() if k != 'segment_summary'},
+                         indent=2, default=str))
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Validators Module - Property Data Validation
+
+Multi-factor authenticity validation for ingested property listings.
+"""
+
+from .property_validator import PropertyValidator, ValidationBatch, ValidationResult, load_validator_config
+
+__all__ = ['PropertyValidator', 'ValidationBatch', 'ValidationResult', 'load_validator_config']
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+🛡️ Property Validator - Multi-Factor Authenticity Scoring
+
+Columnar validator compiled once from config/validator_config.yaml:
+- Six weighted factors (url, price, attributes, market, temporal, images), each scored 0-100
+- Every check is a vectorized operation over a whole batch (no per-row Python)
+- Neighborhood overrides resolved with a categorical join against a compiled threshold table
+- Market factor compares price/m² with running per-neighborhood references (each listing counted once)
+- validate_property is a single-row wrapper over validate_batch
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+VALIDATOR_CONFIG_PATH = PROJECT_ROOT / 'config' / 'validator_config.yaml'
+
+logger = logging.getLogger(__name__)
+
+FACTORS = ('url', 'price', 'attributes', 'market', 'temporal', 'images')
+
+# Input column → accepted source names, first present wins
+COLUMN_ALIASES = {
+    'id': ('id', 'property_id'),
+    'url': ('url',),
+    'price': ('price',),
+    'size': ('size', 'sqm'),
+    'rooms': ('rooms',),
+    'floor': ('floor',),
+    'year_built': ('year_built',),
+    'location': ('location', 'neighborhood'),
+    'listed_date': ('listed_date', 'timestamp', 'source_timestamp', 'scraped_at'),  # Collectors record when they saw the listing
+}
+
+DEFAULT_THRESHOLDS = {
+    'min_score': 70,
+    'price_deviation': 0.3,
+    'price_min': 10_000,
+    'price_max': 10_000_000,
+    'size_min': 20,
+    'size_max': 500,
+    'rooms_min': 1,
+    'rooms_max': 10,
+    'floor_min': -1,
+    'floor_max': 20,
+    'year_min': 1800,
+    'year_max': 2025,
+    'listing_age_days': 180,
+    'images_min': 3,
+    'market_min_samples': 5,
+}
+
+UNKNOWN_MARKET_SCORE = 50.0  # Neighborhoods without a price reference yet are neither confirmed nor penalized
+
+
+@dataclass
+class ValidationResult:
+    """Validation outcome of one property"""
+    property_id: str
+    is_valid: bool
+    score: float
+    factor_scores: Dict[str, float]
+    issues: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'property_id': self.property_id,
+            'is_valid': self.is_valid,
+            'score': self.score,
+            'factor_scores': self.factor_scores,
+            'issues': self.issues,
+        }
+
+
+@dataclass
+class ValidationBatch:
+    """Columnar (struct-of-arrays) validation scores, one entry per input row
+
+    Factor scores and ``total_score`` are 0-100; ``failed_checks`` maps each
+    check name to a boolean array marking the rows that failed it.
+    """
+    property_id: np.ndarray
+    url_score: np.ndarray
+    price_score: np.ndarray
+    attributes_score: np.ndarray
+    market_score: np.ndarray
+    temporal_score: np.ndarray
+    images_score: np.ndarray
+    total_score: np.ndarray
+    is_valid: np.ndarray
+    failed_checks: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.total_score)
+
+    @property
+    def factor_scores(self) -> Dict[str, np.ndarray]:
+        return {factor: getattr(self, f'{factor}_score') for factor in FACTORS}
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the batch as a DataFrame (checks as boolean failed_* columns)"""
+        columns = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'failed_checks'}
+        columns.update({f'failed_{check}': mask for check, mask in self.failed_checks.items()})
+        return pd.DataFrame(columns)
+
+    def result(self, row: int) -> ValidationResult:
+        """Row view as a ValidationResult"""
+        return ValidationResult(
+            property_id=str(self.property_id[row]),
+            is_valid=bool(self.is_valid[row]),
+            score=float(self.total_score[row]),
+            factor_scores={factor: float(scores[row]) for factor, scores in self.factor_scores.items()},
+            issues=[check for check, mask in self.failed_checks.items() if mask[row]],
+        )
+
+
+def load_validator_config(config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH) -> Dict:
+    """Validator YAML with defaults for missing sections"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning(f"⚠️ Validator config not found at {config_path}, using defaults")
+        config = {}
+
+    return {
+        'thresholds': {**DEFAULT_THRESHOLDS, **config.get('thresholds', {})},
+        'weights': config.get('weights', {factor: 1 / len(FACTORS) for factor in FACTORS}),
+        'valid_domains': config.get('valid_domains', []),
+        'neighborhoods': config.get('neighborhoods') or {},
+        'performance': config.get('performance', {}),
+        'logging': config.get('logging', {}),
+        'quality_monitor': config.get('quality_monitor', {}),
+    }
+
+
+class PropertyValidator:
+    """Multi-factor property validator with a vectorized batch path"""
+
+    def __init__(self, config_path: Union[str, Path] = VALIDATOR_CONFIG_PATH,
+                 market_reference: Optional[Dict[str, float]] = None, audit: Optional[bool] = None):
+        """
+        Args:
+            config_path: Validator YAML
+            market_reference: Known price/m² per neighborhood, seeding the market factor
+            audit: Write decisions to the audit JSONL (default: logging.audit_enabled; relative
+                audit_file paths are under the project root)
+        """
+        self.config = load_validator_config(config_path)
+        self._compile(self.config)
+
+        # Running market reference: price/m² sum and count per neighborhood slot, plus the
+        # identity hashes of the listings already counted so re-validating one does not skew it
+        self._lock = threading.Lock()
+        self._market_slots: Dict[str, int] = {}
+        self._market_listings: set = set()
+        self._market_sum = np.zeros(0)
+        self._market_count = np.zeros(0)
+        if market_reference:
+            slots = self._market_slots_for(np.array(list(market_reference), dtype=object))
+            self._market_count[slots] = self.thresholds['market_min_samples']
+            self._market_sum[slots] = np.array(list(market_reference.values()), dtype=float) * self._market_count[slots]
+
+        self._started_at = time.time()
+        self.stats = {'total_validated': 0, 'total_valid': 0, 'batches': 0, 'score_sum': 0.0,
+                      'validation_seconds': 0.0}
+
+        logging_config = self.config['logging']
+        audit = logging_config.get('audit_enabled', False) if audit is None else audit
+        self._audit_path = None
+        if audit and logging_config.get('audit_file'):
+            audit_path = Path(logging_config['audit_file'])
+            self._audit_path = audit_path if audit_path.is_absolute() else PROJECT_ROOT / audit_path
+        self._audit_file = None
+
+    # ------------------------------------------------------------------
+    # Config compilation
+    # ------------------------------------------------------------------
+
+    def _compile(self, config: Dict):
+        """Turn the YAML into arrays the batch checks index directly"""
+        self.thresholds = config['thresholds']
+
+        unknown = set(config['weights']) - set(FACTORS)
+        if unknown:
+            raise ValueError(f"Unknown validation factors in weights: {sorted(unknown)}")
+        self.weights = np.array([float(config['weights'].get(factor, 0.0)) for factor in FACTORS])
+        if not np.isclose(self.weights.sum(), 1.0):
+            raise ValueError(f"Validation weights must sum to 1.0, got {self.weights.sum():.3f}")
+
+        self.valid_domains = tuple(domain.lower() for domain in config['valid_domains'])
+
+        # Neighborhood threshold table: one row per overridden neighborhood plus a final
+        # global row, so categorical codes (-1 for other neighborhoods) index it directly
+        overrides = config['neighborhoods']
+        for neighborhood, values in overrides.items():
+            unknown = set(values) - set(self.thresholds)
+            if unknown:
+                raise ValueError(f"Unknown thresholds for {neighborhood}: {sorted(unknown)}")
+        self.neighborhood_names = pd.Index(list(overrides), dtype=object)
+        overridden = sorted({key for values in overrides.values() for key in values})
+        self.neighborhood_thresholds = {
+            key: np.array([float(overrides[name].get(key, self.thresholds[key])) for name in self.neighborhood_names] +
+                          [float(self.thresholds[key])])
+            for key in overridden
+        }
+
+    def _threshold(self, key: str, codes: np.ndarray) -> Union[float, np.ndarray]:
+        """Per-row threshold: neighborhood override where one exists, global value otherwise"""
+        table = self.neighborhood_thresholds.get(key)
+        return float(self.thresholds[key]) if table is None else table[codes]
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def validate_property(self, property_data: Dict[str, Any]) -> ValidationResult:
+        """Validate one property (a batch of one)"""
+        return self.validate_batch([property_data]).result(0)
+
+    def validate_batch(self, properties: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]) -> ValidationBatch:
+        """
+        Score every property of a batch in one vectorized pass.
+
+        Args:
+            properties: DataFrame, dict of equal-length columns, or list of property dicts
+
+        Returns:
+            ValidationBatch: Per-factor score arrays, weighted total and validity per input row
+        """
+        start_time = time.time()
+        frame = properties if isinstance(properties, pd.DataFrame) else pd.DataFrame(properties)
+        n_rows = len(frame)
+        checks: Dict[str, np.ndarray] = {}
+
+        # Categorical join: distinct neighborhoods → threshold table rows (-1 = global row)
+        location_codes, locations = pd.factorize(self._column(frame, 'location', '').fillna('').astype(str))
+        locations = np.asarray(locations, dtype=object)
+        codes = self.neighborhood_names.get_indexer(locations)[location_codes]
+
+        urls = self._column(frame, 'url', '').fillna('').astype(str)
+        url_score = self._url_scores(urls, checks)
+
+        # Price - present and within the plausible listing range
+        price = self._numeric(frame, 'price')
+        checks['price_out_of_range'] = ~((price >= self.thresholds['price_min']) & (price <= self.thresholds['price_max']))
+        price_score = np.where(checks['price_out_of_range'], 0.0, 100.0)
+
+        # Attributes - share of present attributes inside their (neighborhood) ranges; size is required
+        size = self._numeric(frame, 'size')
+        attribute_checks = {
+            'size': (size, 'size_min', 'size_max', True),
+            'rooms': (self._numeric(frame, 'rooms'), 'rooms_min', 'rooms_max', False),
+            'floor': (self._numeric(frame, 'floor'), 'floor_min', 'floor_max', False),
+            'year_built': (self._numeric(frame, 'year_built'), 'year_min', 'year_max', False),
+        }
+        passed = np.zeros(n_rows)
+        checked = np.zeros(n_rows)
+        for name, (values, low_key, high_key, required) in attribute_checks.items():
+            present = ~np.isnan(values)
+            in_range = present & (values >= self._threshold(low_key, codes)) & (values <= self._threshold(high_key, codes))
+            counted = np.ones(n_rows, dtype=bool) if required else present
+            checks[f'{name}_out_of_range'] = counted & ~in_range
+            passed += in_range
+            checked += counted
+        attributes_score = 100.0 * passed / checked
+
+        property_id = self._column(frame, 'id', '').fillna('').astype(str)
+        listing_keys = self._listing_keys(property_id, urls, location_codes, locations, price, size)
+        market_score = self._market_scores(location_codes, locations, codes, price, size, listing_keys, checks)
+        temporal_score = self._temporal_scores(frame, checks)
+        images_score = self._image_scores(frame, n_rows, checks)
+
+        factor_matrix = np.column_stack([url_score, price_score, attributes_score,
+                                         market_score, temporal_score, images_score])
+        total_score = factor_matrix @ self.weights
+        is_valid = total_score >= self.thresholds['min_score']
+
+        batch = ValidationBatch(property_id.to_numpy(dtype=object), url_score, price_score, attributes_score, market_score,
+                                temporal_score, images_score, total_score, is_valid, checks)
+
+        with self._lock:
+            self.stats['total_validated'] += n_rows
+            self.stats['total_valid'] += int(is_valid.sum())
+            self.stats['batches'] += 1
+            self.stats['score_sum'] += float(total_score.sum())
+            self.stats['validation_seconds'] += time.time() - start_time
+            if self._audit_path is not None:
+                self._audit(batch)
+        return batch
+
+    def _url_scores(self, urls: pd.Series, checks: Dict[str, np.ndarray]) -> np.ndarray:
+        """100 on a listing domain, 30 for other well-formed URLs, 0 when missing or malformed"""
+        host = urls.str.extract(r'^https?://(?:[^@/]*@)?([^/:?#]+)', expand=False).fillna('').str.lower()
+        host_codes, hosts = pd.factorize(host)
+
+        # Domain rules run once per distinct host
+        known_host = np.array([any(h == d or h.endswith('.' + d) for d in self.valid_domains) for h in hosts], dtype=bool)
+        well_formed = (hosts != '')[host_codes]
+        known_domain = known_host[host_codes]
+
+        checks['url_malformed'] = ~well_formed
+        checks['url_unknown_domain'] = well_formed & ~known_domain
+        return np.select([known_domain, well_formed], [100.0, 30.0], default=0.0)
+
+    def market_reference(self) -> Dict[str, float]:
+        """Current price/m² reference per neighborhood with enough samples (seeds other validators)"""
+        with self._lock:
+            known = self._market_count >= self.thresholds['market_min_samples']
+            return {name: float(self._market_sum[slot] / self._market_count[slot])
+                    for name, slot in self._market_slots.items() if known[slot]}
+
+    def _market_slots_for(self, names: np.ndarray) -> np.ndarray:
+        """Reference slot per neighborhood name, growing the reference arrays for new names"""
+        with self._lock:
+            for name in names:
+                if name not in self._market_slots:
+                    self._market_slots[name] = len(self._market_slots)
+            grow = len(self._market_slots) - len(self._market_sum)
+            if grow:
+                self._market_sum = np.concatenate([self._market_sum, np.zeros(grow)])
+                self._market_count = np.concatenate([self._market_count, np.zeros(grow)])
+            return np.array([self._market_slots[name] for name in names], dtype=np.intp)
+
+    @staticmethod
+    def _listing_keys(property_id: pd.Series, urls: pd.Series, location_codes: np.ndarray, locations: np.ndarray,
+                      price: np.ndarray, size: np.ndarray) -> np.ndarray:
+        """Identity per row: the listing id, else its URL, else its location, price and size"""
+        identity = property_id.to_numpy(dtype=object).copy()
+        no_id = identity == ''
+        identity[no_id] = 'url:' + urls.to_numpy(dtype=object)[no_id]
+        anonymous = np.flatnonzero(identity == 'url:')
+        if len(anonymous):
+            identity[anonymous] = [f'content:{location}|{p}|{s}' for location, p, s in
+                                   zip(locations[location_codes[anonymous]], price[anonymous], size[anonymous])]
+        return identity
+
+    def _market_scores(self, location_codes: np.ndarray, locations: np.ndarray, codes: np.ndarray,
+                       price: np.ndarray, size: np.ndarray, listing_keys: np.ndarray,
+                       checks: Dict[str, np.ndarray]) -> np.ndarray:
+        """Price/m² deviation from the neighborhood reference: full score within the allowed deviation, 0 at twice it"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_per_sqm = price / size
+        plausible = ~(checks['price_out_of_range'] | checks['size_out_of_range']) & np.isfinite(price_per_sqm)
+
+        # Plausible rows of listings not counted before feed the reference first, so a batch
+        # of a new neighborhood is judged against itself
+        slots = self._market_slots_for(locations)
+        candidates = np.flatnonzero(plausible)
+        new = np.zeros(len(candidates), dtype=bool)
+        with self._lock:
+            counted = self._market_listings
+            for i, key in enumerate(listing_keys[candidates].tolist()):
+                key_hash = hash(key)
+                if key_hash not in counted:
+                    counted.add(key_hash)
+                    new[i] = True
+            rows = candidates[new]
+            batch_sum = np.bincount(location_codes[rows], price_per_sqm[rows], minlength=len(locations))
+            batch_count = np.bincount(location_codes[rows], minlength=len(locations))
+            self._market_sum[slots] += batch_sum
+            self._market_count[slots] += batch_count
+            market_count = self._market_count[slots]
+            market_sum = self._market_sum[slots]
+
+        known = ((market_count >= self.thresholds['market_min_samples']) & (locations != ''))[location_codes]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            reference = (market_sum / market_count)[location_codes]
+
+        allowed = self._threshold('price_deviation', codes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deviation = np.abs(price_per_sqm / reference - 1.0)
+            score = np.clip(100.0 * (2.0 - deviation / allowed), 0.0, 100.0)
+
+        checks['price_deviation'] = plausible & known & (deviation > allowed)
+        return np.select([~plausible, ~known], [0.0, UNKNOWN_MARKET_SCORE], default=score)
+
+    def _temporal_scores(self, frame: pd.DataFrame, checks: Dict[str, np.ndarray]) -> np.ndarray:
+        """Recent listings score 100, decaying to 0 at twice the maximum age; unparseable or future dates score 0"""
+        raw = self._column(frame, 'listed_date', None)
+        listed = pd.to_datetime(raw, errors='coerce', utc=True, format='ISO8601')
+        now = pd.Timestamp.now(tz='UTC')
+        age_days = ((now - listed) / pd.Timedelta(days=1)).to_numpy(dtype=float, na_value=np.nan)
+
+        max_age = self.thresholds['listing_age_days']
+        checks['listed_date_invalid'] = np.isnan(age_days)
+        checks['listed_date_future'] = age_days < -1.0
+        checks['listing_stale'] = age_days > max_age
+        score = np.clip(100.0 * (2.0 - age_days / max_age), 0.0, 100.0)
+        return np.where(checks['listed_date_invalid'] | checks['listed_date_future'], 0.0, score)
+
+    def _image_scores(self, frame: pd.DataFrame, n_rows: int, checks: Dict[str, np.ndarray]) -> np.ndarray:
+        """Image count relative to images_min; an image_count column skips counting lists"""
+        if 'image_count' in frame:
+            counts = pd.to_numeric(frame['image_count'], errors='coerce').fillna(0).to_numpy(dtype=float)
+        elif 'images' in frame:
+            counts = frame['images'].str.len().fillna(0).to_numpy(dtype=float)
+        else:
+            counts = np.zeros(n_rows)
+
+        checks['too_few_images'] = counts < self.thresholds['images_min']
+        return 100.0 * np.minimum(counts / self.thresholds['images_min'], 1.0)
+
+    def _column(self, frame: pd.DataFrame, name: str, default: Any) -> pd.Series:
+        for source in COLUMN_ALIASES[name]:
+            if source in frame:
+                return frame[source]
+        return pd.Series(default, index=frame.index, dtype=object)
+
+    def _numeric(self, frame: pd.DataFrame, name: str) -> np.ndarray:
+        return pd.to_numeric(self._column(frame, name, np.nan), errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def _audit(self, batch: ValidationBatch):
+        """Append the batch's decisions to the audit JSONL (caller holds the lock)"""
+        if self._audit_file is None:
+            self._audit_path.parent.mkdir(parents=True, exist_ok=True)
+            self._audit_file = open(self._audit_path, 'a', encoding='utf-8')
+        audit = pd.DataFrame({'property_id': batch.property_id, 'score': batch.total_score.round(2),
+                              'is_valid': batch.is_valid})
+        audit.insert(0, 'timestamp', pd.Timestamp.now(tz='UTC').isoformat())
+        self._audit_file.write(audit.to_json(orient='records', lines=True, force_ascii=False))
+        self._audit_file.flush()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Totals, pass rate and throughput since the validator was created"""
+        with self._lock:
+            stats = dict(self.stats)
+        uptime = time.time() - self._started_at
+        total = stats['total_validated']
+        return {
+            'total_validated': total,
+            'total_valid': stats['total_valid'],
+            'total_invalid': total - stats['total_valid'],
+            'pass_rate': stats['total_valid'] / total if total else 0.0,
+            'average_score': stats['score_sum'] / total if total else 0.0,
+            'batches': stats['batches'],
+            'uptime': uptime,
+            'properties_per_minute': total / uptime * 60 if uptime > 0 else 0.0,
+            'validation_properties_per_minute': total / stats['validation_seconds'] * 60
+            if stats['validation_seconds'] > 0 else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._audit_file is not None:
+                self._audit_file.close()
+                self._audit_file = None
+
+
+def main():
+    """Example: validate one listing, then time a synthetic columnar batch"""
+    logging.basicConfig(level=logging.INFO)
+    validator = PropertyValidator(audit=False)
+
+    result = validator.validate_property({
+        'id': 'kolonaki_001',
+        'url': 'https://www.spitogatos.gr/en/property/1117859090',
+        'price': 420000,
+        'size': 95,
+        'rooms': 3,
+        'floor': 2,
+        'location': 'Kolonaki',
+        'listed_date': pd.Timestamp.now().isoformat(),
+        'images': ['1.jpg', '2.jpg', '3.jpg', '4.jpg'],
+    })
+    print(json.dumps(result.to_dict(), indent=2))
+
+    n_rows = 1_000_000
+    rng = np.random.default_rng(42)
+    batch = pd.DataFrame({
+        'id': np.arange(n_rows).astype(str),
+        'url': np.where(rng.random(n_rows) < 0.9, 'https://www.spitogatos.gr/en/property/1', 'https://fake-site.com/1'),
+        'price': rng.integers(80_000, 900_000, n_rows),
+        'size': rng.integers(30, 250, n_rows),
+        'rooms': rng.integers(1, 6, n_rows),
+        'location': rng.choice(['Kolonaki', 'Exarchia', 'Glyfada', 'Kifisia', 'Piraeus'], n_rows),
+        'listed_date': pd.Timestamp.now().isoformat(),
+        'image_count': rng.integers(0, 10, n_rows),
+    })
+    start_time = time.time()
+    scores = validator.validate_batch(batch)
+    elapsed = time.time() - start_time
+    print(f"Batch: {len(scores):,} properties in {elapsed:.2f}s "
+          f"({len(scores) / elapsed * 60:,.0f}/minute), {scores.is_valid.mean():.1%} valid")
+    validator.close()
+
+
+if __name__ == "__main__":
+    main()
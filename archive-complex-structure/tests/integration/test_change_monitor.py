@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+ChangeMonitor checks against a local fixture server
+"""
+
+import asyncio
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.collectors.change_monitor import ChangeMonitor
+from core.collectors.rate_scheduler import HostBudget, RateScheduler
+
+LISTING_PRICES = {f'/en/property/{1117000000 + i}': 250000 + i * 10000 for i in range(5)}
+
+
+@pytest.fixture
+def fixture_server():
+    """Serves LISTING_PRICES as listing pages; tests edit the prices they see"""
+    prices = dict(LISTING_PRICES)
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            price = prices.get(self.path)
+            if price is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = (f'<html><head><title>Apartment 85 m² Koukaki</title></head><body>'
+                    f'<h1>Apartment 85 m², Koukaki</h1><div class="price">€{price:,}</div>'
+                    f'<p>Energy class: B</p></body></html>').encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{server.server_address[1]}', prices
+    finally:
+        server.shutdown()
+
+
+def _monitor(tmp_path: Path) -> ChangeMonitor:
+    scheduler = RateScheduler(tmp_path / 'rate_budget.db', HostBudget(50, 10, 10))
+    return ChangeMonitor(tmp_path / 'listings.db', scheduler=scheduler)
+
+
+def _seed_records(base_url: str):
+    return [{'url': base_url + path, 'price': price} for path, price in LISTING_PRICES.items()]
+
+
+@pytest.mark.integration
+def test_bounded_run_checks_every_seeded_listing(tmp_path, fixture_server):
+    base_url, prices = fixture_server
+    first, second, gone = list(LISTING_PRICES)[:3]
+    prices[first] -= 15000
+    prices[second] += 5000
+    del prices[gone]
+
+    async def run():
+        monitor = _monitor(tmp_path)
+        try:
+            assert monitor.add_known(_seed_records(base_url), spread_seconds=0) == len(LISTING_PRICES)
+            stats = await monitor.run(cycles=1)
+            return stats, monitor.events()
+        finally:
+            await monitor.close()
+
+    stats, events = asyncio.run(run())
+
+    assert stats['checked'] == len(LISTING_PRICES)
+    assert stats['errors'] == 0
+    assert {(event['url'], event['event_type']) for event in events} == {
+        (base_url + first, 'price_drop'),
+        (base_url + second, 'price_increase'),
+        (base_url + gone, 'delisted'),
+    }
+
+
+@pytest.mark.integration
+def test_continuous_seed_spreads_first_checks(tmp_path, fixture_server):
+    base_url, _ = fixture_server
+
+    async def run():
+        monitor = _monitor(tmp_path)
+        try:
+            monitor.add_known(_seed_records(base_url))
+            return await monitor.run(cycles=1)
+        finally:
+            await monitor.close()
+
+    # Spread over the 24 h default base interval, all first checks falling due now is vanishingly unlikely
+    assert asyncio.run(run())['checked'] < len(LISTING_PRICES)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+BudgetPortfolioOptimizer incremental re-solve checks
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.intelligence.portfolio_optimizer import BudgetPortfolioOptimizer, PortfolioConstraints
+
+
+def make_optimizer():
+    optimizer = BudgetPortfolioOptimizer(PortfolioConstraints(budget=1_000_000, max_single_asset_share=1.0),
+                                         budget_resolution=100)
+    optimizer.set_candidates(['a', 'b', 'c', 'd'],
+                             costs=[200_000, 300_000, 250_000, 150_000],
+                             values=[20_000, 33_000, 24_000, 30_000])
+    return optimizer
+
+
+def test_remove_tail_candidate_resolves():
+    optimizer = make_optimizer()
+    assert 'd' in optimizer.solve().selected_keys
+
+    optimizer.remove_candidate('d')
+    selection = optimizer.solve()
+
+    assert 'd' not in selection.selected_keys
+    assert sorted(selection.selected_keys) == ['a', 'b', 'c']
+    assert selection.total_value == 77_000
+
+
+def test_update_after_remove_matches_full_solve():
+    optimizer = make_optimizer()
+    optimizer.solve()
+    optimizer.remove_candidate('b')
+    optimizer.update_candidate('e', 400_000, 50_000)
+    incremental = optimizer.solve()
+
+    fresh = BudgetPortfolioOptimizer(PortfolioConstraints(budget=1_000_000, max_single_asset_share=1.0),
+                                     budget_resolution=100)
+    fresh.set_candidates(['a', 'c', 'd', 'e'],
+                         costs=[200_000, 250_000, 150_000, 400_000],
+                         values=[20_000, 24_000, 30_000, 50_000])
+    assert sorted(incremental.selected_keys) == sorted(fresh.solve().selected_keys)